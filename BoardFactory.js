@@ -5,11 +5,13 @@
  */
 
 class BoardFactory {
-    constructor(scene, materialsLibrary) {
+    constructor(scene, materialsLibrary, materialCache = null) {
         this.scene = scene;
         this.materialsLibrary = materialsLibrary;
+        this.materialCache = materialCache || new MaterialCache(scene, materialsLibrary);
         this.boards = new Map(); // Track all boards by ID
         this.recentVariants = new Map(); // Track recent variants by material ID
+        this.instancer = null; // Optional PartInstancer for identical boards
     }
     
     /**
@@ -138,117 +140,88 @@ class BoardFactory {
         // Make pickable
         mesh.isPickable = true;
         
+        // Identical boards of the same material render as thin instances
+        if (this.instancer) {
+            this.instancer.register(mesh, board.material.id);
+        }
+        
         return mesh;
     }
     
     /**
      * Apply material and texture to mesh
+     * Materials come from the shared MaterialCache - identical boards share one
+     * material and one texture instead of creating a new pair per board.
      */
     applyMaterialToMesh(mesh, board) {
-        const material = new BABYLON.StandardMaterial(`${board.id}_material`, this.scene);
+        const descriptor = {
+            materialId: board.material.id,
+            grade: board.material.grade,
+            grain: board.dimensions.grain_axis,
+            specular: 0.1
+        };
         
         // Apply texture if available
         if (board.material.texture) {
-            try {
-                // Check if material has texture variants
-                const materialData = this.materialsLibrary.getMaterial(board.material.id);
-                let textureUrl = board.material.texture;
+            // Check if material has texture variants
+            const materialData = this.materialsLibrary.getMaterial(board.material.id);
+            let textureUrl = board.material.texture;
+            
+            if (materialData?.visual_assets?.texture_variants && materialData.visual_assets.texture_variants.length > 0) {
+                // Get all available textures (main + variants)
+                const allTextures = [materialData.visual_assets.texture_diffuse, ...materialData.visual_assets.texture_variants];
+                
+                // Get recently used variants for this material (last 2-3)
+                const recentForMaterial = this.recentVariants.get(board.material.id) || [];
+                
+                // Filter out recent variants
+                const availableTextures = allTextures.filter(texture => !recentForMaterial.includes(texture));
                 
-                if (materialData?.visual_assets?.texture_variants && materialData.visual_assets.texture_variants.length > 0) {
-                    // Get all available textures (main + variants)
-                    const allTextures = [materialData.visual_assets.texture_diffuse, ...materialData.visual_assets.texture_variants];
-                    
-                    // Get recently used variants for this material (last 2-3)
-                    const recentForMaterial = this.recentVariants.get(board.material.id) || [];
-                    
-                    // Filter out recent variants
-                    const availableTextures = allTextures.filter(texture => !recentForMaterial.includes(texture));
-                    
-                    // If all textures were recently used, reset and use all
-                    if (availableTextures.length === 0) {
-                        availableTextures.push(...allTextures);
-                        this.recentVariants.set(board.material.id, []);
-                    }
-                    
-                    // Pick a random texture from available ones
-                    const randomIndex = Math.floor(Math.random() * availableTextures.length);
-                    textureUrl = availableTextures[randomIndex];
-                    
-                    // Update recent variants (keep last 2-3)
-                    const updatedRecent = [...recentForMaterial, textureUrl].slice(-Math.min(3, allTextures.length - 1));
-                    this.recentVariants.set(board.material.id, updatedRecent);
-                    
-                    // Store which texture was selected
-                    board.material.selected_texture = textureUrl;
-                    console.log(`🎲 Selected texture: ${textureUrl.split('/').pop()} (avoiding ${recentForMaterial.length} recent)`);
-                }                const texture = new BABYLON.Texture(textureUrl, this.scene);
-                // Set texture to stretch across the entire face
-                texture.wrapU = BABYLON.Texture.WRAP_ADDRESSMODE;
-                texture.wrapV = BABYLON.Texture.WRAP_ADDRESSMODE;
-                // Apply UV offset for variation when no variants exist
-                if (!materialData?.visual_assets?.texture_variants || materialData.visual_assets.texture_variants.length === 0) {
-                    // No variants, use UV offset for variation
-                    
-                    // Track recent UV offsets for this material
-                    if (!this.recentUVOffsets) {
-                        this.recentUVOffsets = new Map();
-                    }
-                    
-                    const recentOffsets = this.recentUVOffsets.get(board.material.id) || [];
-                    
-                    // Generate random UV offset that avoids recent ones
-                    let uOffset, vOffset;
-                    let attempts = 0;
-                    const maxAttempts = 10;
-                    
-                    do {
-                        // Random offset between 0 and 0.7 (leaving 0.3 margin so we don't go off texture)
-                        uOffset = Math.random() * 0.7;
-                        vOffset = Math.random() * 0.7;
-                        attempts++;
-                    } while (attempts < maxAttempts && recentOffsets.some(offset => 
-                        Math.abs(offset.u - uOffset) < 0.15 && Math.abs(offset.v - vOffset) < 0.15
-                    ));
-                    
-                    // Apply the offset
-                    texture.uOffset = uOffset;
-                    texture.vOffset = vOffset;
-                    
-                    // Remember this offset
-                    const newOffsets = [...recentOffsets, {u: uOffset, v: vOffset}].slice(-3);
-                    this.recentUVOffsets.set(board.material.id, newOffsets);
-                    
-                    console.log(`📍 UV offset applied: (${uOffset.toFixed(2)}, ${vOffset.toFixed(2)}) for ${board.name}`);
-                }                
-                // UV mapping should align with grain direction
-                // This ensures texture grain matches actual grain
-                if (board.dimensions.grain_axis === 'x') {
-                    texture.uScale = 1; // No tiling // Repeat every foot
-                    texture.vScale = 1; // No tiling
-                } else if (board.dimensions.grain_axis === 'y') {
-                    texture.uScale = 1; // No tiling
-                    texture.vScale = 1; // No tiling
+                // If all textures were recently used, reset and use all
+                if (availableTextures.length === 0) {
+                    availableTextures.push(...allTextures);
+                    this.recentVariants.set(board.material.id, []);
                 }
                 
-                material.diffuseTexture = texture;
-                material.specularColor = new BABYLON.Color3(0.1, 0.1, 0.1);
+                // Pick a random texture from available ones
+                const randomIndex = Math.floor(Math.random() * availableTextures.length);
+                textureUrl = availableTextures[randomIndex];
                 
-                console.log(`🎨 Applied texture to ${board.name}`);
-            } catch (error) {
-                console.warn(`Failed to load texture for ${board.name}:`, error);
-                this.applyDefaultMaterial(material, board);
+                // Update recent variants (keep last 2-3)
+                const updatedRecent = [...recentForMaterial, textureUrl].slice(-Math.min(3, allTextures.length - 1));
+                this.recentVariants.set(board.material.id, updatedRecent);
+                
+                // Store which texture was selected
+                board.material.selected_texture = textureUrl;
+                console.log(`🎲 Selected texture: ${textureUrl.split('/').pop()} (avoiding ${recentForMaterial.length} recent)`);
+            } else {
+                // No variants, rotate through a few fixed UV offsets for variation.
+                // A fixed set keeps the number of shared materials bounded.
+                if (!this.uvOffsetCounters) {
+                    this.uvOffsetCounters = new Map();
+                }
+                const counter = this.uvOffsetCounters.get(board.material.id) || 0;
+                descriptor.uvOffset = BoardFactory.UV_OFFSET_SLOTS[counter % BoardFactory.UV_OFFSET_SLOTS.length];
+                this.uvOffsetCounters.set(board.material.id, counter + 1);
+                
+                console.log(`📍 UV offset applied: (${descriptor.uvOffset.u.toFixed(2)}, ${descriptor.uvOffset.v.toFixed(2)}) for ${board.name}`);
             }
+            
+            descriptor.textureUrl = textureUrl;
         } else {
-            this.applyDefaultMaterial(material, board);
+            descriptor.textureUrl = null;
+            descriptor.color = this.getDefaultColor(board);
+            descriptor.specular = 0.2;
         }
         
-        mesh.material = material;
+        this.materialCache.assign(mesh, descriptor);
+        console.log(`🎨 Applied material to ${board.name}`);
     }
     
     /**
-     * Apply default material when no texture available
+     * Default wood color when no texture is available
      */
-    applyDefaultMaterial(material, board) {
+    getDefaultColor(board) {
         // Wood color based on species
         const woodColors = {
             'oak': new BABYLON.Color3(0.65, 0.5, 0.4),
@@ -268,8 +241,7 @@ class BoardFactory {
             }
         }
         
-        material.diffuseColor = color;
-        material.specularColor = new BABYLON.Color3(0.2, 0.2, 0.2);
+        return color;
     }
     
     /**
@@ -336,6 +308,14 @@ class BoardFactory {
     }
 }
 
+// Fixed UV offsets used for variation when a material has no texture variants
+BoardFactory.UV_OFFSET_SLOTS = [
+    { u: 0.0, v: 0.0 },
+    { u: 0.35, v: 0.2 },
+    { u: 0.15, v: 0.55 },
+    { u: 0.6, v: 0.4 }
+];
+
 // Export for use
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = BoardFactory;
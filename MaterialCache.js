@@ -0,0 +1,208 @@
+/**
+ * MaterialCache - Shared, reference-counted wood materials and textures
+ * One material per (material id, grade, grain, texture variant) - not one per mesh
+ * Textures are shared by URL; both are disposed when their last user lets go
+ */
+
+class MaterialCache {
+    constructor(scene, materialsLibrary = null) {
+        this.scene = scene;
+        this.materialsLibrary = materialsLibrary;
+        this.materials = new Map();      // key -> { material, refs, textureKey }
+        this.materialKeys = new Map();   // material -> key
+        this.textures = new Map();       // key -> { texture, refs }
+        this.meshBindings = new WeakMap(); // mesh -> { material, observer }
+    }
+
+    /**
+     * Build the cache key for a material descriptor
+     * Descriptor: { materialId, grade, grain, textureUrl, uvOffset: {u, v}, color, specular }
+     */
+    static keyFor(descriptor) {
+        const offset = descriptor.uvOffset
+            ? `${descriptor.uvOffset.u.toFixed(3)},${descriptor.uvOffset.v.toFixed(3)}`
+            : '0,0';
+        // Color only matters for untextured materials
+        const color = !descriptor.textureUrl && descriptor.color
+            ? descriptor.color.toHexString()
+            : '';
+        return [
+            descriptor.materialId || 'default',
+            descriptor.grade || 'select',
+            descriptor.grain || 'x',
+            descriptor.textureUrl || '',
+            offset,
+            color,
+            descriptor.specular ?? 0.1
+        ].join('|');
+    }
+
+    /**
+     * Resolve the library texture when the caller didn't pick one
+     */
+    resolveTextureUrl(descriptor) {
+        if (descriptor.textureUrl !== undefined) {
+            return descriptor.textureUrl;
+        }
+        const materialData = this.materialsLibrary?.getMaterial(descriptor.materialId);
+        return materialData?.visual_assets?.texture_diffuse || null;
+    }
+
+    /**
+     * Get a shared material, creating it on first use (adds one reference)
+     */
+    acquire(descriptor) {
+        const resolved = { ...descriptor, textureUrl: this.resolveTextureUrl(descriptor) };
+        const key = MaterialCache.keyFor(resolved);
+
+        let entry = this.materials.get(key);
+        if (!entry) {
+            entry = this.createEntry(key, resolved);
+            this.materials.set(key, entry);
+            this.materialKeys.set(entry.material, key);
+        }
+
+        entry.refs++;
+        return entry.material;
+    }
+
+    /**
+     * Drop one reference; disposes the material (and its texture) at zero
+     */
+    release(material) {
+        const key = this.materialKeys.get(material);
+        if (!key) return;
+
+        const entry = this.materials.get(key);
+        entry.refs--;
+        if (entry.refs > 0) return;
+
+        this.materials.delete(key);
+        this.materialKeys.delete(material);
+        material.dispose(false, false);
+        if (entry.textureKey) {
+            this.releaseTexture(entry.textureKey);
+        }
+    }
+
+    /**
+     * Assign a shared material to a mesh
+     * Releases whatever cached material the mesh held before and releases this one
+     * automatically when the mesh is disposed.
+     */
+    assign(mesh, descriptor) {
+        const material = this.acquire(descriptor);
+        const binding = this.meshBindings.get(mesh);
+
+        if (binding) {
+            this.release(binding.material);
+            binding.material = material;
+        } else {
+            const newBinding = { material, observer: null };
+            newBinding.observer = mesh.onDisposeObservable.add(() => {
+                this.release(newBinding.material);
+                this.meshBindings.delete(mesh);
+            });
+            this.meshBindings.set(mesh, newBinding);
+        }
+
+        mesh.material = material;
+        return material;
+    }
+
+    /**
+     * Whether a material is owned by the cache (shared - do not mutate per mesh)
+     */
+    isShared(material) {
+        return this.materialKeys.has(material);
+    }
+
+    createEntry(key, descriptor) {
+        const id = descriptor.materialId || 'default';
+        // Keep the "<id>_material_" prefix - restoreMeshGeometry recovers the id from it
+        const material = new BABYLON.StandardMaterial(
+            `${id}_material_${descriptor.grade || 'select'}_${descriptor.grain || 'x'}_${this.materials.size}`,
+            this.scene
+        );
+        const specular = descriptor.specular ?? 0.1;
+        material.specularColor = new BABYLON.Color3(specular, specular, specular);
+
+        let textureKey = null;
+        if (descriptor.textureUrl) {
+            textureKey = this.textureKeyFor(descriptor.textureUrl, descriptor.uvOffset);
+            material.diffuseTexture = this.acquireTexture(descriptor.textureUrl, descriptor.uvOffset);
+        } else {
+            material.diffuseColor = descriptor.color || new BABYLON.Color3(0.8, 0.8, 0.8);
+        }
+
+        return { material, refs: 0, textureKey };
+    }
+
+    // ==================== TEXTURES ====================
+
+    textureKeyFor(url, uvOffset) {
+        return uvOffset ? `${url}|${uvOffset.u.toFixed(3)},${uvOffset.v.toFixed(3)}` : url;
+    }
+
+    /**
+     * Get a shared texture for a URL (and optional UV offset), adding one reference
+     * Keyed by the original URL; the file actually loaded may be a smaller tier.
+     */
+    acquireTexture(url, uvOffset = null) {
+        const key = this.textureKeyFor(url, uvOffset);
+        let entry = this.textures.get(key);
+        if (!entry) {
+            // Load the pre-built power-of-two tier when the texture pipeline has one
+            const loadUrl = this.materialsLibrary?.resolveTextureUrl
+                ? this.materialsLibrary.resolveTextureUrl(url, { engine: this.scene.getEngine() })
+                : url;
+            const texture = new BABYLON.Texture(loadUrl, this.scene);
+            texture.wrapU = BABYLON.Texture.WRAP_ADDRESSMODE;
+            texture.wrapV = BABYLON.Texture.WRAP_ADDRESSMODE;
+            if (uvOffset) {
+                texture.uOffset = uvOffset.u;
+                texture.vOffset = uvOffset.v;
+            }
+            entry = { texture, refs: 0 };
+            this.textures.set(key, entry);
+        }
+        entry.refs++;
+        return entry.texture;
+    }
+
+    releaseTexture(key) {
+        const entry = this.textures.get(key);
+        if (!entry) return;
+        entry.refs--;
+        if (entry.refs <= 0) {
+            entry.texture.dispose();
+            this.textures.delete(key);
+        }
+    }
+
+    /**
+     * Counts for debugging GPU memory growth
+     */
+    getStats() {
+        let materialRefs = 0;
+        this.materials.forEach(entry => { materialRefs += entry.refs; });
+        return {
+            materials: this.materials.size,
+            textures: this.textures.size,
+            materialRefs: materialRefs
+        };
+    }
+
+    dispose() {
+        this.materials.forEach(entry => entry.material.dispose(false, false));
+        this.textures.forEach(entry => entry.texture.dispose());
+        this.materials.clear();
+        this.materialKeys.clear();
+        this.textures.clear();
+    }
+}
+
+// Export for use
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = MaterialCache;
+}
@@ -7,6 +7,15 @@ class MaterialsLibrary {
         this.categories = null;
         this.isLoaded = false;
         this.databaseUrl = 'materials-database.json';
+        
+        // Pre-built texture tiers (scripts/build_material_textures.py)
+        this.textureManifestUrl = 'data/materials/texture-manifest.json';
+        this.textureManifest = null;
+        this.textureMaxSize = 1024; // Largest tier to request for board textures
+        
+        // Thumbnail sprite sheet (scripts/build_thumbnail_atlas.py)
+        this.thumbnailAtlasUrl = 'data/materials/thumbnail-atlas.json';
+        this.thumbnailAtlas = null;
     }
 
     /**
@@ -16,9 +25,7 @@ class MaterialsLibrary {
     async loadDatabase() {
         try {
             
-            // Add cache-busting parameter for development
-            const cacheBuster = `?v=${Date.now()}`;
-            const response = await fetch(this.databaseUrl + cacheBuster);
+            const response = await this.fetchVersioned('materials', this.databaseUrl);
             
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
@@ -38,6 +45,9 @@ class MaterialsLibrary {
             this.lumberGrades = data.lumber_grades;
             this.isLoaded = true;
             
+            // Texture tiers are optional - originals are used when there is no manifest
+            await Promise.all([this.loadTextureManifest(), this.loadThumbnailAtlas()]);
+            
             return true;
             
         } catch (error) {
@@ -46,6 +56,91 @@ class MaterialsLibrary {
         }
     }
 
+    /**
+     * Fetch a JSON database through the browser cache
+     * workspace.php publishes content-hash versions in window.CUTLIST_ASSETS; a
+     * versioned URL is cached until the file changes. Without a manifest entry the
+     * plain file is revalidated (If-None-Match -> 304) instead of refetched.
+     * @param {string} name - Manifest key (see asset-versions.php)
+     * @param {string} path - Direct path used when no manifest is available
+     * @returns {Promise<Response>}
+     */
+    fetchVersioned(name, path) {
+        const asset = typeof window !== 'undefined' ? window.CUTLIST_ASSETS?.[name] : null;
+        if (asset?.version) {
+            return fetch(asset.url);
+        }
+        return fetch(path, { cache: 'no-cache' });
+    }
+
+    /**
+     * Load the texture tier manifest written by the offline texture pipeline
+     * @returns {Promise<boolean>} Whether a manifest is available
+     */
+    async loadTextureManifest() {
+        try {
+            const response = await this.fetchVersioned('texture-manifest', this.textureManifestUrl);
+            if (!response.ok) {
+                this.textureManifest = null;
+                return false;
+            }
+            this.textureManifest = await response.json();
+            return true;
+        } catch (error) {
+            this.textureManifest = null;
+            return false;
+        }
+    }
+
+    /**
+     * Load the thumbnail atlas index and start fetching the sheet
+     * @returns {Promise<boolean>} Whether an atlas is available
+     */
+    async loadThumbnailAtlas() {
+        try {
+            const response = await this.fetchVersioned('thumbnail-atlas', this.thumbnailAtlasUrl);
+            if (!response.ok) {
+                this.thumbnailAtlas = null;
+                return false;
+            }
+            this.thumbnailAtlas = await response.json();
+            
+            // Warm the cache so the modal's first paint doesn't wait on the sheet
+            if (typeof Image !== 'undefined') {
+                const sheet = new Image();
+                sheet.src = this.thumbnailAtlas.image;
+            }
+            return true;
+        } catch (error) {
+            this.thumbnailAtlas = null;
+            return false;
+        }
+    }
+
+    /**
+     * Get the atlas cell for a material thumbnail as CSS background values
+     * Returns null when there is no atlas or the cell is stale (thumbnail changed
+     * since the atlas was built) - callers fall back to the individual image.
+     * @param {string} materialId - Material identifier
+     * @returns {Object|null} { image, size, position } for background-image/-size/-position
+     */
+    getThumbnailSprite(materialId) {
+        const atlas = this.thumbnailAtlas;
+        const cell = atlas?.materials?.[materialId];
+        if (!cell) return null;
+        
+        const material = this.getMaterial(materialId);
+        if (!material || material.visual_assets?.thumbnail !== cell.source) return null;
+        
+        const x = atlas.columns > 1 ? (cell.column / (atlas.columns - 1)) * 100 : 0;
+        const y = atlas.rows > 1 ? (cell.row / (atlas.rows - 1)) * 100 : 0;
+        return {
+            image: atlas.image,
+            size: `${atlas.columns * 100}% ${atlas.rows * 100}%`,
+            position: `${x}% ${y}%`
+        };
+    }
+
     /**
      * Get all available categories
      * @returns {Array} Array of category objects
@@ -276,12 +371,73 @@ class MaterialsLibrary {
 
     /**
      * Get material texture paths for 3D rendering
+     * Without options the stored visual_assets are returned unchanged; with options
+     * the diffuse texture and variants are swapped for their pre-built tiers.
      * @param {string} materialId - Material identifier
+     * @param {Object} options - Optional tier selection ({ maxSize, compressed, engine })
      * @returns {Object} Texture file paths
      */
-    getTexturePaths(materialId) {
+    getTexturePaths(materialId, options = null) {
         const material = this.getMaterial(materialId);
-        return material ? material.visual_assets : null;
+        if (!material) return null;
+        if (!options) return material.visual_assets;
+        
+        const assets = material.visual_assets || {};
+        return {
+            ...assets,
+            texture_diffuse: this.resolveTextureUrl(assets.texture_diffuse, options),
+            texture_variants: (assets.texture_variants || []).map(url => this.resolveTextureUrl(url, options))
+        };
+    }
+
+    /**
+     * Whether KTX2 textures end up GPU-compressed on this engine
+     * Basis transcodes to ASTC, BC7, S3TC or ETC; without any of them it falls back
+     * to uncompressed RGBA, which is bigger and slower than the JPEG/WebP tiers.
+     * @param {BABYLON.Engine} engine
+     * @returns {boolean}
+     */
+    canUseKtx2(engine) {
+        if (!engine || typeof BABYLON === 'undefined' || !BABYLON.KhronosTextureContainer2) return false;
+        if (BABYLON.KhronosTextureContainer2.IsSupported === false) return false; // No Web Workers / WASM
+        
+        const caps = engine.getCaps();
+        return !!(caps.astc || caps.bptc || caps.s3tc || caps.etc2 || caps.etc1);
+    }
+
+    /**
+     * Map an original texture URL to the best pre-built tier from the manifest
+     * Prefers KTX2 (mipmapped, GPU-compressed) when the engine can transcode it to a
+     * compressed format it supports, then the largest power-of-two WebP/JPEG tier not
+     * above maxSize. Unknown URLs pass through.
+     * @param {string} url - Original texture path (as stored in visual_assets)
+     * @param {Object} options - { maxSize: number, compressed: boolean, engine: BABYLON.Engine }
+     * @returns {string} Texture path to load
+     */
+    resolveTextureUrl(url, options = {}) {
+        if (!url || !this.textureManifest?.materials) return url;
+        
+        let entry = null;
+        for (const material of Object.values(this.textureManifest.materials)) {
+            if (material.textures && material.textures[url]) {
+                entry = material.textures[url];
+                break;
+            }
+        }
+        if (!entry) return url;
+        
+        const compressed = options.compressed !== false;
+        if (compressed && entry.ktx2 && this.canUseKtx2(options.engine)) {
+            return entry.ktx2;
+        }
+        
+        const tiers = entry.tiers || [];
+        if (tiers.length === 0) return url;
+        
+        // Tiers are sorted largest first
+        const maxSize = options.maxSize || this.textureMaxSize;
+        const tier = tiers.find(t => t.size <= maxSize) || tiers[tiers.length - 1];
+        return tier.webp || tier.jpeg || url;
     }
 
     /**
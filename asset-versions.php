@@ -0,0 +1,115 @@
+<?php
+/**
+ * Asset Versions - Content-hash versioning for scripts and JSON databases
+ * Included by workspace.php. URLs only change when file contents change, so
+ * repeat visits are served from the browser cache instead of refetching
+ * everything on every page load.
+ */
+
+define('ASSET_VERSION_CACHE', __DIR__ . '/data/asset-versions.json');
+
+/**
+ * JSON databases the page loads through serve-json.php (name => path)
+ */
+function assetJsonSources() {
+    return [
+        'materials' => 'materials-database.json',
+        'texture-manifest' => 'data/materials/texture-manifest.json',
+        'thumbnail-atlas' => 'data/materials/thumbnail-atlas.json'
+    ];
+}
+
+/**
+ * Content hash for a file, memoized by mtime + size so large scripts
+ * are only rehashed after they change
+ */
+function assetVersion($path) {
+    static $cache = null;
+    static $dirty = false;
+
+    $fullPath = __DIR__ . '/' . $path;
+    if (!is_file($fullPath)) {
+        return null;
+    }
+
+    if ($cache === null) {
+        $cache = [];
+        if (is_file(ASSET_VERSION_CACHE)) {
+            $decoded = json_decode(file_get_contents(ASSET_VERSION_CACHE), true);
+            if (is_array($decoded)) {
+                $cache = $decoded;
+            }
+        }
+        // Persist new hashes once the page is done
+        register_shutdown_function(function () use (&$cache, &$dirty) {
+            if ($dirty && is_writable(dirname(ASSET_VERSION_CACHE))) {
+                file_put_contents(ASSET_VERSION_CACHE, json_encode($cache, JSON_PRETTY_PRINT | JSON_UNESCAPED_SLASHES), LOCK_EX);
+            }
+        });
+    }
+
+    clearstatcache(true, $fullPath);
+    $mtime = filemtime($fullPath);
+    $size = filesize($fullPath);
+
+    $entry = $cache[$path] ?? null;
+    if ($entry && $entry['mtime'] === $mtime && $entry['size'] === $size) {
+        return $entry['hash'];
+    }
+
+    $hash = substr(md5_file($fullPath), 0, 10);
+    $cache[$path] = ['mtime' => $mtime, 'size' => $size, 'hash' => $hash];
+    $dirty = true;
+    return $hash;
+}
+
+/**
+ * Versioned URL for a static asset (falls back to the bare path if missing)
+ */
+function assetUrl($path) {
+    $version = assetVersion($path);
+    return $version ? $path . '?v=' . $version : $path;
+}
+
+/**
+ * URL for a script entry point: the content-hashed production bundle when
+ * `npm run build` has produced one (dist/.vite/manifest.json), else the source file
+ */
+function assetEntry($source) {
+    static $buildManifest = null;
+
+    if ($buildManifest === null) {
+        $buildManifest = [];
+        $manifestPath = __DIR__ . '/dist/.vite/manifest.json';
+        if (is_file($manifestPath)) {
+            $decoded = json_decode(file_get_contents($manifestPath), true);
+            if (is_array($decoded)) {
+                $buildManifest = $decoded;
+            }
+        }
+    }
+
+    if (isset($buildManifest[$source]['file'])) {
+        // Bundle names already carry a content hash
+        return 'dist/' . $buildManifest[$source]['file'];
+    }
+    return assetUrl($source);
+}
+
+/**
+ * Manifest the page reads before loading any JSON database:
+ * { name: { path, version, url } } - url is the cacheable serve-json.php address
+ */
+function assetManifest() {
+    $manifest = [];
+    foreach (assetJsonSources() as $name => $path) {
+        $version = assetVersion($path);
+        $manifest[$name] = [
+            'path' => $path,
+            'version' => $version,
+            'url' => 'serve-json.php?name=' . rawurlencode($name) . ($version ? '&v=' . $version : '')
+        ];
+    }
+    return $manifest;
+}
+?>
@@ -1,16 +1,20 @@
 // Drawing World with Babylon.js - UPDATED FOR CAMERA FOCUS FIX
 // UNIT STANDARD: 1 unit = 1 cm (eventually selectable between metric/imperial)
 import { GridSystem } from './grid/GridSystem.js';
-import { Shape2D } from './modules/Shape2D.js?v=20250112001';
-import { CutToolSystem } from './modules/CutToolSystem.js';
-import { TheMillSystem } from './modules/TheMillSystem.js';
+import { ShaderGrid } from './grid/ShaderGrid.js';
+import { RulerCache } from './modules/RulerCache.js';
+import { Shape2D } from './modules/Shape2D.js';
 import { ViewCube } from './modules/ViewCube.js';
-import { RouterBitSystem } from './modules/RouterBitSystem.js';
-import { ScrollCuttingSystem } from './modules/ScrollCuttingSystem.js';
-import { PlaneToolSystem } from './modules/PlaneToolSystem.js';
-import { JoinToolSystem } from './modules/JoinToolSystem.js';
-import { DrillPressSystem } from './modules/DrillPressSystem.js';
+import { ToolRegistry } from './modules/ToolRegistry.js';
+import { PointerDispatcher } from './modules/PointerDispatcher.js';
+import { PickService } from './modules/PickService.js';
 import { Part } from './modules/Part.js';
+import { BenchSpatialHash } from './modules/BenchSpatialHash.js';
+import { PartInstancer } from './modules/PartInstancing.js';
+import { ThumbnailService } from './modules/ThumbnailService.js';
+import { FeatureRealizer } from './modules/PartFeatures.js';
+import { RouterProfileCache } from './modules/RouterProfileCache.js';
+import { EdgeIndexCache } from './modules/EdgeIndex.js';
 
 /**
  * Modern Gizmo System Redesign
@@ -373,18 +377,14 @@ class ModernGizmoSystem {
             const y = pointerInfo.event.clientY - rect.top;
             
             // Check if we clicked on a part
-            const partPickInfo = this.scene.pick(x, y, (mesh) => {
-                if (mesh) {
-                }
-                return mesh && mesh.partData;
-            });
+            const partPickInfo = PickService.forScene(this.scene).pickAt(x, y, (mesh) => mesh && mesh.partData, 'part');
             
             if (partPickInfo.hit && partPickInfo.pickedMesh && partPickInfo.pickedMesh.partData) {
                 this.selectPart(partPickInfo.pickedMesh.partData);
                 pointerInfo.skipOnPointerObservable = true; // Stop other handlers
             } else {
                 // Clicked on empty space - check if not clicking a gizmo
-                const gizmoPickInfo = this.scene.pick(x, y, (mesh) => mesh.isGizmo);
+                const gizmoPickInfo = PickService.forScene(this.scene).pickAt(x, y, (mesh) => mesh.isGizmo, 'gizmo');
                 if (!gizmoPickInfo.hit) {
                     // Really clicked empty space - deselect
                     if (this.selectedPart) {
@@ -404,11 +404,7 @@ class ModernGizmoSystem {
         }
         
         // Check for hover
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX,
-            this.scene.pointerY,
-            (mesh) => mesh.isGizmo
-        );
+        const pickInfo = PickService.forScene(this.scene).pick((mesh) => mesh.isGizmo, 'gizmo');
         
         if (pickInfo.hit && pickInfo.pickedMesh.gizmoHandle) {
             this.setHoveredHandle(pickInfo.pickedMesh.gizmoHandle);
@@ -421,11 +417,7 @@ class ModernGizmoSystem {
         if (pointerInfo.event.button !== 0) return; // Only left click
         
         // Do our own pick specifically for gizmos
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX,
-            this.scene.pointerY,
-            (mesh) => mesh.isGizmo
-        );
+        const pickInfo = PickService.forScene(this.scene).pick((mesh) => mesh.isGizmo, 'gizmo');
         
         if (pickInfo.hit && pickInfo.pickedMesh.isGizmo && pickInfo.pickedMesh.gizmoHandle) {
             this.startDrag(pickInfo.pickedMesh.gizmoHandle, pickInfo);
@@ -858,7 +850,7 @@ class DrawingWorld {
         
         // Materials system
         this.materialsLibrary = null;
-        this.textureCache = new Map(); // Cache for loaded textures
+        this.materialCache = null; // Shared ref-counted materials/textures (MaterialCache)
         this.boardFactory = null;
         this.projectParts = [];
         this.workBenchParts = [];
@@ -889,6 +881,35 @@ class DrawingWorld {
         // Join tool system
         this.joinToolSystem = null;
         
+        // The Mill, plane and drill press systems
+        this.theMillSystem = null;
+        this.planeToolSystem = null;
+        this.drillPressSystem = null;
+        
+        // Creates tool systems on first use and tears idle ones down
+        this.toolRegistry = new ToolRegistry(this);
+        
+        // Single pointer observer for the tool systems and the shared pick cache (created with the scene)
+        this.pointerDispatcher = null;
+        this.pickService = null;
+        
+        // Spatial hashes of part footprints per bench (spawn placement, overlap checks)
+        this.workBenchIndex = null;
+        this.assemblyBenchIndex = null;
+        
+        // Thin-instance renderer for identical parts
+        this.partInstancer = null;
+        
+        // Offscreen, batched part thumbnails for the project explorer
+        this.thumbnailService = null;
+        
+        // Bakes pending part features (drilled holes) into geometry on demand
+        this.featureRealizer = null;
+        
+        // Router caches outlive RouterBitSystem, which the tool registry tears down when idle
+        this.routerProfileCache = null;
+        this.edgeIndexCache = null;
+        
         this.init();
     }
 
@@ -899,6 +920,28 @@ class DrawingWorld {
         // Enable outline renderer for gizmo halo effect
         this.scene.outlineRenderer = new BABYLON.OutlineRenderer(this.scene);
         
+        // One pointer ray per frame, shared by hover, gizmos, tools and the coordinate readout
+        this.pickService = PickService.forScene(this.scene);
+        
+        // Routes pointer events to the active tool
+        this.pointerDispatcher = new PointerDispatcher(this.scene, () => this.activeTool);
+        
+        // Identical parts share one draw call through thin instances
+        this.partInstancer = new PartInstancer(this.scene);
+        
+        // Part thumbnails render in batches on their own target; one explorer refresh per batch
+        this.thumbnailService = new ThumbnailService(this.scene, {
+            size: 128,
+            onBatchComplete: () => this.updateWorkBenchDisplay()
+        });
+        
+        // Drilled holes stay parametric until a cut, route or save needs the geometry
+        this.featureRealizer = new FeatureRealizer(this.scene, { instancer: this.partInstancer });
+        
+        // Bit profiles, cutter geometry and per-mesh feature edges for the router tool
+        this.routerProfileCache = new RouterProfileCache();
+        this.edgeIndexCache = new EdgeIndexCache({ featureAngle: 30 });
+        
         // Set light background color
         this.scene.clearColor = new BABYLON.Color3(0.95, 0.95, 0.95);
         
@@ -921,9 +964,6 @@ class DrawingWorld {
         this.initializeViewCube();
 
         
-        // Initialize grid LOD system
-        this.initializeGridLOD();
-        
         // Set up lighting
         this.setupLighting();
         
@@ -947,25 +987,12 @@ class DrawingWorld {
         // Initialize drag handle interaction
         this.enableDragHandleInteraction();
         
-        // Initialize cut tool system
-        this.cutToolSystem = new CutToolSystem(this);
-        this.theMillSystem = new TheMillSystem(this);
-        
-        // Initialize router bit system
-        this.routerBitSystem = new RouterBitSystem(this);
-        
-        // Initialize scroll cutting system
-        this.scrollCuttingSystem = new ScrollCuttingSystem(this);
-        
-        // Initialize plane tool system
-        this.planeToolSystem = new PlaneToolSystem(this);
-        
-        
-        // Initialize join tool system
-        this.joinToolSystem = new JoinToolSystem(this);
+        // Track bench footprints so placement queries don't scan every mesh
+        this.workBenchIndex = new BenchSpatialHash(this.scene, m => m.isWorkBenchPart);
+        this.assemblyBenchIndex = new BenchSpatialHash(this.scene, m => m.isProjectPart);
         
-        // Initialize drill press system
-        this.drillPressSystem = new DrillPressSystem(this);
+        // Tool systems (cut, mill, router, scroll, plane, join, drill) are created
+        // on first activation by this.toolRegistry - see modules/ToolRegistry.js
         
         // Initialize preferences system
         this.initializePreferencesSystem();
@@ -2058,15 +2085,6 @@ class DrawingWorld {
     }
     
     drawRulerMarkings(canvas, isHorizontal) {
-        const ctx = canvas.getContext('2d');
-        
-        // Clear canvas first
-        ctx.clearRect(0, 0, canvas.width, canvas.height);
-        
-        ctx.fillStyle = '#333';
-        ctx.strokeStyle = '#666';
-        ctx.font = '10px Arial';
-        
         // Calculate pixels per inch based on orthographic camera settings
         let pixelsPerInch = 10; // Default fallback
         
@@ -2077,154 +2095,73 @@ class DrawingWorld {
             
             // viewWidth is in world units (inches), canvasWidth is in pixels
             pixelsPerInch = canvasWidth / viewWidth;
-            
         }
         
-        if (isHorizontal) {
-            // Draw horizontal ruler with offset
-            const startInch = Math.floor(-this.rulerOffsetX / pixelsPerInch);
-            const endInch = Math.ceil((canvas.width - this.rulerOffsetX) / pixelsPerInch);
-            
-            // Determine appropriate interval based on zoom level
-            let majorInterval = 12; // 1 foot
-            let minorInterval = 1;  // 1 inch
-            let showInches = true;
-            
-            if (pixelsPerInch < 5) {
-                // Very zoomed out - show only feet, every 5 or 10 feet
-                majorInterval = pixelsPerInch < 2 ? 120 : 60; // 10 feet or 5 feet
-                minorInterval = 12; // 1 foot
-                showInches = false;
-            } else if (pixelsPerInch > 50) {
-                // Very zoomed in - show fractions of inches
-                majorInterval = 1;
-                minorInterval = 0.25; // 1/4 inch
-                showInches = true;
-            }
-            
-            // Draw minor marks
-            for (let inch = Math.floor(startInch / minorInterval) * minorInterval; 
-                 inch <= endInch; 
-                 inch += minorInterval) {
-                const x = inch * pixelsPerInch + this.rulerOffsetX;
-                if (x < 0 || x > canvas.width) continue;
-                
-                ctx.beginPath();
-                ctx.moveTo(x, canvas.height);
-                ctx.lineTo(x, canvas.height - 5);
-                ctx.stroke();
-            }
-            
-            // Draw major marks and labels
-            for (let inch = Math.floor(startInch / majorInterval) * majorInterval; 
-                 inch <= endInch; 
-                 inch += majorInterval) {
-                const x = inch * pixelsPerInch + this.rulerOffsetX;
-                if (x < -50 || x > canvas.width + 50) continue;
-                
-                ctx.beginPath();
-                ctx.moveTo(x, canvas.height);
-                ctx.lineTo(x, canvas.height - 15);
-                ctx.stroke();
-                
-                // Draw labels
+        // Determine appropriate interval based on zoom level
+        let majorInterval = 12; // 1 foot
+        let minorInterval = 1;  // 1 inch
+        let showInches = true;
+        
+        if (pixelsPerInch < 5) {
+            // Very zoomed out - show only feet, every 5 or 10 feet
+            majorInterval = pixelsPerInch < 2 ? 120 : 60; // 10 feet or 5 feet
+            minorInterval = 12; // 1 foot
+            showInches = false;
+        } else if (pixelsPerInch > 50) {
+            // Very zoomed in - show fractions of inches
+            majorInterval = 1;
+            minorInterval = 0.25; // 1/4 inch
+            showInches = true;
+        }
+        
+        const offset = isHorizontal ? this.rulerOffsetX : this.rulerOffsetY;
+        
+        // Ticks and labels are blitted from the cached strip for this zoom level,
+        // so dragging the ruler doesn't re-stroke every mark
+        this.getRulerCache(isHorizontal).draw(canvas, {
+            pixelsPerUnit: pixelsPerInch,
+            offset: offset,
+            majorSpacing: majorInterval,
+            minorDivisions: Math.round(majorInterval / minorInterval),
+            formatLabel: (inch) => {
                 if (showInches && majorInterval < 12) {
                     // Show inches
-                    const label = inch === 0 ? '0' : inch + '"';
-                    ctx.fillText(label, x + 2, canvas.height - 18);
-                } else {
-                    // Show feet
-                    const feet = inch / 12;
-                    const label = feet === 0 ? '0' : feet + '"';
-                    ctx.fillText(label, x + 2, canvas.height - 18);
-                }
-            }
-            
-            // Draw zero line if visible
-            if (this.rulerOffsetX > 0 && this.rulerOffsetX < canvas.width) {
-                ctx.strokeStyle = '#f00';
-                ctx.lineWidth = 2;
-                ctx.beginPath();
-                ctx.moveTo(this.rulerOffsetX, 0);
-                ctx.lineTo(this.rulerOffsetX, canvas.height);
-                ctx.stroke();
-                ctx.strokeStyle = '#666';
-                ctx.lineWidth = 1;
-            }
-        } else {
-            // Draw vertical ruler with offset
-            const startInch = Math.floor(-this.rulerOffsetY / pixelsPerInch);
-            const endInch = Math.ceil((canvas.height - this.rulerOffsetY) / pixelsPerInch);
-            
-            // Same interval logic as horizontal
-            let majorInterval = 12;
-            let minorInterval = 1;
-            let showInches = true;
-            
-            if (pixelsPerInch < 5) {
-                majorInterval = pixelsPerInch < 2 ? 120 : 60;
-                minorInterval = 12;
-                showInches = false;
-            } else if (pixelsPerInch > 50) {
-                majorInterval = 1;
-                minorInterval = 0.25;
-                showInches = true;
-            }
-            
-            // Draw minor marks
-            for (let inch = Math.floor(startInch / minorInterval) * minorInterval; 
-                 inch <= endInch; 
-                 inch += minorInterval) {
-                const y = inch * pixelsPerInch + this.rulerOffsetY;
-                if (y < 0 || y > canvas.height) continue;
-                
-                ctx.beginPath();
-                ctx.moveTo(canvas.width, y);
-                ctx.lineTo(canvas.width - 5, y);
-                ctx.stroke();
-            }
-            
-            // Draw major marks and labels
-            for (let inch = Math.floor(startInch / majorInterval) * majorInterval; 
-                 inch <= endInch; 
-                 inch += majorInterval) {
-                const y = inch * pixelsPerInch + this.rulerOffsetY;
-                if (y < -50 || y > canvas.height + 50) continue;
-                
-                ctx.beginPath();
-                ctx.moveTo(canvas.width, y);
-                ctx.lineTo(canvas.width - 15, y);
-                ctx.stroke();
-                
-                // Draw labels
-                ctx.save();
-                ctx.translate(12, y - 2);
-                ctx.rotate(-Math.PI / 2);
-                
-                if (showInches && majorInterval < 12) {
-                    const label = inch === 0 ? '0' : inch + '"';
-                    ctx.fillText(label, 0, 0);
-                } else {
-                    const feet = inch / 12;
-                    const label = feet === 0 ? '0' : feet + '"';
-                    ctx.fillText(label, 0, 0);
+                    return inch === 0 ? '0' : inch + '"';
                 }
-                
-                ctx.restore();
+                // Show feet
+                const feet = inch / 12;
+                return feet === 0 ? '0' : feet + '"';
             }
-            
-            // Draw zero line if visible
-            if (this.rulerOffsetY > 0 && this.rulerOffsetY < canvas.height) {
-                ctx.strokeStyle = '#f00';
-                ctx.lineWidth = 2;
-                ctx.beginPath();
-                ctx.moveTo(0, this.rulerOffsetY);
-                ctx.lineTo(canvas.width, this.rulerOffsetY);
-                ctx.stroke();
-                ctx.strokeStyle = '#666';
-                ctx.lineWidth = 1;
+        });
+        
+        // Draw zero line if visible
+        const length = isHorizontal ? canvas.width : canvas.height;
+        if (offset > 0 && offset < length) {
+            const ctx = canvas.getContext('2d');
+            ctx.strokeStyle = '#f00';
+            ctx.lineWidth = 2;
+            ctx.beginPath();
+            if (isHorizontal) {
+                ctx.moveTo(offset, 0);
+                ctx.lineTo(offset, canvas.height);
+            } else {
+                ctx.moveTo(0, offset);
+                ctx.lineTo(canvas.width, offset);
             }
+            ctx.stroke();
+            ctx.strokeStyle = '#666';
+            ctx.lineWidth = 1;
+        }
+    }
+    
+    getRulerCache(isHorizontal) {
+        if (!this.rulerCaches) {
+            this.rulerCaches = {
+                top: new RulerCache({ majorLength: 15, minorLength: 5, labelBaseline: 12 }),
+                left: new RulerCache({ vertical: true, majorLength: 15, minorLength: 5, labelBaseline: 12 })
+            };
         }
+        return isHorizontal ? this.rulerCaches.top : this.rulerCaches.left;
     }
     
     removeOrthoRulers() {
@@ -2767,74 +2704,6 @@ class DrawingWorld {
     
     
     
-    // Grid clipping function - REMOVED
-    // New approach: generate grid lines that are guaranteed to be in front of camera
-    // instead of clipping lines that extend behind the camera
-    
-    initializeGridLOD() {
-        // Metric measurement scale (in cm - 1 unit = 1 cm)
-        this.gridScales = [
-            { minor: 0.1, major: 1, label: "1mm" },        // Finest detail - 1mm minor, 1cm major
-            { minor: 0.2, major: 2, label: "2mm" },        
-            { minor: 0.5, major: 5, label: "5mm" },        
-            { minor: 1, major: 10, label: "1cm" },         // 1cm minor, 10cm major
-            { minor: 2, major: 20, label: "2cm" },         
-            { minor: 5, major: 50, label: "5cm" },         
-            { minor: 10, major: 100, label: "10cm" },      // 10cm minor, 1m major
-            { minor: 20, major: 200, label: "20cm" },      
-            { minor: 50, major: 500, label: "50cm" },      
-            { minor: 100, major: 1000, label: "1m" },      // 1m minor, 10m major
-            { minor: 200, major: 2000, label: "2m" },      
-            { minor: 500, major: 5000, label: "5m" },      
-            { minor: 1000, major: 10000, label: "10m" }    // Large scale
-        ];
-        
-        this.currentGridScale = 0;
-        this.currentGridInfo = this.gridScales[0];
-    }
-    
-    updateGridLOD() {
-        const cameraDistance = this.camera.radius;
-        
-        // Calculate appropriate grid scale based on camera distance
-        // The goal is to keep minor grid lines at a reasonable screen density
-        let targetScale = 0;
-        
-        // Scale selection based on camera distance (cm units)
-        if (cameraDistance < 5) targetScale = 0;        // 1mm
-        else if (cameraDistance < 10) targetScale = 1;   // 2mm
-        else if (cameraDistance < 20) targetScale = 2;   // 5mm
-        else if (cameraDistance < 50) targetScale = 3;   // 1cm
-        else if (cameraDistance < 100) targetScale = 4;  // 2cm
-        else if (cameraDistance < 200) targetScale = 5;  // 5cm
-        else if (cameraDistance < 500) targetScale = 6;  // 10cm
-        else if (cameraDistance < 1000) targetScale = 7; // 20cm
-        else if (cameraDistance < 2000) targetScale = 8; // 50cm
-        else if (cameraDistance < 5000) targetScale = 9; // 1m
-        else if (cameraDistance < 10000) targetScale = 10; // 2m
-        else if (cameraDistance < 20000) targetScale = 11; // 5m
-        else targetScale = 12; // 10m
-        
-        // Only update if scale changed
-        if (targetScale !== this.currentGridScale) {
-            this.currentGridScale = targetScale;
-            this.currentGridInfo = this.gridScales[targetScale];
-            
-            // Update properties panel
-            this.updateGridProperties();
-            
-
-        }
-    }
-    
-    updateGridProperties() {
-        const gridInfoElement = document.getElementById('grid-info');
-        if (gridInfoElement) {
-            gridInfoElement.textContent = `Grid: ${this.currentGridInfo.label}`;
-        }
-    }
-    
-
     createAxes() {
         // X axis (red)
         const xAxis = BABYLON.MeshBuilder.CreateLines('xAxis', {
@@ -3233,6 +3102,30 @@ class DrawingWorld {
         });
     }
 
+    /**
+     * Load and construct a tool system the first time it is needed
+     * Idle systems are torn down again by the registry after a while.
+     * @param {string} key - Entry in TOOL_MODULES (cut, mill, router, scroll, plane, join, drill)
+     * @returns {Promise<Object>} The tool system instance
+     */
+    loadToolSystem(key) {
+        return this.toolRegistry.load(key);
+    }
+    
+    /**
+     * Run a tool activation once its system is loaded, unless the user has
+     * switched to another tool while the chunk was downloading
+     */
+    withToolSystem(key, toolName, callback) {
+        this.loadToolSystem(key)
+            .then(system => {
+                if (this.activeTool === toolName) {
+                    callback(system);
+                }
+            })
+            .catch(error => console.error(`Failed to load ${key} tool:`, error));
+    }
+
     selectSketchTool(toolName) {
         
         if (toolName === 'sketch') {
@@ -3289,7 +3182,7 @@ class DrawingWorld {
             this.updateToolButtonStates();
             
             // Activate cut tool system
-            this.cutToolSystem.activate('rip');
+            this.withToolSystem('cut', 'rip-cut', cutTool => cutTool.activate('rip'));
             
             // Show instruction in UI
             const selectionInfo = document.getElementById('selection-info');
@@ -3309,7 +3202,7 @@ class DrawingWorld {
             this.updateToolButtonStates();
             
             // Activate cut tool system
-            this.cutToolSystem.activate('cross');
+            this.withToolSystem('cut', 'cross-cut', cutTool => cutTool.activate('cross'));
             
             // Show instruction in UI
             const selectionInfo = document.getElementById('selection-info');
@@ -3426,16 +3319,18 @@ class DrawingWorld {
             // Update button visual state
             this.updateToolButtonStates();
             
-            // Activate router bit system with default roundover profile
-            this.routerBitSystem.activate('roundover');
-            
-            // If a part is already selected, focus edge detection on that part
-            if (this.selectedPart) {
-                const selectedMesh = this.scene.meshes.find(m => m.partData === this.selectedPart);
-                if (selectedMesh) {
-                    this.routerBitSystem.setFocusPart(selectedMesh);
+            this.withToolSystem('router', 'router', routerBitSystem => {
+                // Activate router bit system with default roundover profile
+                routerBitSystem.activate('roundover');
+                
+                // If a part is already selected, focus edge detection on that part
+                if (this.selectedPart) {
+                    const selectedMesh = this.scene.meshes.find(m => m.partData === this.selectedPart);
+                    if (selectedMesh) {
+                        routerBitSystem.setFocusPart(selectedMesh);
+                    }
                 }
-            }
+            });
             
             // Show instruction in UI
             const selectionInfo = document.getElementById('selection-info');
@@ -3458,41 +3353,43 @@ class DrawingWorld {
             // Update button visual state
             this.updateToolButtonStates();
             
-            // Check if a part is selected
-            if (this.selectedPart) {
-                const selectedMesh = this.scene.meshes.find(m => m.partData === this.selectedPart);
-                if (selectedMesh && selectedMesh.isWorkBenchPart) {
-                    // Activate scroll cutting on the selected part
-                    const success = this.scrollCuttingSystem.activate(selectedMesh);
-                    if (success) {
+            this.withToolSystem('scroll', 'scroll-cut', scrollCuttingSystem => {
+                // Check if a part is selected
+                if (this.selectedPart) {
+                    const selectedMesh = this.scene.meshes.find(m => m.partData === this.selectedPart);
+                    if (selectedMesh && selectedMesh.isWorkBenchPart) {
+                        // Activate scroll cutting on the selected part
+                        const success = scrollCuttingSystem.activate(selectedMesh);
+                        if (success) {
+                        } else {
+                            console.warn('🎨 Failed to activate scroll cutting');
+                        }
                     } else {
-                        console.warn('🎨 Failed to activate scroll cutting');
+                        console.warn('🎨 Selected part is not suitable for scroll cutting');
                     }
                 } else {
-                    console.warn('🎨 Selected part is not suitable for scroll cutting');
-                }
-            } else {
-                // No part selected - try to find any workbench part
-                const workBenchParts = this.workBenchParts.filter(part => part.isWorkBenchPart);
+                    // No part selected - try to find any workbench part
+                    const workBenchParts = this.workBenchParts.filter(part => part.isWorkBenchPart);
                 
-                if (workBenchParts.length > 0) {
-                    // Use the first workbench part
-                    const firstPart = workBenchParts[0];
-                    const success = this.scrollCuttingSystem.activate(firstPart);
-                    if (success) {
+                    if (workBenchParts.length > 0) {
+                        // Use the first workbench part
+                        const firstPart = workBenchParts[0];
+                        const success = scrollCuttingSystem.activate(firstPart);
+                        if (success) {
+                        } else {
+                            console.warn('🎨 Failed to activate scroll cutting on first workbench part');
+                        }
                     } else {
-                        console.warn('🎨 Failed to activate scroll cutting on first workbench part');
-                    }
-                } else {
-                    console.warn('🎨 No workbench parts available for scroll cutting');
+                        console.warn('🎨 No workbench parts available for scroll cutting');
                     
-                    // Show message to select a part first
-                    const selectionInfo = document.getElementById('selection-info');
-                    if (selectionInfo) {
-                        selectionInfo.innerHTML = '<strong style="color: red;">⚠️ No Parts Available</strong><br><span style="font-size: 0.9em;">Please add a part to the workbench first to use scroll cutting.</span>';
+                        // Show message to select a part first
+                        const selectionInfo = document.getElementById('selection-info');
+                        if (selectionInfo) {
+                            selectionInfo.innerHTML = '<strong style="color: red;">⚠️ No Parts Available</strong><br><span style="font-size: 0.9em;">Please add a part to the workbench first to use scroll cutting.</span>';
+                        }
                     }
                 }
-            }
+            });
             
         } else if (toolName === 'plane') {
             // Activate planing tool for thickness reduction
@@ -3506,7 +3403,7 @@ class DrawingWorld {
             this.updateToolButtonStates();
             
             // Activate plane tool system
-            this.planeToolSystem.activate();
+            this.withToolSystem('plane', 'plane', planeTool => planeTool.activate());
             
             // Show instruction in UI
             const selectionInfo = document.getElementById('selection-info');
@@ -3526,7 +3423,7 @@ class DrawingWorld {
             this.updateToolButtonStates();
             
             // Activate join tool system
-            this.joinToolSystem.activate();
+            this.withToolSystem('join', 'join', joinTool => joinTool.activate());
             
             // Show instruction in UI
             const selectionInfo = document.getElementById('selection-info');
@@ -3546,7 +3443,7 @@ class DrawingWorld {
             this.updateToolButtonStates();
             
             // Activate drill press system
-            this.drillPressSystem.activate();
+            this.withToolSystem('drill', 'drill', drillPress => drillPress.activate());
             
             // Show instruction in UI
             const selectionInfo = document.getElementById('selection-info');
@@ -4160,7 +4057,7 @@ class DrawingWorld {
             const y = event.clientY - rect.top;
             
             // Pick the sketch ground for preview
-            const pickInfo = this.scene.pick(x, y, (mesh) => mesh.name === 'sketchGround');
+            const pickInfo = this.pickService.pickAt(x, y, (mesh) => mesh.name === 'sketchGround', 'sketch-ground');
             
             if (pickInfo.hit) {
                 // Apply grid snapping to preview point (half-grid if Shift is held)
@@ -4226,9 +4123,7 @@ class DrawingWorld {
         }
         
         // Hide the main grid when in sketch mode
-        if (this.gridSystem.gridGround) {
-            this.gridSystem.gridGround.setEnabled(false);
-        }
+        this.gridSystem.hide();
         
         // DIM NON-SKETCH MESHES BUT KEEP THEM VISIBLE FOR REFERENCE
         this.scene.meshes.forEach(mesh => {
@@ -4238,10 +4133,14 @@ class DrawingWorld {
             if (!mesh.name.includes('Plane') && mesh.name !== 'sketchGround' && !isSketchShape) {
                 // Dim background objects instead of hiding them
                 if (mesh.material && !mesh.originalAlpha) {
-                    // Store original alpha for restoration later
-                    mesh.originalAlpha = mesh.material.alpha !== undefined ? mesh.material.alpha : 1.0;
-                    // Dim to 30% opacity
-                    mesh.material.alpha = mesh.originalAlpha * 0.3;
+                    // Materials are shared between parts - dim each material only once
+                    if (mesh.material.originalAlpha === undefined) {
+                        // Store original alpha for restoration later
+                        mesh.material.originalAlpha = mesh.material.alpha !== undefined ? mesh.material.alpha : 1.0;
+                        // Dim to 30% opacity
+                        mesh.material.alpha = mesh.material.originalAlpha * 0.3;
+                    }
+                    mesh.originalAlpha = mesh.material.originalAlpha;
                 }
                 // Make them non-pickable during sketch mode
                 mesh.isPickable = false;
@@ -4265,57 +4164,26 @@ class DrawingWorld {
     }
     
     createSketchGridLines() {
-        // Create grid lines for sketch mode - positioned on the sketch surface
-        const gridSize = 300; // 300cm grid (3 meters) - large area for sketching
-        const divisions = 60; // 60 divisions = 5cm spacing
-        const lineSpacing = gridSize / divisions;
+        // Grid for sketch mode - drawn on the sketch surface by a single shader quad
+        const lineSpacing = 5; // 5cm spacing
         
         // Store grid spacing for snapping
         this.gridSpacing = lineSpacing; // 5cm
         this.halfGridSpacing = lineSpacing / 2; // 2.5cm
         
-        this.sketchGridLines = [];
-        
-        // Get the sketch surface position and orientation
-        const surfacePosition = this.currentSketchSurface.point;
-        const surfaceNormal = this.currentSketchSurface.normal;
-        
-        // Create grid material
-        const gridMaterial = new BABYLON.StandardMaterial('sketchGridMaterial', this.scene);
-        gridMaterial.diffuseColor = new BABYLON.Color3(0.7, 0.7, 0.7);
-        gridMaterial.emissiveColor = new BABYLON.Color3(0.7, 0.7, 0.7);
-        gridMaterial.disableLighting = true;
-        gridMaterial.alpha = 0.8;
-        
         // Use sketch coordinate system for proper grid orientation
-        const right = this.sketchRight;
-        const up = this.sketchUp;
-        
-        // Create horizontal lines (along the right direction)
-        for (let i = 0; i <= divisions; i++) {
-            const upOffset = -gridSize/2 + i * lineSpacing;
-            const start = surfacePosition.add(right.scale(-gridSize/2)).add(up.scale(upOffset));
-            const end = surfacePosition.add(right.scale(gridSize/2)).add(up.scale(upOffset));
-            
-            const points = [start, end];
-            const line = BABYLON.MeshBuilder.CreateLines(`sketchGridH${i}`, {points: points}, this.scene);
-            line.material = gridMaterial;
-            line.isPickable = false;
-            this.sketchGridLines.push(line);
-        }
-        
-        // Create vertical lines (along the up direction)
-        for (let i = 0; i <= divisions; i++) {
-            const rightOffset = -gridSize/2 + i * lineSpacing;
-            const start = surfacePosition.add(right.scale(rightOffset)).add(up.scale(-gridSize/2));
-            const end = surfacePosition.add(right.scale(rightOffset)).add(up.scale(gridSize/2));
-            
-            const points = [start, end];
-            const line = BABYLON.MeshBuilder.CreateLines(`sketchGridV${i}`, {points: points}, this.scene);
-            line.material = gridMaterial;
-            line.isPickable = false;
-            this.sketchGridLines.push(line);
-        }
+        this.sketchGrid = new ShaderGrid(this.scene, this.camera, {
+            name: 'sketchGrid',
+            origin: this.currentSketchSurface.point,
+            axisU: this.sketchRight,
+            axisV: this.sketchUp,
+            minorSpacing: lineSpacing,
+            majorEvery: 10,
+            minorColor: new BABYLON.Color3(0.7, 0.7, 0.7),
+            majorColor: new BABYLON.Color3(0.5, 0.5, 0.5),
+            minorOpacity: 1.0,
+            opacity: 0.8
+        });
     }
     
     snapToGrid(point, useHalfGrid = false) {
@@ -4394,102 +4262,33 @@ class DrawingWorld {
     }
     
     createLineGrid() {
-
-        
-        const gridSize = 20;
-        const lineSpacing = 1;
-        
         // Grid center at the surface origin (picked point) - CRITICAL for 3D geometry placement
-        const gridCenter = this.sketchOrigin.clone();
-
-        
-        // Create arrays to hold all line segments
-        const verticalLines = [];
-        const horizontalLines = [];
-        
-
-        
-        // Create grid lines aligned with the surface coordinate system
-        for (let i = -gridSize; i <= gridSize; i += lineSpacing) {
-            // Vertical lines (along sketch Up direction)
-            const vStart = gridCenter
-                .add(this.sketchRight.scale(i))
-                .add(this.sketchUp.scale(-gridSize));
-            const vEnd = gridCenter
-                .add(this.sketchRight.scale(i))
-                .add(this.sketchUp.scale(gridSize));
-            verticalLines.push([vStart, vEnd]);
-            
-            // Horizontal lines (along sketch Right direction)
-            const hStart = gridCenter
-                .add(this.sketchRight.scale(-gridSize))
-                .add(this.sketchUp.scale(i));
-            const hEnd = gridCenter
-                .add(this.sketchRight.scale(gridSize))
-                .add(this.sketchUp.scale(i));
-            horizontalLines.push([hStart, hEnd]);
-        }
-        
-
-        
-        // Log first few line positions for debugging
-        if (verticalLines.length > 0) {
-
-        }
-        if (horizontalLines.length > 0) {
-
+        if (this.sketchGrid) {
+            this.sketchGrid.dispose();
         }
         
-        // Create line systems for better performance
-        const verticalLineSystem = BABYLON.MeshBuilder.CreateLineSystem("verticalSketchGrid", {
-            lines: verticalLines
-        }, this.scene);
-        verticalLineSystem.color = new BABYLON.Color3(0.6, 0.6, 0.6); // Grid lines
-        verticalLineSystem.isPickable = false;
-        
-        const horizontalLineSystem = BABYLON.MeshBuilder.CreateLineSystem("horizontalSketchGrid", {
-            lines: horizontalLines
-        }, this.scene);
-        horizontalLineSystem.color = new BABYLON.Color3(0.6, 0.6, 0.6); // Grid lines
-        horizontalLineSystem.isPickable = false;
-        
-        // Create center axis lines with different colors
-        const centerLines = [];
-        
-        // X axis (red) - along surface Right direction
-        centerLines.push(BABYLON.MeshBuilder.CreateLines("sketchCenterX", {
-            points: [
-                gridCenter.add(this.sketchRight.scale(-gridSize)),
-                gridCenter.add(this.sketchRight.scale(gridSize))
-            ]
-        }, this.scene));
-        centerLines[0].color = new BABYLON.Color3(0.9, 0.2, 0.2); // Red
-        centerLines[0].isPickable = false;
-        
-        // Y axis (green) - along surface Up direction
-        centerLines.push(BABYLON.MeshBuilder.CreateLines("sketchCenterY", {
-            points: [
-                gridCenter.add(this.sketchUp.scale(-gridSize)),
-                gridCenter.add(this.sketchUp.scale(gridSize))
-            ]
-        }, this.scene));
-        centerLines[1].color = new BABYLON.Color3(0.2, 0.9, 0.2); // Green
-        centerLines[1].isPickable = false;
-        
-        // Store all grid elements for cleanup
-        this.sketchGridLines = [verticalLineSystem, horizontalLineSystem, ...centerLines];
+        // Grid aligned with the surface coordinate system, with red/green center axes
+        this.sketchGrid = new ShaderGrid(this.scene, this.camera, {
+            name: 'sketchGrid',
+            origin: this.sketchOrigin,
+            axisU: this.sketchRight,
+            axisV: this.sketchUp,
+            minorSpacing: 1,
+            majorEvery: 10,
+            minorColor: new BABYLON.Color3(0.6, 0.6, 0.6),
+            majorColor: new BABYLON.Color3(0.45, 0.45, 0.45),
+            minorOpacity: 1.0,
+            showAxes: true
+        });
         
         // Add fade-in effect for grid
         this.animateGridFadeIn();
-        
-
     }
     
     animateGridFadeIn() {
         // Start with invisible grid
-        this.sketchGridLines.forEach(gridLine => {
-            gridLine.alpha = 0;
-        });
+        const grid = this.sketchGrid;
+        grid.setOpacity(0);
         
         // Beautiful slow fade-in synchronized with camera movement
         const fadeInDuration = 1800; // 1.8 seconds for gentle appearance
@@ -4510,10 +4309,11 @@ class DrawingWorld {
             // Beautiful ease-in-out effect
             const easedProgress = this.easeInOutCubic(fadeProgress);
             
-            // Update alpha of all grid lines with gentle fade
-            this.sketchGridLines.forEach(gridLine => {
-                gridLine.alpha = easedProgress * 0.8; // Slightly more subtle than full opacity
-            });
+            // Stop if the grid was removed mid-fade
+            if (!grid.material) return;
+            
+            // Update grid opacity with gentle fade
+            grid.setOpacity(easedProgress * 0.8); // Slightly more subtle than full opacity
             
             if (fadeProgress < 1) {
                 requestAnimationFrame(fadeIn);
@@ -5262,20 +5062,9 @@ class DrawingWorld {
             this.sketchGrid = null;
         }
         
-        // Remove sketch grid lines
-        if (this.sketchGridLines) {
-            this.sketchGridLines.forEach(line => line.dispose());
-            this.sketchGridLines = null;
-        }
-        
         // Re-enable the main grid
         if (this.grid.isVisible) {
-            if (this.gridSystem.gridGround) {
-                // Dispose and recreate grid to ensure visibility
-                this.gridSystem.recreate();
-            } else {
-                this.gridSystem.updateDynamicGrid();
-            }
+            this.gridSystem.show();
         }
         
         // Make all hidden meshes visible and pickable again
@@ -5291,7 +5080,10 @@ class DrawingWorld {
             }
             // Restore original alpha for dimmed background objects
             if (mesh.originalAlpha !== undefined && mesh.material) {
-                mesh.material.alpha = mesh.originalAlpha;
+                if (mesh.material.originalAlpha !== undefined) {
+                    mesh.material.alpha = mesh.material.originalAlpha;
+                    mesh.material.originalAlpha = undefined;
+                }
                 mesh.originalAlpha = undefined; // Clean up
                 mesh.isPickable = true; // Re-enable picking
             }
@@ -5537,14 +5329,15 @@ class DrawingWorld {
             const scientificName = material.basic_info?.scientific_name || material.species || '';
             const pricePerBF = material.cost_structure?.base_price_bf || 'N/A';
             
-            // Debug logging for thumbnails
-            if (material.visual_assets?.thumbnail) {
-            } else {
-            }
+            // One shared sprite sheet for every card; individual image only if the atlas lacks this material
+            const sprite = this.materialsLibrary.getThumbnailSprite?.(materialId);
+            const imageHtml = sprite
+                ? `<div class="material-sprite" role="img" aria-label="${materialName}" style="background-image: url('${sprite.image}'); background-size: ${sprite.size}; background-position: ${sprite.position};"></div>`
+                : `<img src="${thumbnail}" alt="${materialName}" loading="lazy" onerror="this.style.display='none'; console.error('Failed to load material image:', this.src)">`;
             
             card.innerHTML = `
                 <div class="material-image">
-                    <img src="${thumbnail}" alt="${materialName}" loading="lazy" onerror="this.style.display='none'; console.error('Failed to load material image:', this.src)">
+                    ${imageHtml}
                 </div>
                 <div class="material-info">
                     <h4>${materialName}</h4>
@@ -6002,13 +5795,15 @@ class DrawingWorld {
         const x = event.clientX - rect.left;
         const y = event.clientY - rect.top;
         
-        // Get 3D coordinates from mouse position
-        const pickInfo = this.scene.pick(x, y);
-        if (pickInfo.hit) {
-            const pos = pickInfo.pickedPoint;
-            document.getElementById('coordinates').textContent = 
-                `X: ${pos.x.toFixed(2)}, Y: ${pos.y.toFixed(2)}, Z: ${pos.z.toFixed(2)}`;
-        }
+        // Get 3D coordinates from mouse position (GPU-picked on large scenes;
+        // null means a newer mouse move already replaced this request)
+        this.pickService.pickAsync(x, y).then(pickInfo => {
+            if (pickInfo && pickInfo.hit) {
+                const pos = pickInfo.pickedPoint;
+                document.getElementById('coordinates').textContent = 
+                    `X: ${pos.x.toFixed(2)}, Y: ${pos.y.toFixed(2)}, Z: ${pos.z.toFixed(2)}`;
+            }
+        }).catch(error => console.error('Coordinate pick failed:', error));
     }
     
     updateSketchPreviewWithPoint(point) {
@@ -6172,11 +5967,7 @@ class DrawingWorld {
         // Allow hover handling even when something is selected
         // This lets users see other selectable shapes
         
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX, 
-            this.scene.pointerY, 
-            (mesh) => this.isSelectableFace(mesh)
-        );
+        const pickInfo = this.pickService.pick((mesh) => this.isSelectableFace(mesh), 'selectable-face');
         
         if (pickInfo.hit && pickInfo.pickedMesh) {
             const face = pickInfo.pickedMesh;
@@ -6203,15 +5994,8 @@ class DrawingWorld {
             return;
         }
         
-        // First check what we're hitting without filter
-        const anyPick = this.scene.pick(this.scene.pointerX, this.scene.pointerY);
-        
         // Check for parts with partData first (higher priority)
-        const partPickInfo = this.scene.pick(
-            this.scene.pointerX, 
-            this.scene.pointerY, 
-            (mesh) => mesh && mesh.partData
-        );
+        const partPickInfo = this.pickService.pick((mesh) => mesh && mesh.partData, 'part');
         
         if (partPickInfo.hit && partPickInfo.pickedMesh && partPickInfo.pickedMesh.partData) {
             const partMesh = partPickInfo.pickedMesh;
@@ -6230,11 +6014,7 @@ class DrawingWorld {
         }
         
         // If no part was clicked, check for selectable faces
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX, 
-            this.scene.pointerY, 
-            (mesh) => this.isSelectableFace(mesh)
-        );
+        const pickInfo = this.pickService.pick((mesh) => this.isSelectableFace(mesh), 'selectable-face');
         
         if (pickInfo.hit && pickInfo.pickedMesh) {
             const face = pickInfo.pickedMesh;
@@ -8261,7 +8041,9 @@ class DrawingWorld {
             this.materialsLibrary = new MaterialsLibrary();
             
             // Initialize BoardFactory
-            this.boardFactory = new BoardFactory(this.scene, this.materialsLibrary);
+            this.materialCache = new MaterialCache(this.scene, this.materialsLibrary);
+            this.boardFactory = new BoardFactory(this.scene, this.materialsLibrary, this.materialCache);
+            this.boardFactory.instancer = this.partInstancer;
             
             // TEST: Verify Board system is available
             if (typeof Board !== "undefined" && typeof BoardFactory !== "undefined") {
@@ -8729,7 +8511,7 @@ class DrawingWorld {
         box.position = new BABYLON.Vector3(xPosition, thicknessCm / 2, 0);
 
         // Apply material with texture
-        box.material = this.getMaterialColor(part.materialId);
+        this.applyPartMaterial(box, part.materialId, part);
 
         // Store reference
         box.partData = part;
@@ -8749,32 +8531,11 @@ class DrawingWorld {
 
     }
 
-    getMaterialColor(materialId) {
-        const uniqueId = Date.now() + "_" + Math.random().toString(36).substr(2, 9);
-        // Creating unique material instance
-        const material = new BABYLON.StandardMaterial(materialId + "_material_" + uniqueId, this.scene);
-        
-        
-        
-        // Try to get texture from materials database
-        if (this.materialsLibrary) {
-            const materialData = this.materialsLibrary.getMaterial(materialId);
-            if (materialData && materialData.visual_assets && materialData.visual_assets.texture_diffuse) {
-                // Loading texture from materials database
-                
-                try {
-                    const texture = new BABYLON.Texture(materialData.visual_assets.texture_diffuse, this.scene);
-                    material.diffuseTexture = texture;
-                    material.specularColor = new BABYLON.Color3(0.1, 0.1, 0.1); // Low shine for wood
-                    // Texture loaded successfully
-                    return material;
-                } catch (error) {
-                    console.warn("Failed to load texture for " + materialId + ", using fallback color");
-                }
-            }
-        }
-        
-        // Fallback to solid colors if texture fails
+    /**
+     * Descriptor for the shared material of a part (see MaterialCache)
+     */
+    getPartMaterialDescriptor(materialId, part = null) {
+        // Fallback to solid colors if the material has no texture
         const colorMap = {
             'walnut_001': new BABYLON.Color3(0.36, 0.25, 0.22), // Dark brown
             'maple_001': new BABYLON.Color3(0.96, 0.96, 0.86),   // Light cream
@@ -8785,9 +8546,27 @@ class DrawingWorld {
             'sande_ply_001': new BABYLON.Color3(0.90, 0.84, 0.72)  // Medium tan
         };
         
-        material.diffuseColor = colorMap[materialId] || new BABYLON.Color3(0.8, 0.8, 0.8);
-        // Using solid color fallback
-        return material;
+        return {
+            materialId: materialId,
+            grade: part?.grade,
+            grain: part?.grain,
+            color: colorMap[materialId] || new BABYLON.Color3(0.8, 0.8, 0.8),
+            specular: 0.1 // Low shine for wood
+        };
+    }
+
+    /**
+     * Give a part mesh the shared material for its wood, releasing any previous one
+     */
+    applyPartMaterial(mesh, materialId, part = null) {
+        return this.materialCache.assign(mesh, this.getPartMaterialDescriptor(materialId, part));
+    }
+
+    /**
+     * Base color for a material id (no cache reference; use applyPartMaterial for meshes)
+     */
+    getMaterialColor(materialId) {
+        return this.getPartMaterialDescriptor(materialId).color;
     }
 
     // === BENCH SYSTEM METHODS ===
@@ -8898,6 +8677,9 @@ class DrawingWorld {
         this.selectedPart = targetMesh;
         
         // Update visual selection
+        if (this.partInstancer) {
+            this.partInstancer.suspend(targetMesh);
+        }
         if (targetMesh.outlineRenderer) {
             targetMesh.renderOutline = true;
             targetMesh.outlineColor = new BABYLON.Color3(0, 1, 0); // Green outline
@@ -8962,55 +8744,24 @@ class DrawingWorld {
     }
     
     /**
-     * Generate a 3D thumbnail for a part using screenshot
+     * Bake a part's pending features into its mesh before geometry-dependent work
+     * (CSG tools, serialization). Cheap no-op when nothing is pending.
      */
-    generatePartThumbnail(mesh, partData) {
-        
-        // Create a separate camera for thumbnail generation to avoid moving the main camera
-        const thumbnailCamera = new BABYLON.ArcRotateCamera(
-            "thumbnailCamera",
-            0, 0, 0,
-            BABYLON.Vector3.Zero(),
-            this.scene
-        );
+    realizePartFeatures(mesh) {
+        if (!this.featureRealizer || !this.featureRealizer.realize(mesh)) return false;
         
-        // Position thumbnail camera for isometric style
-        const meshBounds = mesh.getBoundingInfo();
-        const meshSize = meshBounds.maximum.subtract(meshBounds.minimum);
-        const meshCenter = mesh.position;
-        
-        const distance = Math.max(meshSize.x, meshSize.y, meshSize.z) * 1.8;
-        thumbnailCamera.position = new BABYLON.Vector3(
-            meshCenter.x + distance * 0.8,
-            meshCenter.y + distance * 0.6,
-            meshCenter.z + distance * 0.8
-        );
-        thumbnailCamera.target = meshCenter;
-        
-        // Hide all other meshes temporarily
-        const otherMeshes = this.scene.meshes.filter(m => 
-            m !== mesh && m.isVisible && !m.name.includes('grid')
-        );
-        otherMeshes.forEach(m => m.isVisible = false);
+        this.generatePartThumbnail(mesh, mesh.partData);
+        return true;
+    }
+    
+    /**
+     * Queue a 3D thumbnail for a part (rendered offscreen with the next batch)
+     */
+    generatePartThumbnail(mesh, partData) {
+        if (!this.thumbnailService) return;
         
-        // Generate thumbnail using the separate camera (no main camera movement!)
-        setTimeout(() => {
-            BABYLON.ScreenshotTools.CreateScreenshot(
-                this.engine,
-                thumbnailCamera,
-                { width: 128, height: 128 },
-                (data) => {
-                    partData.thumbnail = data;
-                    
-                    // Update the project explorer to show the new thumbnail
-                    this.updateWorkBenchDisplay();
-                    
-                    // Restore scene state and cleanup
-                    otherMeshes.forEach(m => m.isVisible = true);
-                    thumbnailCamera.dispose(); // Clean up the temporary camera
-                }
-            );
-        }, 50); // Brief delay to ensure proper render
+        // Current thumbnails (saved with the project or cached) are reused as-is
+        this.thumbnailService.request(mesh, partData);
     }
 
     updateProjectPartsDisplay() {
@@ -9166,49 +8917,25 @@ class DrawingWorld {
             mesh.rotation = new BABYLON.Vector3(meshData.rotation.x, meshData.rotation.y, meshData.rotation.z);
             mesh.scaling = new BABYLON.Vector3(meshData.scaling.x, meshData.scaling.y, meshData.scaling.z);
             
-            // Restore material
+            // Restore material from the shared cache
             if (meshData.material) {
-                const material = new BABYLON.StandardMaterial(meshData.material.name || "restored_material", this.scene);
-        // Apply material with texture
+                // Saved material names start with the material id ("<id>_material_...")
+                const materialName = meshData.material.name || '';
+                const materialId = materialName.includes('_material_') ? materialName.split('_material_')[0] : null;
+                const descriptor = this.getPartMaterialDescriptor(materialId);
+                
                 if (meshData.material.diffuseColor) {
-                    material.diffuseColor = new BABYLON.Color3(
+                    descriptor.color = new BABYLON.Color3(
                         meshData.material.diffuseColor.r,
                         meshData.material.diffuseColor.g,
                         meshData.material.diffuseColor.b
                     );
                 }
-                // CRITICAL FIX: Load texture from materials library for restored boards
-                const materialName = meshData.material.name;
-                if (materialName && this.materialsLibrary) {
-                    const materialId = materialName.split("_material_")[0];
-                    const materialData = this.materialsLibrary.getMaterial(materialId);
-                    if (materialData && materialData.visual_assets && materialData.visual_assets.texture_diffuse) {
-                        const texturePath = materialData.visual_assets.texture_diffuse;
-                        
-                        // Check texture cache first
-                        let texture = this.textureCache ? this.textureCache.get(texturePath) : null;
-                        if (!texture) {
-                            try {
-                                texture = new BABYLON.Texture(texturePath, this.scene);
-                                if (this.textureCache) {
-                                    this.textureCache.set(texturePath, texture);
-                                }
-                            } catch (error) {
-                                console.warn("Failed to load texture for restored mesh:", error);
-                            }
-                        } else {
-                        }
-                        
-                        if (texture) {
-                            material.diffuseTexture = texture;
-                            material.specularColor = new BABYLON.Color3(0.1, 0.1, 0.1);
-                        }
-                    } else {
-                    }
-                } else {
+                if (!materialId || !this.materialsLibrary?.getMaterial(materialId)) {
+                    descriptor.textureUrl = null; // Unknown material - keep the saved color
                 }
                 
-                mesh.material = material;
+                this.materialCache.assign(mesh, descriptor);
             }
             
             return mesh;
@@ -9244,7 +8971,7 @@ class DrawingWorld {
             
             // CRITICAL FIX: Replace restored material with properly textured material
             if (box && box.material) {
-                box.material = this.getMaterialColor(part.materialId);
+                this.applyPartMaterial(box, part.materialId, part);
             }
         }
         
@@ -9265,7 +8992,7 @@ class DrawingWorld {
             
             // Create material-specific appearance for new boxes
         // Apply material with texture
-            box.material = this.getMaterialColor(part.materialId);
+            this.applyPartMaterial(box, part.materialId, part);
 
         }
 
@@ -9297,7 +9024,7 @@ class DrawingWorld {
         }
 
         // Always apply material with texture for consistency
-        box.material = this.getMaterialColor(part.materialId || part.material?.id);
+        this.applyPartMaterial(box, part.materialId || part.material?.id, part);
 
         // Store reference
         box.partData = part;
@@ -9331,10 +9058,9 @@ class DrawingWorld {
         
         // DEBUG: Check board properties for cutting system
         
-        // DISABLED: Generate thumbnail - causes grid to shrink to thumbnail size during cuts
-        // if (!this.isLoadingProject) {
-        //     this.generatePartThumbnail(box, part);
-        // }
+        // Thumbnail renders offscreen, so the main view (and grid) is never resized.
+        // Restored parts keep their saved thumbnail unless the geometry changed.
+        this.generatePartThumbnail(box, part);
         
         // DRAMATIC REVEAL: Animate camera to showcase the new material (skip during loading)
         if (!this.isLoadingProject) {
@@ -9554,9 +9280,9 @@ class DrawingWorld {
         // Set Y position to place material on ground
         targetPosition.y = thicknessCm / 2;
         
-        // Check for collisions with existing work bench parts
-        const existingParts = this.scene.meshes.filter(m => m.isWorkBenchPart);
-        const searchRadius = Math.max(lengthCm, widthCm) + 20; // Part size + 20cm clearance
+        // Check for collisions with existing work bench parts via the footprint grid
+        const halfExtent = Math.max(lengthCm, widthCm) / 2; // Part may be placed in either orientation
+        const clearance = 10; // 10cm gap between parts
         const maxDistance = 500; // Don't search beyond 5 meters
         
         // Find the nearest available position
@@ -9574,20 +9300,14 @@ class DrawingWorld {
                 searchPos.y = thicknessCm / 2;
                 
                 // Check if this position is clear of existing parts
-                const isPositionClear = existingParts.every(part => {
-                    const distance = BABYLON.Vector3.Distance(searchPos, part.position);
-                    return distance > searchRadius;
-                });
-                
-                if (isPositionClear) {
+                if (this.workBenchIndex.isRegionFree(searchPos.x, searchPos.z, halfExtent, halfExtent, clearance)) {
                     return searchPos;
                 }
             }
         }
         
         // Fallback: use old method if no clear position found
-        const existingWorkBenchParts = this.scene.meshes.filter(m => m.isWorkBenchPart);
-        const xOffset = existingWorkBenchParts.length * (lengthCm + 10);
+        const xOffset = this.workBenchIndex.size * (lengthCm + 10);
         return new BABYLON.Vector3(xOffset, thicknessCm / 2, 0);
     }
     
@@ -9625,9 +9345,9 @@ class DrawingWorld {
         // Start with origin position
         let targetPosition = new BABYLON.Vector3(0, thicknessCm / 2, 0);
         
-        // Get existing assembly parts to check for collisions
-        const existingParts = this.scene.meshes.filter(m => m.isProjectPart);
-        const searchRadius = Math.max(lengthCm, widthCm) + 20; // Part size + 20cm clearance
+        // Existing assembly parts are checked through the footprint grid
+        const halfExtent = Math.max(lengthCm, widthCm) / 2;
+        const clearance = 10; // 10cm gap between parts
         
         // Generate search positions in expanding pattern from origin
         const searchPositions = this.generateAssemblySearchPositions(lengthCm, widthCm, thicknessCm);
@@ -9635,12 +9355,7 @@ class DrawingWorld {
         // Find the first available position
         for (let searchPos of searchPositions) {
             // Check if this position is clear of existing parts
-            const isPositionClear = existingParts.every(part => {
-                const distance = BABYLON.Vector3.Distance(searchPos, part.position);
-                return distance > searchRadius;
-            });
-            
-            if (isPositionClear) {
+            if (this.assemblyBenchIndex.isRegionFree(searchPos.x, searchPos.z, halfExtent, halfExtent, clearance)) {
                 return searchPos;
             }
         }
@@ -10100,7 +9815,7 @@ class DrawingWorld {
 
                 // Create material-specific appearance for new boxes
         // Apply material with texture
-                box.material = this.getMaterialColor(part.materialId);
+                this.applyPartMaterial(box, part.materialId, part);
     
             }
 
@@ -10134,7 +9849,7 @@ class DrawingWorld {
             // Only create material if it doesn't already exist (restored geometry has its own material)
             if (!box.material) {
         // Apply material with texture
-                box.material = this.getMaterialColor(part.materialId);
+                this.applyPartMaterial(box, part.materialId, part);
     
             }
 
@@ -10289,8 +10004,8 @@ class DrawingWorld {
         }
         
         
-        // Find the mesh for this part
-        const mesh = this.scene.meshes.find(m => m.partData === this.selectedPart);
+        // Find the mesh for this part (focusPartInScene selects the mesh itself)
+        const mesh = this.scene.meshes.find(m => m.partData === this.selectedPart || m === this.selectedPart);
         if (mesh) {
             this.setPartSelection(mesh, false);
         }
@@ -10320,6 +10035,11 @@ class DrawingWorld {
         const positionBefore = mesh.position.clone();
         
         if (isSelected) {
+            // Instanced parts don't draw their own mesh; highlights need it
+            if (this.partInstancer) {
+                this.partInstancer.suspend(mesh);
+            }
+            
             // Store original material
             mesh.originalMaterial = mesh.material;
             
@@ -10354,6 +10074,10 @@ class DrawingWorld {
             
             // Remove outline
             mesh.disableEdgesRendering();
+            
+            if (this.partInstancer) {
+                this.partInstancer.resume(mesh);
+            }
         }
         
         // DEBUG: Track position after selection
@@ -12176,8 +11900,9 @@ class DrawingWorld {
             this.ghostMesh = null;
         }
         
-        // Clone the mesh for ghost
+        // Clone the mesh for ghost (instanced parts are hidden, the ghost must not be)
         this.ghostMesh = originalMesh.clone(originalMesh.name + "_ghost");
+        this.ghostMesh.visibility = 1;
         
         // Create ghost material
         const ghostMaterial = new BABYLON.StandardMaterial("ghostMaterial", this.scene);
@@ -0,0 +1,270 @@
+// ShaderGrid.js - Procedural grid drawn by a fragment shader on a single quad
+// Replaces grids built from hundreds of line meshes. Line positions come from
+// world coordinates on the grid plane, so the quad can follow the camera for an
+// infinite grid, and line density fades analytically with screen-space
+// derivatives instead of swapping LOD meshes as the camera moves.
+//
+// Spacing is in scene units (cm): minorSpacing is the finest line spacing, every
+// majorEvery-th line is a major line, and each LOD step multiplies the spacing
+// by lodBase.
+
+const SHADER_NAME = 'cutlistGrid';
+
+BABYLON.Effect.ShadersStore[`${SHADER_NAME}VertexShader`] = `
+precision highp float;
+
+attribute vec3 position;
+
+uniform mat4 world;
+uniform mat4 viewProjection;
+
+varying vec3 vWorldPosition;
+
+void main(void) {
+    vec4 worldPosition = world * vec4(position, 1.0);
+    vWorldPosition = worldPosition.xyz;
+    gl_Position = viewProjection * worldPosition;
+}
+`;
+
+BABYLON.Effect.ShadersStore[`${SHADER_NAME}FragmentShader`] = `
+#extension GL_OES_standard_derivatives : enable
+precision highp float;
+
+varying vec3 vWorldPosition;
+
+uniform vec3 origin;
+uniform vec3 axisU;
+uniform vec3 axisV;
+uniform vec3 planeNormal;
+uniform vec3 cameraPosition;
+
+uniform vec3 minorColor;
+uniform vec3 majorColor;
+uniform vec3 axisUColor;
+uniform vec3 axisVColor;
+
+uniform float minorSpacing;
+uniform float majorEvery;
+uniform float lodBase;
+uniform float minPixels;
+uniform float opacity;
+uniform float minorOpacity;
+uniform float axisOpacity;
+uniform float belowOpacity;
+uniform float fadeDistance;
+
+// Antialiased coverage (0..1) of lines every 'spacing' units, 'width' pixels wide
+float gridCoverage(vec2 coord, vec2 derivative, float spacing, float width) {
+    vec2 distanceToLine = abs(fract(coord / spacing + 0.5) - 0.5) * spacing;
+    vec2 lines = 1.0 - clamp(distanceToLine / (derivative * width), 0.0, 1.0);
+    return max(lines.x, lines.y);
+}
+
+void main(void) {
+    vec3 relative = vWorldPosition - origin;
+    vec2 coord = vec2(dot(relative, axisU), dot(relative, axisV));
+    vec2 derivative = max(fwidth(coord), vec2(1e-6));
+
+    // LOD: finest spacing whose cells stay at least minPixels wide on screen.
+    // The fractional part fades the finest level out as the next one takes over.
+    float pixelSize = max(derivative.x, derivative.y);
+    float level = max(0.0, log(pixelSize * minPixels / minorSpacing) / log(lodBase));
+    float levelFade = fract(level);
+    float spacing = minorSpacing * pow(lodBase, floor(level));
+
+    float fine = gridCoverage(coord, derivative, spacing, 1.0) * (1.0 - levelFade);
+    float coarse = gridCoverage(coord, derivative, spacing * lodBase, 1.0);
+    float major = gridCoverage(coord, derivative, spacing * majorEvery, 1.5);
+
+    float minorAlpha = max(fine, coarse) * minorOpacity;
+    vec3 color = mix(minorColor, majorColor, major);
+    float alpha = max(minorAlpha, major);
+
+    // Axis lines through the grid origin
+    if (axisOpacity > 0.0) {
+        vec2 axisLines = 1.0 - clamp(abs(coord) / (derivative * 2.0), 0.0, 1.0);
+        float axis = max(axisLines.x, axisLines.y) * axisOpacity;
+        vec3 axisColor = axisLines.y > axisLines.x ? axisUColor : axisVColor;
+        color = mix(color, axisColor, axis);
+        alpha = max(alpha, axis);
+    }
+
+    // Fade toward the horizon and dim when seen from below the plane
+    float distanceFade = 1.0 - smoothstep(fadeDistance * 0.5, fadeDistance, length(vWorldPosition - cameraPosition));
+    float side = dot(cameraPosition - origin, planeNormal) >= 0.0 ? 1.0 : belowOpacity;
+
+    alpha *= opacity * distanceFade * side;
+    if (alpha < 0.002) {
+        discard;
+    }
+    gl_FragColor = vec4(color, alpha);
+}
+`;
+
+export class ShaderGrid {
+    /**
+     * @param {BABYLON.Scene} scene
+     * @param {BABYLON.Camera} camera
+     * @param {Object} options - {
+     *   name, minorSpacing (scene units), majorEvery, lodBase, minPixels,
+     *   minorColor, majorColor, opacity, minorOpacity, belowOpacity,
+     *   showAxes, axisUColor, axisVColor,
+     *   size: fixed quad size, or null for an infinite grid that follows the camera,
+     *   origin, axisU, axisV: grid plane (defaults to the XZ ground plane)
+     * }
+     */
+    constructor(scene, camera, options = {}) {
+        this.scene = scene;
+        this.camera = camera;
+        this.name = options.name || 'shaderGrid';
+
+        this.minorSpacing = options.minorSpacing ?? 1.0;
+        this.majorEvery = options.majorEvery ?? 10;
+        this.lodBase = options.lodBase ?? 10;
+        this.minPixels = options.minPixels ?? 8;
+        this.size = options.size ?? null;
+
+        this.origin = (options.origin || BABYLON.Vector3.Zero()).clone();
+        this.axisU = (options.axisU || new BABYLON.Vector3(1, 0, 0)).clone().normalize();
+        this.axisV = (options.axisV || new BABYLON.Vector3(0, 0, 1)).clone().normalize();
+        this.normal = BABYLON.Vector3.Cross(this.axisV, this.axisU).normalize();
+
+        this.mesh = null;
+        this.material = null;
+        this.viewObserver = null;
+
+        this.createMesh(options);
+        this.setPlane(this.origin, this.axisU, this.axisV);
+        this.viewObserver = this.camera.onViewMatrixChangedObservable.add(() => this.update());
+        this.update();
+    }
+
+    createMesh(options) {
+        // Unit quad in local XZ; scaled and placed by update()
+        this.mesh = BABYLON.MeshBuilder.CreateGround(this.name, { width: 1, height: 1 }, this.scene);
+        this.mesh.isPickable = false;
+        this.mesh.alwaysSelectAsActiveMesh = true;
+        this.mesh.rotationQuaternion = BABYLON.Quaternion.Identity();
+
+        this.material = new BABYLON.ShaderMaterial(`${this.name}Material`, this.scene, SHADER_NAME, {
+            attributes: ['position'],
+            uniforms: [
+                'world', 'viewProjection',
+                'origin', 'axisU', 'axisV', 'planeNormal', 'cameraPosition',
+                'minorColor', 'majorColor', 'axisUColor', 'axisVColor',
+                'minorSpacing', 'majorEvery', 'lodBase', 'minPixels',
+                'opacity', 'minorOpacity', 'axisOpacity', 'belowOpacity', 'fadeDistance'
+            ],
+            needAlphaBlending: true
+        });
+        this.material.backFaceCulling = false; // Visible from above and below the plane
+        this.material.disableDepthWrite = true; // Parts always draw over the grid
+
+        this.material.setColor3('minorColor', options.minorColor || new BABYLON.Color3(0.7, 0.7, 0.7));
+        this.material.setColor3('majorColor', options.majorColor || new BABYLON.Color3(0.4, 0.4, 0.4));
+        this.material.setColor3('axisUColor', options.axisUColor || new BABYLON.Color3(0.9, 0.2, 0.2));
+        this.material.setColor3('axisVColor', options.axisVColor || new BABYLON.Color3(0.2, 0.9, 0.2));
+        this.material.setFloat('minorSpacing', this.minorSpacing);
+        this.material.setFloat('majorEvery', this.majorEvery);
+        this.material.setFloat('lodBase', this.lodBase);
+        this.material.setFloat('minPixels', this.minPixels);
+        this.material.setFloat('minorOpacity', options.minorOpacity ?? 0.7);
+        this.material.setFloat('axisOpacity', options.showAxes ? 1.0 : 0.0);
+        this.material.setFloat('belowOpacity', options.belowOpacity ?? 1.0);
+        this.setOpacity(options.opacity ?? 1.0);
+
+        this.mesh.material = this.material;
+    }
+
+    /**
+     * Move the grid to another plane (sketch surfaces)
+     */
+    setPlane(origin, axisU, axisV) {
+        this.origin = origin.clone();
+        this.axisU = axisU.clone().normalize();
+        this.axisV = axisV.clone().normalize();
+        this.normal = BABYLON.Vector3.Cross(this.axisV, this.axisU).normalize();
+
+        // Local X -> U, local Y (ground normal) -> plane normal, local Z -> V
+        BABYLON.Quaternion.RotationQuaternionFromAxisToRef(this.axisU, this.normal, this.axisV, this.mesh.rotationQuaternion);
+
+        this.material.setVector3('origin', this.origin);
+        this.material.setVector3('axisU', this.axisU);
+        this.material.setVector3('axisV', this.axisV);
+        this.material.setVector3('planeNormal', this.normal);
+        this.update();
+    }
+
+    setOpacity(opacity) {
+        this.opacity = opacity;
+        this.material.setFloat('opacity', opacity);
+    }
+
+    /**
+     * Reposition the quad for the current view - no geometry is rebuilt
+     */
+    update() {
+        const cameraPosition = this.camera.globalPosition || this.camera.position;
+        this.material.setVector3('cameraPosition', cameraPosition);
+
+        // Fade out well beyond what the camera is looking at
+        const viewDistance = this.camera.radius ?? BABYLON.Vector3.Distance(cameraPosition, this.origin);
+        const fadeDistance = Math.max(viewDistance * 10, this.minorSpacing * this.majorEvery * 20);
+        this.material.setFloat('fadeDistance', this.size ? this.size * 10 : fadeDistance);
+
+        if (this.size) {
+            this.mesh.position.copyFrom(this.origin);
+            this.mesh.scaling.set(this.size, 1, this.size);
+            return;
+        }
+
+        // Infinite grid: center the quad under the point the camera looks at
+        const focus = this.camera.target || cameraPosition;
+        const offset = BABYLON.Vector3.Dot(focus.subtract(this.origin), this.normal);
+        this.mesh.position.copyFrom(focus.subtract(this.normal.scale(offset)));
+        this.mesh.scaling.set(fadeDistance * 2, 1, fadeDistance * 2);
+    }
+
+    /**
+     * Minor line spacing currently drawn at the center of the view (mirrors the shader LOD)
+     */
+    getLineSpacing() {
+        const engine = this.scene.getEngine();
+        const height = engine.getRenderHeight() || 1;
+
+        let worldPerPixel;
+        if (this.camera.mode === BABYLON.Camera.ORTHOGRAPHIC_CAMERA) {
+            worldPerPixel = Math.abs((this.camera.orthoTop ?? 1) - (this.camera.orthoBottom ?? -1)) / height;
+        } else {
+            const distance = this.camera.radius ?? 1;
+            worldPerPixel = 2 * distance * Math.tan(this.camera.fov / 2) / height;
+        }
+
+        const level = Math.max(0, Math.log(worldPerPixel * this.minPixels / this.minorSpacing) / Math.log(this.lodBase));
+        return this.minorSpacing * Math.pow(this.lodBase, Math.floor(level));
+    }
+
+    setEnabled(enabled) {
+        this.mesh.setEnabled(enabled);
+    }
+
+    isEnabled() {
+        return this.mesh.isEnabled();
+    }
+
+    dispose() {
+        if (this.viewObserver) {
+            this.camera.onViewMatrixChangedObservable.remove(this.viewObserver);
+            this.viewObserver = null;
+        }
+        if (this.mesh) {
+            this.mesh.dispose();
+            this.mesh = null;
+        }
+        if (this.material) {
+            this.material.dispose();
+            this.material = null;
+        }
+    }
+}
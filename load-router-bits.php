@@ -10,9 +10,53 @@ if ($_SERVER['REQUEST_METHOD'] !== 'GET') {
 }
 
 $routerBitsFile = 'data/router-bits.json';
+$routerBitIndexFile = 'data/router-bits/index.json';
 
-// Check if router bits file exists
-if (!file_exists($routerBitsFile)) {
+// Single bit mesh: the binary blob written by scripts/import_router_bit.py.
+// Blobs are named by content hash, so they can be cached forever.
+if (isset($_GET['blob'])) {
+    $hash = $_GET['blob'];
+    $blobFile = 'data/router-bits/' . $hash . '.bin';
+    if (!preg_match('/^[0-9a-f]{16}$/', $hash) || !file_exists($blobFile)) {
+        http_response_code(404);
+        echo json_encode(['error' => 'Router bit mesh not found']);
+        exit;
+    }
+    header('Content-Type: application/octet-stream');
+    header('Content-Length: ' . filesize($blobFile));
+    header('Cache-Control: public, max-age=31536000, immutable');
+    readfile($blobFile);
+    exit;
+}
+
+// Index entries (profile, counts, blob reference - no mesh data)
+$routerBits = [];
+if (file_exists($routerBitIndexFile)) {
+    $index = json_decode(file_get_contents($routerBitIndexFile), true);
+    if ($index === null) {
+        http_response_code(500);
+        echo json_encode(['error' => 'Failed to parse router bit index']);
+        exit;
+    }
+    $routerBits = $index['bits'] ?? [];
+}
+
+// Bits saved before the import pipeline (or without it) still carry raw meshData
+if (file_exists($routerBitsFile)) {
+    $legacyBits = json_decode(file_get_contents($routerBitsFile), true);
+    if ($legacyBits === null) {
+        http_response_code(500);
+        echo json_encode(['error' => 'Failed to parse router bits data']);
+        exit;
+    }
+    foreach ($legacyBits as $name => $bit) {
+        if (!isset($routerBits[$name])) {
+            $routerBits[$name] = $bit;
+        }
+    }
+}
+
+if (empty($routerBits)) {
     echo json_encode([
         'success' => true,
         'routerBits' => [],
@@ -21,16 +65,6 @@ if (!file_exists($routerBitsFile)) {
     exit;
 }
 
-// Load router bits data
-$routerBitsData = file_get_contents($routerBitsFile);
-$routerBits = json_decode($routerBitsData, true);
-
-if ($routerBits === null) {
-    http_response_code(500);
-    echo json_encode(['error' => 'Failed to parse router bits data']);
-    exit;
-}
-
 echo json_encode([
     'success' => true,
     'routerBits' => $routerBits,
@@ -0,0 +1,250 @@
+/**
+ * BenchSpatialHash Module - Uniform Grid of Part Footprints on a Bench
+ *
+ * Tracks the XZ footprint (world-space AABB projected onto the floor) of every
+ * mesh that belongs to a bench and buckets it into a uniform 2D grid. Footprints
+ * are updated when a part's world matrix changes, so spawn placement and overlap
+ * checks only touch the cells a candidate covers instead of every part on the bench.
+ *
+ * Meshes are picked up automatically: new meshes are queued when added to the
+ * scene and checked against the bench predicate on each query and once more at
+ * the end of the frame (flags such as isWorkBenchPart are set after construction),
+ * and removed when disposed.
+ */
+
+export class BenchSpatialHash {
+    /**
+     * @param {BABYLON.Scene} scene
+     * @param {Function} predicate - (mesh) => boolean, membership test for this bench
+     * @param {number} cellSize - Grid cell size in cm
+     */
+    constructor(scene, predicate, cellSize = 50) {
+        this.scene = scene;
+        this.predicate = predicate;
+        this.cellSize = cellSize;
+
+        // "i,j" -> Set of meshes whose footprint touches the cell
+        this.cells = new Map();
+        // mesh -> { minX, minZ, maxX, maxZ, minY, maxY, keys, observer }
+        this.entries = new Map();
+        // Meshes added to the scene but not yet checked against the predicate
+        this.pending = new Set();
+
+        this.addObserver = scene.onNewMeshAddedObservable.add((mesh) => this.pending.add(mesh));
+        this.removeObserver = scene.onMeshRemovedObservable.add((mesh) => this.remove(mesh));
+        this.frameObserver = scene.onAfterRenderObservable.add(() => this.flushPending(true));
+
+        // Seed with whatever is already in the scene
+        scene.meshes.forEach(mesh => this.pending.add(mesh));
+    }
+
+    /**
+     * Number of parts currently tracked
+     */
+    get size() {
+        this.flushPending();
+        return this.entries.size;
+    }
+
+    /**
+     * Move newly added meshes that belong to this bench into the grid
+     * @param {boolean} final - Drop meshes that still don't match (end of frame)
+     */
+    flushPending(final = false) {
+        if (this.pending.size === 0) return;
+        this.pending.forEach(mesh => {
+            if (mesh.isDisposed()) {
+                this.pending.delete(mesh);
+            } else if (this.predicate(mesh)) {
+                this.pending.delete(mesh);
+                this.track(mesh);
+            }
+        });
+        if (final) {
+            this.pending.clear();
+        }
+    }
+
+    /**
+     * Start tracking a mesh explicitly (also safe to call for already tracked meshes)
+     */
+    track(mesh) {
+        if (this.entries.has(mesh)) {
+            this.update(mesh);
+            return;
+        }
+
+        const entry = { keys: [], observer: null };
+        entry.observer = mesh.onAfterWorldMatrixUpdateObservable.add(() => this.update(mesh));
+        this.entries.set(mesh, entry);
+        this.update(mesh);
+    }
+
+    /**
+     * Stop tracking a mesh
+     */
+    remove(mesh) {
+        this.pending.delete(mesh);
+        const entry = this.entries.get(mesh);
+        if (!entry) return;
+
+        this.unbucket(mesh, entry);
+        if (entry.observer) {
+            mesh.onAfterWorldMatrixUpdateObservable.remove(entry.observer);
+        }
+        this.entries.delete(mesh);
+    }
+
+    /**
+     * Recompute a mesh footprint after it moved, rotated or was rebuilt
+     */
+    update(mesh) {
+        const entry = this.entries.get(mesh);
+        if (!entry) return;
+
+        // A part that left the bench (e.g. moved to assembly) drops out of the grid
+        if (mesh.isDisposed() || !this.predicate(mesh)) {
+            this.remove(mesh);
+            return;
+        }
+
+        const box = mesh.getBoundingInfo().boundingBox;
+        const min = box.minimumWorld;
+        const max = box.maximumWorld;
+        if (entry.minX === min.x && entry.minZ === min.z && entry.maxX === max.x &&
+            entry.maxZ === max.z && entry.minY === min.y && entry.maxY === max.y) {
+            return;
+        }
+
+        this.unbucket(mesh, entry);
+        entry.minX = min.x;
+        entry.minZ = min.z;
+        entry.maxX = max.x;
+        entry.maxZ = max.z;
+        entry.minY = min.y;
+        entry.maxY = max.y;
+
+        this.forEachCell(min.x, min.z, max.x, max.z, key => {
+            let cell = this.cells.get(key);
+            if (!cell) {
+                cell = new Set();
+                this.cells.set(key, cell);
+            }
+            cell.add(mesh);
+            entry.keys.push(key);
+        });
+    }
+
+    unbucket(mesh, entry) {
+        entry.keys.forEach(key => {
+            const cell = this.cells.get(key);
+            if (!cell) return;
+            cell.delete(mesh);
+            if (cell.size === 0) this.cells.delete(key);
+        });
+        entry.keys = [];
+    }
+
+    forEachCell(minX, minZ, maxX, maxZ, callback) {
+        const i0 = Math.floor(minX / this.cellSize);
+        const i1 = Math.floor(maxX / this.cellSize);
+        const j0 = Math.floor(minZ / this.cellSize);
+        const j1 = Math.floor(maxZ / this.cellSize);
+        for (let i = i0; i <= i1; i++) {
+            for (let j = j0; j <= j1; j++) {
+                callback(`${i},${j}`);
+            }
+        }
+    }
+
+    /**
+     * Meshes whose footprint overlaps the given XZ rectangle
+     * @param {BABYLON.AbstractMesh} ignore - Optional mesh to leave out (e.g. the one being moved)
+     */
+    queryRegion(minX, minZ, maxX, maxZ, ignore = null) {
+        this.flushPending();
+        const result = new Set();
+        this.forEachCell(minX, minZ, maxX, maxZ, key => {
+            const cell = this.cells.get(key);
+            if (!cell) return;
+            cell.forEach(mesh => {
+                if (mesh === ignore || result.has(mesh)) return;
+                const e = this.entries.get(mesh);
+                if (e.maxX >= minX && e.minX <= maxX && e.maxZ >= minZ && e.minZ <= maxZ) {
+                    result.add(mesh);
+                }
+            });
+        });
+        return result;
+    }
+
+    /**
+     * Whether a rectangle centered at (x, z) is clear of every tracked footprint
+     * @param {number} halfX - Half extent along X (cm)
+     * @param {number} halfZ - Half extent along Z (cm)
+     * @param {number} clearance - Extra gap to keep around the rectangle (cm)
+     */
+    isRegionFree(x, z, halfX, halfZ, clearance = 0, ignore = null) {
+        this.flushPending();
+        const minX = x - halfX - clearance, maxX = x + halfX + clearance;
+        const minZ = z - halfZ - clearance, maxZ = z + halfZ + clearance;
+        let free = true;
+        this.forEachCell(minX, minZ, maxX, maxZ, key => {
+            if (!free) return;
+            const cell = this.cells.get(key);
+            if (!cell) return;
+            for (const mesh of cell) {
+                if (mesh === ignore) continue;
+                const e = this.entries.get(mesh);
+                if (e.maxX > minX && e.minX < maxX && e.maxZ > minZ && e.minZ < maxZ) {
+                    free = false;
+                    return;
+                }
+            }
+        });
+        return free;
+    }
+
+    /**
+     * Tracked meshes whose 3D world AABB overlaps the given mesh
+     */
+    findOverlaps(mesh) {
+        mesh.computeWorldMatrix(true);
+        const box = mesh.getBoundingInfo().boundingBox;
+        const min = box.minimumWorld;
+        const max = box.maximumWorld;
+        const overlaps = [];
+        this.queryRegion(min.x, min.z, max.x, max.z, mesh).forEach(other => {
+            const e = this.entries.get(other);
+            if (e.maxY >= min.y && e.minY <= max.y) {
+                overlaps.push(other);
+            }
+        });
+        return overlaps;
+    }
+
+    /**
+     * Per-axis overlap of two world AABBs, or null when they do not intersect
+     */
+    static aabbOverlap(min1, max1, min2, max2) {
+        if (max1.x < min2.x || min1.x > max2.x ||
+            max1.y < min2.y || min1.y > max2.y ||
+            max1.z < min2.z || min1.z > max2.z) {
+            return null;
+        }
+        return {
+            x: Math.min(max1.x, max2.x) - Math.max(min1.x, min2.x),
+            y: Math.min(max1.y, max2.y) - Math.max(min1.y, min2.y),
+            z: Math.min(max1.z, max2.z) - Math.max(min1.z, min2.z)
+        };
+    }
+
+    dispose() {
+        this.scene.onNewMeshAddedObservable.remove(this.addObserver);
+        this.scene.onMeshRemovedObservable.remove(this.removeObserver);
+        this.scene.onAfterRenderObservable.remove(this.frameObserver);
+        Array.from(this.entries.keys()).forEach(mesh => this.remove(mesh));
+        this.cells.clear();
+        this.pending.clear();
+    }
+}
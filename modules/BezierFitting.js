@@ -0,0 +1,350 @@
+/**
+ * BezierFitting Module - Least-Squares Cubic Bézier Fitting for Cut Paths
+ *
+ * Scroll-saw control handles used to be picked at fixed fractions of the
+ * sampled path, and dragging one rebuilt the whole path as straight lines
+ * between handles. A drawn path is now fitted with a minimal piecewise cubic
+ * spline (Schneider, "An Algorithm for Automatically Fitting Digitized
+ * Curves", Graphics Gems 1990): each run between corners gets one cubic fitted
+ * by least squares with chord-length parameters, refined by Newton-Raphson
+ * reparameterization, and split at the worst point until it is within the
+ * error bound.
+ *
+ * BezierPath holds the result as anchors with in/out handles. Each segment's
+ * samples are cached, so moving an anchor or handle re-evaluates only the one
+ * or two segments that use it.
+ *
+ * Points are part-local BABYLON.Vector3s on the top face; fitting happens in
+ * the XZ plane and Y follows the anchors.
+ */
+
+const CORNER_ANGLE = Math.PI / 3;   // Sharper turns split the fit and keep independent handles
+const MAX_REPARAMETERIZE = 4;
+export const MAX_SAMPLES_PER_SEGMENT = 64;
+
+// ==================== 2D HELPERS ====================
+
+const sub = (a, b) => ({ x: a.x - b.x, z: a.z - b.z });
+const add = (a, b) => ({ x: a.x + b.x, z: a.z + b.z });
+const scale = (a, s) => ({ x: a.x * s, z: a.z * s });
+const dot = (a, b) => a.x * b.x + a.z * b.z;
+const length = (a) => Math.hypot(a.x, a.z);
+const normalize = (a) => {
+    const l = length(a);
+    return l > 0 ? { x: a.x / l, z: a.z / l } : { x: 0, z: 0 };
+};
+
+function bezierPoint(bez, t) {
+    const mt = 1 - t;
+    const b0 = mt * mt * mt, b1 = 3 * mt * mt * t, b2 = 3 * mt * t * t, b3 = t * t * t;
+    return {
+        x: bez[0].x * b0 + bez[1].x * b1 + bez[2].x * b2 + bez[3].x * b3,
+        z: bez[0].z * b0 + bez[1].z * b1 + bez[2].z * b2 + bez[3].z * b3
+    };
+}
+
+// ==================== SCHNEIDER FIT ====================
+
+function chordLengthParameterize(points, first, last) {
+    const u = [0];
+    for (let i = first + 1; i <= last; i++) {
+        u.push(u[u.length - 1] + length(sub(points[i], points[i - 1])));
+    }
+    const total = u[u.length - 1] || 1;
+    return u.map(value => value / total);
+}
+
+function generateBezier(points, first, last, u, tHat1, tHat2) {
+    const p0 = points[first];
+    const p3 = points[last];
+
+    // Least-squares handle lengths along the fixed end tangents
+    let c00 = 0, c01 = 0, c11 = 0, x0 = 0, x1 = 0;
+    for (let i = 0; i < u.length; i++) {
+        const t = u[i];
+        const mt = 1 - t;
+        const a1 = scale(tHat1, 3 * mt * mt * t);
+        const a2 = scale(tHat2, 3 * mt * t * t);
+        c00 += dot(a1, a1);
+        c01 += dot(a1, a2);
+        c11 += dot(a2, a2);
+        const base = add(scale(p0, mt * mt * mt + 3 * mt * mt * t), scale(p3, 3 * mt * t * t + t * t * t));
+        const residual = sub(points[first + i], base);
+        x0 += dot(a1, residual);
+        x1 += dot(a2, residual);
+    }
+
+    const det = c00 * c11 - c01 * c01;
+    let alphaL = det !== 0 ? (x0 * c11 - x1 * c01) / det : 0;
+    let alphaR = det !== 0 ? (c00 * x1 - c01 * x0) / det : 0;
+
+    // Degenerate solutions fall back to the Wu/Barsky heuristic
+    const segmentLength = length(sub(p3, p0));
+    const epsilon = 1e-6 * segmentLength;
+    if (alphaL < epsilon || alphaR < epsilon) {
+        alphaL = alphaR = segmentLength / 3;
+    }
+
+    return [p0, add(p0, scale(tHat1, alphaL)), add(p3, scale(tHat2, alphaR)), p3];
+}
+
+function computeMaxError(points, first, last, bez, u) {
+    let maxError = 0;
+    let split = Math.floor((last - first + 1) / 2) + first;
+    for (let i = first + 1; i < last; i++) {
+        const d = sub(bezierPoint(bez, u[i - first]), points[i]);
+        const error = dot(d, d);
+        if (error >= maxError) {
+            maxError = error;
+            split = i;
+        }
+    }
+    return { maxError, split };
+}
+
+// Newton-Raphson step towards the closest parameter on the curve
+function reparameterize(points, first, last, u, bez) {
+    const q1 = [0, 1, 2].map(i => scale(sub(bez[i + 1], bez[i]), 3));
+    const q2 = [0, 1].map(i => scale(sub(q1[i + 1], q1[i]), 2));
+    const quadratic = (q, t) => {
+        const mt = 1 - t;
+        return add(add(scale(q[0], mt * mt), scale(q[1], 2 * mt * t)), scale(q[2], t * t));
+    };
+    const linear = (q, t) => add(scale(q[0], 1 - t), scale(q[1], t));
+
+    return u.map((t, i) => {
+        const d = sub(bezierPoint(bez, t), points[first + i]);
+        const d1 = quadratic(q1, t);
+        const d2 = linear(q2, t);
+        const denominator = dot(d1, d1) + dot(d, d2);
+        if (denominator === 0) return t;
+        return Math.min(1, Math.max(0, t - dot(d, d1) / denominator));
+    });
+}
+
+function fitCubic(points, first, last, tHat1, tHat2, errorSquared, segments) {
+    if (last - first === 1) {
+        const distance = length(sub(points[last], points[first])) / 3;
+        segments.push([points[first], add(points[first], scale(tHat1, distance)), add(points[last], scale(tHat2, distance)), points[last]]);
+        return;
+    }
+
+    let u = chordLengthParameterize(points, first, last);
+    let bez = generateBezier(points, first, last, u, tHat1, tHat2);
+    let { maxError, split } = computeMaxError(points, first, last, bez, u);
+    if (maxError < errorSquared) {
+        segments.push(bez);
+        return;
+    }
+
+    // Close: improve the parameterization before giving up on one segment
+    if (maxError < errorSquared * 4) {
+        for (let i = 0; i < MAX_REPARAMETERIZE; i++) {
+            u = reparameterize(points, first, last, u, bez);
+            bez = generateBezier(points, first, last, u, tHat1, tHat2);
+            ({ maxError, split } = computeMaxError(points, first, last, bez, u));
+            if (maxError < errorSquared) {
+                segments.push(bez);
+                return;
+            }
+        }
+    }
+
+    // Split at the worst point with a shared tangent so the join stays smooth
+    split = Math.min(last - 1, Math.max(first + 1, split));
+    const center = normalize(sub(points[split - 1], points[split + 1]));
+    fitCubic(points, first, split, tHat1, center, errorSquared, segments);
+    fitCubic(points, split, last, scale(center, -1), tHat2, errorSquared, segments);
+}
+
+/**
+ * Fit a polyline with a piecewise cubic Bézier spline
+ * @param {Array<BABYLON.Vector3>} points
+ * @param {number} error - Maximum distance from the points
+ * @returns {BezierPath}
+ */
+export function fitBezierPath(points, error) {
+    const flat = points.map(p => ({ x: p.x, z: p.z }));
+    const y = points.length > 0 ? points.reduce((sum, p) => sum + p.y, 0) / points.length : 0;
+    const anchors = [];
+    if (flat.length < 2) {
+        return new BezierPath([], y);
+    }
+
+    // Fit each run between corners on its own
+    const breaks = [0];
+    for (let i = 1; i < flat.length - 1; i++) {
+        const inDir = normalize(sub(flat[i], flat[i - 1]));
+        const outDir = normalize(sub(flat[i + 1], flat[i]));
+        if (Math.acos(Math.max(-1, Math.min(1, dot(inDir, outDir)))) > CORNER_ANGLE) breaks.push(i);
+    }
+    breaks.push(flat.length - 1);
+
+    const segments = [];
+    const smoothJoins = [];
+    for (let b = 0; b < breaks.length - 1; b++) {
+        const first = breaks[b];
+        const last = breaks[b + 1];
+        const tHat1 = normalize(sub(flat[first + 1], flat[first]));
+        const tHat2 = normalize(sub(flat[last - 1], flat[last]));
+        const start = segments.length;
+        fitCubic(flat, first, last, tHat1, tHat2, error * error, segments);
+        for (let s = start; s < segments.length - 1; s++) smoothJoins[s + 1] = true;
+    }
+
+    segments.forEach((bez, s) => {
+        if (s === 0) {
+            anchors.push({ point: bez[0], handleIn: null, handleOut: bez[1], smooth: false });
+        } else {
+            anchors[anchors.length - 1].handleOut = bez[1];
+        }
+        anchors.push({ point: bez[3], handleIn: bez[2], handleOut: null, smooth: !!smoothJoins[s + 1] });
+    });
+    anchors[anchors.length - 1].smooth = false;
+
+    return new BezierPath(anchors, y);
+}
+
+// ==================== EDITABLE SPLINE ====================
+
+export class BezierPath {
+    /**
+     * @param {Array} anchors - [{ point, handleIn, handleOut, smooth }] with {x, z} positions
+     * @param {number} y - Height of the path plane
+     */
+    constructor(anchors, y) {
+        this.anchors = anchors;
+        this.y = y;
+        this.tolerance = 0.05;   // Flattening tolerance for samples (cm)
+        this.samples = new Array(Math.max(0, anchors.length - 1)).fill(null);
+        this.points = null;
+    }
+
+    get segmentCount() {
+        return Math.max(0, this.anchors.length - 1);
+    }
+
+    getSegment(k) {
+        const a = this.anchors[k];
+        const b = this.anchors[k + 1];
+        return [a.point, a.handleOut, b.handleIn, b.point];
+    }
+
+    /**
+     * Samples of one segment, both ends included (cached until the segment changes)
+     */
+    sampleSegment(k) {
+        if (this.samples[k]) return this.samples[k];
+
+        const bez = this.getSegment(k);
+        // Flatness bound: n segments keep the chord error below tolerance
+        const second = Math.max(
+            length(add(sub(bez[0], scale(bez[1], 2)), bez[2])),
+            length(add(sub(bez[1], scale(bez[2], 2)), bez[3]))
+        );
+        const count = Math.min(MAX_SAMPLES_PER_SEGMENT, Math.max(1, Math.ceil(Math.sqrt(0.75 * second / this.tolerance))));
+
+        const samples = [];
+        for (let i = 0; i <= count; i++) {
+            const p = bezierPoint(bez, i / count);
+            samples.push(new BABYLON.Vector3(p.x, this.y, p.z));
+        }
+        this.samples[k] = samples;
+        return samples;
+    }
+
+    /**
+     * The whole path as a polyline (only changed segments are re-evaluated)
+     */
+    getPoints() {
+        if (!this.points) {
+            const points = [];
+            for (let k = 0; k < this.segmentCount; k++) {
+                const samples = this.sampleSegment(k);
+                points.push(...(k === 0 ? samples : samples.slice(1)));
+            }
+            this.points = points;
+        }
+        return this.points;
+    }
+
+    invalidate(segments) {
+        segments.forEach(k => {
+            if (k >= 0 && k < this.segmentCount) this.samples[k] = null;
+        });
+        this.points = null;
+        return segments.filter(k => k >= 0 && k < this.segmentCount);
+    }
+
+    // ==================== EDITING ====================
+
+    /**
+     * Move an anchor; its handles move with it
+     * @returns {Array<number>} Segments that changed
+     */
+    moveAnchor(i, position) {
+        const anchor = this.anchors[i];
+        const delta = { x: position.x - anchor.point.x, z: position.z - anchor.point.z };
+        anchor.point = { x: position.x, z: position.z };
+        if (anchor.handleIn) anchor.handleIn = add(anchor.handleIn, delta);
+        if (anchor.handleOut) anchor.handleOut = add(anchor.handleOut, delta);
+        return this.invalidate([i - 1, i]);
+    }
+
+    /**
+     * Move one handle of an anchor
+     * Smooth anchors keep their handles collinear: the opposite handle turns
+     * to match and keeps its length.
+     * @param {string} side - 'in' or 'out'
+     * @returns {Array<number>} Segments that changed
+     */
+    moveHandle(i, side, position) {
+        const anchor = this.anchors[i];
+        const moved = side === 'in' ? 'handleIn' : 'handleOut';
+        const opposite = side === 'in' ? 'handleOut' : 'handleIn';
+        if (!anchor[moved]) return [];
+
+        anchor[moved] = { x: position.x, z: position.z };
+        if (anchor.smooth && anchor[opposite]) {
+            const direction = normalize(sub(anchor.point, anchor[moved]));
+            const handleLength = length(sub(anchor[opposite], anchor.point));
+            if (direction.x !== 0 || direction.z !== 0) {
+                anchor[opposite] = add(anchor.point, scale(direction, handleLength));
+            }
+        }
+        return this.invalidate([i - 1, i]);
+    }
+
+    /**
+     * Remove an anchor - an interior one joins its two segments with the outer
+     * handles, an end one drops its segment. At least two anchors remain.
+     * @returns {boolean} Whether the anchor was removed
+     */
+    removeAnchor(i) {
+        if (i < 0 || i >= this.anchors.length || this.anchors.length <= 2) return false;
+        if (i === 0) {
+            this.anchors.shift();
+            this.samples.shift();
+            this.anchors[0].handleIn = null;
+            this.anchors[0].smooth = false;
+        } else if (i === this.anchors.length - 1) {
+            this.anchors.pop();
+            this.samples.pop();
+            this.anchors[i - 1].handleOut = null;
+            this.anchors[i - 1].smooth = false;
+        } else {
+            this.anchors.splice(i, 1);
+            this.samples.splice(i, 1);
+            this.samples[i - 1] = null;
+        }
+        this.points = null;
+        return true;
+    }
+
+    /**
+     * Anchor or handle position as a world-ready local Vector3
+     */
+    toVector3(point) {
+        return new BABYLON.Vector3(point.x, this.y, point.z);
+    }
+}
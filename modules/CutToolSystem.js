@@ -178,6 +178,17 @@ export class CutToolSystem {
             piece1Part.mesh = piece1Mesh;
             piece2Part.mesh = piece2Mesh;
             
+            // Pieces carry the original's (already realized) feature history plus the cut
+            const inheritedFeatures = originalMesh.partInstance ? originalMesh.partInstance.features : [];
+            [piece1Part, piece2Part].forEach((piecePart, index) => {
+                piecePart.features = inheritedFeatures.map(feature => ({ ...feature, params: { ...feature.params } }));
+                piecePart.addFeature('cut', {
+                    direction: this.activeCutDirection,
+                    position: cutPosition,
+                    piece: index === 0 ? 'A' : 'B'
+                }, true);
+            });
+            
             // Delete original Part instance
             if (originalMesh.partInstance) {
                 originalMesh.partInstance.delete();
@@ -292,6 +303,9 @@ export class CutToolSystem {
     performCsgIntersection(originalMesh, cuttingPlane, newMeshId) {
         try {
             
+            // Drilled holes still pending on the part go in before the cut
+            this.drawingWorld.realizePartFeatures(originalMesh);
+            
             const csg1 = BABYLON.CSG.FromMesh(originalMesh);
             const csg2 = BABYLON.CSG.FromMesh(cuttingPlane);
             
@@ -569,8 +583,8 @@ export class CutToolSystem {
      * Setup mouse tracking for cut preview
      */
     setupMouseTracking() {
-        // Mouse move event for cut preview
-        this.pointerObserver = this.scene.onPointerObservable.add((pointerInfo) => {
+        // Mouse move event for cut preview (only delivered while a cut tool is selected)
+        this.pointerObserver = this.drawingWorld.pointerDispatcher.register((pointerInfo) => {
             if (!this.cutPreviewActive) return;
             
             if (pointerInfo.type === BABYLON.PointerEventTypes.POINTERMOVE) {
@@ -581,7 +595,7 @@ export class CutToolSystem {
                     pointerInfo.skipOnPointerObservable = true;
                 }
             }
-        });
+        }, { tools: ['rip-cut', 'cross-cut', 'cut'] });
         
     }
     
@@ -909,7 +923,7 @@ export class CutToolSystem {
         }
         
         // Get pick info
-        const pickInfo = this.scene.pick(this.scene.pointerX, this.scene.pointerY);
+        const pickInfo = this.drawingWorld.pickService.pick();
         
         // Check if mouse is over a lumber part
         if (pickInfo.hit && pickInfo.pickedMesh) {
@@ -2202,10 +2216,8 @@ export class CutToolSystem {
         mesh.partData = partData;
         mesh.isWorkBenchPart = true;
         
-        // Apply material color
-        const material = new BABYLON.StandardMaterial(`${partData.id}_material`, this.scene);
-        material.diffuseColor = this.drawingWorld.getMaterialColor(partData.materialId);
-        mesh.material = material;
+        // Shared material, released when the mesh is disposed
+        this.drawingWorld.applyPartMaterial(mesh, partData.materialId, partData);
         
         // Position the mesh
         mesh.position = originalPosition.clone();
@@ -2533,7 +2545,7 @@ export class CutToolSystem {
      * Handle waste selection hover effects
      */
     handleWasteSelectionHover(pointerInfo) {
-        const pickInfo = this.scene.pick(this.scene.pointerX, this.scene.pointerY);
+        const pickInfo = this.drawingWorld.pickService.pick();
         
         if (pickInfo.hit && pickInfo.pickedMesh) {
             const mesh = pickInfo.pickedMesh;
@@ -3056,10 +3068,8 @@ export class CutToolSystem {
         mesh.partData = partData;
         mesh.isWorkBenchPart = true;
         
-        // Apply material
-        const material = new BABYLON.StandardMaterial(`${partData.id}_material`, this.scene);
-        material.diffuseColor = this.drawingWorld.getMaterialColor(partData.materialId);
-        mesh.material = material;
+        // Shared material, released when the mesh is disposed
+        this.drawingWorld.applyPartMaterial(mesh, partData.materialId, partData);
         
         // Add to work bench
         this.drawingWorld.workBenchParts.push(partData);
@@ -3116,9 +3126,14 @@ export class CutToolSystem {
         
         // Remove pointer observer
         if (this.pointerObserver) {
-            this.scene.onPointerObservable.remove(this.pointerObserver);
+            this.drawingWorld.pointerDispatcher.unregister(this.pointerObserver);
             this.pointerObserver = null;
         }
         
+        // Remove measurement overlay
+        if (this.measurementDisplay) {
+            this.measurementDisplay.remove();
+            this.measurementDisplay = null;
+        }
     }
 }
\ No newline at end of file
@@ -75,21 +75,28 @@ export class DrillPressSystem {
      * Setup keyboard and mouse event listeners
      */
     setupEventListeners() {
+        // Handlers are kept so dispose() can detach them
+        this.domListeners = [];
+        const listen = (target, type, handler) => {
+            target.addEventListener(type, handler);
+            this.domListeners.push({ target, type, handler });
+        };
+        
         // Keyboard events for shift detection
-        window.addEventListener('keydown', (event) => {
+        listen(window, 'keydown', (event) => {
             if (event.key === 'Shift') {
                 this.shiftPressed = true;
             }
         });
         
-        window.addEventListener('keyup', (event) => {
+        listen(window, 'keyup', (event) => {
             if (event.key === 'Shift') {
                 this.shiftPressed = false;
             }
         });
         
         // Delete key handler for removing selected markers
-        window.addEventListener('keydown', (event) => {
+        listen(window, 'keydown', (event) => {
             if (this.isActive && event.key === 'Delete' && this.selectedMarker) {
                 this.deleteSelectedMarker();
                 event.preventDefault();
@@ -97,13 +104,13 @@ export class DrillPressSystem {
         });
         
         // Mouse events for hole placement and marker dragging
-        this.canvas.addEventListener('mousedown', (event) => {
+        listen(this.canvas, 'mousedown', (event) => {
             if (this.isActive && event.button === 0) { // Left click only
                 this.handleMouseDown(event);
             }
         });
         
-        this.canvas.addEventListener('mousemove', (event) => {
+        listen(this.canvas, 'mousemove', (event) => {
             if (this.isActive) {
                 if (this.isDragging) {
                     this.handleDrag(event);
@@ -113,20 +120,20 @@ export class DrillPressSystem {
             }
         });
         
-        this.canvas.addEventListener('mouseup', (event) => {
+        listen(this.canvas, 'mouseup', (event) => {
             if (this.isActive && event.button === 0) { // Left click only
                 this.handleMouseUp(event);
             }
         });
         
-        this.canvas.addEventListener('click', (event) => {
+        listen(this.canvas, 'click', (event) => {
             if (this.isActive && !this.isDragging && !this.dragStartPos) {
                 this.handleSurfaceClick(event);
             }
         });
         
         // Right-click context menu for marker deletion
-        this.canvas.addEventListener('contextmenu', (event) => {
+        listen(this.canvas, 'contextmenu', (event) => {
             if (this.isActive) {
                 this.handleRightClick(event);
                 event.preventDefault(); // Prevent browser context menu
@@ -939,40 +946,23 @@ export class DrillPressSystem {
     }
     
     /**
-     * Create a cylinder for drilling holes
+     * Hole feature parameters for a marker, in the board's local space (cm)
      */
-    createHoleCylinder(position, diameter, depth) {
-        // Get board dimensions to determine proper cylinder height
-        const boardBounds = this.selectedBoard.getBoundingInfo();
-        const boardHeight = boardBounds.maximum.y - boardBounds.minimum.y;
-        
-        let cylinderHeight;
-        if (depth === 'through') {
-            // Through hole - make cylinder taller than board
-            cylinderHeight = boardHeight + 2;
-        } else {
-            // Partial depth hole
-            cylinderHeight = parseFloat(depth);
-        }
-        
-        // Create cylinder with proper radius (diameter / 2)
-        const cylinder = BABYLON.MeshBuilder.CreateCylinder('drillHole', {
-            diameter: diameter,
-            height: cylinderHeight,
-            tessellation: 32
-        }, this.scene);
-        
-        // Position cylinder at marker location
-        cylinder.position = position.clone();
-        
-        // For partial depth holes, adjust position so cylinder starts at surface
-        if (depth !== 'through') {
-            // Assuming Y is up - adjust based on surface normal
-            cylinder.position.y = position.y - cylinderHeight / 2;
-        }
-        
-        
-        return cylinder;
+    createHoleFeature(boardMesh, marker) {
+        const holeSize = marker.drillSize || this.currentDrillSize;
+        const holeDepth = marker.drillDepth || this.currentDepth;
+        
+        // Drill into the picked surface
+        const toLocal = boardMesh.computeWorldMatrix(true).clone().invert();
+        const center = BABYLON.Vector3.TransformCoordinates(marker.position, toLocal);
+        const axis = BABYLON.Vector3.TransformNormal(this.surfaceNormal.negate(), toLocal).normalize();
+        
+        return {
+            center: { x: center.x, y: center.y, z: center.z },
+            axis: { x: axis.x, y: axis.y, z: axis.z },
+            diameter: holeSize * 2.54,
+            depth: holeDepth === 'through' ? null : parseFloat(holeDepth) * 2.54
+        };
     }
     
     /**
@@ -992,44 +982,20 @@ export class DrillPressSystem {
                 throw new Error('No valid board selected for drilling');
             }
             
-            // Clone the original mesh for CSG operations
-            let currentMesh = originalMesh.clone(originalMesh.name + '_drilled');
-            currentMesh.partData = { ...originalMesh.partData };
-            currentMesh.isWorkBenchPart = true;
+            // Holes are recorded on the part and shown as previews; the geometry is
+            // cut in one pass when a later operation (cut, route, save) needs it
+            const holes = this.holeMarkers.map(marker => this.createHoleFeature(originalMesh, marker));
+            const realizer = this.drawingWorld.featureRealizer;
+            const part = originalMesh.partInstance;
             
-            // Drill each hole using CSG subtraction
-            for (const marker of this.holeMarkers) {
-                const holeSize = marker.drillSize || this.currentDrillSize;
-                const holeDepth = marker.drillDepth || this.currentDepth;
-                
-                // Create cylinder for hole
-                const holeCylinder = this.createHoleCylinder(marker.position, holeSize, holeDepth);
-                
-                // Perform CSG subtraction
-                const newMesh = BABYLON.CSG.FromMesh(currentMesh).subtract(BABYLON.CSG.FromMesh(holeCylinder)).toMesh(
-                    currentMesh.name,
-                    currentMesh.material,
-                    this.scene
-                );
-                
-                // Copy properties
-                newMesh.partData = currentMesh.partData;
-                newMesh.isWorkBenchPart = true;
-                newMesh.position = currentMesh.position.clone();
-                
-                // Clean up previous mesh
-                if (currentMesh !== originalMesh) {
-                    currentMesh.dispose();
-                }
-                holeCylinder.dispose();
-                
-                currentMesh = newMesh;
-                
+            if (part) {
+                holes.forEach(params => part.addFeature('hole', params));
+                realizer.updatePreview(originalMesh);
+            } else {
+                // No Part to carry the features - drill right away
+                realizer.realize(originalMesh, holes.map(params => ({ type: 'hole', params })));
             }
             
-            // Replace original mesh with drilled version
-            originalMesh.dispose();
-            
             // Update part data to reflect holes were drilled
             const drillSummary = this.holeMarkers.map(m => 
                 `${m.drillSize || this.currentDrillSize}" ${m.drillDepth || this.currentDepth === 'through' ? 'through' : m.drillDepth + '" deep'}`
@@ -1133,4 +1099,37 @@ export class DrillPressSystem {
         } else {
         }
     }
+    
+    /**
+     * Release listeners, overlays and markers (tool registry idle teardown)
+     */
+    dispose() {
+        if (this.isActive) {
+            this.deactivate();
+        }
+        
+        (this.domListeners || []).forEach(({ target, type, handler }) => {
+            target.removeEventListener(type, handler);
+        });
+        this.domListeners = [];
+        
+        this.clearAllMarkers();
+        
+        if (this.drillBitUI) {
+            this.drillBitUI.remove();
+            this.drillBitUI = null;
+        }
+        if (this.surfaceQuad) {
+            this.surfaceQuad.dispose();
+            this.surfaceQuad = null;
+        }
+        if (this.previewCircle) {
+            this.previewCircle.dispose();
+            this.previewCircle = null;
+        }
+        if (this.crosshair) {
+            this.crosshair.dispose();
+            this.crosshair = null;
+        }
+    }
 }
\ No newline at end of file
@@ -0,0 +1,308 @@
+/**
+ * EdgeIndex Module - Precomputed Feature Edge Index for Part Meshes
+ *
+ * Extracts the sharp (feature) edges of a mesh once, by dihedral angle between
+ * adjacent faces, and stores them in a uniform spatial grid in the mesh's local
+ * space. Hover queries then become a nearest-segment lookup over a handful of
+ * grid cells instead of recomputing bounding box distances on every move.
+ *
+ * Works for any triangulated part - cut, beveled, chamfered or routed boards
+ * all expose their real edges, not just the edges of their bounding box.
+ */
+
+export class EdgeIndex {
+    /**
+     * @param {BABYLON.AbstractMesh} mesh - Mesh to index
+     * @param {Object} options
+     * @param {number} options.featureAngle - Minimum dihedral angle in degrees for a sharp edge
+     * @param {number} options.weldTolerance - Distance (cm) under which vertices are welded
+     * @param {number} options.cellSize - Grid cell size (cm); derived from mesh size when omitted
+     */
+    constructor(mesh, options = {}) {
+        this.mesh = mesh;
+        this.featureAngle = options.featureAngle ?? 30;
+        this.weldTolerance = options.weldTolerance ?? 0.001;
+        this.cellSize = options.cellSize ?? null;
+
+        // Geometry signature used to detect stale indices
+        this.geometry = mesh.geometry || null;
+        this.vertexCount = mesh.getTotalVertices ? mesh.getTotalVertices() : 0;
+
+        // Flat segment storage: [ax, ay, az, bx, by, bz] per edge (local space)
+        this.segments = new Float32Array(0);
+        this.edgeCount = 0;
+
+        // Uniform grid: "i,j,k" -> array of edge indices
+        this.grid = new Map();
+
+        this.build();
+    }
+
+    /**
+     * Check whether this index still matches the mesh geometry
+     */
+    isValidFor(mesh) {
+        if (mesh !== this.mesh || mesh.isDisposed()) return false;
+        const vertexCount = mesh.getTotalVertices ? mesh.getTotalVertices() : 0;
+        return (mesh.geometry || null) === this.geometry && vertexCount === this.vertexCount;
+    }
+
+    /**
+     * Extract feature edges and populate the spatial grid
+     */
+    build() {
+        const positions = this.mesh.getVerticesData(BABYLON.VertexBuffer.PositionKind);
+        let indices = this.mesh.getIndices();
+        if (!positions) return;
+
+        const vertexTotal = positions.length / 3;
+        if (!indices || indices.length === 0) {
+            indices = Array.from({ length: vertexTotal }, (_, i) => i);
+        }
+
+        // Weld duplicated vertices (box faces carry their own copies for normals/UVs)
+        const inv = 1 / this.weldTolerance;
+        const weldMap = new Map();
+        const welded = new Int32Array(vertexTotal);
+        const points = [];
+        for (let i = 0; i < vertexTotal; i++) {
+            const x = positions[i * 3], y = positions[i * 3 + 1], z = positions[i * 3 + 2];
+            const key = `${Math.round(x * inv)},${Math.round(y * inv)},${Math.round(z * inv)}`;
+            let id = weldMap.get(key);
+            if (id === undefined) {
+                id = points.length / 3;
+                weldMap.set(key, id);
+                points.push(x, y, z);
+            }
+            welded[i] = id;
+        }
+
+        // Collect face normals per undirected edge
+        const edgeFaces = new Map();
+        const addEdge = (a, b, nx, ny, nz) => {
+            if (a === b) return;
+            const key = a < b ? `${a}_${b}` : `${b}_${a}`;
+            let entry = edgeFaces.get(key);
+            if (!entry) {
+                entry = { a: Math.min(a, b), b: Math.max(a, b), normals: [] };
+                edgeFaces.set(key, entry);
+            }
+            entry.normals.push(nx, ny, nz);
+        };
+
+        for (let t = 0; t + 2 < indices.length; t += 3) {
+            const i0 = welded[indices[t]], i1 = welded[indices[t + 1]], i2 = welded[indices[t + 2]];
+            if (i0 === i1 || i1 === i2 || i0 === i2) continue; // Degenerate after welding
+
+            const ux = points[i1 * 3] - points[i0 * 3];
+            const uy = points[i1 * 3 + 1] - points[i0 * 3 + 1];
+            const uz = points[i1 * 3 + 2] - points[i0 * 3 + 2];
+            const vx = points[i2 * 3] - points[i0 * 3];
+            const vy = points[i2 * 3 + 1] - points[i0 * 3 + 1];
+            const vz = points[i2 * 3 + 2] - points[i0 * 3 + 2];
+            let nx = uy * vz - uz * vy;
+            let ny = uz * vx - ux * vz;
+            let nz = ux * vy - uy * vx;
+            const len = Math.hypot(nx, ny, nz);
+            if (len < 1e-12) continue;
+            nx /= len; ny /= len; nz /= len;
+
+            addEdge(i0, i1, nx, ny, nz);
+            addEdge(i1, i2, nx, ny, nz);
+            addEdge(i2, i0, nx, ny, nz);
+        }
+
+        // Keep boundary edges and edges whose adjacent faces bend past the feature angle
+        const cosThreshold = Math.cos(this.featureAngle * Math.PI / 180);
+        const featureEdges = [];
+        edgeFaces.forEach(entry => {
+            const n = entry.normals;
+            let isFeature = n.length === 3; // Open boundary
+            for (let i = 0; !isFeature && i < n.length; i += 3) {
+                for (let j = i + 3; j < n.length; j += 3) {
+                    const dot = n[i] * n[j] + n[i + 1] * n[j + 1] + n[i + 2] * n[j + 2];
+                    if (dot < cosThreshold) {
+                        isFeature = true;
+                        break;
+                    }
+                }
+            }
+            if (isFeature) featureEdges.push(entry);
+        });
+
+        this.edgeCount = featureEdges.length;
+        this.segments = new Float32Array(this.edgeCount * 6);
+        featureEdges.forEach((entry, e) => {
+            this.segments.set(points.slice(entry.a * 3, entry.a * 3 + 3), e * 6);
+            this.segments.set(points.slice(entry.b * 3, entry.b * 3 + 3), e * 6 + 3);
+        });
+
+        this.buildGrid(points);
+    }
+
+    /**
+     * Bucket every feature edge into the grid cells its bounding box covers
+     */
+    buildGrid(points) {
+        this.grid.clear();
+        if (this.edgeCount === 0) return;
+
+        if (!this.cellSize) {
+            // Aim for roughly one edge per cell along the longest extent
+            let min = [Infinity, Infinity, Infinity];
+            let max = [-Infinity, -Infinity, -Infinity];
+            for (let i = 0; i < points.length; i += 3) {
+                for (let k = 0; k < 3; k++) {
+                    min[k] = Math.min(min[k], points[i + k]);
+                    max[k] = Math.max(max[k], points[i + k]);
+                }
+            }
+            const extent = Math.max(max[0] - min[0], max[1] - min[1], max[2] - min[2], 1);
+            this.cellSize = Math.max(extent / Math.max(4, Math.cbrt(this.edgeCount) * 2), 0.5);
+        }
+
+        const s = this.segments;
+        for (let e = 0; e < this.edgeCount; e++) {
+            const o = e * 6;
+            const lo = this.cellOf(Math.min(s[o], s[o + 3]), Math.min(s[o + 1], s[o + 4]), Math.min(s[o + 2], s[o + 5]));
+            const hi = this.cellOf(Math.max(s[o], s[o + 3]), Math.max(s[o + 1], s[o + 4]), Math.max(s[o + 2], s[o + 5]));
+            for (let i = lo[0]; i <= hi[0]; i++) {
+                for (let j = lo[1]; j <= hi[1]; j++) {
+                    for (let k = lo[2]; k <= hi[2]; k++) {
+                        const key = `${i},${j},${k}`;
+                        let bucket = this.grid.get(key);
+                        if (!bucket) {
+                            bucket = [];
+                            this.grid.set(key, bucket);
+                        }
+                        bucket.push(e);
+                    }
+                }
+            }
+        }
+    }
+
+    cellOf(x, y, z) {
+        return [
+            Math.floor(x / this.cellSize),
+            Math.floor(y / this.cellSize),
+            Math.floor(z / this.cellSize)
+        ];
+    }
+
+    /**
+     * Find the feature edge nearest to a local-space point
+     * @returns {{edgeIndex, distance, start, end, closestPoint}|null}
+     */
+    findNearestLocal(point, maxDistance) {
+        if (this.edgeCount === 0) return null;
+
+        const lo = this.cellOf(point.x - maxDistance, point.y - maxDistance, point.z - maxDistance);
+        const hi = this.cellOf(point.x + maxDistance, point.y + maxDistance, point.z + maxDistance);
+        const s = this.segments;
+        const visited = new Set();
+
+        let best = -1;
+        let bestDistSq = maxDistance * maxDistance;
+        let bestT = 0;
+
+        for (let i = lo[0]; i <= hi[0]; i++) {
+            for (let j = lo[1]; j <= hi[1]; j++) {
+                for (let k = lo[2]; k <= hi[2]; k++) {
+                    const bucket = this.grid.get(`${i},${j},${k}`);
+                    if (!bucket) continue;
+                    for (const e of bucket) {
+                        if (visited.has(e)) continue;
+                        visited.add(e);
+
+                        const o = e * 6;
+                        const dx = s[o + 3] - s[o], dy = s[o + 4] - s[o + 1], dz = s[o + 5] - s[o + 2];
+                        const px = point.x - s[o], py = point.y - s[o + 1], pz = point.z - s[o + 2];
+                        const lenSq = dx * dx + dy * dy + dz * dz;
+                        const t = lenSq > 0 ? Math.max(0, Math.min(1, (px * dx + py * dy + pz * dz) / lenSq)) : 0;
+                        const cx = px - dx * t, cy = py - dy * t, cz = pz - dz * t;
+                        const distSq = cx * cx + cy * cy + cz * cz;
+                        if (distSq <= bestDistSq) {
+                            best = e;
+                            bestDistSq = distSq;
+                            bestT = t;
+                        }
+                    }
+                }
+            }
+        }
+
+        if (best < 0) return null;
+
+        const start = this.getEdgeStart(best);
+        const end = this.getEdgeEnd(best);
+        return {
+            edgeIndex: best,
+            distance: Math.sqrt(bestDistSq),
+            start: start,
+            end: end,
+            closestPoint: BABYLON.Vector3.Lerp(start, end, bestT)
+        };
+    }
+
+    /**
+     * Find the feature edge nearest to a world-space point
+     * Returned points are in world space; localStart/localEnd stay in mesh space.
+     */
+    findNearest(worldPoint, maxDistance) {
+        const world = this.mesh.computeWorldMatrix(true);
+        const inverse = world.clone().invert();
+        const localPoint = BABYLON.Vector3.TransformCoordinates(worldPoint, inverse);
+
+        // Scale the search radius into local units (non-uniform scaling uses the smallest axis)
+        const scaling = this.mesh.absoluteScaling || this.mesh.scaling || new BABYLON.Vector3(1, 1, 1);
+        const minScale = Math.max(Math.min(Math.abs(scaling.x), Math.abs(scaling.y), Math.abs(scaling.z)), 1e-6);
+
+        const hit = this.findNearestLocal(localPoint, maxDistance / minScale);
+        if (!hit) return null;
+
+        const closestWorld = BABYLON.Vector3.TransformCoordinates(hit.closestPoint, world);
+        return {
+            edgeIndex: hit.edgeIndex,
+            distance: BABYLON.Vector3.Distance(worldPoint, closestWorld),
+            localStart: hit.start,
+            localEnd: hit.end,
+            start: BABYLON.Vector3.TransformCoordinates(hit.start, world),
+            end: BABYLON.Vector3.TransformCoordinates(hit.end, world),
+            closestPoint: closestWorld
+        };
+    }
+
+    getEdgeStart(edgeIndex) {
+        const o = edgeIndex * 6;
+        return new BABYLON.Vector3(this.segments[o], this.segments[o + 1], this.segments[o + 2]);
+    }
+
+    getEdgeEnd(edgeIndex) {
+        const o = edgeIndex * 6;
+        return new BABYLON.Vector3(this.segments[o + 3], this.segments[o + 4], this.segments[o + 5]);
+    }
+}
+
+/**
+ * Per-mesh cache of edge indices, rebuilt only when a mesh's geometry changes
+ */
+export class EdgeIndexCache {
+    constructor(options = {}) {
+        this.options = options;
+        this.indices = new WeakMap();
+    }
+
+    get(mesh) {
+        let index = this.indices.get(mesh);
+        if (!index || !index.isValidFor(mesh)) {
+            index = new EdgeIndex(mesh, this.options);
+            this.indices.set(mesh, index);
+        }
+        return index;
+    }
+
+    invalidate(mesh) {
+        this.indices.delete(mesh);
+    }
+}
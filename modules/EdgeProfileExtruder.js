@@ -0,0 +1,255 @@
+/**
+ * EdgeProfileExtruder Module - Analytic Router Profiles on Box Parts
+ *
+ * Routing a roundover, chamfer, cove or rabbet along a straight top edge of a
+ * square board has an exact answer: the corner is replaced by the profile
+ * polyline extruded along the edge. Instead of a CSG subtraction, the part is
+ * rebuilt from its box extents and the set of profiled top edges as a stack of
+ * rectangular loops, one per profile point. Where two profiled edges meet, the
+ * loops produce the mitered corner a router leaves going around a square
+ * corner.
+ *
+ * Supported: plain box parts (or parts built here) whose profiled top edges
+ * all use the same bit and size. Imported bits are profiled from the
+ * silhouette stored with them (profileFromOutline). Anything else - mixed
+ * profiles, curved or previously cut edges - stays on the CSG path.
+ *
+ * UVs are planar per side, normalized to the box like CreateBox faces; the
+ * profile strips continue their side's UVs by arc length, so grain runs
+ * unbroken along each edge and over the profile.
+ */
+
+export const ANALYTIC_PROFILES = ['roundover', 'chamfer', 'cove', 'rabbeting'];
+export const TOP_EDGE_SIDES = {
+    top_front_edge: 'front',
+    top_back_edge: 'back',
+    top_left_edge: 'left',
+    top_right_edge: 'right'
+};
+
+const ARC_STEPS = 16;
+const SHARP_ANGLE = Math.PI / 6; // Profile turns above 30 degrees get a hard edge
+
+/**
+ * Profile as [{ w: inset from the edge, d: depth below the top }], top first, ending at w = 0
+ * @param {string} kind - One of ANALYTIC_PROFILES
+ * @param {number} size - Bit size in cm (radius, chamfer leg or rabbet width/depth)
+ */
+export function getEdgeProfile(kind, size) {
+    const arc = (fn) => {
+        const points = [];
+        for (let i = 0; i <= ARC_STEPS; i++) {
+            points.push(fn((i / ARC_STEPS) * Math.PI / 2));
+        }
+        return points;
+    };
+
+    switch (kind) {
+        case 'roundover':
+            // Convex quarter circle centered inside the board
+            return arc(phi => ({ w: size * (1 - Math.sin(phi)), d: size * (1 - Math.cos(phi)) }));
+        case 'cove':
+            // Concave quarter circle centered on the old corner
+            return arc(phi => ({ w: size * Math.cos(phi), d: size * Math.sin(phi) }));
+        case 'chamfer':
+            return [{ w: size, d: 0 }, { w: 0, d: size }];
+        case 'rabbeting':
+            return [{ w: size, d: 0 }, { w: size, d: size }, { w: 0, d: size }];
+        default:
+            return null;
+    }
+}
+
+/**
+ * Profile for an imported bit, in the same form as getEdgeProfile
+ * The bit plunges from the top face with its bearing (smallest radius) riding
+ * the board's side; the silhouette is scaled so the cut is size deep.
+ * @param {Array} outline - [[radius, height]] from the bit's tip up (scripts/import_router_bit.py)
+ * @param {number} size - Cut depth in cm
+ * @returns {Array|null} Null for a silhouette with no height
+ */
+export function profileFromOutline(outline, size) {
+    if (!outline || outline.length < 2) return null;
+    const height = Math.max(...outline.map(point => point[1]));
+    if (!(height > 0)) return null;
+
+    const bearing = Math.min(...outline.map(point => point[0]));
+    const scale = size / height;
+    const profile = [...outline]
+        .sort((a, b) => b[1] - a[1])
+        .map(([r, h]) => ({ w: (r - bearing) * scale, d: (height - h) * scale }));
+
+    // The cut must come back to the side face
+    const last = profile[profile.length - 1];
+    if (last.w > 0) {
+        profile.push({ w: 0, d: last.d });
+    }
+    return profile;
+}
+
+/**
+ * Whether a mesh is still an untouched box (8 corners, however many vertices)
+ */
+export function isPlainBox(mesh) {
+    const positions = mesh.getVerticesData(BABYLON.VertexBuffer.PositionKind);
+    const indices = mesh.getIndices();
+    if (!positions || !indices || indices.length !== 36) return false;
+
+    const bounds = mesh.getBoundingInfo().boundingBox;
+    const min = bounds.minimum;
+    const max = bounds.maximum;
+    const eps = 1e-4 * Math.max(max.x - min.x, max.y - min.y, max.z - min.z, 1);
+    const onBound = (value, low, high) => Math.abs(value - low) < eps || Math.abs(value - high) < eps;
+
+    for (let i = 0; i < positions.length; i += 3) {
+        if (!onBound(positions[i], min.x, max.x) ||
+            !onBound(positions[i + 1], min.y, max.y) ||
+            !onBound(positions[i + 2], min.z, max.z)) {
+            return false;
+        }
+    }
+    return true;
+}
+
+/**
+ * Box with the given top edges profiled
+ * @param {BABYLON.Vector3} min - Local box minimum
+ * @param {BABYLON.Vector3} max - Local box maximum
+ * @param {Array<string>} sides - Profiled sides ('front' = +Z, 'back' = -Z, 'right' = +X, 'left' = -X)
+ * @param {Array} profile - From getEdgeProfile
+ * @returns {BABYLON.VertexData|null} Null when the profile doesn't fit the board
+ */
+export function buildProfiledBox(min, max, sides, profile) {
+    const size = max.subtract(min);
+    const maxInset = Math.max(...profile.map(p => p.w));
+    const depth = Math.max(...profile.map(p => p.d));
+    const insetX = (sides.includes('left') ? maxInset : 0) + (sides.includes('right') ? maxInset : 0);
+    const insetZ = (sides.includes('back') ? maxInset : 0) + (sides.includes('front') ? maxInset : 0);
+    if (depth > size.y + 1e-6 || insetX >= size.x || insetZ >= size.z) return null;
+
+    // Loops from the top face down; the wall below the profile ends at the bottom
+    const loops = profile.map(p => ({ y: max.y - p.d, w: p.w, sharp: false }));
+    if (depth < size.y - 1e-6) {
+        loops.push({ y: min.y, w: 0, sharp: false });
+    }
+    markSharpTurns(loops);
+
+    const inset = (side, w) => (sides.includes(side) ? w : 0);
+    const rect = (loop) => ({
+        x0: min.x + inset('left', loop.w),
+        x1: max.x - inset('right', loop.w),
+        z0: min.z + inset('back', loop.w),
+        z1: max.z - inset('front', loop.w)
+    });
+
+    // Arc length from the bottom loop up, so side UVs run on over the profile
+    const arcLength = new Array(loops.length).fill(0);
+    for (let k = loops.length - 2; k >= 0; k--) {
+        arcLength[k] = arcLength[k + 1] + Math.hypot(loops[k].w - loops[k + 1].w, loops[k].y - loops[k + 1].y);
+    }
+
+    const positions = [];
+    const indices = [];
+    const uvs = [];
+
+    const addQuad = (corners, uvCorners, outward) => {
+        const base = positions.length / 3;
+        corners.forEach(c => positions.push(c.x, c.y, c.z));
+        uvCorners.forEach(uv => uvs.push(uv[0], uv[1]));
+        pushTriangle(indices, positions, base, base + 1, base + 2, outward);
+        pushTriangle(indices, positions, base, base + 2, base + 3, outward);
+    };
+
+    // Top and bottom faces
+    const top = rect(loops[0]);
+    const topUV = (x, z) => [(x - min.x) / size.x, (z - min.z) / size.z];
+    addQuad([
+        new BABYLON.Vector3(top.x0, max.y, top.z0), new BABYLON.Vector3(top.x1, max.y, top.z0),
+        new BABYLON.Vector3(top.x1, max.y, top.z1), new BABYLON.Vector3(top.x0, max.y, top.z1)
+    ], [topUV(top.x0, top.z0), topUV(top.x1, top.z0), topUV(top.x1, top.z1), topUV(top.x0, top.z1)], new BABYLON.Vector3(0, 1, 0));
+    const bottom = rect(loops[loops.length - 1]);
+    addQuad([
+        new BABYLON.Vector3(bottom.x0, min.y, bottom.z0), new BABYLON.Vector3(bottom.x1, min.y, bottom.z0),
+        new BABYLON.Vector3(bottom.x1, min.y, bottom.z1), new BABYLON.Vector3(bottom.x0, min.y, bottom.z1)
+    ], [topUV(bottom.x0, bottom.z0), topUV(bottom.x1, bottom.z0), topUV(bottom.x1, bottom.z1), topUV(bottom.x0, bottom.z1)], new BABYLON.Vector3(0, -1, 0));
+
+    // Each side: one strip per pair of loops, vertices shared along smooth runs
+    const sideDefs = [
+        { outward: new BABYLON.Vector3(0, 0, 1), edge: r => [[r.x0, r.z1], [r.x1, r.z1]], u: p => (p[0] - min.x) / size.x },
+        { outward: new BABYLON.Vector3(0, 0, -1), edge: r => [[r.x1, r.z0], [r.x0, r.z0]], u: p => (p[0] - min.x) / size.x },
+        { outward: new BABYLON.Vector3(1, 0, 0), edge: r => [[r.x1, r.z1], [r.x1, r.z0]], u: p => (p[1] - min.z) / size.z },
+        { outward: new BABYLON.Vector3(-1, 0, 0), edge: r => [[r.x0, r.z0], [r.x0, r.z1]], u: p => (p[1] - min.z) / size.z }
+    ];
+
+    sideDefs.forEach(side => {
+        const outward = side.outward.add(new BABYLON.Vector3(0, 1, 0)).normalize();
+        let runStart = null;
+
+        for (let k = 0; k < loops.length - 1; k++) {
+            // Start a new vertex run at sharp profile points
+            if (runStart === null || loops[k].sharp) {
+                runStart = positions.length / 3;
+                pushLoopEdge(positions, uvs, side, rect(loops[k]), loops[k].y, arcLength[k], size.y);
+            }
+            const upper = positions.length / 3 - 2;
+            pushLoopEdge(positions, uvs, side, rect(loops[k + 1]), loops[k + 1].y, arcLength[k + 1], size.y);
+            const lower = upper + 2;
+
+            pushTriangle(indices, positions, upper, upper + 1, lower + 1, outward);
+            pushTriangle(indices, positions, upper, lower + 1, lower, outward);
+        }
+    });
+
+    // Drop triangles that collapsed (unprofiled sides at a rabbet ledge)
+    const kept = [];
+    for (let i = 0; i < indices.length; i += 3) {
+        if (triangleArea(positions, indices[i], indices[i + 1], indices[i + 2]) > 1e-10) {
+            kept.push(indices[i], indices[i + 1], indices[i + 2]);
+        }
+    }
+
+    const normals = [];
+    BABYLON.VertexData.ComputeNormals(positions, kept, normals);
+
+    const vertexData = new BABYLON.VertexData();
+    vertexData.positions = positions;
+    vertexData.indices = kept;
+    vertexData.normals = normals;
+    vertexData.uvs = uvs;
+    return vertexData;
+}
+
+function markSharpTurns(loops) {
+    for (let k = 1; k < loops.length - 1; k++) {
+        const a = { w: loops[k].w - loops[k - 1].w, y: loops[k].y - loops[k - 1].y };
+        const b = { w: loops[k + 1].w - loops[k].w, y: loops[k + 1].y - loops[k].y };
+        const lengths = Math.hypot(a.w, a.y) * Math.hypot(b.w, b.y);
+        if (lengths < 1e-12) continue;
+        const cos = Math.max(-1, Math.min(1, (a.w * b.w + a.y * b.y) / lengths));
+        if (Math.acos(cos) > SHARP_ANGLE) loops[k].sharp = true;
+    }
+}
+
+function pushLoopEdge(positions, uvs, side, rect, y, arc, height) {
+    const v = arc / height;
+    side.edge(rect).forEach(point => {
+        positions.push(point[0], y, point[1]);
+        uvs.push(side.u(point), v);
+    });
+}
+
+// Wind so Babylon's (p1 - p2) x (p3 - p2) face normal points outward
+function pushTriangle(indices, positions, a, b, c, outward) {
+    const p = i => new BABYLON.Vector3(positions[i * 3], positions[i * 3 + 1], positions[i * 3 + 2]);
+    const normal = BABYLON.Vector3.Cross(p(a).subtract(p(b)), p(c).subtract(p(b)));
+    if (BABYLON.Vector3.Dot(normal, outward) >= 0) {
+        indices.push(a, b, c);
+    } else {
+        indices.push(a, c, b);
+    }
+}
+
+function triangleArea(positions, a, b, c) {
+    const p = i => new BABYLON.Vector3(positions[i * 3], positions[i * 3 + 1], positions[i * 3 + 2]);
+    return BABYLON.Vector3.Cross(p(b).subtract(p(a)), p(c).subtract(p(a))).length() / 2;
+}
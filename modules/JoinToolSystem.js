@@ -12,6 +12,8 @@
  * - Professional joinery alignment
  */
 
+import { BenchSpatialHash } from './BenchSpatialHash.js';
+
 export class JoinToolSystem {
     constructor(drawingWorld) {
         this.drawingWorld = drawingWorld;
@@ -96,7 +98,7 @@ export class JoinToolSystem {
      * Setup mouse tracking for join tool
      */
     setupMouseTracking() {
-        this.pointerObserver = this.scene.onPointerObservable.add((pointerInfo) => {
+        this.pointerObserver = this.drawingWorld.pointerDispatcher.register((pointerInfo) => {
             if (!this.joinToolActive) return;
             
             if (pointerInfo.type === BABYLON.PointerEventTypes.POINTERDOWN && pointerInfo.event.button === 0) {
@@ -104,7 +106,7 @@ export class JoinToolSystem {
             } else if (pointerInfo.type === BABYLON.PointerEventTypes.POINTERMOVE) {
                 this.onMouseMove(pointerInfo);
             }
-        });
+        }, { tools: ['join'] });
     }
     
     /**
@@ -198,9 +200,7 @@ export class JoinToolSystem {
      * Handle mouse click for join workflow
      */
     onMouseClick(pointerInfo) {
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX,
-            this.scene.pointerY,
+        const pickInfo = this.drawingWorld.pickService.pick(
             (mesh) => {
                 return (mesh.isProjectPart || mesh.isWorkBenchPart || this.isSnapPoint(mesh));
             }
@@ -228,9 +228,7 @@ export class JoinToolSystem {
     onMouseMove(pointerInfo) {
         if (!this.joinToolActive) return;
         
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX,
-            this.scene.pointerY,
+        const pickInfo = this.drawingWorld.pickService.pick(
             (mesh) => {
                 return (mesh.isProjectPart || mesh.isWorkBenchPart || this.isSnapPoint(mesh));
             }
@@ -565,22 +563,20 @@ export class JoinToolSystem {
         console.log("Mesh1 world bounds:", worldMin1.toString(), "to", worldMax1.toString());
         console.log("Mesh2 world bounds:", worldMin2.toString(), "to", worldMax2.toString());
         
-        // Check if boxes intersect at all using world coordinates
-        const intersects = !(worldMax1.x < worldMin2.x || worldMin1.x > worldMax2.x ||
-                           worldMax1.y < worldMin2.y || worldMin1.y > worldMax2.y ||
-                           worldMax1.z < worldMin2.z || worldMin1.z > worldMax2.z);
-        console.log("Boxes intersect:", intersects);
+        // Check if boxes intersect at all using world coordinates (shared bench AABB test)
+        const overlap = BenchSpatialHash.aabbOverlap(worldMin1, worldMax1, worldMin2, worldMax2);
+        console.log("Boxes intersect:", !!overlap);
         
-        if (!intersects) {
+        if (!overlap) {
             // No intersection at all - boards aren't touching
             console.log("No intersection - allowing join");
             return false;
         }
         
-        // Calculate the overlap amount in each dimension using world coordinates
-        const overlapX = Math.min(worldMax1.x, worldMax2.x) - Math.max(worldMin1.x, worldMin2.x);
-        const overlapY = Math.min(worldMax1.y, worldMax2.y) - Math.max(worldMin1.y, worldMin2.y);
-        const overlapZ = Math.min(worldMax1.z, worldMax2.z) - Math.max(worldMin1.z, worldMin2.z);
+        // Overlap amount in each dimension using world coordinates
+        const overlapX = overlap.x;
+        const overlapY = overlap.y;
+        const overlapZ = overlap.z;
         
         console.log("Overlap amounts - X:", overlapX, "Y:", overlapY, "Z:", overlapZ);
         
@@ -639,7 +635,8 @@ export class JoinToolSystem {
      */
     destroy() {
         if (this.pointerObserver) {
-            this.scene.onPointerObservable.remove(this.pointerObserver);
+            this.drawingWorld.pointerDispatcher.unregister(this.pointerObserver);
+            this.pointerObserver = null;
         }
         
         this.clearAllHighlights();
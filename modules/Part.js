@@ -55,6 +55,10 @@ export class Part {
         // Modification history
         this.modifications = data.modifications || [];
         
+        // Parametric features (holes, routed edges, cuts) - see PartFeatures.js
+        // Pending features are drawn as previews until FeatureRealizer bakes them
+        this.features = (data.features || []).map(feature => ({ ...feature, params: { ...feature.params } }));
+        
         // Relationships
         this.parentId = data.parentId || null;
         this.childIds = data.childIds || [];
@@ -131,6 +135,25 @@ export class Part {
         this.saveToDatabase();
     }
     
+    // Record a feature; holes stay pending until the geometry is needed
+    addFeature(type, params, realized = false) {
+        const feature = {
+            id: 'feature_' + Date.now() + '_' + Math.random().toString(36).substr(2, 6),
+            type,
+            params,
+            realized
+        };
+        this.features.push(feature);
+        this.modified = Date.now();
+        this.saveToDatabase();
+        return feature;
+    }
+    
+    // Features recorded but not yet baked into the mesh
+    getPendingFeatures() {
+        return this.features.filter(feature => !feature.realized);
+    }
+    
     // Save to database immediately
     saveToDatabase() {
         // TODO: Implement actual database persistence
@@ -176,6 +199,11 @@ export class Part {
             type: this.type
         };
         
+        // Identical parts of the same material render as thin instances
+        if (window.drawingWorld && window.drawingWorld.partInstancer) {
+            window.drawingWorld.partInstancer.register(mesh, this.material.id || this.materialId);
+        }
+        
         console.log(`✅ Part ${this.id}: Mesh created and linked`);
         return mesh;
     }
@@ -234,6 +262,7 @@ export class Part {
             rotation: { ...this.rotation },
             material: { ...this.material },
             modifications: [...this.modifications],
+            features: this.features.map(feature => ({ ...feature, params: { ...feature.params } })),
             parentId: this.parentId,
             childIds: [...this.childIds],
             created: this.created,
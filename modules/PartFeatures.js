@@ -0,0 +1,270 @@
+/**
+ * PartFeatures Module - Parametric Part Features with Deferred Realization
+ *
+ * Drilled holes used to be baked into the board with a CSG pass the moment they
+ * were drilled, and the part kept no record of them. Parts now carry a feature
+ * list (Part.features). Holes are recorded parametrically in the mesh's local
+ * space and drawn as thin-instanced cylinders until an operation needs real
+ * geometry - a cut, a route, the mill, saving the project.
+ *
+ * FeatureRealizer then subtracts every pending hole in a single CSG pass and
+ * caches the resulting geometry by (geometry hash, pending feature hash), so a
+ * part realized twice, or identical parts drilled with the same pattern, reuse
+ * the result instead of running CSG again.
+ *
+ * Routed edges and cuts are recorded as realized features: their tools still
+ * produce geometry immediately.
+ */
+
+import { PartInstancer } from './PartInstancing.js';
+
+const MAX_CACHED_GEOMETRIES = 32;
+const PREVIEW_CLEARANCE = 0.02;   // cm the preview cylinders stand proud of the surface
+const THROUGH_CLEARANCE = 1;      // cm a through-hole cutter extends past each face
+const ENTRY_CLEARANCE = 0.1;      // cm a blind-hole cutter starts above the surface
+
+/**
+ * Stable hash of feature parameters (ids and realized flags don't change geometry)
+ */
+export function hashFeatures(features) {
+    const text = JSON.stringify(features.map(feature => [feature.type, feature.params]));
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return (hash >>> 0).toString(16);
+}
+
+/**
+ * Combine hole cylinders into a single CSG cutter
+ * Holes that don't touch are merged as plain geometry (no boolean work);
+ * only overlapping holes are unioned, so a shelf-pin row costs one merge.
+ * The caller keeps ownership of the cylinders.
+ */
+export function createHoleCutterCSG(cylinders, scene) {
+    const overlaps = (a, b) => {
+        const boxA = a.getBoundingInfo().boundingBox;
+        const boxB = b.getBoundingInfo().boundingBox;
+        return boxA.minimumWorld.x <= boxB.maximumWorld.x && boxA.maximumWorld.x >= boxB.minimumWorld.x &&
+            boxA.minimumWorld.y <= boxB.maximumWorld.y && boxA.maximumWorld.y >= boxB.minimumWorld.y &&
+            boxA.minimumWorld.z <= boxB.maximumWorld.z && boxA.maximumWorld.z >= boxB.minimumWorld.z;
+    };
+
+    // Group cylinders whose bounds overlap
+    const groups = [];
+    cylinders.forEach(cylinder => {
+        cylinder.computeWorldMatrix(true);
+        const touching = groups.filter(group => group.some(other => overlaps(cylinder, other)));
+        const merged = [cylinder];
+        touching.forEach(group => {
+            merged.push(...group);
+            groups.splice(groups.indexOf(group), 1);
+        });
+        groups.push(merged);
+    });
+
+    // Overlapping holes need a real union; the rest are already disjoint solids
+    const temporary = [];
+    const solids = groups.map(group => {
+        if (group.length === 1) return group[0];
+        const union = group.slice(1).reduce(
+            (csg, cylinder) => csg.union(BABYLON.CSG.FromMesh(cylinder)),
+            BABYLON.CSG.FromMesh(group[0])
+        );
+        const mesh = union.toMesh('holeUnion', null, scene);
+        mesh.parent = group[0].parent; // toMesh keeps the first cylinder's local transform
+        temporary.push(mesh);
+        return mesh;
+    });
+
+    let cutterCSG;
+    if (solids.length === 1) {
+        cutterCSG = BABYLON.CSG.FromMesh(solids[0]);
+    } else {
+        // Merged copies are baked to world space
+        const cutter = BABYLON.Mesh.MergeMeshes(solids, false, true);
+        cutterCSG = BABYLON.CSG.FromMesh(cutter);
+        cutter.dispose();
+    }
+    temporary.forEach(mesh => mesh.dispose());
+    return cutterCSG;
+}
+
+export class FeatureRealizer {
+    /**
+     * @param {BABYLON.Scene} scene
+     * @param {Object} options - { instancer: PartInstancer to release realized parts from }
+     */
+    constructor(scene, options = {}) {
+        this.scene = scene;
+        this.instancer = options.instancer || null;
+
+        this.cache = new Map();      // geometry|features hash -> VertexData (insertion order = age)
+        this.previews = new Map();   // part mesh -> preview mesh
+        this.previewMaterial = null;
+        this.stats = { realized: 0, cacheHits: 0 };
+    }
+
+    /**
+     * Features recorded on the part but not yet in its geometry
+     */
+    getPendingFeatures(mesh) {
+        const features = mesh && mesh.partInstance ? mesh.partInstance.features : null;
+        return (features || []).filter(feature => !feature.realized);
+    }
+
+    // ==================== HOLE GEOMETRY ====================
+
+    /**
+     * Local transform of a unit cylinder (diameter 1, height 1 along Y) for a hole
+     * @param {number} clearance - How far the cylinder extends past the entry face
+     */
+    getHoleMatrix(mesh, hole, clearance) {
+        const axis = new BABYLON.Vector3(hole.axis.x, hole.axis.y, hole.axis.z).normalize();
+        const entry = new BABYLON.Vector3(hole.center.x, hole.center.y, hole.center.z);
+
+        let length;
+        if (hole.depth === null || hole.depth === undefined) {
+            // Through: the board's extent along the drilling axis plus clearance on both sides
+            const bounds = mesh.getBoundingInfo().boundingBox;
+            const size = bounds.maximum.subtract(bounds.minimum);
+            const extent = Math.abs(size.x * axis.x) + Math.abs(size.y * axis.y) + Math.abs(size.z * axis.z);
+            length = extent + clearance * 2;
+        } else {
+            length = hole.depth + clearance;
+        }
+
+        const center = entry.add(axis.scale(length / 2 - clearance));
+        const rotation = new BABYLON.Quaternion();
+        BABYLON.Quaternion.FromUnitVectorsToRef(BABYLON.Vector3.Up(), axis, rotation);
+        return BABYLON.Matrix.Compose(new BABYLON.Vector3(hole.diameter, length, hole.diameter), rotation, center);
+    }
+
+    /**
+     * Cutter cylinder for one hole, parented to the part mesh
+     */
+    createHoleCylinder(mesh, hole) {
+        const clearance = hole.depth === null || hole.depth === undefined ? THROUGH_CLEARANCE : ENTRY_CLEARANCE;
+        const cylinder = BABYLON.MeshBuilder.CreateCylinder('drillHole', { diameter: 1, height: 1, tessellation: 32 }, this.scene);
+        cylinder.rotationQuaternion = new BABYLON.Quaternion();
+        this.getHoleMatrix(mesh, hole, clearance).decompose(cylinder.scaling, cylinder.rotationQuaternion, cylinder.position);
+        cylinder.parent = mesh;
+        cylinder.isVisible = false;
+        return cylinder;
+    }
+
+    // ==================== PREVIEW ====================
+
+    /**
+     * Show pending holes as thin-instanced cylinders on the part
+     */
+    updatePreview(mesh) {
+        const holes = this.getPendingFeatures(mesh).filter(feature => feature.type === 'hole');
+        if (holes.length === 0) {
+            this.clearPreview(mesh);
+            return;
+        }
+
+        let preview = this.previews.get(mesh);
+        if (!preview) {
+            preview = BABYLON.MeshBuilder.CreateCylinder(`${mesh.name}_holes`, { diameter: 1, height: 1, tessellation: 24 }, this.scene);
+            preview.material = this.getPreviewMaterial();
+            preview.parent = mesh;
+            preview.isPickable = false;
+            preview.isFeaturePreview = true;
+            preview.alwaysSelectAsActiveMesh = true;
+            this.previews.set(mesh, preview);
+            mesh.onDisposeObservable.addOnce(() => this.clearPreview(mesh));
+        }
+
+        const matrices = new Float32Array(holes.length * 16);
+        holes.forEach((feature, i) => {
+            this.getHoleMatrix(mesh, feature.params, PREVIEW_CLEARANCE).copyToArray(matrices, i * 16);
+        });
+        preview.thinInstanceSetBuffer('matrix', matrices, 16, true);
+    }
+
+    getPreviewMaterial() {
+        if (!this.previewMaterial) {
+            this.previewMaterial = new BABYLON.StandardMaterial('featurePreviewMaterial', this.scene);
+            this.previewMaterial.diffuseColor = new BABYLON.Color3(0.12, 0.1, 0.08);
+            this.previewMaterial.specularColor = BABYLON.Color3.Black();
+        }
+        return this.previewMaterial;
+    }
+
+    clearPreview(mesh) {
+        const preview = this.previews.get(mesh);
+        if (preview) {
+            preview.dispose();
+            this.previews.delete(mesh);
+        }
+    }
+
+    // ==================== REALIZATION ====================
+
+    /**
+     * Bake pending features into the mesh geometry
+     * @param {BABYLON.Mesh} mesh - Part mesh (geometry is replaced in place)
+     * @param {Array} features - Features to bake; defaults to the part's pending features
+     * @returns {boolean} Whether the geometry changed
+     */
+    realize(mesh, features = null) {
+        const pending = features || this.getPendingFeatures(mesh);
+        const holes = pending.filter(feature => feature.type === 'hole');
+        if (!mesh || holes.length === 0) {
+            pending.forEach(feature => { feature.realized = true; });
+            return false;
+        }
+
+        const key = `${PartInstancer.computeGeometryHash(mesh)}|${hashFeatures(holes)}`;
+        let vertexData = this.cache.get(key);
+        if (vertexData) {
+            this.cache.delete(key);
+            this.stats.cacheHits++;
+        } else {
+            const cylinders = holes.map(feature => this.createHoleCylinder(mesh, feature.params));
+            const cutterCSG = createHoleCutterCSG(cylinders, this.scene);
+            const result = BABYLON.CSG.FromMesh(mesh).subtract(cutterCSG).toMesh('featureRealization', null, this.scene);
+            vertexData = BABYLON.VertexData.ExtractFromMesh(result, true, true);
+            result.dispose();
+            cylinders.forEach(cylinder => cylinder.dispose());
+            this.stats.realized++;
+        }
+        this.cache.set(key, vertexData);
+        if (this.cache.size > MAX_CACHED_GEOMETRIES) {
+            this.cache.delete(this.cache.keys().next().value);
+        }
+
+        // Unique geometry from here on; applyToMesh writes into the mesh's
+        // Geometry in place, which must not be shared with another mesh
+        if (this.instancer) this.instancer.release(mesh);
+        mesh.makeGeometryUnique();
+        this.copyVertexData(vertexData).applyToMesh(mesh, true);
+        mesh.refreshBoundingInfo();
+
+        pending.forEach(feature => { feature.realized = true; });
+        this.clearPreview(mesh);
+        return true;
+    }
+
+    // The cached arrays must not end up in (updatable) mesh buffers
+    copyVertexData(source) {
+        const copy = new BABYLON.VertexData();
+        ['positions', 'normals', 'uvs', 'colors', 'indices'].forEach(kind => {
+            if (source[kind]) copy[kind] = source[kind].slice();
+        });
+        return copy;
+    }
+
+    dispose() {
+        this.previews.forEach(preview => preview.dispose());
+        this.previews.clear();
+        this.cache.clear();
+        if (this.previewMaterial) {
+            this.previewMaterial.dispose();
+            this.previewMaterial = null;
+        }
+    }
+}
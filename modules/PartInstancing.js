@@ -0,0 +1,256 @@
+/**
+ * PartInstancing Module - Thin-Instance Rendering for Repeated Identical Parts
+ *
+ * Cabinet projects are full of identical parts (shelves, slats, face-frame stiles).
+ * Each part still owns its own mesh - tools, gizmos and picking keep working on
+ * mesh.partData exactly as before - but once two or more parts share the same
+ * geometry and material, their meshes stop drawing and a single source mesh draws
+ * all of them as thin instances. Draw calls scale with distinct parts, not parts.
+ *
+ * Instance transforms follow the part meshes: every world matrix update on a part
+ * mesh (driven by Part.position / Part.rotation) is copied into the thin-instance
+ * matrix buffer. A part that gets cut, drilled or routed is replaced by a new
+ * unique mesh by the tool; disposing the old mesh drops it out of its group, and
+ * release() can be called to hand a part back to unique rendering explicitly.
+ * A selected part is suspended from its group so its outline, edge rendering
+ * and selection material draw on its own mesh.
+ */
+
+export class PartInstancer {
+    constructor(scene, options = {}) {
+        this.scene = scene;
+        this.minInstances = options.minInstances ?? 2; // Group size before instancing kicks in
+
+        // key -> { key, members: [mesh], source, matrices }
+        this.groups = new Map();
+        // mesh -> { group, observers, index, materialId }
+        this.members = new WeakMap();
+        // mesh -> { materialId, count }, for parts taken out of their group (selected, dimmed)
+        this.suspended = new WeakMap();
+    }
+
+    /**
+     * Hash vertex data so identical boards land in the same group
+     * FNV-1a over positions, normals, UVs and indices quantized to 0.01 mm.
+     */
+    static computeGeometryHash(mesh) {
+        let hash = 0x811c9dc5;
+        const mix = (value) => {
+            hash ^= value & 0xffff;
+            hash = Math.imul(hash, 0x01000193);
+            hash ^= (value >>> 16) & 0xffff;
+            hash = Math.imul(hash, 0x01000193);
+        };
+        const mixArray = (data, scale) => {
+            if (!data) {
+                mix(0);
+                return;
+            }
+            mix(data.length);
+            for (let i = 0; i < data.length; i++) {
+                mix(Math.round(data[i] * scale) | 0);
+            }
+        };
+
+        mixArray(mesh.getVerticesData(BABYLON.VertexBuffer.PositionKind), 1000);
+        mixArray(mesh.getVerticesData(BABYLON.VertexBuffer.NormalKind), 1000);
+        mixArray(mesh.getVerticesData(BABYLON.VertexBuffer.UVKind), 1000);
+        mixArray(mesh.getIndices(), 1);
+
+        return (hash >>> 0).toString(16);
+    }
+
+    /**
+     * Register a part mesh for instanced rendering
+     * @param {BABYLON.Mesh} mesh - Part mesh (keeps its partData and stays pickable)
+     * @param {string} materialId - Material library id; part of the grouping key
+     */
+    register(mesh, materialId) {
+        if (!mesh || this.members.has(mesh) || !mesh.geometry || mesh.skeleton) return null;
+        if (this.suspended.has(mesh)) {
+            // Suspended: regroup (with this material) on the last resume()
+            this.suspended.get(mesh).materialId = materialId;
+            return null;
+        }
+
+        const key = `${PartInstancer.computeGeometryHash(mesh)}|${materialId || 'default'}`;
+        let group = this.groups.get(key);
+        if (!group) {
+            group = { key, members: [], source: null, matrices: null };
+            this.groups.set(key, group);
+        }
+
+        const observers = {
+            transform: mesh.onAfterWorldMatrixUpdateObservable.add(() => this.updateInstanceMatrix(mesh)),
+            dispose: mesh.onDisposeObservable.add(() => this.release(mesh))
+        };
+        this.members.set(mesh, { group, observers, index: -1, materialId });
+        group.members.push(mesh);
+
+        if (group.source) {
+            this.hideMember(mesh);
+            this.rebuildBuffer(group);
+        } else if (group.members.length >= this.minInstances) {
+            this.activateGroup(group);
+        }
+
+        return key;
+    }
+
+    /**
+     * Return a part mesh to unique rendering (e.g. before a tool modifies it)
+     */
+    release(mesh) {
+        const member = this.members.get(mesh);
+        if (!member) return;
+
+        const group = member.group;
+        mesh.onAfterWorldMatrixUpdateObservable.remove(member.observers.transform);
+        mesh.onDisposeObservable.remove(member.observers.dispose);
+        this.members.delete(mesh);
+
+        const index = group.members.indexOf(mesh);
+        if (index !== -1) group.members.splice(index, 1);
+        if (!mesh.isDisposed()) this.showMember(mesh);
+
+        if (group.members.length === 0) {
+            this.disposeGroup(group);
+        } else if (group.source && group.members.length < this.minInstances) {
+            this.deactivateGroup(group);
+        } else if (group.source) {
+            this.rebuildBuffer(group);
+        }
+    }
+
+    /**
+     * Draw a part with its own mesh until resume() (e.g. while it is selected)
+     * Calls nest: the part is regrouped after as many resume() calls.
+     */
+    suspend(mesh) {
+        const suspension = this.suspended.get(mesh);
+        if (suspension) {
+            suspension.count++;
+            return;
+        }
+
+        const member = this.members.get(mesh);
+        if (!member) return;
+
+        this.suspended.set(mesh, { materialId: member.materialId, count: 1 });
+        this.release(mesh);
+    }
+
+    /**
+     * Put a suspended part back into instancing, regrouped by its current geometry
+     */
+    resume(mesh) {
+        const suspension = this.suspended.get(mesh);
+        if (!suspension || --suspension.count > 0) return;
+
+        this.suspended.delete(mesh);
+        if (!mesh.isDisposed()) this.register(mesh, suspension.materialId);
+    }
+
+    /**
+     * Whether a mesh is currently drawn through a thin-instance group
+     */
+    isInstanced(mesh) {
+        const member = this.members.get(mesh);
+        return !!(member && member.group.source);
+    }
+
+    // ==================== GROUP MANAGEMENT ====================
+
+    activateGroup(group) {
+        const template = group.members[0];
+
+        // Plain mesh with its own copy of the template geometry - no part flags,
+        // never picked. Sharing the template's Geometry would let an in-place
+        // vertex write on that part (drilling, routing) reshape every instance.
+        const source = new BABYLON.Mesh(`partInstances_${group.key}`, this.scene);
+        BABYLON.VertexData.ExtractFromMesh(template, true, true).applyToMesh(source);
+        source.material = template.material;
+        source.isPickable = false;
+        source.alwaysSelectAsActiveMesh = true; // Instances span the bench; skip source culling
+        source.renderingGroupId = template.renderingGroupId;
+        source.receiveShadows = template.receiveShadows;
+        source.isPartInstanceSource = true;
+
+        group.source = source;
+        group.members.forEach(mesh => this.hideMember(mesh));
+        this.rebuildBuffer(group);
+    }
+
+    deactivateGroup(group) {
+        group.members.forEach(mesh => this.showMember(mesh));
+        if (group.source) {
+            group.source.dispose(false, false); // Material belongs to the parts
+            group.source = null;
+        }
+        group.matrices = null;
+    }
+
+    disposeGroup(group) {
+        this.deactivateGroup(group);
+        this.groups.delete(group.key);
+    }
+
+    // Part meshes stay enabled and pickable; visibility 0 keeps them out of the render list
+    hideMember(mesh) {
+        mesh.visibility = 0;
+    }
+
+    showMember(mesh) {
+        mesh.visibility = 1;
+    }
+
+    // ==================== MATRIX BUFFER ====================
+
+    rebuildBuffer(group) {
+        if (!group.source) return;
+
+        // Detach the old buffer first so the forced matrix updates below don't write into it
+        group.matrices = null;
+        const matrices = new Float32Array(group.members.length * 16);
+        group.members.forEach((mesh, i) => {
+            this.members.get(mesh).index = i;
+            mesh.computeWorldMatrix(true).copyToArray(matrices, i * 16);
+        });
+
+        group.source.thinInstanceSetBuffer('matrix', matrices, 16, false);
+        group.matrices = matrices;
+        group.source.thinInstanceRefreshBoundingInfo(false);
+    }
+
+    updateInstanceMatrix(mesh) {
+        const member = this.members.get(mesh);
+        if (!member || member.index < 0 || !member.group.source || !member.group.matrices) return;
+
+        mesh.getWorldMatrix().copyToArray(member.group.matrices, member.index * 16);
+        member.group.source.thinInstanceBufferUpdated('matrix');
+    }
+
+    // ==================== STATS ====================
+
+    /**
+     * Draw-call summary for the status bar / debugging
+     */
+    getStats() {
+        let instancedParts = 0;
+        let activeGroups = 0;
+        this.groups.forEach(group => {
+            if (group.source) {
+                activeGroups++;
+                instancedParts += group.members.length;
+            }
+        });
+        return { groups: this.groups.size, activeGroups, instancedParts };
+    }
+
+    dispose() {
+        Array.from(this.groups.values()).forEach(group => {
+            group.members.slice().forEach(mesh => this.release(mesh));
+            this.disposeGroup(group);
+        });
+    }
+}
@@ -0,0 +1,139 @@
+/**
+ * PathPreviewRibbon Module - Updatable Preview Strip for Fitted Scroll-Saw Paths
+ *
+ * Every drag of a scroll-saw control point used to dispose the path preview and
+ * build a new line mesh from the whole path, so drags slowed down as paths got
+ * longer. The fitted path is now drawn as one flat strip whose vertex buffer
+ * holds a fixed-size slot per spline segment. A drag rewrites only the slots of
+ * the segments it changed and uploads just those ranges; the buffer and index
+ * layout are rebuilt only when segments are added or removed.
+ *
+ * Segments sampled more coarsely than the slot allows repeat their last sample,
+ * which leaves degenerate (invisible) triangles at the end of the slot.
+ */
+
+import { MAX_SAMPLES_PER_SEGMENT } from './BezierFitting.js';
+
+const SLOT_SAMPLES = MAX_SAMPLES_PER_SEGMENT + 1;
+const SLOT_FLOATS = SLOT_SAMPLES * 2 * 3;
+
+export class PathPreviewRibbon {
+    /**
+     * @param {BABYLON.Scene} scene
+     * @param {Object} options - { width (path units), material, renderingGroupId }
+     */
+    constructor(scene, options = {}) {
+        this.scene = scene;
+        this.width = options.width ?? 0.1;
+        this.material = options.material || null;
+        this.renderingGroupId = options.renderingGroupId ?? 1;
+
+        this.mesh = null;
+        this.positions = null;
+        this.segmentCount = 0;
+        this.worldMatrix = null;
+        this.scratch = new BABYLON.Vector3();
+    }
+
+    /**
+     * Build the strip for every segment of a BezierPath
+     * @param {BezierPath} bezierPath
+     * @param {BABYLON.Matrix} worldMatrix - Part-local to world transform
+     */
+    build(bezierPath, worldMatrix) {
+        this.dispose();
+
+        this.segmentCount = bezierPath.segmentCount;
+        this.worldMatrix = worldMatrix.clone();
+        this.positions = new Float32Array(this.segmentCount * SLOT_FLOATS);
+        for (let k = 0; k < this.segmentCount; k++) {
+            this.writeSegment(k, bezierPath.sampleSegment(k));
+        }
+
+        const vertexCount = this.positions.length / 3;
+        const indexCount = this.segmentCount * (SLOT_SAMPLES - 1) * 6;
+        const indices = vertexCount > 65535 ? new Uint32Array(indexCount) : new Uint16Array(indexCount);
+        let n = 0;
+        for (let k = 0; k < this.segmentCount; k++) {
+            for (let i = 0; i < SLOT_SAMPLES - 1; i++) {
+                const a = (k * SLOT_SAMPLES + i) * 2;
+                indices[n++] = a; indices[n++] = a + 1; indices[n++] = a + 2;
+                indices[n++] = a + 1; indices[n++] = a + 3; indices[n++] = a + 2;
+            }
+        }
+
+        const normals = new Float32Array(this.positions.length);
+        for (let i = 1; i < normals.length; i += 3) normals[i] = 1;
+
+        const vertexData = new BABYLON.VertexData();
+        vertexData.positions = this.positions;
+        vertexData.normals = normals;
+        vertexData.indices = indices;
+
+        this.mesh = new BABYLON.Mesh('pathPreview', this.scene);
+        vertexData.applyToMesh(this.mesh, true);
+        this.mesh.material = this.material;
+        this.mesh.isPickable = false;
+        this.mesh.renderingGroupId = this.renderingGroupId;
+        // Bounds are not recomputed on partial updates
+        this.mesh.alwaysSelectAsActiveMesh = true;
+        return this.mesh;
+    }
+
+    /**
+     * Rewrite and upload only the given segments
+     * @param {BezierPath} bezierPath
+     * @param {Array<number>} segments - Segment indices whose samples changed
+     * @returns {boolean} False when the strip has to be rebuilt instead
+     */
+    update(bezierPath, segments) {
+        if (!this.mesh || bezierPath.segmentCount !== this.segmentCount) return false;
+
+        const buffer = this.mesh.getVertexBuffer(BABYLON.VertexBuffer.PositionKind);
+        segments.forEach(k => {
+            this.writeSegment(k, bezierPath.sampleSegment(k));
+            const start = k * SLOT_FLOATS;
+            buffer.updateDirectly(this.positions.subarray(start, start + SLOT_FLOATS), start);
+        });
+        return true;
+    }
+
+    /**
+     * Fill a segment's slot: two world-space vertices per sample, either side of the path
+     */
+    writeSegment(k, samples) {
+        const half = this.width / 2;
+        const last = samples.length - 1;
+        let offset = k * SLOT_FLOATS;
+
+        for (let i = 0; i < SLOT_SAMPLES; i++) {
+            const s = Math.min(i, last);
+            const point = samples[s];
+            const before = samples[Math.max(0, s - 1)];
+            const after = samples[Math.min(last, s + 1)];
+            const dx = after.x - before.x;
+            const dz = after.z - before.z;
+            const length = Math.hypot(dx, dz) || 1;
+            const nx = -dz / length * half;
+            const nz = dx / length * half;
+
+            for (const side of [1, -1]) {
+                BABYLON.Vector3.TransformCoordinatesFromFloatsToRef(
+                    point.x + nx * side, point.y, point.z + nz * side, this.worldMatrix, this.scratch
+                );
+                this.positions[offset++] = this.scratch.x;
+                this.positions[offset++] = this.scratch.y;
+                this.positions[offset++] = this.scratch.z;
+            }
+        }
+    }
+
+    dispose() {
+        if (this.mesh) {
+            this.mesh.dispose();
+            this.mesh = null;
+        }
+        this.positions = null;
+        this.segmentCount = 0;
+    }
+}
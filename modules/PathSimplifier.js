@@ -0,0 +1,207 @@
+/**
+ * PathSimplifier Module - Simplification and Resampling for Freehand Cut Paths
+ *
+ * Freehand scroll-saw paths arrive as one point per pointer move - thousands
+ * for an intricate cut - and every one of them used to reach the control
+ * handles and the cutter mesh. Paths are now reduced while they are drawn:
+ *
+ * - StreamingPathSimplifier keeps only the points needed to stay within a
+ *   tolerance of the pointer trail (a bounded sleeve test per move), so the
+ *   live preview stays small.
+ * - simplifyPath (Ramer-Douglas-Peucker) tidies the result when drawing ends.
+ * - resamplePath puts points back only where the path bends: a smooth
+ *   Hermite curve through the simplified vertices, sampled per segment in
+ *   proportion to how far it turns. Straight runs stay a single segment and
+ *   sharp corners stay sharp.
+ *
+ * Paths are in part-local coordinates on the top face, so distances are
+ * measured in the XZ plane and Y is interpolated.
+ */
+
+const MAX_TAIL = 64;                          // Raw points checked per pointer move
+const DEFAULT_CORNER_ANGLE = Math.PI / 3;     // Turns above 60 degrees are kept as corners
+const DEFAULT_ANGLE_STEP = Math.PI / 18;      // One sample per 10 degrees of turning
+const MAX_SAMPLES_PER_SEGMENT = 16;
+
+function distance2D(a, b) {
+    return Math.hypot(b.x - a.x, b.z - a.z);
+}
+
+function deviation2D(point, start, end) {
+    const dx = end.x - start.x;
+    const dz = end.z - start.z;
+    const length = Math.hypot(dx, dz);
+    if (length === 0) return distance2D(point, start);
+    return Math.abs(dx * (point.z - start.z) - dz * (point.x - start.x)) / length;
+}
+
+// Unsigned turn between the segments meeting at b, in radians
+function turnAngle(a, b, c) {
+    const ux = b.x - a.x, uz = b.z - a.z;
+    const vx = c.x - b.x, vz = c.z - b.z;
+    const lengths = Math.hypot(ux, uz) * Math.hypot(vx, vz);
+    if (lengths === 0) return 0;
+    return Math.acos(Math.max(-1, Math.min(1, (ux * vx + uz * vz) / lengths)));
+}
+
+/**
+ * Ramer-Douglas-Peucker simplification (iterative, XZ plane)
+ * @param {Array<BABYLON.Vector3>} points
+ * @param {number} tolerance - Maximum distance from the original path
+ * @returns {Array<BABYLON.Vector3>} Subset of the input points
+ */
+export function simplifyPath(points, tolerance) {
+    if (points.length < 3) return points.slice();
+
+    const keep = new Uint8Array(points.length);
+    keep[0] = 1;
+    keep[points.length - 1] = 1;
+
+    const stack = [[0, points.length - 1]];
+    while (stack.length > 0) {
+        const [first, last] = stack.pop();
+        let worst = 0;
+        let split = -1;
+        for (let i = first + 1; i < last; i++) {
+            const d = deviation2D(points[i], points[first], points[last]);
+            if (d > worst) {
+                worst = d;
+                split = i;
+            }
+        }
+        if (split !== -1 && worst > tolerance) {
+            keep[split] = 1;
+            stack.push([first, split], [split, last]);
+        }
+    }
+
+    return points.filter((_, i) => keep[i]);
+}
+
+/**
+ * Curvature-adaptive resampling of a simplified path
+ * @param {Array<BABYLON.Vector3>} points - Simplified vertices (kept in the output)
+ * @param {Object} options - { cornerAngle, angleStep } in radians
+ * @returns {Array<BABYLON.Vector3>}
+ */
+export function resamplePath(points, options = {}) {
+    if (points.length < 3) return points.map(p => p.clone());
+
+    const cornerAngle = options.cornerAngle ?? DEFAULT_CORNER_ANGLE;
+    const angleStep = options.angleStep ?? DEFAULT_ANGLE_STEP;
+    const count = points.length;
+
+    const turns = points.map((p, i) => (i === 0 || i === count - 1) ? 0 : turnAngle(points[i - 1], p, points[i + 1]));
+
+    // Unit tangent at each vertex: along the neighbours at smooth vertices,
+    // along the segment itself at corners and ends (side 0 = leaving, 1 = arriving)
+    const tangent = (i, side) => {
+        const smooth = i > 0 && i < count - 1 && turns[i] < cornerAngle;
+        const from = smooth ? points[i - 1] : (side === 0 ? points[i] : points[i - 1]);
+        const to = smooth ? points[i + 1] : (side === 0 ? points[i + 1] : points[i]);
+        const length = distance2D(from, to) || 1;
+        return { x: (to.x - from.x) / length, z: (to.z - from.z) / length };
+    };
+
+    const result = [points[0].clone()];
+    for (let i = 0; i < count - 1; i++) {
+        const a = points[i];
+        const b = points[i + 1];
+        const length = distance2D(a, b);
+        const ta = tangent(i, 0);
+        const tb = tangent(i + 1, 1);
+
+        // Samples in proportion to the turning this segment carries
+        const startTurn = turns[i] < cornerAngle ? turns[i] / 2 : 0;
+        const endTurn = turns[i + 1] < cornerAngle ? turns[i + 1] / 2 : 0;
+        const samples = Math.min(MAX_SAMPLES_PER_SEGMENT, Math.max(1, Math.ceil((startTurn + endTurn) / angleStep)));
+
+        for (let s = 1; s < samples; s++) {
+            const t = s / samples;
+            const t2 = t * t;
+            const t3 = t2 * t;
+            const h00 = 2 * t3 - 3 * t2 + 1;
+            const h10 = t3 - 2 * t2 + t;
+            const h01 = -2 * t3 + 3 * t2;
+            const h11 = t3 - t2;
+            result.push(new BABYLON.Vector3(
+                h00 * a.x + h10 * ta.x * length + h01 * b.x + h11 * tb.x * length,
+                a.y + (b.y - a.y) * t,
+                h00 * a.z + h10 * ta.z * length + h01 * b.z + h11 * tb.z * length
+            ));
+        }
+        result.push(b.clone());
+    }
+    return result;
+}
+
+/**
+ * Incremental simplification while a path is drawn
+ *
+ * Each new point extends a "sleeve" from the last kept vertex; once a raw point
+ * falls outside the tolerance of the straight chord, the previous point is
+ * kept and a new sleeve starts there. Work per point is bounded by MAX_TAIL.
+ */
+export class StreamingPathSimplifier {
+    /**
+     * @param {Object} options - { tolerance, minSpacing } in path units (cm)
+     */
+    constructor(options = {}) {
+        this.tolerance = options.tolerance ?? 0.05;
+        this.minSpacing = options.minSpacing ?? this.tolerance * 0.5;
+
+        this.vertices = [];  // Kept vertices
+        this.tail = [];      // Raw points since the last kept vertex (tail[0] is that vertex)
+        this.rawCount = 0;
+    }
+
+    /**
+     * Add a pointer position
+     * @returns {boolean} Whether the simplified path changed
+     */
+    add(point) {
+        this.rawCount++;
+        if (this.vertices.length === 0) {
+            this.vertices.push(point);
+            this.tail = [point];
+            return true;
+        }
+
+        const last = this.tail[this.tail.length - 1];
+        if (distance2D(last, point) < this.minSpacing) return false;
+
+        this.tail.push(point);
+        if (this.tail.length > 2 && (this.tail.length > MAX_TAIL || this.exceedsTolerance())) {
+            const corner = this.tail[this.tail.length - 2];
+            this.vertices.push(corner);
+            this.tail = [corner, point];
+        }
+        return true;
+    }
+
+    exceedsTolerance() {
+        const start = this.tail[0];
+        const end = this.tail[this.tail.length - 1];
+        for (let i = 1; i < this.tail.length - 1; i++) {
+            if (deviation2D(this.tail[i], start, end) > this.tolerance) return true;
+        }
+        return false;
+    }
+
+    /**
+     * Current simplified path, ending at the latest pointer position
+     */
+    getPoints() {
+        const points = this.vertices.slice();
+        if (this.tail.length > 1) points.push(this.tail[this.tail.length - 1]);
+        return points;
+    }
+
+    /**
+     * Final path: RDP over the kept vertices, then curvature-adaptive resampling
+     * @param {Object} options - Passed to resamplePath
+     */
+    finish(options = {}) {
+        return resamplePath(simplifyPath(this.getPoints(), this.tolerance), options);
+    }
+}
@@ -0,0 +1,219 @@
+/**
+ * PickService Module - Frame-Coalesced Picking
+ *
+ * Hover highlighting, the gizmos, the active tool and the coordinate readout
+ * all ask "what is under the pointer?" during the same pointer move, each with
+ * its own scene.pick. The service casts the pointer ray once per frame and
+ * pointer position (one multiPick, hits sorted nearest first) and answers
+ * every caller from that list with the caller's own predicate. Callers that
+ * pass a key also get their filtered result memoized for the rest of the frame.
+ *
+ * pickAsync() uses Babylon's GPU picker on large scenes: the mesh under the
+ * pointer is read back from an id buffer, then a single-mesh ray recovers the
+ * picked point and normal. The picking list follows the meshes' pickable,
+ * visible and enabled flags, and a GPU hit that fails the caller's predicate
+ * falls back to the ray list.
+ *
+ * One service exists per scene (PickService.forScene), so classes that only
+ * hold a scene share the same cache as the DrawingWorld.
+ */
+
+const services = new WeakMap();
+
+// scene.pick's default filter when no predicate is given
+const DEFAULT_PREDICATE = (mesh) => mesh.isPickable && mesh.isVisible && mesh.isEnabled();
+
+export class PickService {
+    /**
+     * Shared service for a scene (created on first use)
+     */
+    static forScene(scene) {
+        let service = services.get(scene);
+        if (!service) {
+            service = new PickService(scene);
+            services.set(scene, service);
+        }
+        return service;
+    }
+
+    /**
+     * @param {BABYLON.Scene} scene
+     * @param {Object} options - { gpuMeshThreshold: mesh count above which pickAsync uses the GPU }
+     */
+    constructor(scene, options = {}) {
+        this.scene = scene;
+        this.gpuMeshThreshold = options.gpuMeshThreshold ?? 400;
+
+        this.cache = null;      // { frameId, x, y, hits, results: Map(key -> PickingInfo) }
+        this.stats = { casts: 0, requests: 0 };
+
+        // GPU picking state
+        this.gpuPicker = null;
+        this.gpuList = null;    // meshes the GPU picker currently draws
+        this.gpuInFlight = false;
+        this.gpuQueued = null;  // latest request waiting for the in-flight one
+
+        // Clicks and releases can follow a move in the same frame after handlers
+        // moved previews around, so only moves reuse the cached hits
+        this.prePointerObserver = scene.onPrePointerObservable.add((pointerInfo) => {
+            if (pointerInfo.type !== BABYLON.PointerEventTypes.POINTERMOVE) {
+                this.invalidate();
+            }
+        });
+
+        this.meshRemovedObserver = scene.onMeshRemovedObservable.add(() => {
+            this.invalidate();
+        });
+    }
+
+    /**
+     * Nearest mesh under the pointer accepted by predicate
+     * @param {Function} predicate - (mesh) => boolean; defaults to scene.pick's pickable/visible/enabled test
+     * @param {string} key - Optional name to memoize this predicate's result for the frame
+     * @returns {BABYLON.PickingInfo} A miss (hit === false) when nothing matches
+     */
+    pick(predicate = null, key = null) {
+        return this.pickAt(this.scene.pointerX, this.scene.pointerY, predicate, key);
+    }
+
+    /**
+     * Same as pick() for explicit canvas coordinates
+     */
+    pickAt(x, y, predicate = null, key = null) {
+        this.stats.requests++;
+        const cache = this.getCache(x, y);
+
+        if (key !== null && cache.results.has(key)) {
+            return cache.results.get(key);
+        }
+
+        const accept = predicate || DEFAULT_PREDICATE;
+        const result = cache.hits.find(info => accept(info.pickedMesh)) || new BABYLON.PickingInfo();
+
+        if (key !== null) {
+            cache.results.set(key, result);
+        }
+        return result;
+    }
+
+    /**
+     * Every hit under (x, y), nearest first
+     */
+    getHits(x = this.scene.pointerX, y = this.scene.pointerY) {
+        return this.getCache(x, y).hits;
+    }
+
+    getCache(x, y) {
+        const frameId = this.scene.getFrameId();
+        const cache = this.cache;
+        if (cache && cache.frameId === frameId && cache.x === x && cache.y === y) {
+            return cache;
+        }
+
+        // Every mesh: callers' predicates decide, exactly as they did with scene.pick
+        const hits = this.scene.multiPick(x, y, () => true) || [];
+        hits.sort((a, b) => a.distance - b.distance);
+        this.stats.casts++;
+
+        this.cache = { frameId, x, y, hits, results: new Map() };
+        return this.cache;
+    }
+
+    /**
+     * Drop cached hits (after meshes were added, moved or removed mid-frame)
+     */
+    invalidate() {
+        this.cache = null;
+    }
+
+    // ==================== GPU PICKING ====================
+
+    /**
+     * Whether pickAsync goes through the GPU picker for this scene
+     */
+    usesGpu() {
+        return typeof BABYLON.GPUPicker === 'function' &&
+            this.scene.meshes.length >= this.gpuMeshThreshold;
+    }
+
+    /**
+     * Pick without blocking on a CPU ray cast against every mesh
+     *
+     * Resolves to a PickingInfo, or null when a newer pickAsync call replaced
+     * this one before the GPU got to it (callers should ignore those).
+     */
+    pickAsync(x = this.scene.pointerX, y = this.scene.pointerY, predicate = null) {
+        if (!this.usesGpu()) {
+            return Promise.resolve(this.pickAt(x, y, predicate));
+        }
+
+        return new Promise((resolve, reject) => {
+            const request = { x, y, predicate, resolve, reject };
+            if (this.gpuInFlight) {
+                // Only the most recent position matters
+                if (this.gpuQueued) this.gpuQueued.resolve(null);
+                this.gpuQueued = request;
+                return;
+            }
+            this.runGpuPick(request);
+        });
+    }
+
+    runGpuPick(request) {
+        this.gpuInFlight = true;
+        const picker = this.getGpuPicker();
+
+        picker.pickAsync(request.x, request.y)
+            .then(result => {
+                const mesh = result && result.mesh;
+                if (!mesh) {
+                    request.resolve(new BABYLON.PickingInfo());
+                } else if (!(request.predicate || DEFAULT_PREDICATE)(mesh)) {
+                    // The nearest mesh is not one the caller wants (or stopped being
+                    // pickable since the list was built) - fall back to the ray list
+                    request.resolve(this.pickAt(request.x, request.y, request.predicate));
+                } else {
+                    // One mesh to intersect instead of the whole scene
+                    request.resolve(this.scene.pick(request.x, request.y, m => m === mesh));
+                }
+            })
+            .catch(request.reject)
+            .finally(() => {
+                this.gpuInFlight = false;
+                const next = this.gpuQueued;
+                this.gpuQueued = null;
+                if (next) this.runGpuPick(next);
+            });
+    }
+
+    getGpuPicker() {
+        if (!this.gpuPicker) {
+            this.gpuPicker = new BABYLON.GPUPicker();
+        }
+        // Tools toggle isPickable/isEnabled/isVisible on existing meshes (sketch
+        // mode makes every part unpickable), so the list is checked per pick
+        const list = this.scene.meshes.filter(DEFAULT_PREDICATE);
+        const current = this.gpuList;
+        if (!current || current.length !== list.length || list.some((mesh, i) => mesh !== current[i])) {
+            this.gpuPicker.setPickingList(list);
+            this.gpuList = list;
+        }
+        return this.gpuPicker;
+    }
+
+    dispose() {
+        this.scene.onPrePointerObservable.remove(this.prePointerObserver);
+        this.scene.onMeshRemovedObservable.remove(this.meshRemovedObserver);
+        if (this.gpuPicker) {
+            this.gpuPicker.dispose();
+            this.gpuPicker = null;
+            this.gpuList = null;
+        }
+        if (this.gpuQueued) {
+            this.gpuQueued.resolve(null);
+            this.gpuQueued = null;
+        }
+        this.cache = null;
+        services.delete(this.scene);
+    }
+}
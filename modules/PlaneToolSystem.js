@@ -122,13 +122,14 @@ export class PlaneToolSystem {
             this.startDragging(e);
         });
         
-        document.addEventListener('mousemove', (e) => {
+        this.documentMouseMove = (e) => {
             this.onDrag(e);
-        });
-        
-        document.addEventListener('mouseup', () => {
+        };
+        this.documentMouseUp = () => {
             this.stopDragging();
-        });
+        };
+        document.addEventListener('mousemove', this.documentMouseMove);
+        document.addEventListener('mouseup', this.documentMouseUp);
         
         // Close on outside click
         this.modal.addEventListener('click', (e) => {
@@ -550,6 +551,10 @@ export class PlaneToolSystem {
     destroy() {
         if (this.modal) {
             this.modal.remove();
+            this.modal = null;
         }
+        
+        document.removeEventListener('mousemove', this.documentMouseMove);
+        document.removeEventListener('mouseup', this.documentMouseUp);
     }
 }
\ No newline at end of file
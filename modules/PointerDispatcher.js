@@ -0,0 +1,95 @@
+/**
+ * PointerDispatcher Module - One Pointer Observer for Every Tool System
+ *
+ * Tool systems used to each add their own scene.onPointerObservable observer,
+ * check whether their tool was active and often run their own scene.pick, so a
+ * single pointer move cost one callback (and one pick) per installed tool. The
+ * dispatcher owns a single observer and hands each event only to the handlers
+ * registered for DrawingWorld.activeTool, plus any global handlers.
+ * Handlers pick through DrawingWorld.pickService, which shares one ray cast
+ * per frame between all of them.
+ */
+
+export class PointerDispatcher {
+    /**
+     * @param {BABYLON.Scene} scene
+     * @param {Function} getActiveTool - Returns the active tool name (DrawingWorld.activeTool)
+     */
+    constructor(scene, getActiveTool) {
+        this.scene = scene;
+        this.getActiveTool = getActiveTool;
+
+        this.handlersByTool = new Map(); // tool name -> [registration]
+        this.globalHandlers = [];        // registrations that see every event
+        this.observer = null;
+    }
+
+    /**
+     * Route pointer events to a handler
+     * @param {Function} handler - (pointerInfo) => void
+     * @param {Object} options - { tools: activeTool names the handler serves (omit for every event) }
+     * @returns {Object} Registration token for unregister()
+     */
+    register(handler, options = {}) {
+        const registration = { handler, tools: options.tools || null };
+
+        if (registration.tools) {
+            registration.tools.forEach(tool => {
+                if (!this.handlersByTool.has(tool)) {
+                    this.handlersByTool.set(tool, []);
+                }
+                this.handlersByTool.get(tool).push(registration);
+            });
+        } else {
+            this.globalHandlers.push(registration);
+        }
+
+        // Installed on first use so tool handlers run after DrawingWorld's own observers
+        if (!this.observer) {
+            this.observer = this.scene.onPointerObservable.add(pointerInfo => this.dispatch(pointerInfo));
+        }
+        return registration;
+    }
+
+    unregister(registration) {
+        if (!registration) return;
+
+        const remove = list => {
+            const index = list.indexOf(registration);
+            if (index !== -1) list.splice(index, 1);
+        };
+
+        if (registration.tools) {
+            registration.tools.forEach(tool => {
+                const list = this.handlersByTool.get(tool);
+                if (!list) return;
+                remove(list);
+                if (list.length === 0) this.handlersByTool.delete(tool);
+            });
+        } else {
+            remove(this.globalHandlers);
+        }
+    }
+
+    dispatch(pointerInfo) {
+        const toolHandlers = this.handlersByTool.get(this.getActiveTool());
+        if (!toolHandlers && this.globalHandlers.length === 0) return;
+
+        // Copy so handlers may unregister while the event is being delivered
+        const handlers = toolHandlers ? [...this.globalHandlers, ...toolHandlers] : [...this.globalHandlers];
+        for (const { handler } of handlers) {
+            handler(pointerInfo);
+            // A handler that consumed the event stops it here
+            if (pointerInfo.skipOnPointerObservable) break;
+        }
+    }
+
+    dispose() {
+        if (this.observer) {
+            this.scene.onPointerObservable.remove(this.observer);
+            this.observer = null;
+        }
+        this.handlersByTool.clear();
+        this.globalHandlers = [];
+    }
+}
@@ -0,0 +1,654 @@
+/**
+ * PolygonClipper Module - Integer 2D Polygon Offsetting, Booleans and Triangulation
+ *
+ * Scroll cuts on a flat board are a 2D problem: the kerf is the cut path
+ * offset by half the blade width, the cut board is its outline minus the kerf,
+ * and the pieces are that result extruded back to the board's thickness. This
+ * module does the 2D part in the manner of Clipper (Vatti/Johnson):
+ *
+ * - Coordinates are snapped to an integer grid (SCALE units per path unit), so
+ *   intersection and side tests are exact and repeatable.
+ * - booleanPolygons splits every edge at every crossing, merges coincident
+ *   edges, computes the winding number of both inputs on each side of each edge
+ *   and keeps the edges where the result fill changes. Fill is non-zero.
+ * - offsetPolyline builds the kerf as convex pieces (a rectangle per segment,
+ *   round joins on the outside of turns, round caps) and unions them.
+ * - triangulatePolygon ear-clips a result outline (holes bridged in) for
+ *   extrusion.
+ *
+ * Points are {x, y}; outer outlines come back counter-clockwise, holes
+ * clockwise. scripts/polygon_clipper.py is the same engine for offline use.
+ */
+
+const SCALE = 1000;                  // Grid units per path unit (10 µm for cm)
+const MAX_SPLIT_PASSES = 4;          // Rounded crossings can create new ones - rarely more than once
+const DEFAULT_ARC_TOLERANCE = 0.005; // Max chord error of round joins and caps, path units
+
+// ==================== GEOMETRY HELPERS ====================
+
+function cross(o, a, b) {
+    return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x);
+}
+
+/**
+ * Signed area, positive for counter-clockwise loops
+ */
+export function polygonArea(loop) {
+    let area = 0;
+    for (let i = 0, j = loop.length - 1; i < loop.length; j = i++) {
+        area += (loop[j].x - loop[i].x) * (loop[j].y + loop[i].y);
+    }
+    return area / 2;
+}
+
+function perimeter(loop) {
+    let length = 0;
+    for (let i = 0, j = loop.length - 1; i < loop.length; j = i++) {
+        length += Math.hypot(loop[i].x - loop[j].x, loop[i].y - loop[j].y);
+    }
+    return length;
+}
+
+function pointInLoop(point, loop) {
+    let inside = false;
+    for (let i = 0, j = loop.length - 1; i < loop.length; j = i++) {
+        const a = loop[i];
+        const b = loop[j];
+        if ((a.y > point.y) !== (b.y > point.y) &&
+            point.x < (b.x - a.x) * (point.y - a.y) / (b.y - a.y) + a.x) {
+            inside = !inside;
+        }
+    }
+    return inside;
+}
+
+// Integer loop without repeated points; null when nothing is left of it
+function toGrid(loop) {
+    const points = [];
+    loop.forEach(p => {
+        const q = { x: Math.round(p.x * SCALE), y: Math.round(p.y * SCALE) };
+        const last = points[points.length - 1];
+        if (!last || last.x !== q.x || last.y !== q.y) points.push(q);
+    });
+    while (points.length > 1 && points[0].x === points[points.length - 1].x && points[0].y === points[points.length - 1].y) {
+        points.pop();
+    }
+    return points.length >= 3 ? points : null;
+}
+
+// ==================== EDGE ARRANGEMENT ====================
+
+// Segments run from their lexicographically smaller end; w[set] is +1 per
+// input edge running that way, -1 per edge running the other way
+function makeSegment(ax, ay, bx, by, w0, w1) {
+    if (ax > bx || (ax === bx && ay > by)) {
+        return { ax: bx, ay: by, bx: ax, by: ay, w: [-w0, -w1] };
+    }
+    return { ax, ay, bx, by, w: [w0, w1] };
+}
+
+function addLoop(segments, loop, set) {
+    for (let i = 0; i < loop.length; i++) {
+        const a = loop[i];
+        const b = loop[(i + 1) % loop.length];
+        segments.push(makeSegment(a.x, a.y, b.x, b.y, set === 0 ? 1 : 0, set === 1 ? 1 : 0));
+    }
+}
+
+function addSplit(splits, index, x, y) {
+    if (!splits.has(index)) splits.set(index, []);
+    splits.get(index).push({ x, y });
+}
+
+// Strictly between a segment's ends, for a point known to be on its line
+function strictlyInside(s, x, y) {
+    if (s.ax !== s.bx) return x > s.ax && x < s.bx;
+    return y > s.ay && y < s.by;
+}
+
+function intersect(segments, i, j, splits) {
+    const s = segments[i];
+    const t = segments[j];
+    const d1x = s.bx - s.ax, d1y = s.by - s.ay;
+    const d2x = t.bx - t.ax, d2y = t.by - t.ay;
+    const ex = t.ax - s.ax, ey = t.ay - s.ay;
+    let denom = d1x * d2y - d1y * d2x;
+
+    if (denom === 0) {
+        // Parallel: only collinear overlaps matter, split each at the other's ends
+        if (ex * d1y - ey * d1x !== 0) return;
+        if (strictlyInside(s, t.ax, t.ay)) addSplit(splits, i, t.ax, t.ay);
+        if (strictlyInside(s, t.bx, t.by)) addSplit(splits, i, t.bx, t.by);
+        if (strictlyInside(t, s.ax, s.ay)) addSplit(splits, j, s.ax, s.ay);
+        if (strictlyInside(t, s.bx, s.by)) addSplit(splits, j, s.bx, s.by);
+        return;
+    }
+
+    let sNum = ex * d2y - ey * d2x;
+    let tNum = ex * d1y - ey * d1x;
+    if (denom < 0) {
+        denom = -denom;
+        sNum = -sNum;
+        tNum = -tNum;
+    }
+    if (sNum < 0 || sNum > denom || tNum < 0 || tNum > denom) return;
+
+    // Touching ends split the other segment exactly; crossings are rounded to the grid
+    let x, y;
+    if (tNum === 0) { x = t.ax; y = t.ay; }
+    else if (tNum === denom) { x = t.bx; y = t.by; }
+    else if (sNum === 0) { x = s.ax; y = s.ay; }
+    else if (sNum === denom) { x = s.bx; y = s.by; }
+    else {
+        x = Math.round(s.ax + d1x * sNum / denom);
+        y = Math.round(s.ay + d1y * sNum / denom);
+    }
+
+    if (sNum > 0 && sNum < denom && !(x === s.ax && y === s.ay) && !(x === s.bx && y === s.by)) {
+        addSplit(splits, i, x, y);
+    }
+    if (tNum > 0 && tNum < denom && !(x === t.ax && y === t.ay) && !(x === t.bx && y === t.by)) {
+        addSplit(splits, j, x, y);
+    }
+}
+
+// Split every segment at every crossing, overlap and touching end
+function splitSegments(segments) {
+    for (let pass = 0; pass < MAX_SPLIT_PASSES; pass++) {
+        const order = segments.map((_, i) => i).sort((i, j) => segments[i].ax - segments[j].ax);
+        const splits = new Map();
+
+        for (let m = 0; m < order.length; m++) {
+            const s = segments[order[m]];
+            const sMinY = Math.min(s.ay, s.by), sMaxY = Math.max(s.ay, s.by);
+            for (let n = m + 1; n < order.length; n++) {
+                const t = segments[order[n]];
+                if (t.ax > s.bx) break;
+                if (Math.max(t.ay, t.by) < sMinY || Math.min(t.ay, t.by) > sMaxY) continue;
+                intersect(segments, order[m], order[n], splits);
+            }
+        }
+        if (splits.size === 0) break;
+
+        const result = [];
+        segments.forEach((s, i) => {
+            const points = splits.get(i);
+            if (!points) {
+                result.push(s);
+                return;
+            }
+            points.sort((p, q) => (p.x - q.x) || (p.y - q.y));
+            let ax = s.ax, ay = s.ay;
+            points.forEach(p => {
+                if (p.x === ax && p.y === ay) return;
+                result.push(makeSegment(ax, ay, p.x, p.y, s.w[0], s.w[1]));
+                ax = p.x;
+                ay = p.y;
+            });
+            result.push(makeSegment(ax, ay, s.bx, s.by, s.w[0], s.w[1]));
+        });
+        segments = result;
+    }
+    return segments;
+}
+
+// Coincident segments become one carrying the summed windings
+function mergeSegments(segments) {
+    const merged = new Map();
+    segments.forEach(s => {
+        if (s.ax === s.bx && s.ay === s.by) return;
+        const key = `${s.ax},${s.ay},${s.bx},${s.by}`;
+        const existing = merged.get(key);
+        if (existing) {
+            existing.w[0] += s.w[0];
+            existing.w[1] += s.w[1];
+        } else {
+            merged.set(key, { ax: s.ax, ay: s.ay, bx: s.bx, by: s.by, w: [s.w[0], s.w[1]] });
+        }
+    });
+    return [...merged.values()].filter(s => s.w[0] !== 0 || s.w[1] !== 0);
+}
+
+/**
+ * Buckets segments into slabs so a ray only visits the segments it can cross
+ * axis 'x': vertical rays (non-vertical segments by x range)
+ * axis 'y': horizontal rays (non-horizontal segments by y range)
+ */
+class SlabIndex {
+    constructor(segments, axis) {
+        this.axis = axis;
+        const spans = segments.map(s => axis === 'x' ? [s.ax, s.bx] : [Math.min(s.ay, s.by), Math.max(s.ay, s.by)]);
+        this.min = Math.min(...spans.map(span => span[0]));
+        const max = Math.max(...spans.map(span => span[1]));
+        this.count = Math.max(1, Math.ceil(Math.sqrt(segments.length)));
+        this.size = Math.max(1, (max - this.min) / this.count);
+        this.slabs = Array.from({ length: this.count }, () => []);
+
+        segments.forEach((s, i) => {
+            const [lo, hi] = spans[i];
+            if (lo === hi) return;
+            for (let k = this.slab(lo); k <= this.slab(hi); k++) this.slabs[k].push(s);
+        });
+    }
+
+    slab(value) {
+        return Math.max(0, Math.min(this.count - 1, Math.floor((value - this.min) / this.size)));
+    }
+
+    at(value) {
+        return this.slabs[this.slab(value)];
+    }
+}
+
+// Winding numbers of both inputs just left of each segment (seen from a to b)
+function computeWindings(segments) {
+    const columns = new SlabIndex(segments, 'x');
+    const rows = new SlabIndex(segments, 'y');
+
+    segments.forEach(s => {
+        // Doubled midpoint keeps the side tests in integers
+        const px = s.ax + s.bx, py = s.ay + s.by;
+        const left = [0, 0];
+
+        if (s.ax !== s.bx) {
+            // Left of a +x segment is above it: count segments crossed by an upward ray
+            columns.at(px / 2).forEach(t => {
+                if (t === s || 2 * t.ax > px || 2 * t.bx <= px) return;
+                const side = (t.bx - t.ax) * (py - 2 * t.ay) - (t.by - t.ay) * (px - 2 * t.ax);
+                if (side < 0) {
+                    left[0] -= t.w[0];
+                    left[1] -= t.w[1];
+                }
+            });
+        } else {
+            // Left of a +y segment is toward -x: count segments crossed by a leftward ray
+            rows.at(py / 2).forEach(t => {
+                if (t === s) return;
+                const up = t.by > t.ay;
+                const lx = up ? t.ax : t.bx, ly = up ? t.ay : t.by;
+                const hx = up ? t.bx : t.ax, hy = up ? t.by : t.ay;
+                if (2 * ly > py || 2 * hy <= py) return;
+                const side = (hx - lx) * (py - 2 * ly) - (hy - ly) * (px - 2 * lx);
+                if (side < 0) {
+                    const sign = up ? -1 : 1;
+                    left[0] += sign * t.w[0];
+                    left[1] += sign * t.w[1];
+                }
+            });
+        }
+        s.left = left;
+    });
+}
+
+const OPERATIONS = {
+    union: (a, b) => a || b,
+    intersection: (a, b) => a && b,
+    difference: (a, b) => a && !b,
+    xor: (a, b) => a !== b
+};
+
+// Join boundary edges (filled side on the left) into loops, taking the
+// sharpest left turn at shared vertices so touching loops stay separate
+function linkLoops(edges) {
+    const outgoing = new Map();
+    edges.forEach(e => {
+        const key = `${e.ax},${e.ay}`;
+        if (!outgoing.has(key)) outgoing.set(key, []);
+        outgoing.get(key).push(e);
+    });
+
+    const loops = [];
+    edges.forEach(first => {
+        if (first.used) return;
+        const loop = [];
+        let edge = first;
+        while (edge) {
+            edge.used = true;
+            loop.push({ x: edge.ax, y: edge.ay });
+            const back = Math.atan2(edge.ay - edge.by, edge.ax - edge.bx);
+            let next = null;
+            let best = Infinity;
+            (outgoing.get(`${edge.bx},${edge.by}`) || []).forEach(candidate => {
+                if (candidate.used && candidate !== first) return;
+                let turn = back - Math.atan2(candidate.by - candidate.ay, candidate.bx - candidate.ax);
+                while (turn <= 0) turn += 2 * Math.PI;
+                while (turn > 2 * Math.PI) turn -= 2 * Math.PI;
+                if (turn < best) {
+                    best = turn;
+                    next = candidate;
+                }
+            });
+            edge = next === first ? null : next;
+        }
+
+        // Drop straight-through and spike vertices
+        let cleaned = loop;
+        let changed = true;
+        while (changed && cleaned.length >= 3) {
+            changed = false;
+            const kept = cleaned.filter((p, i) => {
+                const prev = cleaned[(i + cleaned.length - 1) % cleaned.length];
+                const next = cleaned[(i + 1) % cleaned.length];
+                return cross(prev, p, next) !== 0;
+            });
+            changed = kept.length !== cleaned.length;
+            cleaned = kept;
+        }
+        // Rounding can leave loops a grid unit wide; they are not geometry
+        if (cleaned.length >= 3 && 2 * Math.abs(polygonArea(cleaned)) > perimeter(cleaned)) loops.push(cleaned);
+    });
+    return loops;
+}
+
+/**
+ * Boolean operation on two sets of polygons (non-zero fill within each set)
+ * @param {Array<Array<{x, y}>>} subject
+ * @param {Array<Array<{x, y}>>} clip
+ * @param {string} operation - 'union' | 'intersection' | 'difference' | 'xor'
+ * @returns {Array<Array<{x, y}>>} Outer loops counter-clockwise, holes clockwise
+ */
+export function booleanPolygons(subject, clip, operation = 'union') {
+    if (!OPERATIONS[operation]) throw new Error(`PolygonClipper: unknown operation '${operation}'`);
+    return fromGrid(booleanGrid(subject.map(toGrid), clip.map(toGrid), operation));
+}
+
+function fromGrid(loops) {
+    return loops.map(loop => loop.map(p => ({ x: p.x / SCALE, y: p.y / SCALE })));
+}
+
+function booleanGrid(subject, clip, operation) {
+    const fill = OPERATIONS[operation];
+    let segments = [];
+    subject.forEach(loop => { if (loop) addLoop(segments, loop, 0); });
+    clip.forEach(loop => { if (loop) addLoop(segments, loop, 1); });
+    if (segments.length === 0) return [];
+
+    segments = mergeSegments(splitSegments(segments));
+    if (segments.length === 0) return [];
+    computeWindings(segments);
+
+    const edges = [];
+    segments.forEach(s => {
+        const leftFilled = fill(s.left[0] !== 0, s.left[1] !== 0);
+        const rightFilled = fill(s.left[0] - s.w[0] !== 0, s.left[1] - s.w[1] !== 0);
+        if (leftFilled === rightFilled) return;
+        edges.push(leftFilled
+            ? { ax: s.ax, ay: s.ay, bx: s.bx, by: s.by }
+            : { ax: s.bx, ay: s.by, bx: s.ax, by: s.ay });
+    });
+
+    return linkLoops(edges);
+}
+
+/**
+ * Sort boolean output into outlines with their holes
+ * @returns {Array<{outer, holes, area}>} Largest first
+ */
+export function groupPolygons(loops) {
+    const outers = [];
+    const holes = [];
+    loops.forEach(loop => {
+        const area = polygonArea(loop);
+        if (area > 0) outers.push({ outer: loop, holes: [], area });
+        else if (area < 0) holes.push({ loop, area });
+    });
+
+    holes.forEach(({ loop, area }) => {
+        const probe = { x: (loop[0].x + loop[1].x) / 2, y: (loop[0].y + loop[1].y) / 2 };
+        let owner = null;
+        outers.forEach(candidate => {
+            if (pointInLoop(probe, candidate.outer) && (!owner || candidate.area < owner.area)) owner = candidate;
+        });
+        if (owner) {
+            owner.holes.push(loop);
+            owner.net = (owner.net ?? owner.area) + area;
+        }
+    });
+
+    return outers
+        .map(group => ({ outer: group.outer, holes: group.holes, area: group.net ?? group.area }))
+        .sort((a, b) => b.area - a.area);
+}
+
+// ==================== OFFSETTING ====================
+
+/**
+ * Region within delta of an open polyline (round joins and round ends)
+ *
+ * Built from convex pieces in grid coordinates - a rectangle per segment, a
+ * join piece on the outside of each turn, a half disc at each end - and
+ * unioned. Neighbouring pieces are given the same grid corners, so the edges
+ * they share cancel exactly instead of leaving rounding slivers.
+ *
+ * @param {Array<{x, y}>} points
+ * @param {number} delta - Offset distance (half the kerf)
+ * @param {Object} options - { arcTolerance }
+ * @returns {Array<Array<{x, y}>>}
+ */
+export function offsetPolyline(points, delta, options = {}) {
+    const arcTolerance = options.arcTolerance ?? DEFAULT_ARC_TOLERANCE;
+    const step = delta > arcTolerance ? 2 * Math.acos(1 - arcTolerance / delta) : Math.PI / 2;
+    const d = delta * SCALE;
+
+    const path = [];
+    points.forEach(p => {
+        const q = { x: p.x * SCALE, y: p.y * SCALE };
+        const last = path[path.length - 1];
+        if (!last || Math.hypot(q.x - last.x, q.y - last.y) >= 1) path.push(q);
+    });
+    if (path.length === 0 || d < 1) return [];
+
+    const snap = (center, angle, radius = d) => ({
+        x: Math.round(center.x + radius * Math.cos(angle)),
+        y: Math.round(center.y + radius * Math.sin(angle))
+    });
+    // Points strictly between two angles on the arc around center
+    const arc = (center, from, sweep) => {
+        const count = Math.max(1, Math.ceil(Math.abs(sweep) / step));
+        const result = [];
+        for (let k = 1; k < count; k++) result.push(snap(center, from + sweep * k / count));
+        return result;
+    };
+
+    if (path.length === 1) {
+        return fromGrid(booleanGrid([[snap(path[0], 0), ...arc(path[0], 0, 2 * Math.PI)]], [], 'union'));
+    }
+
+    // Left normal angle of each segment, and its four corners (L = left, R = right)
+    const segments = [];
+    for (let i = 0; i < path.length - 1; i++) {
+        const a = path[i];
+        const b = path[i + 1];
+        const normal = Math.atan2(b.y - a.y, b.x - a.x) + Math.PI / 2;
+        segments.push({
+            normal,
+            length: Math.hypot(b.x - a.x, b.y - a.y),
+            startL: snap(a, normal), startR: snap(a, normal + Math.PI),
+            endL: snap(b, normal), endR: snap(b, normal + Math.PI)
+        });
+    }
+
+    const pieces = [];
+    for (let i = 1; i < path.length - 1; i++) {
+        const v = path[i];
+        const before = segments[i - 1];
+        const after = segments[i];
+        let turn = after.normal - before.normal;
+        while (turn > Math.PI) turn -= 2 * Math.PI;
+        while (turn < -Math.PI) turn += 2 * Math.PI;
+
+        // A mitre within tolerance of the round join lets both segments share
+        // its corners - unless moving them would fold a short segment
+        const mitre = d / Math.cos(turn / 2);
+        const shift = d * Math.tan(Math.abs(turn) / 2);
+        if (mitre - d <= arcTolerance * SCALE && 2 * shift <= Math.min(before.length, after.length)) {
+            const bisector = before.normal + turn / 2;
+            before.endL = after.startL = snap(v, bisector, mitre);
+            before.endR = after.startR = snap(v, bisector + Math.PI, mitre);
+        } else if (turn > 0) {
+            // Left turn opens on the right. The piece crosses itself at v; its
+            // inner lobe lies inside both rectangles, so it stays filled
+            pieces.push([
+                before.endR, ...arc(v, before.normal + Math.PI, turn), after.startR,
+                after.startL, before.endL
+            ]);
+        } else {
+            pieces.push([
+                after.startL, ...arc(v, after.normal, -turn), before.endL,
+                before.endR, after.startR
+            ]);
+        }
+    }
+
+    segments.forEach(s => pieces.push([s.startR, s.endR, s.endL, s.startL]));
+
+    // Round ends
+    const first = segments[0];
+    const last = segments[segments.length - 1];
+    pieces.push([first.startL, ...arc(path[0], first.normal, Math.PI), first.startR]);
+    pieces.push([last.endR, ...arc(path[path.length - 1], last.normal + Math.PI, Math.PI), last.endL]);
+
+    return fromGrid(booleanGrid(pieces, [], 'union'));
+}
+
+// ==================== TRIANGULATION ====================
+
+function createNode(index, point) {
+    return { i: index, x: point.x, y: point.y, prev: null, next: null };
+}
+
+function linkRing(loop, offset, counterClockwiseRing) {
+    const ordered = (polygonArea(loop) > 0) === counterClockwiseRing ? loop : loop.slice().reverse();
+    const indices = (polygonArea(loop) > 0) === counterClockwiseRing
+        ? loop.map((_, k) => offset + k)
+        : loop.map((_, k) => offset + loop.length - 1 - k);
+    const nodes = ordered.map((p, k) => createNode(indices[k], p));
+    nodes.forEach((node, k) => {
+        node.next = nodes[(k + 1) % nodes.length];
+        node.prev = nodes[(k + nodes.length - 1) % nodes.length];
+    });
+    return nodes[0];
+}
+
+function ringNodes(start) {
+    const nodes = [];
+    let p = start;
+    do {
+        nodes.push(p);
+        p = p.next;
+    } while (p !== start);
+    return nodes;
+}
+
+function segmentsCross(a, b, c, d) {
+    const d1 = cross(a, b, c), d2 = cross(a, b, d);
+    const d3 = cross(c, d, a), d4 = cross(c, d, b);
+    return ((d1 > 0 && d2 < 0) || (d1 < 0 && d2 > 0)) && ((d3 > 0 && d4 < 0) || (d3 < 0 && d4 > 0));
+}
+
+// Whether the direction toward b leaves node a into the polygon (interior on the left)
+function locallyInside(a, b) {
+    if (cross(a.prev, a, a.next) >= 0) {
+        return cross(a, a.next, b) > 0 && cross(a.prev, a, b) > 0;
+    }
+    return cross(a, a.next, b) > 0 || cross(a.prev, a, b) > 0;
+}
+
+// Connect a hole ring to the outer ring through the nearest vertex both can see
+function bridgeHole(outerStart, holeStart, pendingHoles) {
+    let hole = holeStart;
+    ringNodes(holeStart).forEach(p => { if (p.x > hole.x) hole = p; });
+
+    const blockers = [outerStart, holeStart, ...pendingHoles].flatMap(ringNodes);
+    const candidates = ringNodes(outerStart)
+        .filter(p => p.x >= hole.x)
+        .sort((p, q) => Math.hypot(p.x - hole.x, p.y - hole.y) - Math.hypot(q.x - hole.x, q.y - hole.y));
+    const all = candidates.length > 0 ? candidates : ringNodes(outerStart);
+
+    const target = all.find(p =>
+        locallyInside(p, hole) && locallyInside(hole, p) &&
+        !blockers.some(e => e !== p && e.next !== p && e !== hole && e.next !== hole && segmentsCross(hole, p, e, e.next))
+    ) || all[0];
+
+    const target2 = createNode(target.i, target);
+    const hole2 = createNode(hole.i, hole);
+    const targetNext = target.next;
+    const holePrev = hole.prev;
+    target.next = hole;
+    hole.prev = target;
+    target2.next = targetNext;
+    targetNext.prev = target2;
+    hole2.next = target2;
+    target2.prev = hole2;
+    holePrev.next = hole2;
+    hole2.prev = holePrev;
+    return outerStart;
+}
+
+function isEar(ear) {
+    const a = ear.prev, b = ear, c = ear.next;
+    if (cross(a, b, c) <= 0) return false;
+    for (let p = c.next; p !== a; p = p.next) {
+        if ((p.x === a.x && p.y === a.y) || (p.x === b.x && p.y === b.y) || (p.x === c.x && p.y === c.y)) continue;
+        if (cross(a, b, p) >= 0 && cross(b, c, p) >= 0 && cross(c, a, p) >= 0 && cross(p.prev, p, p.next) <= 0) {
+            return false;
+        }
+    }
+    return true;
+}
+
+function removeNode(node) {
+    node.prev.next = node.next;
+    node.next.prev = node.prev;
+}
+
+/**
+ * Triangulate an outline with holes
+ * @returns {{vertices: Array<{x, y}>, indices: Array<number>}} Counter-clockwise triangles
+ */
+export function triangulatePolygon(outer, holes = []) {
+    const vertices = [...outer, ...holes.flat()];
+    const indices = [];
+
+    let start = linkRing(outer, 0, true);
+    let offset = outer.length;
+    const holeRings = holes.map(hole => {
+        const ring = linkRing(hole, offset, false);
+        offset += hole.length;
+        return ring;
+    });
+    holeRings
+        .map(ring => ({ ring, maxX: Math.max(...ringNodes(ring).map(p => p.x)) }))
+        .sort((a, b) => b.maxX - a.maxX)
+        .forEach(({ ring }, k, sorted) => {
+            start = bridgeHole(start, ring, sorted.slice(k + 1).map(h => h.ring));
+        });
+
+    let ear = start;
+    let stop = ear;
+    let forced = false;
+    while (ear.prev !== ear.next) {
+        const prev = ear.prev;
+        const next = ear.next;
+        if (cross(prev, ear, next) === 0 && (forced || (ear.x === prev.x && ear.y === prev.y) || (ear.x === next.x && ear.y === next.y))) {
+            // Degenerate vertex: drop it without a triangle
+            removeNode(ear);
+            ear = stop = next;
+            continue;
+        }
+        if (isEar(ear) || (forced && cross(prev, ear, next) > 0)) {
+            indices.push(prev.i, ear.i, next.i);
+            removeNode(ear);
+            ear = stop = next.next;
+            forced = false;
+            continue;
+        }
+        ear = next;
+        if (ear === stop) {
+            // No clean ear in a full lap (touching or collinear geometry): take the next convex one
+            if (forced) break;
+            forced = true;
+        }
+    }
+    return { vertices, indices };
+}
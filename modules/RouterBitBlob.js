@@ -0,0 +1,75 @@
+/**
+ * RouterBitBlob Module - Decoder for Imported Router Bit Meshes
+ *
+ * Custom bits are stored as compact binary blobs by scripts/import_router_bit.py
+ * (welded, decimated, 16-bit quantized positions, octahedral normals) and
+ * served by load-router-bits.php?blob=<hash>. See the script for the layout.
+ */
+
+const MAGIC = 'CLRB';
+const FORMAT_VERSION = 1;
+const HEADER_BYTES = 40;
+
+/**
+ * Decode a blob into vertex arrays
+ * @param {ArrayBuffer} buffer
+ * @returns {{positions: Float32Array, normals: Float32Array, indices: Uint16Array|Uint32Array, bounds: Object}}
+ */
+export function decodeRouterBitBlob(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== MAGIC || view.getUint16(4, true) !== FORMAT_VERSION) {
+        throw new Error('RouterBitBlob: unsupported router bit mesh');
+    }
+
+    const indexSize = view.getUint16(6, true);
+    const vertexCount = view.getUint32(8, true);
+    const indexCount = view.getUint32(12, true);
+    const min = [0, 1, 2].map(i => view.getFloat32(16 + i * 4, true));
+    const max = [0, 1, 2].map(i => view.getFloat32(28 + i * 4, true));
+
+    // Positions: 0..65535 across the bounds
+    const quantized = new Uint16Array(buffer, HEADER_BYTES, vertexCount * 3);
+    const positions = new Float32Array(vertexCount * 3);
+    for (let i = 0; i < positions.length; i++) {
+        const axis = i % 3;
+        positions[i] = min[axis] + (quantized[i] / 65535) * (max[axis] - min[axis]);
+    }
+
+    // Normals: octahedral pairs
+    const encoded = new Int8Array(buffer, HEADER_BYTES + vertexCount * 6, vertexCount * 2);
+    const normals = new Float32Array(vertexCount * 3);
+    for (let i = 0; i < vertexCount; i++) {
+        let x = encoded[i * 2] / 127;
+        let y = encoded[i * 2 + 1] / 127;
+        const z = 1 - Math.abs(x) - Math.abs(y);
+        if (z < 0) {
+            const folded = x;
+            x = (1 - Math.abs(y)) * Math.sign(x || 1);
+            y = (1 - Math.abs(folded)) * Math.sign(y || 1);
+        }
+        const length = Math.hypot(x, y, z) || 1;
+        normals[i * 3] = x / length;
+        normals[i * 3 + 1] = y / length;
+        normals[i * 3 + 2] = z / length;
+    }
+
+    const indexOffset = HEADER_BYTES + vertexCount * 8;
+    const indices = indexSize === 2
+        ? new Uint16Array(buffer, indexOffset, indexCount).slice()
+        : new Uint32Array(buffer, indexOffset, indexCount).slice();
+
+    return { positions, normals, indices, bounds: { min, max } };
+}
+
+/**
+ * Decoded blob as Babylon vertex data
+ */
+export function routerBitVertexData(buffer) {
+    const decoded = decodeRouterBitBlob(buffer);
+    const vertexData = new BABYLON.VertexData();
+    vertexData.positions = decoded.positions;
+    vertexData.normals = decoded.normals;
+    vertexData.indices = decoded.indices;
+    return vertexData;
+}
@@ -0,0 +1,154 @@
+/**
+ * RouterBitLibrary Module - Paged Router Bit Library with Client-Side Geometry Cache
+ *
+ * The router bit modal used to get the whole library, every bit's mesh
+ * included, in one response. The library is now browsed a page at a time
+ * through router-bit-index.php (names, categories, sizes and thumbnails only);
+ * a bit's profile and mesh are fetched the first time it is picked and kept in
+ * IndexedDB by content hash, so later sessions load it without the network.
+ */
+
+import { decodeRouterBitBlob } from './RouterBitBlob.js';
+
+const DB_NAME = 'cutlist-router-bits';
+const DB_VERSION = 1;
+const GEOMETRY_STORE = 'geometry';
+const DEFAULT_PAGE_SIZE = 24;
+
+export class RouterBitLibrary {
+    /**
+     * @param {Object} options - { indexUrl, blobUrl, pageSize }
+     */
+    constructor(options = {}) {
+        this.indexUrl = options.indexUrl || 'router-bit-index.php';
+        this.blobUrl = options.blobUrl || 'load-router-bits.php';
+        this.pageSize = options.pageSize ?? DEFAULT_PAGE_SIZE;
+
+        this.bits = new Map();   // name -> Promise({ summary, profile, geometry })
+        this.dbPromise = null;
+        this.stats = { cacheHits: 0, downloads: 0 };
+    }
+
+    /**
+     * One page of bit summaries
+     * Revalidated with the server's ETag, so an unchanged page costs a 304.
+     * @param {Object} options - { query, category, page }
+     * @returns {Promise<{bits: Array, categories: Array, total: number, page: number, pages: number}>}
+     */
+    async fetchPage({ query = '', category = '', page = 1 } = {}) {
+        const params = new URLSearchParams({ q: query, category, page, limit: this.pageSize });
+        return this.fetchJson(`${this.indexUrl}?${params}`);
+    }
+
+    /**
+     * Profile and geometry for a bit from a page summary (fetched once, then cached)
+     * @returns {Promise<{summary: Object, profile: Array, geometry: Object}>}
+     */
+    getBit(summary) {
+        let request = this.bits.get(summary.name);
+        if (!request) {
+            request = this.loadBit(summary);
+            request.catch(() => this.bits.delete(summary.name));
+            this.bits.set(summary.name, request);
+        }
+        return request;
+    }
+
+    async loadBit(summary) {
+        if (summary.hash) {
+            const cached = await this.readCache(summary.hash);
+            if (cached) {
+                this.stats.cacheHits++;
+                return { summary, profile: cached.profile, geometry: decodeRouterBitBlob(cached.buffer) };
+            }
+        }
+
+        this.stats.downloads++;
+        const detail = await this.fetchJson(`${this.indexUrl}?name=${encodeURIComponent(summary.name)}`);
+        const entry = detail.bit;
+
+        // Legacy bits (not imported yet) still carry raw arrays
+        if (!entry.hash) {
+            const meshData = entry.meshData || {};
+            return {
+                summary,
+                profile: entry.profile || [],
+                geometry: {
+                    positions: new Float32Array(meshData.positions || []),
+                    normals: new Float32Array(meshData.normals || []),
+                    indices: new Uint32Array(meshData.indices || [])
+                }
+            };
+        }
+
+        const response = await fetch(`${this.blobUrl}?blob=${entry.hash}`);
+        if (!response.ok) {
+            throw new Error(`RouterBitLibrary: mesh request failed (${response.status})`);
+        }
+        const buffer = await response.arrayBuffer();
+        this.writeCache({ hash: entry.hash, profile: entry.profile || [], buffer });
+        return { summary, profile: entry.profile || [], geometry: decodeRouterBitBlob(buffer) };
+    }
+
+    async fetchJson(url) {
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`RouterBitLibrary: request failed (${response.status})`);
+        }
+        return response.json();
+    }
+
+    // ==================== INDEXEDDB ====================
+
+    /**
+     * Resolves to null where IndexedDB is unavailable (private browsing, old
+     * browsers) - bits are then simply fetched each session
+     */
+    openDatabase() {
+        if (!this.dbPromise) {
+            this.dbPromise = new Promise(resolve => {
+                if (!window.indexedDB) {
+                    resolve(null);
+                    return;
+                }
+                const request = window.indexedDB.open(DB_NAME, DB_VERSION);
+                request.onupgradeneeded = () => {
+                    request.result.createObjectStore(GEOMETRY_STORE, { keyPath: 'hash' });
+                };
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => resolve(null);
+                request.onblocked = () => resolve(null);
+            });
+        }
+        return this.dbPromise;
+    }
+
+    async readCache(hash) {
+        const db = await this.openDatabase();
+        if (!db) return null;
+        return new Promise(resolve => {
+            const request = db.transaction(GEOMETRY_STORE, 'readonly').objectStore(GEOMETRY_STORE).get(hash);
+            request.onsuccess = () => resolve(request.result || null);
+            request.onerror = () => resolve(null);
+        });
+    }
+
+    async writeCache(record) {
+        const db = await this.openDatabase();
+        if (!db) return;
+        try {
+            // Blobs are content-addressed: a put never replaces different data
+            db.transaction(GEOMETRY_STORE, 'readwrite').objectStore(GEOMETRY_STORE).put(record);
+        } catch (error) {
+            console.warn('RouterBitLibrary: could not cache bit geometry', error);
+        }
+    }
+
+    dispose() {
+        this.bits.clear();
+        if (this.dbPromise) {
+            this.dbPromise.then(db => db && db.close());
+            this.dbPromise = null;
+        }
+    }
+}
@@ -14,6 +14,12 @@
  * - Material-aware feed rate calculations
  */
 
+import { EdgeIndexCache } from './EdgeIndex.js';
+import { RouterProfileCache } from './RouterProfileCache.js';
+import { ANALYTIC_PROFILES, TOP_EDGE_SIDES, getEdgeProfile, profileFromOutline, isPlainBox, buildProfiledBox } from './EdgeProfileExtruder.js';
+import { PartInstancer } from './PartInstancing.js';
+import { RouterBitLibrary } from './RouterBitLibrary.js';
+
 export class RouterBitSystem {
     constructor(drawingWorld) {
         this.drawingWorld = drawingWorld;
@@ -30,6 +36,11 @@ export class RouterBitSystem {
         // Router bit library
         this.routerBitLibrary = null;
         this.currentBitSize = 0.25; // Default 1/4" radius
+        // Profiles and cutter meshes by bit/size/length - owned by DrawingWorld so they survive idle teardown
+        this.profileCache = drawingWorld.routerProfileCache || new RouterProfileCache();
+        this.bitLibrary = new RouterBitLibrary(); // Imported bits, paged from the server
+        this.libraryQuery = { query: '', category: '', page: 1 };
+        this.libraryRequest = 0;
         
         // Visual elements
         this.edgePreviewMaterial = null;
@@ -42,6 +53,9 @@ export class RouterBitSystem {
         
         // Edge detection
         this.edgeDetectionTolerance = 0.1; // 1mm tolerance for edge detection
+        this.edgeHoverTolerance = 3.0; // Max pick-to-edge distance (cm) for hover
+        this.edgeIndexCache = drawingWorld.edgeIndexCache || new EdgeIndexCache({ featureAngle: 30 });
+        this.edgeObjects = new WeakMap(); // EdgeIndex -> Map(edgeIndex -> edge)
         this.detectedEdges = [];
         this.focusPart = null; // Currently focused part for edge detection
         
@@ -95,7 +109,7 @@ export class RouterBitSystem {
      * Setup mouse tracking for edge detection
      */
     setupMouseTracking() {
-        this.pointerObserver = this.scene.onPointerObservable.add((pointerInfo) => {
+        this.pointerObserver = this.drawingWorld.pointerDispatcher.register((pointerInfo) => {
             if (!this.isActive) return;
             
             if (pointerInfo.type === BABYLON.PointerEventTypes.POINTERMOVE) {
@@ -105,7 +119,7 @@ export class RouterBitSystem {
                     this.handleEdgeSelection(pointerInfo);
                 }
             }
-        });
+        }, { tools: ['router'] });
         
         // console.log('RouterBitSystem: Mouse tracking setup complete');
     }
@@ -114,11 +128,7 @@ export class RouterBitSystem {
      * Handle edge hover detection
      */
     handleEdgeHover(pointerInfo) {
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX,
-            this.scene.pointerY,
-            (mesh) => this.isRoutablePart(mesh)
-        );
+        const pickInfo = this.drawingWorld.pickService.pick((mesh) => this.isRoutablePart(mesh));
         
         if (pickInfo.hit && pickInfo.pickedMesh) {
             const edge = this.detectEdgeFromPick(pickInfo);
@@ -147,9 +157,7 @@ export class RouterBitSystem {
             }
         } else {
             // If no edge is hovered but we clicked on a part, set it as focus part
-            const pickInfo = this.scene.pick(
-                this.scene.pointerX,
-                this.scene.pointerY,
+            const pickInfo = this.drawingWorld.pickService.pick(
                 (mesh) => mesh && (mesh.isWorkBenchPart || mesh.isProjectPart)
             );
             
@@ -162,110 +170,92 @@ export class RouterBitSystem {
     
     /**
      * Detect edge from pick information
+     * Uses the precomputed feature-edge index for the picked mesh, so hover cost
+     * no longer depends on rebuilding bounds and works for cut or beveled parts.
      */
     detectEdgeFromPick(pickInfo) {
         const mesh = pickInfo.pickedMesh;
         const pickPoint = pickInfo.pickedPoint;
+        if (!mesh || !pickPoint) return null;
+        
+        const edgeIndex = this.edgeIndexCache.get(mesh);
+        const hit = edgeIndex.findNearest(pickPoint, this.edgeHoverTolerance);
+        if (!hit) {
+            return null;
+        }
+        
+        // Reuse the edge object while hovering along the same feature edge,
+        // unless the part has moved since it was created
+        let meshEdges = this.edgeObjects.get(edgeIndex);
+        if (!meshEdges) {
+            meshEdges = new Map();
+            this.edgeObjects.set(edgeIndex, meshEdges);
+        }
+        const worldMatrixFlag = mesh.getWorldMatrix().updateFlag;
+        const existing = meshEdges.get(hit.edgeIndex);
+        if (existing && existing.worldMatrixFlag === worldMatrixFlag) {
+            return existing;
+        }
         
-        // Get mesh bounds
+        // Mesh bounds (local space) for classifying box-aligned edges
         const bounds = mesh.getBoundingInfo();
         const size = bounds.maximum.subtract(bounds.minimum);
         const center = mesh.position;
+        const { edgeType, specificSide, edgeDirection } = this.classifyEdge(hit.localStart, hit.localEnd, bounds.minimum, bounds.maximum);
         
-        // Calculate distances to edges based on pick point relative to mesh center
-        const relativePoint = pickPoint.subtract(center);
-        const edgeTolerance = 3.0; // Tighter tolerance for precise edge detection
+        const edge = {
+            type: edgeType,
+            direction: edgeDirection,
+            specificSide: specificSide,
+            mesh: mesh,
+            pickPoint: pickPoint,
+            center: center,
+            size: size,
+            relativePoint: pickPoint.subtract(center),
+            start: hit.start,
+            end: hit.end,
+            edgeIndex: hit.edgeIndex,
+            worldMatrixFlag: worldMatrixFlag,
+            id: `edge_${mesh.uniqueId}_${hit.edgeIndex}`
+        };
+        meshEdges.set(hit.edgeIndex, edge);
         
-        // console.log('RouterBitSystem: Analyzing click at relative position:', relativePoint);
-        // console.log('RouterBitSystem: Board dimensions - X:', size.x.toFixed(1), 'Y:', size.y.toFixed(1), 'Z:', size.z.toFixed(1));
-        
-        // Calculate distances to each face
-        const distToTop = Math.abs(relativePoint.y - size.y / 2);
-        const distToBottom = Math.abs(relativePoint.y + size.y / 2);
-        const distToRight = Math.abs(relativePoint.x - size.x / 2);
-        const distToLeft = Math.abs(relativePoint.x + size.x / 2);
-        const distToFront = Math.abs(relativePoint.z - size.z / 2);
-        const distToBack = Math.abs(relativePoint.z + size.z / 2);
-        
-        // Find which face we're closest to
-        const minDistance = Math.min(distToTop, distToBottom, distToRight, distToLeft, distToFront, distToBack);
-        
-        if (minDistance > edgeTolerance) {
-            // console.log('RouterBitSystem: Click too far from any edge, min distance:', minDistance.toFixed(1));
-            return null;
-        }
+        return edge;
+    }
+    
+    /**
+     * Classify an indexed edge against the mesh bounds
+     * Edges lying on the bounding box keep their legacy names (top_front_edge, ...)
+     * so the cutting tool placement continues to work; anything else is a feature_edge.
+     */
+    classifyEdge(start, end, min, max) {
+        const size = max.subtract(min);
+        const eps = Math.max(Math.min(size.x, size.y, size.z) * 0.01, 0.01);
+        const at = (value, target) => Math.abs(value - target) < eps;
+        const both = (axis, target) => at(start[axis], target) && at(end[axis], target);
         
-        let edgeType = 'unknown';
-        let edgeDirection = 'unknown';
-        let specificSide = 'unknown';
+        const alongX = both('y', start.y) && both('z', start.z) && !at(start.x, end.x);
+        const alongY = both('x', start.x) && both('z', start.z) && !at(start.y, end.y);
+        const alongZ = both('x', start.x) && both('y', start.y) && !at(start.z, end.z);
+        const longestXZ = (axisIsX) => (axisIsX ? size.x > size.z : size.z > size.x) ? 'long_edge' : 'short_edge';
         
-        // Determine which specific edge based on the closest face and position
-        if (minDistance === distToTop) {
-            // Top face - determine which specific edge
-            // console.log('RouterBitSystem: On top face');
-            
-            // Check if we're near the X edges (front/back edges of top face)
-            if (Math.abs(relativePoint.z - size.z / 2) < edgeTolerance) {
-                edgeType = 'top_front_edge';
-                specificSide = 'front';
-                edgeDirection = size.x > size.z ? 'long_edge' : 'short_edge';
-            } else if (Math.abs(relativePoint.z + size.z / 2) < edgeTolerance) {
-                edgeType = 'top_back_edge';
-                specificSide = 'back';
-                edgeDirection = size.x > size.z ? 'long_edge' : 'short_edge';
-            }
-            // Check if we're near the Z edges (left/right edges of top face)
-            else if (Math.abs(relativePoint.x - size.x / 2) < edgeTolerance) {
-                edgeType = 'top_right_edge';
-                specificSide = 'right';
-                edgeDirection = size.z > size.x ? 'long_edge' : 'short_edge';
-            } else if (Math.abs(relativePoint.x + size.x / 2) < edgeTolerance) {
-                edgeType = 'top_left_edge';
-                specificSide = 'left';
-                edgeDirection = size.z > size.x ? 'long_edge' : 'short_edge';
-            }
+        if (both('y', max.y)) {
+            if (alongX && both('z', max.z)) return { edgeType: 'top_front_edge', specificSide: 'front', edgeDirection: longestXZ(true) };
+            if (alongX && both('z', min.z)) return { edgeType: 'top_back_edge', specificSide: 'back', edgeDirection: longestXZ(true) };
+            if (alongZ && both('x', max.x)) return { edgeType: 'top_right_edge', specificSide: 'right', edgeDirection: longestXZ(false) };
+            if (alongZ && both('x', min.x)) return { edgeType: 'top_left_edge', specificSide: 'left', edgeDirection: longestXZ(false) };
         }
-        else if (minDistance === distToRight) {
-            edgeType = 'right_edge';
-            specificSide = 'right';
-            edgeDirection = size.z > size.x ? 'long_edge' : 'short_edge';
-        }
-        else if (minDistance === distToLeft) {
-            edgeType = 'left_edge';
-            specificSide = 'left';
-            edgeDirection = size.z > size.x ? 'long_edge' : 'short_edge';
-        }
-        else if (minDistance === distToFront) {
-            edgeType = 'front_edge';
-            specificSide = 'front';
-            edgeDirection = size.x > size.z ? 'long_edge' : 'short_edge';
-        }
-        else if (minDistance === distToBack) {
-            edgeType = 'back_edge';
-            specificSide = 'back';
-            edgeDirection = size.x > size.z ? 'long_edge' : 'short_edge';
-        }
-        
-        if (edgeType !== 'unknown') {
-            const edge = {
-                type: edgeType,
-                direction: edgeDirection,
-                specificSide: specificSide,
-                mesh: mesh,
-                pickPoint: pickPoint,
-                center: center,
-                size: size,
-                relativePoint: relativePoint,
-                id: `edge_${mesh.uniqueId}_${Date.now()}_${specificSide}`
-            };
-            
-            // console.log('RouterBitSystem: PRECISE edge detected -', edgeType, '(', edgeDirection, ') on', specificSide, 'side');
-            // console.log('RouterBitSystem: Distance to edge:', minDistance.toFixed(1), 'cm');
-            return edge;
+        if (alongY) {
+            if (both('x', max.x)) return { edgeType: 'right_edge', specificSide: 'right', edgeDirection: longestXZ(false) };
+            if (both('x', min.x)) return { edgeType: 'left_edge', specificSide: 'left', edgeDirection: longestXZ(false) };
         }
         
-        // console.log('RouterBitSystem: No valid edge detected');
-        return null;
+        const length = BABYLON.Vector3.Distance(start, end);
+        return {
+            edgeType: 'feature_edge',
+            specificSide: 'feature',
+            edgeDirection: length >= Math.max(size.x, size.z) * 0.5 ? 'long_edge' : 'short_edge'
+        };
     }
     
     /**
@@ -390,6 +380,15 @@ export class RouterBitSystem {
                 cap: BABYLON.Mesh.CAP_ALL
             }, this.scene);
         }
+        else if (edge.start && edge.end) {
+            // Indexed feature edge (cut, beveled or rotated parts) - follow the real segment
+            edgeLine = BABYLON.MeshBuilder.CreateTube('edgePreview', {
+                path: [edge.start, edge.end],
+                radius: 0.3,
+                tessellation: 8,
+                cap: BABYLON.Mesh.CAP_ALL
+            }, this.scene);
+        }
         else {
             // console.warn('RouterBitSystem: Unknown edge type:', edge.type, '- no preview will be shown');
             return; // Don't show anything for unknown edge types
@@ -521,6 +520,14 @@ export class RouterBitSystem {
                 cap: BABYLON.Mesh.CAP_ALL
             }, this.scene);
         }
+        else if (edge.start && edge.end) {
+            selectionLine = BABYLON.MeshBuilder.CreateTube('edgeSelection', {
+                path: [edge.start, edge.end],
+                radius: 0.4,
+                tessellation: 8,
+                cap: BABYLON.Mesh.CAP_ALL
+            }, this.scene);
+        }
         
         if (selectionLine) {
             selectionLine.material = this.selectedEdgeMaterial; // Use orange material
@@ -1227,30 +1234,112 @@ export class RouterBitSystem {
         const cancelButton = document.getElementById('cancel-router-bit');
         const applyButton = document.getElementById('apply-router-bit');
         
-        if (closeButton) {
-            closeButton.addEventListener('click', () => this.hideRouterBitModal());
-        }
-        
-        if (cancelButton) {
-            cancelButton.addEventListener('click', () => this.showRouterBitGrid());
-        }
+        // The modal lives in workspace.php - keep handlers so dispose() can detach them
+        this.modalListeners = [];
+        const listen = (element, type, handler) => {
+            if (!element) return;
+            element.addEventListener(type, handler);
+            this.modalListeners.push({ element, type, handler });
+        };
         
-        if (applyButton) {
-            applyButton.addEventListener('click', () => this.applySelectedBit());
-        }
+        listen(closeButton, 'click', () => this.hideRouterBitModal());
+        listen(cancelButton, 'click', () => this.showRouterBitGrid());
+        listen(applyButton, 'click', () => this.applySelectedBit());
         
         // Close modal when clicking outside
-        this.routerBitModal?.addEventListener('click', (e) => {
+        listen(this.routerBitModal, 'click', (e) => {
             if (e.target === this.routerBitModal) {
                 this.hideRouterBitModal();
             }
         });
         
+        // Search, category filter and paging for imported bits
+        this.createLibraryControls(listen);
+        
         // Populate router bit grid
         this.populateRouterBitGrid();
         
         // console.log('RouterBitSystem: Router bit modal setup complete');
     }
+    
+    /**
+     * Controls above the grid for browsing imported bits a page at a time
+     */
+    createLibraryControls(listen) {
+        if (!this.routerBitGrid) return;
+        
+        this.libraryControls = document.createElement('div');
+        this.libraryControls.className = 'router-bit-library-controls';
+        this.libraryControls.innerHTML = `
+            <input type="search" class="router-bit-search" placeholder="Search bits">
+            <select class="router-bit-category"><option value="">All categories</option></select>
+            <button class="btn-secondary router-bit-prev">&lsaquo;</button>
+            <span class="router-bit-page"></span>
+            <button class="btn-secondary router-bit-next">&rsaquo;</button>
+        `;
+        this.routerBitGrid.parentNode.insertBefore(this.libraryControls, this.routerBitGrid);
+        
+        const search = this.libraryControls.querySelector('.router-bit-search');
+        const category = this.libraryControls.querySelector('.router-bit-category');
+        let searchTimer = null;
+        listen(search, 'input', () => {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => {
+                this.loadLibraryPage({ query: search.value.trim(), page: 1 });
+            }, 250);
+        });
+        listen(category, 'change', () => this.loadLibraryPage({ category: category.value, page: 1 }));
+        listen(this.libraryControls.querySelector('.router-bit-prev'), 'click', () => {
+            this.loadLibraryPage({ page: this.libraryQuery.page - 1 });
+        });
+        listen(this.libraryControls.querySelector('.router-bit-next'), 'click', () => {
+            this.loadLibraryPage({ page: this.libraryQuery.page + 1 });
+        });
+    }
+    
+    /**
+     * Fetch one page of imported bits and show it in the grid
+     * Only the newest request is rendered, so fast typing can't show stale results.
+     */
+    async loadLibraryPage(changes = {}) {
+        const query = { ...this.libraryQuery, ...changes };
+        query.page = Math.max(1, query.page);
+        const requestId = ++this.libraryRequest;
+        
+        let result;
+        try {
+            result = await this.bitLibrary.fetchPage(query);
+        } catch (error) {
+            console.error('RouterBitSystem: Could not load router bit library', error);
+            return;
+        }
+        if (requestId !== this.libraryRequest) return;
+        
+        this.libraryQuery = { ...query, page: result.page };
+        this.populateRouterBitGrid(result.bits);
+        this.updateLibraryControls(result);
+    }
+    
+    updateLibraryControls(result) {
+        if (!this.libraryControls) return;
+        
+        const category = this.libraryControls.querySelector('.router-bit-category');
+        const options = ['', ...result.categories];
+        if (category.options.length !== options.length) {
+            category.innerHTML = '';
+            options.forEach(value => {
+                const option = document.createElement('option');
+                option.value = value;
+                option.textContent = value || 'All categories';
+                category.appendChild(option);
+            });
+        }
+        category.value = this.libraryQuery.category;
+        
+        this.libraryControls.querySelector('.router-bit-page').textContent = `${result.page} / ${result.pages}`;
+        this.libraryControls.querySelector('.router-bit-prev').disabled = result.page <= 1;
+        this.libraryControls.querySelector('.router-bit-next').disabled = result.page >= result.pages;
+    }
 
     /**
      * Show router bit library in properties panel
@@ -1394,6 +1483,7 @@ export class RouterBitSystem {
         if (this.routerBitModal) {
             this.routerBitModal.style.display = 'flex';
             this.showRouterBitGrid();
+            this.loadLibraryPage();
             
             // Update apply button text with edge count
             const applyButton = document.getElementById('apply-router-bit');
@@ -1442,13 +1532,15 @@ export class RouterBitSystem {
     
     /**
      * Populate the router bit grid with available bits
+     * @param {Array} importedBits - Current page of imported bit summaries
      */
-    populateRouterBitGrid() {
+    populateRouterBitGrid(importedBits = []) {
         if (!this.routerBitGrid) return;
         
         this.routerBitGrid.innerHTML = '';
         
         Object.entries(this.routerBitLibrary).forEach(([key, bitProfile]) => {
+            if (bitProfile.imported) return; // Listed with their library page
             const bitCard = document.createElement('div');
             bitCard.className = 'router-bit-card';
             bitCard.dataset.bitKey = key;
@@ -1465,6 +1557,77 @@ export class RouterBitSystem {
             
             this.routerBitGrid.appendChild(bitCard);
         });
+        
+        importedBits.forEach(summary => {
+            const bitCard = document.createElement('div');
+            bitCard.className = 'router-bit-card';
+            bitCard.dataset.bitKey = this.importedBitKey(summary.name);
+            
+            const icon = summary.thumbnail
+                ? `<img class="router-bit-icon" src="${summary.thumbnail}" alt="" loading="lazy" width="48" height="48">`
+                : '<span class="router-bit-icon">⚙</span>';
+            bitCard.innerHTML = `
+                ${icon}
+                <div class="router-bit-name"></div>
+                <div class="router-bit-description"></div>
+            `;
+            bitCard.querySelector('.router-bit-name').textContent = summary.name;
+            bitCard.querySelector('.router-bit-description').textContent = summary.category || '';
+            
+            bitCard.addEventListener('click', () => this.selectImportedBit(summary, bitCard));
+            this.routerBitGrid.appendChild(bitCard);
+        });
+        
+        // Build the offered bits' profiles in idle time so applying one is instant
+        const warmJobs = [];
+        Object.entries(this.routerBitLibrary).forEach(([key, bitProfile]) => {
+            if (typeof bitProfile.generateProfile !== 'function') return;
+            (bitProfile.defaultSizes || []).forEach(size => {
+                warmJobs.push({ bitType: key, size, generate: s => bitProfile.generateProfile(s) });
+            });
+        });
+        this.profileCache.warm(warmJobs);
+    }
+    
+    /**
+     * Library key for an imported bit - namespaced so a bit named like a
+     * built-in profile (e.g. 'roundover') never replaces it
+     */
+    importedBitKey(name) {
+        return `imported:${name}`;
+    }
+    
+    /**
+     * Fetch an imported bit's profile and mesh on first use, then select it
+     */
+    async selectImportedBit(summary, bitCard) {
+        bitCard.classList.add('loading');
+        let bit;
+        try {
+            bit = await this.bitLibrary.getBit(summary);
+        } catch (error) {
+            console.error('RouterBitSystem: Could not load router bit', summary.name, error);
+            return;
+        } finally {
+            bitCard.classList.remove('loading');
+        }
+        
+        // Profile points are stored in the bit's own units; scale them so the
+        // profile height matches the chosen size, like the built-in generators
+        const profileHeight = Math.max(...bit.profile.map(point => point[1]), 0) || 1;
+        const bitProfile = {
+            name: summary.name,
+            description: summary.category || '',
+            icon: '⚙',
+            defaultSizes: summary.sizes || [],
+            imported: true,
+            geometry: bit.geometry,
+            outline: bit.profile,
+            generateProfile: (size) => bit.profile.map(([r, h]) => new BABYLON.Vector3(r * size / profileHeight, h * size / profileHeight, 0))
+        };
+        const key = this.importedBitKey(summary.name);
+        this.routerBitLibrary[key] = bitProfile;
+        this.selectRouterBit(key, bitProfile);
     }
     
     /**
@@ -1637,8 +1800,15 @@ export class RouterBitSystem {
             return;
         }
         
-        // Generate profile points
-        const profilePoints = profileInfo.generateProfile(size);
+        // Roundover and chamfer cutters are shaped for the box's top edges only;
+        // other profiles run a span cutter along any indexed edge
+        if (edge.type === 'feature_edge' && (profileName === 'roundover' || profileName === 'chamfer')) {
+            console.warn('RouterBitSystem: The', profileName, 'bit can only be applied to the top edges of a board');
+            return;
+        }
+        
+        // Profile points (cached per bit and size)
+        const profilePoints = this.profileCache.getProfile(profileName, size, s => profileInfo.generateProfile(s));
         
         // Apply actual geometry modification
         this.modifyMeshWithProfile(edge, profilePoints, profileName, size);
@@ -1656,6 +1826,21 @@ export class RouterBitSystem {
         
         // console.log('RouterBitSystem: Modifying mesh geometry for', profileName, 'profile');
         
+        // Straight top edges of box parts get the exact profile without CSG
+        if (this.applyAnalyticProfile(edge, profileName, size)) {
+            if (this.drawingWorld.updateWorkBenchDisplay) {
+                this.drawingWorld.updateWorkBenchDisplay();
+            }
+            return;
+        }
+        
+        // Imported bits have no cutter shape of their own; a stand-in groove
+        // would cut the wrong profile
+        if (this.routerBitLibrary[profileName]?.imported) {
+            console.warn('RouterBitSystem: Imported bits can only be applied to the top edges of a square board, one bit and size per board');
+            return;
+        }
+        
         // Create the cutting tool geometry
         const cuttingTool = this.createCuttingToolGeometry(edge, profileName, size);
         
@@ -1670,6 +1855,72 @@ export class RouterBitSystem {
         }
     }
     
+    /**
+     * Rebuild a box part with the profile extruded along a straight top edge
+     * Returns false (caller falls back to CSG) for non-box parts, other edges,
+     * unsupported bits, or a bit/size different from edges already profiled.
+     */
+    applyAnalyticProfile(edge, profileName, size) {
+        const mesh = edge.mesh;
+        const side = TOP_EDGE_SIDES[edge.type];
+        const bitProfile = this.routerBitLibrary[profileName];
+        const imported = Boolean(bitProfile && bitProfile.imported);
+        if (!mesh || !side || !(imported || ANALYTIC_PROFILES.includes(profileName))) return false;
+        
+        // Pending drilled holes must be cut first - that's the CSG path's job
+        if (this.drawingWorld.featureRealizer && this.drawingWorld.featureRealizer.getPendingFeatures(mesh).length > 0) {
+            return false;
+        }
+        
+        // Either an untouched box or geometry we built and nothing changed since
+        let state = mesh.edgeProfileState;
+        if (state && state.geometryHash !== PartInstancer.computeGeometryHash(mesh)) {
+            mesh.edgeProfileState = null;
+            return false;
+        }
+        if (!state) {
+            if (!isPlainBox(mesh)) return false;
+            const bounds = mesh.getBoundingInfo().boundingBox;
+            state = { min: bounds.minimum.clone(), max: bounds.maximum.clone(), profile: profileName, size, sides: [] };
+        } else if (state.profile !== profileName || state.size !== size) {
+            return false;
+        }
+        if (state.sides.includes(side)) return true; // Same bit on the same edge cuts nothing new
+        
+        const sides = [...state.sides, side];
+        const profile = imported ? profileFromOutline(bitProfile.outline, size * 2.54) : getEdgeProfile(profileName, size * 2.54);
+        if (!profile) return false;
+        const vertexData = buildProfiledBox(state.min, state.max, sides, profile);
+        if (!vertexData) return false;
+        
+        // Unique geometry from here on; applyToMesh writes into the mesh's
+        // Geometry in place, which must not be shared with another mesh
+        if (this.drawingWorld.partInstancer) {
+            this.drawingWorld.partInstancer.release(mesh);
+        }
+        mesh.makeGeometryUnique();
+        vertexData.applyToMesh(mesh, true);
+        mesh.refreshBoundingInfo();
+        mesh.edgeProfileState = { ...state, sides, geometryHash: PartInstancer.computeGeometryHash(mesh) };
+        this.edgeIndexCache.invalidate(mesh);
+        
+        // Same bookkeeping as the CSG path
+        if (mesh.partInstance) {
+            mesh.partInstance.addFeature('route', { profile: profileName, edges: [edge.type] }, true);
+        }
+        if (this.drawingWorld.serializeMeshGeometry && mesh.partData) {
+            const meshGeometry = this.drawingWorld.serializeMeshGeometry(mesh);
+            if (meshGeometry) {
+                meshGeometry.routedEdges = this.selectedEdges.map(selected => selected.type);
+                mesh.partData.meshGeometry = meshGeometry;
+            }
+        }
+        if (this.drawingWorld.generatePartThumbnail && mesh.partData) {
+            this.drawingWorld.generatePartThumbnail(mesh, mesh.partData);
+        }
+        return true;
+    }
+    
     /**
      * Create cutting tool geometry for CSG subtraction
      */
@@ -1683,56 +1934,65 @@ export class RouterBitSystem {
         const sizeInCm = size * 2.54; // Convert inches to cm
         
         
+        // Cutters come from the profile cache; those running along an edge are
+        // built to a bucketed length so similar edges share one entry
+        const spanLength = RouterProfileCache.bucketLength(Math.max(meshSize.x, meshSize.z));
+        const cutter = (name, orientation, length, build) => this.profileCache.createCutter(
+            this.profileCache.cutterKey(profileName, size, orientation, length), name, build, this.scene
+        );
+        
         if (profileName === 'roundover') {
             // Create a torus for proper roundover - when subtracted leaves convex rounded edge
-            cuttingTool = BABYLON.TorusBuilder.CreateTorus('roundover_cutter', {
+            cuttingTool = cutter('roundover_cutter', 'ring', 0, () => BABYLON.TorusBuilder.CreateTorus('roundover_cutter', {
                 diameter: sizeInCm * 2, // Major diameter
                 thickness: sizeInCm, // Minor diameter (thickness of torus)
                 tessellation: 16
-            }, this.scene);
+            }, this.scene));
             
         } else if (profileName === 'chamfer') {
             // Create edge-specific rectangular cutting tool
             if (edge.type === 'top_front_edge' || edge.type === 'top_back_edge') {
                 // Long edges - box runs along X direction
-                cuttingTool = BABYLON.BoxBuilder.CreateBox('chamfer_cutter', {
-                    width: meshSize.x + 2,     // Full edge length
+                const length = RouterProfileCache.bucketLength(meshSize.x + 2); // Full edge length
+                cuttingTool = cutter('chamfer_cutter', 'x', length, () => BABYLON.BoxBuilder.CreateBox('chamfer_cutter', {
+                    width: length,
                     height: sizeInCm * 1.5,    // Bit size * 1.5 for clean cut
                     depth: sizeInCm * 1.5      // Bit size * 1.5 for clean cut
-                }, this.scene);
+                }, this.scene));
             } else if (edge.type === 'top_left_edge' || edge.type === 'top_right_edge') {
-                // Short edges - box runs along Z direction  
-                cuttingTool = BABYLON.BoxBuilder.CreateBox('chamfer_cutter', {
+                // Short edges - box runs along Z direction
+                const length = RouterProfileCache.bucketLength(meshSize.z + 2); // Full edge length
+                cuttingTool = cutter('chamfer_cutter', 'z', length, () => BABYLON.BoxBuilder.CreateBox('chamfer_cutter', {
                     width: sizeInCm * 1.5,     // Bit size * 1.5 for clean cut
                     height: sizeInCm * 1.5,    // Bit size * 1.5 for clean cut
-                    depth: meshSize.z + 2      // Full edge length
-                }, this.scene);
+                    depth: length
+                }, this.scene));
             }
             
         } else if (profileName === 'cove') {
             // Create a cylinder for cove cutting
-            cuttingTool = BABYLON.CylinderBuilder.CreateCylinder('cove_cutter', {
-                height: Math.max(meshSize.x, meshSize.z),
+            cuttingTool = cutter('cove_cutter', 'span', spanLength, () => BABYLON.CylinderBuilder.CreateCylinder('cove_cutter', {
+                height: spanLength,
                 diameter: sizeInCm * 2,
                 tessellation: 16
-            }, this.scene);
+            }, this.scene));
             cuttingTool.rotation.z = Math.PI / 2;
             
         } else if (profileName === 'rabbeting') {
             // Create a rectangular notch for rabbet cutting
-            cuttingTool = BABYLON.BoxBuilder.CreateBox('rabbet_cutter', {
-                width: Math.max(meshSize.x, meshSize.z),
+            cuttingTool = cutter('rabbet_cutter', 'span', spanLength, () => BABYLON.BoxBuilder.CreateBox('rabbet_cutter', {
+                width: spanLength,
                 height: sizeInCm,
                 depth: sizeInCm
-            }, this.scene);
+            }, this.scene));
             
         } else {
             // Generic groove cutter
-            cuttingTool = BABYLON.CylinderBuilder.CreateCylinder('groove_cutter', {
-                height: Math.max(meshSize.x, meshSize.z),
+            cuttingTool = cutter('groove_cutter', 'span', spanLength, () => BABYLON.CylinderBuilder.CreateCylinder('groove_cutter', {
+                height: spanLength,
                 diameter: sizeInCm,
                 tessellation: 12
-            }, this.scene);
+            }, this.scene));
             cuttingTool.rotation.z = Math.PI / 2;
         }
         
@@ -1744,6 +2004,30 @@ export class RouterBitSystem {
         return cuttingTool;
     }
     
+    /**
+     * Run a span cutter along an indexed feature edge (world space)
+     * Cylinders are built along local Y, the rabbet box along local X; either is
+     * centred on the edge, turned onto its direction and cut to its length.
+     */
+    alignCutterToEdge(cuttingTool, edge) {
+        const direction = edge.end.subtract(edge.start);
+        const length = direction.length();
+        if (length === 0) return;
+        direction.scaleInPlace(1 / length);
+        
+        const alongX = cuttingTool.name.includes('rabbet');
+        const axis = alongX ? BABYLON.Vector3.Right() : BABYLON.Vector3.Up();
+        const rotation = new BABYLON.Quaternion();
+        BABYLON.Quaternion.FromUnitVectorsToRef(axis, direction, rotation);
+        
+        cuttingTool.position = BABYLON.Vector3.Center(edge.start, edge.end);
+        cuttingTool.rotationQuaternion = rotation;
+        const builtLength = cuttingTool.getBoundingInfo().boundingBox.extendSize[alongX ? 'x' : 'y'] * 2;
+        if (builtLength > 0) {
+            cuttingTool.scaling[alongX ? 'x' : 'y'] = length / builtLength;
+        }
+    }
+    
     /**
      * Position the cutting tool at the correct edge location
      */
@@ -1840,6 +2124,9 @@ export class RouterBitSystem {
             cuttingTool.rotation.x = Math.PI / 2; // Vertical orientation
             // console.log('RouterBitSystem: Positioned on back vertical edge (', edge.direction, ')');
             
+        } else if (edge.type === 'feature_edge') {
+            this.alignCutterToEdge(cuttingTool, edge);
+            
         } else {
             // console.log('RouterBitSystem: Unknown edge type, using fallback positioning');
         }
@@ -1857,6 +2144,9 @@ export class RouterBitSystem {
         // console.log('RouterBitSystem: Performing CSG subtraction for', profileName);
         
         try {
+            // Bake pending holes first so the route works on the real geometry
+            this.drawingWorld.realizePartFeatures(boardMesh);
+            
             // Create CSG objects
             const boardCSG = BABYLON.CSG.FromMesh(boardMesh);
             const toolCSG = BABYLON.CSG.FromMesh(cuttingTool);
@@ -1876,6 +2166,14 @@ export class RouterBitSystem {
             newMesh.isWorkBenchPart = boardMesh.isWorkBenchPart;
             newMesh.isProjectPart = boardMesh.isProjectPart;
             newMesh.partData = boardMesh.partData;
+            newMesh.partInstance = boardMesh.partInstance;
+            if (newMesh.partInstance) {
+                newMesh.partInstance.mesh = newMesh;
+                newMesh.partInstance.addFeature('route', {
+                    profile: profileName,
+                    edges: this.selectedEdges.map(edge => edge.type)
+                }, true);
+            }
             
             // Chamfering doesn't change board dimensions - just adds routed geometry
             // The board is still the same size, just with chamfered edges
@@ -2109,7 +2407,7 @@ export class RouterBitSystem {
         
         // Remove observer
         if (this.pointerObserver) {
-            this.scene.onPointerObservable.remove(this.pointerObserver);
+            this.drawingWorld.pointerDispatcher.unregister(this.pointerObserver);
             this.pointerObserver = null;
         }
         
@@ -2126,10 +2424,23 @@ export class RouterBitSystem {
         
         // Clear all selections and previews
         this.clearAll();
+        this.bitLibrary.dispose();
+        
+        // Detach modal handlers
+        (this.modalListeners || []).forEach(({ element, type, handler }) => {
+            element.removeEventListener(type, handler);
+        });
+        this.modalListeners = [];
         
         // Clear state
         this.isActive = false;
         this.selectedBitProfile = null;
         this.routerBitLibrary = null;
+        // Shared caches stay with DrawingWorld for the next activation; only stop idle warming
+        if (this.profileCache === this.drawingWorld.routerProfileCache) {
+            this.profileCache.cancelWarm();
+        } else {
+            this.profileCache.clear();
+        }
     }
 }
\ No newline at end of file
@@ -0,0 +1,158 @@
+/**
+ * RouterProfileCache Module - LRU Cache for Router Bit Geometry
+ *
+ * Every edge routed used to regenerate the bit's 2D profile and rebuild the
+ * cutter mesh before the CSG subtraction. Both depend only on the bit, its
+ * size and (for cutters that run along the edge) the edge length, so they are
+ * cached here: profile polylines by bit and size, cutter vertex data by bit,
+ * size, cutter orientation and an edge-length bucket. Routing the same edge on
+ * a stack of identical parts builds the geometry once.
+ *
+ * Cutters that span an edge are built to the bucket length (always at least
+ * the edge length) so nearby lengths share one entry; the extra length sits
+ * outside the board and cuts nothing.
+ */
+
+const DEFAULT_CAPACITY = 64;
+const LENGTH_BUCKET = 8; // cm
+
+export class RouterProfileCache {
+    /**
+     * @param {Object} options - { capacity: entries kept per cache }
+     */
+    constructor(options = {}) {
+        this.capacity = options.capacity ?? DEFAULT_CAPACITY;
+
+        this.profiles = new Map(); // bit|size -> [Vector3] (insertion order = age)
+        this.cutters = new Map();  // bit|size|orientation|length -> VertexData
+        this.stats = { profileHits: 0, profileMisses: 0, cutterHits: 0, cutterMisses: 0 };
+
+        this.warmHandle = null;
+    }
+
+    /**
+     * Cutter length for an edge: rounded up to the bucket size
+     */
+    static bucketLength(length) {
+        return Math.max(LENGTH_BUCKET, Math.ceil(length / LENGTH_BUCKET) * LENGTH_BUCKET);
+    }
+
+    // ==================== PROFILES ====================
+
+    /**
+     * 2D profile polyline for a bit (shared - callers must not modify the points)
+     * @param {string} bitType - Router bit library key
+     * @param {number} size - Bit size in inches
+     * @param {Function} generate - (size) => [Vector3], called on a miss
+     */
+    getProfile(bitType, size, generate) {
+        const key = `${bitType}|${size}`;
+        const cached = this.profiles.get(key);
+        if (cached) {
+            this.stats.profileHits++;
+            return this.touch(this.profiles, key, cached);
+        }
+
+        this.stats.profileMisses++;
+        const points = generate(size);
+        this.store(this.profiles, key, points);
+        return points;
+    }
+
+    // ==================== CUTTERS ====================
+
+    /**
+     * Cutter mesh for a bit, from cached vertex data when available
+     * @param {string} key - From cutterKey()
+     * @param {string} name - Mesh name
+     * @param {Function} build - () => BABYLON.Mesh, called on a miss (untransformed cutter)
+     * @param {BABYLON.Scene} scene
+     */
+    createCutter(key, name, build, scene) {
+        const cached = this.cutters.get(key);
+        if (cached) {
+            this.stats.cutterHits++;
+            this.touch(this.cutters, key, cached);
+
+            const mesh = new BABYLON.Mesh(name, scene);
+            this.copyVertexData(cached).applyToMesh(mesh);
+            return mesh;
+        }
+
+        this.stats.cutterMisses++;
+        const mesh = build();
+        if (mesh) {
+            this.store(this.cutters, key, BABYLON.VertexData.ExtractFromMesh(mesh, true, true));
+        }
+        return mesh;
+    }
+
+    cutterKey(bitType, size, orientation, length) {
+        return `${bitType}|${size}|${orientation}|${length}`;
+    }
+
+    // ==================== IDLE WARMING ====================
+
+    /**
+     * Generate profiles for the bits on offer while the browser is idle
+     * @param {Array} jobs - [{ bitType, size, generate }]
+     */
+    warm(jobs) {
+        this.cancelWarm();
+        const queue = jobs.filter(job => !this.profiles.has(`${job.bitType}|${job.size}`));
+        if (queue.length === 0) return;
+
+        const requestIdle = window.requestIdleCallback || ((callback) => setTimeout(() => callback({ timeRemaining: () => 8 }), 50));
+        const step = (deadline) => {
+            this.warmHandle = null;
+            while (queue.length > 0 && deadline.timeRemaining() > 2) {
+                const job = queue.shift();
+                this.getProfile(job.bitType, job.size, job.generate);
+            }
+            if (queue.length > 0) {
+                this.warmHandle = requestIdle(step);
+            }
+        };
+        this.warmHandle = requestIdle(step);
+    }
+
+    cancelWarm() {
+        if (this.warmHandle === null) return;
+        if (window.cancelIdleCallback) {
+            window.cancelIdleCallback(this.warmHandle);
+        } else {
+            clearTimeout(this.warmHandle);
+        }
+        this.warmHandle = null;
+    }
+
+    // ==================== LRU ====================
+
+    touch(map, key, value) {
+        map.delete(key);
+        map.set(key, value);
+        return value;
+    }
+
+    store(map, key, value) {
+        map.set(key, value);
+        if (map.size > this.capacity) {
+            map.delete(map.keys().next().value);
+        }
+    }
+
+    // Cached arrays must not end up inside mesh buffers
+    copyVertexData(source) {
+        const copy = new BABYLON.VertexData();
+        ['positions', 'normals', 'uvs', 'indices'].forEach(kind => {
+            if (source[kind]) copy[kind] = source[kind].slice();
+        });
+        return copy;
+    }
+
+    clear() {
+        this.cancelWarm();
+        this.profiles.clear();
+        this.cutters.clear();
+    }
+}
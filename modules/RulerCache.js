@@ -0,0 +1,214 @@
+/**
+ * RulerCache Module - Tiled Ruler Rendering
+ *
+ * The orthographic and scroll-saw rulers used to stroke every tick and lay out
+ * every label whenever the camera moved. A RulerCache pre-renders one tick
+ * strip per zoom bucket (spacing + quantized pixels-per-unit) and one sprite
+ * per label text, then draws a ruler by blitting those at the current offset.
+ * Panning only moves the blits; the strip is re-rasterized when the zoom
+ * bucket changes.
+ */
+
+// Zoom buckets per doubling of scale; blits stretch by at most ~4.5% within one
+const BUCKETS_PER_OCTAVE = 8;
+// Strips cover at least this many pixels so a ruler takes few blits
+const MIN_STRIP_LENGTH = 256;
+const MAX_LABEL_SPRITES = 512;
+
+/**
+ * Nice major tick spacing for a scale - targets ~60px between major ticks
+ */
+export function calculateOptimalTickSpacing(pixelsPerUnit) {
+    const targetPixelSpacing = 60;
+
+    // Round to nice increments (0.25, 0.5, 1.0, 2.0, etc.)
+    const niceIncrements = [0.125, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0];
+
+    for (let increment of niceIncrements) {
+        if (increment * pixelsPerUnit >= targetPixelSpacing * 0.7) {
+            return increment;
+        }
+    }
+
+    return 1.0; // Default fallback
+}
+
+export class RulerCache {
+    /**
+     * @param {Object} options - {
+     *   vertical: ticks run down a vertical ruler (anchored to its right edge),
+     *   majorLength, minorLength: tick lengths in px from the anchored edge,
+     *   majorColor, minorColor, labelColor, font, fontSize,
+     *   labelOffset: px from the tick to the label along the ruler,
+     *   labelBaseline: px from the ruler's top (horizontal) or left (vertical) edge to the label baseline
+     * }
+     */
+    constructor(options = {}) {
+        this.vertical = !!options.vertical;
+        this.majorLength = options.majorLength ?? 15;
+        this.minorLength = options.minorLength ?? 5;
+        this.majorColor = options.majorColor || '#666';
+        this.minorColor = options.minorColor || this.majorColor;
+        this.labelColor = options.labelColor || '#333';
+        this.fontSize = options.fontSize ?? 10;
+        this.font = options.font || `${this.fontSize}px Arial`;
+        this.labelOffset = options.labelOffset ?? 2;
+        this.labelBaseline = options.labelBaseline ?? 12;
+
+        this.strip = null;       // { key, canvas, periodPx, periods }
+        this.labels = new Map(); // text -> sprite canvas
+    }
+
+    /**
+     * Draw the ruler
+     * @param {HTMLCanvasElement} canvas - Ruler canvas (cleared first)
+     * @param {Object} view - {
+     *   pixelsPerUnit, offset: px position of value 0 along the ruler,
+     *   majorSpacing, minorDivisions: minor ticks per major interval (1 = none),
+     *   formatLabel: value -> text (null/'' for no label),
+     *   from, to: optional value range to draw
+     * }
+     */
+    draw(canvas, view) {
+        const ctx = canvas.getContext('2d');
+        ctx.clearRect(0, 0, canvas.width, canvas.height);
+
+        const { pixelsPerUnit, offset, majorSpacing } = view;
+        if (!(pixelsPerUnit > 0) || !(majorSpacing > 0)) return;
+
+        const length = this.vertical ? canvas.height : canvas.width;
+        const thickness = this.vertical ? canvas.width : canvas.height;
+        const periodPx = majorSpacing * pixelsPerUnit;
+        const strip = this.getStrip(periodPx, view.minorDivisions || 1, thickness);
+        const stripLength = periodPx * strip.periods;
+
+        // Visible span in major intervals, optionally clamped to [from, to]
+        let firstIndex = Math.floor(-offset / periodPx);
+        let lastIndex = Math.ceil((length - offset) / periodPx);
+        if (view.from !== undefined) firstIndex = Math.max(firstIndex, Math.ceil(view.from / majorSpacing));
+        if (view.to !== undefined) lastIndex = Math.min(lastIndex, Math.floor(view.to / majorSpacing));
+        if (lastIndex < firstIndex) return;
+
+        // Ticks: whole strips, then a clipped remainder for a range end
+        const clipEnd = view.to !== undefined ? offset + lastIndex * periodPx + 1 : length;
+        ctx.save();
+        if (view.to !== undefined || view.from !== undefined) {
+            const clipStart = offset + firstIndex * periodPx - 1;
+            if (this.vertical) {
+                ctx.beginPath();
+                ctx.rect(0, clipStart, thickness, clipEnd - clipStart);
+            } else {
+                ctx.beginPath();
+                ctx.rect(clipStart, 0, clipEnd - clipStart, thickness);
+            }
+            ctx.clip();
+        }
+        for (let index = firstIndex; index <= lastIndex; index += strip.periods) {
+            const position = offset + index * periodPx;
+            if (this.vertical) {
+                ctx.drawImage(strip.canvas, 0, position, thickness, stripLength);
+            } else {
+                ctx.drawImage(strip.canvas, position, 0, stripLength, thickness);
+            }
+        }
+        ctx.restore();
+
+        // Labels: cached sprites at each major tick
+        if (!view.formatLabel) return;
+        for (let index = firstIndex; index <= lastIndex; index++) {
+            const text = view.formatLabel(index * majorSpacing);
+            if (!text) continue;
+            const sprite = this.getLabel(text);
+            const position = offset + index * periodPx;
+            if (this.vertical) {
+                // Rotated text runs up the ruler from just above the tick
+                ctx.drawImage(sprite, this.labelBaseline - this.fontSize, position - this.labelOffset - sprite.height);
+            } else {
+                ctx.drawImage(sprite, position + this.labelOffset, this.labelBaseline - this.fontSize);
+            }
+        }
+    }
+
+    /**
+     * Tick strip for a zoom bucket, rasterized once per bucket
+     */
+    getStrip(periodPx, minorDivisions, thickness) {
+        const bucket = Math.round(Math.log2(periodPx) * BUCKETS_PER_OCTAVE);
+        const key = `${bucket}|${minorDivisions}|${thickness}`;
+        if (this.strip && this.strip.key === key) {
+            return this.strip;
+        }
+
+        const bucketPeriod = Math.pow(2, bucket / BUCKETS_PER_OCTAVE);
+        const periods = Math.max(1, Math.ceil(MIN_STRIP_LENGTH / bucketPeriod));
+        const stripLength = Math.max(1, Math.round(bucketPeriod * periods));
+
+        const canvas = document.createElement('canvas');
+        canvas.width = this.vertical ? thickness : stripLength;
+        canvas.height = this.vertical ? stripLength : thickness;
+        const ctx = canvas.getContext('2d');
+        ctx.lineWidth = 1;
+
+        const step = stripLength / (periods * minorDivisions);
+        for (let i = 0; i < periods * minorDivisions; i++) {
+            const isMajor = i % minorDivisions === 0;
+            const tickLength = isMajor ? this.majorLength : this.minorLength;
+            // Half-pixel offset keeps 1px ticks crisp
+            const position = Math.round(i * step) + 0.5;
+
+            ctx.strokeStyle = isMajor ? this.majorColor : this.minorColor;
+            ctx.beginPath();
+            if (this.vertical) {
+                ctx.moveTo(thickness, position);
+                ctx.lineTo(thickness - tickLength, position);
+            } else {
+                ctx.moveTo(position, thickness);
+                ctx.lineTo(position, thickness - tickLength);
+            }
+            ctx.stroke();
+        }
+
+        this.strip = { key, canvas, periods };
+        return this.strip;
+    }
+
+    /**
+     * Pre-rendered label text (rotated for vertical rulers)
+     */
+    getLabel(text) {
+        let sprite = this.labels.get(text);
+        if (sprite) return sprite;
+
+        if (this.labels.size >= MAX_LABEL_SPRITES) {
+            this.labels.clear();
+        }
+
+        const measure = document.createElement('canvas').getContext('2d');
+        measure.font = this.font;
+        const textWidth = Math.ceil(measure.measureText(text).width) + 1;
+        const lineHeight = Math.ceil(this.fontSize * 1.3);
+
+        sprite = document.createElement('canvas');
+        sprite.width = this.vertical ? lineHeight : textWidth;
+        sprite.height = this.vertical ? textWidth : lineHeight;
+        const ctx = sprite.getContext('2d');
+        ctx.font = this.font;
+        ctx.fillStyle = this.labelColor;
+
+        if (this.vertical) {
+            ctx.translate(this.fontSize, textWidth);
+            ctx.rotate(-Math.PI / 2);
+            ctx.fillText(text, 0, 0);
+        } else {
+            ctx.fillText(text, 0, this.fontSize);
+        }
+
+        this.labels.set(text, sprite);
+        return sprite;
+    }
+
+    clear() {
+        this.strip = null;
+        this.labels.clear();
+    }
+}
@@ -47,7 +47,6 @@ export class SawToolSystem {
      */
     init() {
         this.setupCutLineMaterial();
-        this.setupMouseTracking();
         this.setupMeasurementDisplay();
     }
     
@@ -63,9 +62,13 @@ export class SawToolSystem {
     
     /**
      * Setup mouse tracking for saw tool
+     * There is no 'saw' activeTool, so the handler is registered for every event
+     * while the saw is active rather than under a tool name.
      */
     setupMouseTracking() {
-        this.pointerObserver = this.scene.onPointerObservable.add((pointerInfo) => {
+        if (this.pointerObserver) return;
+        
+        this.pointerObserver = this.drawingWorld.pointerDispatcher.register((pointerInfo) => {
             if (pointerInfo.type === BABYLON.PointerEventTypes.POINTERMOVE) {
                 this.onMouseMove(pointerInfo);
             } else if (pointerInfo.type === BABYLON.PointerEventTypes.POINTERDOWN && pointerInfo.event.button === 0) {
@@ -74,6 +77,13 @@ export class SawToolSystem {
         });
     }
     
+    removeMouseTracking() {
+        if (this.pointerObserver) {
+            this.drawingWorld.pointerDispatcher.unregister(this.pointerObserver);
+            this.pointerObserver = null;
+        }
+    }
+    
     /**
      * Setup measurement display for cut line length
      */
@@ -149,6 +159,7 @@ export class SawToolSystem {
         this.sawToolActive = true;
         this.currentStep = 'first_point';
         this.cutPoints = [];
+        this.setupMouseTracking();
         
         // Set cursor to crosshair
         this.canvas.style.cursor = 'crosshair';
@@ -171,6 +182,7 @@ export class SawToolSystem {
      */
     deactivate() {
         this.sawToolActive = false;
+        this.removeMouseTracking();
         this.currentStep = 'first_point';
         this.cutPoints = [];
         this.clearCutPreview();
@@ -192,9 +204,7 @@ export class SawToolSystem {
     onMouseMove(pointerInfo) {
         if (!this.sawToolActive) return;
         
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX,
-            this.scene.pointerY,
+        const pickInfo = this.drawingWorld.pickService.pick(
             (mesh) => {
                 return mesh.partData && mesh.partData.bench === 'work';
             }
@@ -237,9 +247,7 @@ export class SawToolSystem {
     onMouseClick(pointerInfo) {
         if (!this.sawToolActive) return;
         
-        const pickInfo = this.scene.pick(
-            this.scene.pointerX,
-            this.scene.pointerY,
+        const pickInfo = this.drawingWorld.pickService.pick(
             (mesh) => {
                 return mesh.partData && mesh.partData.bench === 'work';
             }
@@ -1337,9 +1345,7 @@ export class SawToolSystem {
      * Cleanup when tool system is destroyed
      */
     destroy() {
-        if (this.pointerObserver) {
-            this.scene.onPointerObservable.remove(this.pointerObserver);
-        }
+        this.removeMouseTracking();
         
         this.clearCutPreview();
         
@@ -1368,37 +1374,46 @@ export class SawToolSystem {
             mesh.isWorkBenchPart && mesh.partData
         );
         
+        // Materials are shared between parts, so dim each mesh rather than its material
+        const instancer = this.drawingWorld.partInstancer;
         let dimmedCount = 0;
         workbenchMeshes.forEach(mesh => {
             if (mesh.partData && mesh.partData.id === selectedPartId) {
                 // Keep selected piece at full brightness
-                if (mesh.material) {
-                    mesh.material.alpha = 1.0;
-                }
-            } else {
-                // Dim unselected pieces
-                if (mesh.material) {
-                    mesh.material.alpha = 0.3;
-                    dimmedCount++;
+                this.restorePieceOpacity(mesh);
+            } else if (!mesh.sawDimmed) {
+                // Instanced pieces are drawn by a shared source mesh - draw this one on its own
+                if (instancer) {
+                    instancer.suspend(mesh);
                 }
+                mesh.visibility = 0.3;
+                mesh.sawDimmed = true;
+                dimmedCount++;
             }
         });
         
     }
     
+    /**
+     * Undo dimUnselectedPieces for one piece
+     */
+    restorePieceOpacity(mesh) {
+        if (!mesh.sawDimmed) return;
+        
+        mesh.visibility = 1.0;
+        mesh.sawDimmed = false;
+        if (this.drawingWorld.partInstancer) {
+            this.drawingWorld.partInstancer.resume(mesh);
+        }
+    }
+    
     /**
      * Restore normal opacity to all pieces
      */
     restoreNormalOpacity() {
-        const workbenchMeshes = this.scene.meshes.filter(mesh => 
-            mesh.isWorkBenchPart && mesh.partData && mesh.partData.bench === 'work'
-        );
-        
-        workbenchMeshes.forEach(mesh => {
-            if (mesh.material) {
-                mesh.material.alpha = 1.0;
-            }
-        });
+        this.scene.meshes
+            .filter(mesh => mesh.sawDimmed)
+            .forEach(mesh => this.restorePieceOpacity(mesh));
         
     }
     
@@ -1406,7 +1421,8 @@ export class SawToolSystem {
      * Minimal deactivate method - only called when switching tools
      */
     deactivate() {
-        // Only reset cursor and restore opacity - don't interfere with cutting process
+        // Only reset cursor, pointer handling and opacity - don't interfere with cutting process
+        this.removeMouseTracking();
         this.canvas.style.cursor = 'default';
         this.restoreNormalOpacity();
     }
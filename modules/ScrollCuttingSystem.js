@@ -3,7 +3,7 @@
  * 
  * Provides orthographic mode interface for complex cutting operations including:
  * - Freehand mouse-driven cutting paths
- * - Path smoothing and curve optimization
+ * - Path simplification and curvature-adaptive resampling
  * - Symmetrical cutting operations
  * - Bezier handle editing for precise curves
  * - Real-time cut preview and validation
@@ -12,10 +12,18 @@
  * - Orthographic top-down view of workpiece
  * - Multiple cutting tools (freehand, geometric, symmetrical)
  * - Real-time path smoothing algorithms
- * - CSG-based actual geometry cutting
+ * - 2D kerf offset and boolean cutting of flat boards (CSG for profiled ones)
  * - Professional woodworking cut patterns
  */
 
+import { RulerCache, calculateOptimalTickSpacing } from './RulerCache.js';
+import { StreamingPathSimplifier } from './PathSimplifier.js';
+import { fitBezierPath } from './BezierFitting.js';
+import { PathPreviewRibbon } from './PathPreviewRibbon.js';
+import { booleanPolygons, groupPolygons, offsetPolyline, polygonArea, triangulatePolygon } from './PolygonClipper.js';
+
+const WALL_SMOOTH_ANGLE = Math.PI / 6; // Cut walls turning less than 30 degrees are shaded smooth
+
 export class ScrollCuttingSystem {
     constructor(drawingWorld) {
         this.drawingWorld = drawingWorld;
@@ -34,11 +42,16 @@ export class ScrollCuttingSystem {
         this.currentPath = [];
         this.smoothedPath = [];
         this.pathPreviewMesh = null;
+        this.pathRibbon = null; // Updatable preview of the fitted path (PathPreviewRibbon)
+        this.previewWidth = 0.04; // Preview strip width, inches
         this.cutDepth = 2.0; // Default cut depth in cm (through cut)
         this.cutDepthSlider = null;
         
-        // Smoothing settings
-        this.smoothingLevel = 0.7; // 0 = no smoothing, 1 = max smoothing
+        // Simplification settings
+        this.pathTolerance = 0.02; // Max deviation from the drawn path, inches
+        this.curveFitTolerance = 0.04; // Max deviation of the fitted spline, inches
+        this.pathSimplifier = null;
+        this.bezierPath = null; // Editable spline the cut follows (BezierFitting)
         this.symmetryAxis = null; // 'x', 'z', or null
         this.symmetryEnabled = false;
         
@@ -96,6 +109,7 @@ export class ScrollCuttingSystem {
         this.pathMaterial.alpha = 0.9;
         this.pathMaterial.disableLighting = true;
         this.pathMaterial.disableDepthWrite = true;
+        this.pathMaterial.backFaceCulling = false; // Preview strip is seen from either side
         
         console.log('ScrollCuttingSystem: Path materials created');
     }
@@ -104,7 +118,7 @@ export class ScrollCuttingSystem {
      * Setup mouse tracking for path drawing
      */
     setupMouseTracking() {
-        this.pointerObserver = this.scene.onPointerObservable.add((pointerInfo) => {
+        this.pointerObserver = this.drawingWorld.pointerDispatcher.register((pointerInfo) => {
             if (!this.isActive) return;
             
             // CRITICAL: Block ALL mouse events when scroll cutting is active
@@ -141,7 +155,7 @@ export class ScrollCuttingSystem {
                     }
                 }
             }
-        }, -1); // High priority to catch events first
+        }, { tools: ['scroll-cut'] });
         
         console.log('ScrollCuttingSystem: Mouse tracking enabled with comprehensive event blocking');
     }
@@ -218,19 +232,16 @@ export class ScrollCuttingSystem {
             // Update control point position
             mesh.position = this.localToWorld(newPosition);
             
-            // Update the path
-            const pathIndex = mesh.metadata.pathIndex;
-            if (pathIndex !== undefined && this.smoothedPath[pathIndex]) {
-                this.smoothedPath[pathIndex] = newPosition;
+            // Move the anchor - only the two segments meeting there are re-evaluated
+            const anchorIndex = mesh.metadata.anchorIndex;
+            if (this.bezierPath && anchorIndex !== undefined) {
+                const changed = this.bezierPath.moveAnchor(anchorIndex, newPosition);
                 
-                // Regenerate the smoothed path from all control points
-                this.regenerateSmoothedPathFromControlPoints();
-                
-                // Update path preview
-                this.updatePathPreview();
+                // Patch the preview for those segments; smoothedPath follows when the drag ends
+                this.updatePathPreview(changed);
                 
                 // Update associated bezier handles
-                this.updateBezierHandlesForControlPoint(mesh, pathIndex);
+                this.updateBezierHandlesForControlPoint(mesh, anchorIndex);
             }
         } else if (mesh.metadata.type === 'bezierTangentHandle') {
             // Update bezier handle position
@@ -259,6 +270,9 @@ export class ScrollCuttingSystem {
                 }
             }
             
+            // Pick up the edited samples for the cut
+            this.regenerateSmoothedPathFromControlPoints();
+            
             console.log('ScrollCuttingSystem: Control point dragging finished');
         }
         
@@ -282,91 +296,36 @@ export class ScrollCuttingSystem {
     }
     
     /**
-     * Regenerate the smoothed path from current control point positions
+     * Regenerate the smoothed path from the spline (changed segments only are re-sampled)
      */
     regenerateSmoothedPathFromControlPoints() {
-        if (!this.controlHandles || this.controlHandles.length < 2) {
-            console.warn('ScrollCuttingSystem: Cannot regenerate path - insufficient control points');
+        if (!this.bezierPath || this.bezierPath.segmentCount === 0) {
+            console.warn('ScrollCuttingSystem: Cannot regenerate path - no fitted spline');
             return;
         }
         
-        // Sort control points by their original path index
-        const sortedControlPoints = this.controlHandles.slice().sort((a, b) => {
-            return a.metadata.pathIndex - b.metadata.pathIndex;
-        });
-        
-        // Create new smoothed path from control point positions
-        const newPath = [];
-        
-        for (let i = 0; i < sortedControlPoints.length; i++) {
-            const controlPoint = sortedControlPoints[i];
-            const worldPos = controlPoint.position;
-            const localPos = this.worldToLocal(worldPos);
-            
-            if (i === 0) {
-                // First point - add directly
-                newPath.push(localPos);
-            } else {
-                // Interpolate between previous and current control point
-                const prevPos = newPath[newPath.length - 1];
-                const steps = 8; // Number of interpolation steps
-                
-                for (let step = 1; step <= steps; step++) {
-                    const t = step / steps;
-                    const interpolated = new BABYLON.Vector3(
-                        prevPos.x + (localPos.x - prevPos.x) * t,
-                        prevPos.y + (localPos.y - prevPos.y) * t,
-                        prevPos.z + (localPos.z - prevPos.z) * t
-                    );
-                    newPath.push(interpolated);
-                }
-            }
-        }
-        
-        // Update the smoothed path
-        this.smoothedPath = newPath;
-        
-        console.log('ScrollCuttingSystem: Regenerated smoothed path with', this.smoothedPath.length, 'points from', this.controlHandles.length, 'control points');
+        this.smoothedPath = this.bezierPath.getPoints();
     }
-
+    
     /**
      * Update bezier handles when control point is moved
      */
-    updateBezierHandlesForControlPoint(controlPoint, pathIndex) {
+    updateBezierHandlesForControlPoint(controlPoint, anchorIndex) {
         // Find the bezier handle set for this control point
         const handleSet = this.bezierHandles.find(set => set.controlPoint === controlPoint);
-        if (!handleSet) return;
+        if (!handleSet || !this.bezierPath) return;
         
-        // Recalculate tangent direction from neighboring points
-        const prevIndex = Math.max(0, pathIndex - 1);
-        const nextIndex = Math.min(this.smoothedPath.length - 1, pathIndex + 1);
+        const anchor = this.bezierPath.anchors[anchorIndex];
+        const currentWorld = controlPoint.position;
         
-        if (prevIndex < this.smoothedPath.length && nextIndex < this.smoothedPath.length) {
-            const prevWorld = this.localToWorld(this.smoothedPath[prevIndex]);
-            const nextWorld = this.localToWorld(this.smoothedPath[nextIndex]);
-            const currentWorld = controlPoint.position;
-            
-            // Calculate tangent direction
-            const tangent = nextWorld.subtract(prevWorld).normalize();
-            const handleLength = 3.0;
-            
-            // Update handle positions
-            if (handleSet.handle1) {
-                handleSet.handle1.position = currentWorld.subtract(tangent.scale(handleLength));
-            }
-            if (handleSet.handle2) {
-                handleSet.handle2.position = currentWorld.add(tangent.scale(handleLength));
-            }
-            
-            // Update connecting lines
-            if (handleSet.line1) {
-                handleSet.line1.dispose();
-                handleSet.line1 = this.createHandleLine(currentWorld, handleSet.handle1.position);
-            }
-            if (handleSet.line2) {
-                handleSet.line2.dispose();
-                handleSet.line2 = this.createHandleLine(currentWorld, handleSet.handle2.position);
-            }
+        // Handles follow the spline's in/out control points
+        if (handleSet.handle1 && anchor.handleIn) {
+            handleSet.handle1.position = this.localToWorld(this.bezierPath.toVector3(anchor.handleIn));
+            this.updateHandleLine(handleSet.line1, currentWorld, handleSet.handle1.position);
+        }
+        if (handleSet.handle2 && anchor.handleOut) {
+            handleSet.handle2.position = this.localToWorld(this.bezierPath.toVector3(anchor.handleOut));
+            this.updateHandleLine(handleSet.line2, currentWorld, handleSet.handle2.position);
         }
     }
     
@@ -379,22 +338,16 @@ export class ScrollCuttingSystem {
             set.handle1 === handle || set.handle2 === handle
         );
         
-        if (!handleSet) return;
-        
-        // Update the connecting line
-        const controlPos = handleSet.controlPoint.position;
-        const handleType = (handleSet.handle1 === handle) ? 'line1' : 'line2';
+        if (!handleSet || !this.bezierPath) return;
         
-        if (handleSet[handleType]) {
-            handleSet[handleType].dispose();
-            handleSet[handleType] = this.createHandleLine(controlPos, this.localToWorld(newPosition));
-        }
+        // Reshape the segment(s) using this handle; a smooth anchor turns its other handle too
+        const side = (handleSet.handle1 === handle) ? 'in' : 'out';
+        const changed = this.bezierPath.moveHandle(handleSet.anchorIndex, side, newPosition);
         
-        // For more advanced bezier curve modification, you could update the path curvature here
-        // For now, we'll just update the handle position and line
-        console.log('ScrollCuttingSystem: Bezier handle moved, path curvature could be updated');
+        this.updateBezierHandlesForControlPoint(handleSet.controlPoint, handleSet.anchorIndex);
+        this.updatePathPreview(changed);
     }
-
+    
     /**
      * Validate that we have a proper Babylon.js mesh
      */
@@ -618,6 +571,9 @@ export class ScrollCuttingSystem {
                     
                     this.lastPanPosition = { x: pointerInfo.event.clientX, y: pointerInfo.event.clientY };
                     
+                    // Slide the cached ruler strips along with the view
+                    this.updateRulerMarkings();
+                    
                     console.log('ScrollCuttingSystem: Panning - delta:', deltaX, deltaY);
                     
                 } else if (pointerInfo.type === BABYLON.PointerEventTypes.POINTERUP) {
@@ -653,10 +609,11 @@ export class ScrollCuttingSystem {
         
         if (cuttingPoint) {
             this.isDrawing = true;
-            this.currentPath = [];
             
-            // Add first point directly
-            this.currentPath.push(cuttingPoint);
+            // Points are simplified as they arrive (path units are cm)
+            this.pathSimplifier = new StreamingPathSimplifier({ tolerance: this.pathTolerance * 2.54 });
+            this.pathSimplifier.add(cuttingPoint);
+            this.currentPath = this.pathSimplifier.getPoints();
             console.log('ScrollCuttingSystem: Started drawing cutting path at', cuttingPoint);
             
             // Update path preview immediately
@@ -671,11 +628,12 @@ export class ScrollCuttingSystem {
         // Project mouse position onto the workpiece plane
         const cuttingPoint = this.projectMouseToWorkpiecePlane(pointerInfo);
         
-        if (cuttingPoint) {
-            this.currentPath.push(cuttingPoint);
-            
-            // Update path preview in real-time
-            this.updatePathPreview();
+        if (cuttingPoint && this.pathSimplifier) {
+            // Moves that don't change the simplified path don't touch the preview
+            if (this.pathSimplifier.add(cuttingPoint)) {
+                this.currentPath = this.pathSimplifier.getPoints();
+                this.updatePathPreview();
+            }
             
             // If symmetry is enabled, add mirrored points
             if (this.symmetryEnabled) {
@@ -696,10 +654,17 @@ export class ScrollCuttingSystem {
         
         this.isDrawing = false;
         
-        console.log('ScrollCuttingSystem: Finished drawing path with', this.currentPath.length, 'points');
+        // Tidy the simplified path and resample it where it bends
+        this.smoothedPath = this.pathSimplifier.finish();
+        console.log('ScrollCuttingSystem: Finished drawing path -', this.pathSimplifier.rawCount, 'pointer points reduced to', this.smoothedPath.length);
+        this.pathSimplifier = null;
         
-        // Apply smoothing to the path
-        this.smoothedPath = this.applySmoothingToPath(this.currentPath);
+        // Fit the editable spline; the cut follows its samples from here on
+        this.bezierPath = fitBezierPath(this.smoothedPath, this.curveFitTolerance * 2.54);
+        this.bezierPath.tolerance = this.pathTolerance * 2.54;
+        if (this.bezierPath.segmentCount > 0) {
+            this.smoothedPath = this.bezierPath.getPoints();
+        }
         
         // Update preview with smoothed path and make it persistent
         this.updatePathPreview();
@@ -721,46 +686,25 @@ export class ScrollCuttingSystem {
     }
     
     /**
-     * Apply smoothing algorithm to raw path points
+     * Update real-time path preview
+     * A fitted path is shown as a strip; passing the changed segment indices
+     * patches just those parts of it instead of rebuilding the preview.
      */
-    applySmoothingToPath(rawPath) {
-        if (rawPath.length < 3 || this.smoothingLevel === 0) {
-            return rawPath.slice(); // Return copy of original path
-        }
-        
-        const smoothed = [];
-        const factor = this.smoothingLevel;
-        
-        // Keep first point
-        smoothed.push(rawPath[0]);
-        
-        // Smooth intermediate points using weighted average
-        for (let i = 1; i < rawPath.length - 1; i++) {
-            const prev = rawPath[i - 1];
-            const curr = rawPath[i];
-            const next = rawPath[i + 1];
-            
-            // Weighted average with neighboring points
-            const smoothedPoint = new BABYLON.Vector3(
-                curr.x * (1 - factor) + (prev.x + next.x) * factor * 0.5,
-                curr.y * (1 - factor) + (prev.y + next.y) * factor * 0.5,
-                curr.z * (1 - factor) + (prev.z + next.z) * factor * 0.5
-            );
+    updatePathPreview(changedSegments = null) {
+        if (this.bezierPath && this.bezierPath.segmentCount > 0) {
+            if (changedSegments && this.pathRibbon && this.pathRibbon.update(this.bezierPath, changedSegments)) {
+                return;
+            }
             
-            smoothed.push(smoothedPoint);
+            this.clearPathPreview();
+            this.pathRibbon = new PathPreviewRibbon(this.scene, {
+                width: this.previewWidth * 2.54,
+                material: this.pathMaterial
+            });
+            this.pathPreviewMesh = this.pathRibbon.build(this.bezierPath, this.focusPart.getWorldMatrix());
+            return;
         }
         
-        // Keep last point
-        smoothed.push(rawPath[rawPath.length - 1]);
-        
-        console.log('ScrollCuttingSystem: Applied smoothing - reduced from', rawPath.length, 'to', smoothed.length, 'points');
-        return smoothed;
-    }
-    
-    /**
-     * Update real-time path preview
-     */
-    updatePathPreview() {
         // Clear existing preview
         this.clearPathPreview();
         
@@ -904,39 +848,17 @@ export class ScrollCuttingSystem {
     
     /**
      * Create bezier control points and handles for path editing
+     * One control point per spline anchor, with its in/out handles.
      */
     createBezierControlPoints() {
-        if (!this.smoothedPath || this.smoothedPath.length < 3) return;
+        if (!this.bezierPath || this.bezierPath.segmentCount === 0) return;
         
         // Clear existing handles
         this.clearBezierHandles();
         
-        console.log('ScrollCuttingSystem: Creating bezier control points for', this.smoothedPath.length, 'path points');
-        
-        // Create fewer control points for easier manipulation
-        const controlPointIndices = [];
-        const pathLength = this.smoothedPath.length;
-        
-        // Start point
-        controlPointIndices.push(0);
-        
-        // Middle points (only 2-3 points for most paths)
-        if (pathLength > 10) {
-            controlPointIndices.push(Math.floor(pathLength * 0.33));
-            controlPointIndices.push(Math.floor(pathLength * 0.67));
-        } else if (pathLength > 5) {
-            controlPointIndices.push(Math.floor(pathLength * 0.5));
-        }
-        
-        // End point
-        if (controlPointIndices[controlPointIndices.length - 1] !== pathLength - 1) {
-            controlPointIndices.push(pathLength - 1);
-        }
-        
         // Create control points and tangent handles
-        controlPointIndices.forEach((index, i) => {
-            const localPoint = this.smoothedPath[index];
-            const worldPoint = this.localToWorld(localPoint);
+        this.bezierPath.anchors.forEach((anchor, i) => {
+            const worldPoint = this.localToWorld(this.bezierPath.toVector3(anchor.point));
             
             // Create main control point (draggable) - much larger
             const controlPoint = BABYLON.MeshBuilder.CreateSphere(`controlPoint_${i}`, {
@@ -956,19 +878,15 @@ export class ScrollCuttingSystem {
             controlPoint.renderingGroupId = 2; // Render on top
             controlPoint.metadata = {
                 type: 'bezierControlPoint',
-                pathIndex: index,
+                anchorIndex: i,
                 scrollCuttingSystem: this
             };
             
             this.controlHandles.push(controlPoint);
-            
-            // Create tangent handles if not at endpoints
-            if (i > 0 && i < controlPointIndices.length - 1) {
-                this.createTangentHandles(controlPoint, localPoint, i);
-            }
+            this.createTangentHandles(controlPoint, anchor, i);
         });
         
-        console.log('ScrollCuttingSystem: Created', this.controlHandles.length, 'bezier control points');
+        console.log('ScrollCuttingSystem: Created', this.controlHandles.length, 'bezier control points for', this.bezierPath.segmentCount, 'curve segments');
     }
     
     /**
@@ -983,42 +901,30 @@ export class ScrollCuttingSystem {
     /**
      * Create tangent handles for a control point
      */
-    createTangentHandles(controlPoint, localPoint, index) {
-        const worldPoint = this.localToWorld(localPoint);
-        
-        // Calculate tangent direction from neighboring points
-        const prevIndex = Math.max(0, index - 1);
-        const nextIndex = Math.min(this.smoothedPath.length - 1, index + 1);
+    createTangentHandles(controlPoint, anchor, index) {
+        const worldPoint = controlPoint.position;
+        const handleSet = {
+            controlPoint: controlPoint,
+            handle1: null,
+            handle2: null,
+            line1: null,
+            line2: null,
+            anchorIndex: index
+        };
         
-        if (prevIndex < this.smoothedPath.length && nextIndex < this.smoothedPath.length) {
-            const prevWorld = this.localToWorld(this.smoothedPath[prevIndex]);
-            const nextWorld = this.localToWorld(this.smoothedPath[nextIndex]);
-            
-            // Calculate tangent direction
-            const tangent = nextWorld.subtract(prevWorld).normalize();
-            const handleLength = 3.0; // 3cm handle length - more visible
-            
-            // Create two tangent handles (before and after the control point)
-            const handle1Pos = worldPoint.subtract(tangent.scale(handleLength));
-            const handle2Pos = worldPoint.add(tangent.scale(handleLength));
-            
-            // Create handle meshes
-            const handle1 = this.createTangentHandle(handle1Pos, index, 'before');
-            const handle2 = this.createTangentHandle(handle2Pos, index, 'after');
-            
-            // Create connecting lines
-            const line1 = this.createHandleLine(worldPoint, handle1Pos);
-            const line2 = this.createHandleLine(worldPoint, handle2Pos);
-            
-            this.bezierHandles.push({
-                controlPoint: controlPoint,
-                handle1: handle1,
-                handle2: handle2,
-                line1: line1,
-                line2: line2,
-                pathIndex: index
-            });
+        // End anchors have a single handle
+        if (anchor.handleIn) {
+            const handle1Pos = this.localToWorld(this.bezierPath.toVector3(anchor.handleIn));
+            handleSet.handle1 = this.createTangentHandle(handle1Pos, index, 'before');
+            handleSet.line1 = this.createHandleLine(worldPoint, handle1Pos);
         }
+        if (anchor.handleOut) {
+            const handle2Pos = this.localToWorld(this.bezierPath.toVector3(anchor.handleOut));
+            handleSet.handle2 = this.createTangentHandle(handle2Pos, index, 'after');
+            handleSet.line2 = this.createHandleLine(worldPoint, handle2Pos);
+        }
+        
+        this.bezierHandles.push(handleSet);
     }
     
     /**
@@ -1051,10 +957,31 @@ export class ScrollCuttingSystem {
     
     /**
      * Create line connecting control point to tangent handle
+     * Parallel offset lines give it thickness; one updatable line system so
+     * dragging moves it in place (updateHandleLine).
      */
     createHandleLine(start, end) {
-        // Create multiple parallel lines for thickness
-        const lines = [];
+        const line = BABYLON.MeshBuilder.CreateLineSystem('handleLine', {
+            lines: this.getHandleLineSegments(start, end),
+            updatable: true
+        }, this.scene);
+        
+        line.color = new BABYLON.Color3(0.7, 0.7, 0.7); // Lighter gray
+        line.alpha = 0.8;
+        line.isPickable = false;
+        line.renderingGroupId = 1;
+        return line;
+    }
+    
+    updateHandleLine(line, start, end) {
+        if (!line) return;
+        BABYLON.MeshBuilder.CreateLineSystem('handleLine', {
+            lines: this.getHandleLineSegments(start, end),
+            instance: line
+        });
+    }
+    
+    getHandleLineSegments(start, end) {
         const offsets = [
             new BABYLON.Vector3(0, 0, 0),
             new BABYLON.Vector3(0.05, 0, 0),
@@ -1062,20 +989,7 @@ export class ScrollCuttingSystem {
             new BABYLON.Vector3(0, 0.05, 0),
             new BABYLON.Vector3(0, -0.05, 0)
         ];
-        
-        offsets.forEach((offset, i) => {
-            const line = BABYLON.LinesBuilder.CreateLines(`handleLine_${i}`, {
-                points: [start.add(offset), end.add(offset)]
-            }, this.scene);
-            
-            line.color = new BABYLON.Color3(0.7, 0.7, 0.7); // Lighter gray
-            line.alpha = 0.8;
-            line.isPickable = false;
-            line.renderingGroupId = 1;
-            lines.push(line);
-        });
-        
-        return lines[0]; // Return main line for disposal tracking
+        return offsets.map(offset => [start.add(offset), end.add(offset)]);
     }
     
     /**
@@ -1100,52 +1014,40 @@ export class ScrollCuttingSystem {
     
     /**
      * Delete a specific control point
+     * The neighbouring segments are joined using the outer handles.
      */
     deleteControlPoint(controlPoint) {
-        if (!controlPoint || !controlPoint.metadata) return;
+        if (!controlPoint || !controlPoint.metadata || controlPoint.metadata.type !== 'bezierControlPoint') return;
         
-        const pathIndex = controlPoint.metadata.pathIndex;
-        console.log('ScrollCuttingSystem: Deleting control point at index', pathIndex);
-        
-        // Remove from control handles array
-        const handleIndex = this.controlHandles.indexOf(controlPoint);
-        if (handleIndex !== -1) {
-            this.controlHandles.splice(handleIndex, 1);
-        }
-        
-        // Remove from scene
-        controlPoint.dispose();
+        const anchorIndex = controlPoint.metadata.anchorIndex;
+        console.log('ScrollCuttingSystem: Deleting control point at anchor', anchorIndex);
         
         // Clear selection
         this.selectedControlPoint = null;
         
-        // If this was the only control point, clear the path
-        if (this.controlHandles.length === 0) {
+        // A spline needs two anchors - otherwise the path goes
+        if (!this.bezierPath || !this.bezierPath.removeAnchor(anchorIndex)) {
             this.clearCurrentCutPath();
-        } else {
-            // Regenerate the path without this point
-            this.regeneratePathFromControlPoints();
+            return;
         }
         
+        // Regenerate the path without this point
+        this.regeneratePathFromControlPoints();
+        
         console.log('ScrollCuttingSystem: Control point deleted');
     }
     
     /**
-     * Regenerate path from remaining control points
+     * Regenerate path and handles after the spline's anchors changed
      */
     regeneratePathFromControlPoints() {
-        if (this.controlHandles.length < 2) {
+        if (!this.bezierPath || this.bezierPath.segmentCount === 0) {
             this.clearCurrentCutPath();
             return;
         }
         
-        // Extract positions from remaining control points
-        const newPath = this.controlHandles.map(handle => 
-            this.worldToLocal(handle.position)
-        );
-        
-        // Update the smoothed path
-        this.smoothedPath = newPath;
+        this.regenerateSmoothedPathFromControlPoints();
+        this.createBezierControlPoints();
         
         // Update path preview
         this.updatePathPreview();
@@ -1194,6 +1096,11 @@ export class ScrollCuttingSystem {
      * Clear current path preview
      */
     clearPathPreview() {
+        if (this.pathRibbon) {
+            this.pathRibbon.dispose();
+            this.pathRibbon = null;
+            this.pathPreviewMesh = null;
+        }
         if (this.pathPreviewMesh) {
             this.pathPreviewMesh.dispose();
             this.pathPreviewMesh = null;
@@ -1206,6 +1113,8 @@ export class ScrollCuttingSystem {
     clearCurrentPath() {
         this.currentPath = [];
         this.smoothedPath = [];
+        this.pathSimplifier = null;
+        this.bezierPath = null;
         this.isDrawing = false;
         this.clearPathPreview();
     }
@@ -1230,7 +1139,7 @@ export class ScrollCuttingSystem {
         `;
         
         // Create horizontal ruler (top)
-        this.horizontalRuler = document.createElement('div');
+        this.horizontalRuler = document.createElement('canvas');
         this.horizontalRuler.style.cssText = `
             position: absolute;
             top: 0;
@@ -1245,7 +1154,7 @@ export class ScrollCuttingSystem {
         `;
         
         // Create vertical ruler (left)
-        this.verticalRuler = document.createElement('div');
+        this.verticalRuler = document.createElement('canvas');
         this.verticalRuler.style.cssText = `
             position: absolute;
             top: 40px;
@@ -1332,13 +1241,15 @@ export class ScrollCuttingSystem {
     
     /**
      * Update ruler markings based on current view
+     * Ticks and labels are blitted from RulerCache strips, so pans and small
+     * zooms only re-position them; strips are redrawn when the zoom bucket changes.
      */
     updateRulerMarkings() {
         if (!this.horizontalRuler || !this.verticalRuler || !this.focusPart) return;
         
-        // Get workpiece dimensions and camera info
-        const meshBounds = this.focusPart.getBoundingInfo();
-        const meshSize = meshBounds.maximum.subtract(meshBounds.minimum);
+        // Get workpiece bounds and camera info
+        const bounds = this.focusPart.getBoundingInfo().boundingBox;
+        const meshSize = bounds.maximumWorld.subtract(bounds.minimumWorld);
         const camera = this.drawingWorld.camera;
         
         // Calculate scale: pixels per unit
@@ -1347,114 +1258,87 @@ export class ScrollCuttingSystem {
         const orthoWidth = camera.orthoRight - camera.orthoLeft;
         const orthoHeight = camera.orthoTop - camera.orthoBottom;
         const pixelsPerUnit = canvasWidth / orthoWidth;
-        
-        // Clear existing markings
-        this.horizontalRuler.innerHTML = '';
-        this.verticalRuler.innerHTML = '';
-        
-        // Add horizontal ruler markings
-        const workpieceWidth = meshSize.x;
+        const verticalPixelsPerUnit = canvasHeight / orthoHeight;
         const majorTickSpacing = this.calculateOptimalTickSpacing(pixelsPerUnit);
         
-        for (let i = 0; i <= Math.ceil(workpieceWidth / majorTickSpacing) + 2; i++) {
-            const value = i * majorTickSpacing;
-            const pixelPos = (value / orthoWidth) * canvasWidth;
-            
-            // Major tick
-            const majorTick = document.createElement('div');
-            majorTick.style.cssText = `
-                position: absolute;
-                left: ${pixelPos}px;
-                top: 20px;
-                width: 1px;
-                height: 20px;
-                background: #333;
-            `;
-            this.horizontalRuler.appendChild(majorTick);
-            
-            // Label
-            const label = document.createElement('div');
-            label.style.cssText = `
-                position: absolute;
-                left: ${pixelPos + 2}px;
-                top: 2px;
-                color: #333;
-                font-size: 9px;
-            `;
-            label.textContent = (value * 0.393701).toFixed(2) + '"';
-            this.horizontalRuler.appendChild(label);
-            
-            // Minor ticks
-            for (let j = 1; j < 4; j++) {
-                const minorValue = value + (j * majorTickSpacing / 4);
-                const minorPixelPos = (minorValue / orthoWidth) * canvasWidth;
-                
-                const minorTick = document.createElement('div');
-                minorTick.style.cssText = `
-                    position: absolute;
-                    left: ${minorPixelPos}px;
-                    top: 30px;
-                    width: 1px;
-                    height: 10px;
-                    background: #666;
-                `;
-                this.horizontalRuler.appendChild(minorTick);
-            }
+        // Rulers start at the workpiece corner, wherever panning has put it on screen
+        const corner = this.projectToScreen(bounds.minimumWorld);
+        const farCorner = this.projectToScreen(bounds.maximumWorld);
+        const rulerSize = 40; // Ruler thickness, also each ruler's offset from the canvas edge
+        
+        this.fitRulerCanvas(this.horizontalRuler);
+        this.fitRulerCanvas(this.verticalRuler);
+        
+        if (!this.rulerCaches) {
+            const font = "9px 'Courier New', monospace";
+            this.rulerCaches = {
+                horizontal: new RulerCache({
+                    majorLength: 20, minorLength: 10, majorColor: '#333', minorColor: '#666',
+                    font: font, fontSize: 9, labelBaseline: 11
+                }),
+                vertical: new RulerCache({
+                    vertical: true, majorLength: 20, majorColor: '#333',
+                    font: font, fontSize: 9, labelBaseline: 11
+                })
+            };
         }
+        const formatLabel = (value) => (value * 0.393701).toFixed(2) + '"';
+        
+        // Horizontal ruler: major ticks with 4 minor divisions across the workpiece width
+        this.rulerCaches.horizontal.draw(this.horizontalRuler, {
+            pixelsPerUnit: pixelsPerUnit,
+            offset: Math.min(corner.x, farCorner.x) - rulerSize,
+            majorSpacing: majorTickSpacing,
+            minorDivisions: 4,
+            formatLabel: formatLabel,
+            from: 0,
+            to: (Math.ceil(meshSize.x / majorTickSpacing) + 2) * majorTickSpacing
+        });
         
-        // Add vertical ruler markings (similar logic)
-        const workpieceDepth = meshSize.z;
-        for (let i = 0; i <= Math.ceil(workpieceDepth / majorTickSpacing) + 2; i++) {
-            const value = i * majorTickSpacing;
-            const pixelPos = (value / orthoHeight) * canvasHeight;
-            
-            // Major tick
-            const majorTick = document.createElement('div');
-            majorTick.style.cssText = `
-                position: absolute;
-                top: ${pixelPos}px;
-                left: 20px;
-                width: 20px;
-                height: 1px;
-                background: #333;
-            `;
-            this.verticalRuler.appendChild(majorTick);
-            
-            // Label (rotated)
-            const label = document.createElement('div');
-            label.style.cssText = `
-                position: absolute;
-                top: ${pixelPos + 2}px;
-                left: 2px;
-                color: #333;
-                font-size: 9px;
-                transform: rotate(-90deg);
-                transform-origin: left top;
-                width: 30px;
-            `;
-            label.textContent = (value * 0.393701).toFixed(2) + '"';
-            this.verticalRuler.appendChild(label);
+        // Vertical ruler: major ticks only, down the workpiece depth
+        this.rulerCaches.vertical.draw(this.verticalRuler, {
+            pixelsPerUnit: verticalPixelsPerUnit,
+            offset: Math.min(corner.y, farCorner.y) - rulerSize,
+            majorSpacing: majorTickSpacing,
+            minorDivisions: 1,
+            formatLabel: formatLabel,
+            from: 0,
+            to: (Math.ceil(meshSize.z / majorTickSpacing) + 2) * majorTickSpacing
+        });
+    }
+    
+    /**
+     * Screen position (canvas pixels) of a world point
+     */
+    projectToScreen(point) {
+        const engine = this.scene.getEngine();
+        const camera = this.drawingWorld.camera;
+        return BABYLON.Vector3.Project(
+            point,
+            BABYLON.Matrix.IdentityReadOnly,
+            // Fresh matrices: a pan moves the camera before the next render updates the scene's
+            camera.getViewMatrix(true).multiply(camera.getProjectionMatrix(true)),
+            camera.viewport.toGlobal(engine.getRenderWidth(), engine.getRenderHeight())
+        );
+    }
+    
+    /**
+     * Match a ruler canvas's backing size to its laid-out size
+     */
+    fitRulerCanvas(canvas) {
+        const width = canvas.clientWidth || 40;
+        const height = canvas.clientHeight || 40;
+        if (canvas.width !== width || canvas.height !== height) {
+            canvas.width = width;
+            canvas.height = height;
         }
     }
     
     /**
-     * Calculate optimal tick spacing based on zoom level
+     * Calculate optimal tick spacing based on zoom level (shared with RulerCache)
      */
     calculateOptimalTickSpacing(pixelsPerUnit) {
-        // Target 40-80 pixels between major ticks
-        const targetPixelSpacing = 60;
-        const unitSpacing = targetPixelSpacing / pixelsPerUnit;
-        
-        // Round to nice increments (0.25, 0.5, 1.0, 2.0, etc.)
-        const niceIncrements = [0.125, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0];
-        
-        for (let increment of niceIncrements) {
-            if (increment * pixelsPerUnit >= targetPixelSpacing * 0.7) {
-                return increment;
-            }
-        }
-        
-        return 1.0; // Default fallback
+        return calculateOptimalTickSpacing(pixelsPerUnit);
     }
     
     /**
@@ -1609,6 +1493,7 @@ export class ScrollCuttingSystem {
             this.rulersContainer = null;
             this.horizontalRuler = null;
             this.verticalRuler = null;
+            this.rulerCaches = null;
             this.coordinateDisplay = null;
             this.cutDepthSlider = null;
         }
@@ -1793,21 +1678,28 @@ export class ScrollCuttingSystem {
             const boardBottom = meshBounds.minimum.y;
             const kerfWidth = 0.3; // Width of the cut (like a saw blade)
             
-            // Create cutting geometry that follows the curve exactly
-            const cuttingMesh = this.createCurveCuttingMesh(worldPath, boardTop, boardBottom, kerfWidth);
+            // Bake pending holes first so every piece keeps them
+            this.drawingWorld.realizePartFeatures(this.focusPart);
             
-            if (!cuttingMesh) {
+            // Flat boards are cut in 2D (kerf outline subtracted from the footprint,
+            // pieces re-extruded); profiled boards fall back to a CSG cutter
+            const flatCut = this.computeFlatCutPieces(this.focusPart, kerfWidth);
+            const cuttingMesh = flatCut ? null : this.createCurveCuttingMesh(worldPath, boardTop, boardBottom, kerfWidth);
+            
+            if (!flatCut && !cuttingMesh) {
                 throw new Error('Failed to create cutting mesh from path');
             }
             
-            console.log('ScrollCuttingSystem: Created cutting mesh following curve path');
-            console.log('Cutting mesh details:', {
-                position: cuttingMesh.position,
-                pathPoints: worldPath.length,
-                kerfWidth: kerfWidth,
-                boardTop: boardTop,
-                boardBottom: boardBottom
-            });
+            if (cuttingMesh) {
+                console.log('ScrollCuttingSystem: Created cutting mesh following curve path');
+                console.log('Cutting mesh details:', {
+                    position: cuttingMesh.position,
+                    pathPoints: worldPath.length,
+                    kerfWidth: kerfWidth,
+                    boardTop: boardTop,
+                    boardBottom: boardBottom
+                });
+            }
             
             // Store references before CSG operation
             const originalPart = this.focusPart;
@@ -1815,45 +1707,48 @@ export class ScrollCuttingSystem {
             const originalPartData = originalPart.partData;
             const originalPosition = originalPart.position.clone();
             
-            console.log('ScrollCuttingSystem: Performing CSG subtraction...');
+            console.log('ScrollCuttingSystem: Performing', flatCut ? 'flat 2D cut...' : 'CSG subtraction...');
             console.log('Original part info:', {
                 name: originalPart.name,
                 position: originalPart.position,
                 hasVertices: !!originalPart.getVerticesData(BABYLON.VertexBuffer.PositionKind),
                 vertexCount: originalPart.getVerticesData(BABYLON.VertexBuffer.PositionKind)?.length / 3
             });
-            console.log('Cutting mesh info:', {
-                position: cuttingMesh.position,
-                scaling: cuttingMesh.scaling,
-                hasVertices: !!cuttingMesh.getVerticesData(BABYLON.VertexBuffer.PositionKind),
-                vertexCount: cuttingMesh.getVerticesData(BABYLON.VertexBuffer.PositionKind)?.length / 3
-            });
-            
-            // Debug: Check if cutting mesh actually intersects with the board
-            const boardBounds = originalPart.getBoundingInfo();
-            const cuttingBounds = cuttingMesh.getBoundingInfo();
-            
-            console.log('ScrollCuttingSystem: Board bounds:', {
-                min: boardBounds.minimum,
-                max: boardBounds.maximum
-            });
-            console.log('ScrollCuttingSystem: Cutting mesh bounds:', {
-                min: cuttingBounds.minimum,
-                max: cuttingBounds.maximum
-            });
-            
-            // Check if they might intersect (simple overlap check)
-            const boardMin = boardBounds.minimum;
-            const boardMax = boardBounds.maximum;
-            const cuttingMin = cuttingBounds.minimum;
-            const cuttingMax = cuttingBounds.maximum;
             
-            const intersects = !(
-                cuttingMax.x < boardMin.x || cuttingMin.x > boardMax.x ||
-                cuttingMax.y < boardMin.y || cuttingMin.y > boardMax.y ||
-                cuttingMax.z < boardMin.z || cuttingMin.z > boardMax.z
-            );
-            console.log('ScrollCuttingSystem: Bounds overlap:', intersects);
+            if (cuttingMesh) {
+                console.log('Cutting mesh info:', {
+                    position: cuttingMesh.position,
+                    scaling: cuttingMesh.scaling,
+                    hasVertices: !!cuttingMesh.getVerticesData(BABYLON.VertexBuffer.PositionKind),
+                    vertexCount: cuttingMesh.getVerticesData(BABYLON.VertexBuffer.PositionKind)?.length / 3
+                });
+                
+                // Debug: Check if cutting mesh actually intersects with the board
+                const boardBounds = originalPart.getBoundingInfo();
+                const cuttingBounds = cuttingMesh.getBoundingInfo();
+                
+                console.log('ScrollCuttingSystem: Board bounds:', {
+                    min: boardBounds.minimum,
+                    max: boardBounds.maximum
+                });
+                console.log('ScrollCuttingSystem: Cutting mesh bounds:', {
+                    min: cuttingBounds.minimum,
+                    max: cuttingBounds.maximum
+                });
+                
+                // Check if they might intersect (simple overlap check)
+                const boardMin = boardBounds.minimum;
+                const boardMax = boardBounds.maximum;
+                const cuttingMin = cuttingBounds.minimum;
+                const cuttingMax = cuttingBounds.maximum;
+                
+                const intersects = !(
+                    cuttingMax.x < boardMin.x || cuttingMin.x > boardMax.x ||
+                    cuttingMax.y < boardMin.y || cuttingMin.y > boardMax.y ||
+                    cuttingMax.z < boardMin.z || cuttingMin.z > boardMax.z
+                );
+                console.log('ScrollCuttingSystem: Bounds overlap:', intersects);
+            }
             
             // Create two separate pieces using the cutting mesh as the separator
             console.log('ScrollCuttingSystem: Creating two pieces separated by cutting path');
@@ -1884,96 +1779,118 @@ export class ScrollCuttingSystem {
             
             try {
                 
-                // Create TWO pieces using the cutting mesh twice!
-                console.log('ScrollCuttingSystem: Creating two pieces - use cutting mesh twice');
+                let piece1;
+                const extraPieces = []; // Pieces cut free of the main board
                 
-                // Create CSG objects
-                const boardCSG = BABYLON.CSG.FromMesh(originalPart);
-                const cutterCSG = BABYLON.CSG.FromMesh(cuttingMesh);
-                
-                // Dispose original part to prevent duplicates
-                originalPart.dispose();
-                console.log('ScrollCuttingSystem: ✅ Disposed original part to prevent duplicates');
-                
-                // PIECE A: Board with cutting mesh subtracted (the main board piece)
-                const piece1CSG = boardCSG.subtract(cutterCSG);
-                const tempPiece1 = piece1CSG.toMesh(originalName + '_temp1', originalMaterial, this.scene);
-                
-                console.log('ScrollCuttingSystem: Using subtract approach for piece1');
-                
-                // Create completely clean mesh from geometry to avoid bounding box issues
-                const piece1Vertices = tempPiece1.getVerticesData(BABYLON.VertexBuffer.PositionKind);
-                const piece1Indices = tempPiece1.getIndices();
-                const piece1Normals = tempPiece1.getVerticesData(BABYLON.VertexBuffer.NormalKind);
-                
-                // Create fresh mesh
-                const piece1 = new BABYLON.Mesh(originalName + '_piece1', this.scene);
-                piece1.setVerticesData(BABYLON.VertexBuffer.PositionKind, piece1Vertices);
-                piece1.setIndices(piece1Indices);
-                if (piece1Normals) {
-                    piece1.setVerticesData(BABYLON.VertexBuffer.NormalKind, piece1Normals);
-                }
-                piece1.material = originalMaterial;
+                if (flatCut) {
+                    // Dispose original part to prevent duplicates
+                    originalPart.dispose();
+                    
+                    flatCut.groups.forEach((group, k) => {
+                        const suffix = k === 0 ? '_piece1' : (flatCut.groups.length > 2 ? `_piece2_${k}` : '_piece2');
+                        const piece = this.extrudeFlatPiece(originalName + suffix, group, flatCut);
+                        piece.material = originalMaterial;
+                        piece.position = originalPosition.clone();
+                        piece.refreshBoundingInfo();
+                        piece.computeWorldMatrix(true);
+                        if (k === 0) piece1 = piece;
+                        else extraPieces.push(piece);
+                    });
+                    
+                    console.log('ScrollCuttingSystem: ✅ Extruded', flatCut.groups.length, 'piece(s) from the flat cut');
+                } else {
+                    // Create TWO pieces using the cutting mesh twice!
+                    console.log('ScrollCuttingSystem: Creating two pieces - use cutting mesh twice');
+                
+                    // Create CSG objects
+                    const boardCSG = BABYLON.CSG.FromMesh(originalPart);
+                    const cutterCSG = BABYLON.CSG.FromMesh(cuttingMesh);
+                
+                    // Dispose original part to prevent duplicates
+                    originalPart.dispose();
+                    console.log('ScrollCuttingSystem: ✅ Disposed original part to prevent duplicates');
+                
+                    // PIECE A: Board with cutting mesh subtracted (the main board piece)
+                    const piece1CSG = boardCSG.subtract(cutterCSG);
+                    const tempPiece1 = piece1CSG.toMesh(originalName + '_temp1', originalMaterial, this.scene);
+                
+                    console.log('ScrollCuttingSystem: Using subtract approach for piece1');
+                
+                    // Create completely clean mesh from geometry to avoid bounding box issues
+                    const piece1Vertices = tempPiece1.getVerticesData(BABYLON.VertexBuffer.PositionKind);
+                    const piece1Indices = tempPiece1.getIndices();
+                    const piece1Normals = tempPiece1.getVerticesData(BABYLON.VertexBuffer.NormalKind);
+                
+                    // Create fresh mesh
+                    piece1 = new BABYLON.Mesh(originalName + '_piece1', this.scene);
+                    piece1.setVerticesData(BABYLON.VertexBuffer.PositionKind, piece1Vertices);
+                    piece1.setIndices(piece1Indices);
+                    if (piece1Normals) {
+                        piece1.setVerticesData(BABYLON.VertexBuffer.NormalKind, piece1Normals);
+                    }
+                    piece1.material = originalMaterial;
                 
-                // Position at original location  
-                piece1.position = originalPosition.clone();
+                    // Position at original location  
+                    piece1.position = originalPosition.clone();
                 
-                // Dispose temp mesh
-                tempPiece1.dispose();
+                    // Dispose temp mesh
+                    tempPiece1.dispose();
                 
-                console.log('ScrollCuttingSystem: ✅ Created clean piece1 mesh from geometry data');
+                    console.log('ScrollCuttingSystem: ✅ Created clean piece1 mesh from geometry data');
                 
-                // Debug piece1 bounding box immediately after CSG
-                console.log('ScrollCuttingSystem: Piece1 bounds after CSG:', {
-                    min: piece1.getBoundingInfo().minimum,
-                    max: piece1.getBoundingInfo().maximum,
-                    size: piece1.getBoundingInfo().maximum.subtract(piece1.getBoundingInfo().minimum)
-                });
+                    // Debug piece1 bounding box immediately after CSG
+                    console.log('ScrollCuttingSystem: Piece1 bounds after CSG:', {
+                        min: piece1.getBoundingInfo().minimum,
+                        max: piece1.getBoundingInfo().maximum,
+                        size: piece1.getBoundingInfo().maximum.subtract(piece1.getBoundingInfo().minimum)
+                    });
                 
-                // PIECE B: Only the part of cutting mesh that intersects with the board
-                const piece2CSG = cutterCSG.intersect(boardCSG);
-                const tempPiece2 = piece2CSG.toMesh(originalName + '_temp', originalMaterial, this.scene);
+                    // PIECE B: Only the part of cutting mesh that intersects with the board
+                    const piece2CSG = cutterCSG.intersect(boardCSG);
+                    const tempPiece2 = piece2CSG.toMesh(originalName + '_temp', originalMaterial, this.scene);
                 
-                // Debug piece2 bounding box immediately after CSG
-                console.log('ScrollCuttingSystem: Piece2 bounds after CSG:', {
-                    min: tempPiece2.getBoundingInfo().minimum,
-                    max: tempPiece2.getBoundingInfo().maximum,
-                    size: tempPiece2.getBoundingInfo().maximum.subtract(tempPiece2.getBoundingInfo().minimum)
-                });
+                    // Debug piece2 bounding box immediately after CSG
+                    console.log('ScrollCuttingSystem: Piece2 bounds after CSG:', {
+                        min: tempPiece2.getBoundingInfo().minimum,
+                        max: tempPiece2.getBoundingInfo().maximum,
+                        size: tempPiece2.getBoundingInfo().maximum.subtract(tempPiece2.getBoundingInfo().minimum)
+                    });
                 
-                // Create a completely clean mesh from the intersected geometry
-                const piece2Vertices = tempPiece2.getVerticesData(BABYLON.VertexBuffer.PositionKind);
-                const piece2Indices = tempPiece2.getIndices();
-                const piece2Normals = tempPiece2.getVerticesData(BABYLON.VertexBuffer.NormalKind);
-                
-                // Create new clean mesh
-                const piece2 = new BABYLON.Mesh(originalName + '_piece2', this.scene);
-                piece2.setVerticesData(BABYLON.VertexBuffer.PositionKind, piece2Vertices);
-                piece2.setIndices(piece2Indices);
-                if (piece2Normals) {
-                    piece2.setVerticesData(BABYLON.VertexBuffer.NormalKind, piece2Normals);
-                }
-                piece2.material = originalMaterial;
+                    // Create a completely clean mesh from the intersected geometry
+                    const piece2Vertices = tempPiece2.getVerticesData(BABYLON.VertexBuffer.PositionKind);
+                    const piece2Indices = tempPiece2.getIndices();
+                    const piece2Normals = tempPiece2.getVerticesData(BABYLON.VertexBuffer.NormalKind);
+                
+                    // Create new clean mesh
+                    const piece2 = new BABYLON.Mesh(originalName + '_piece2', this.scene);
+                    piece2.setVerticesData(BABYLON.VertexBuffer.PositionKind, piece2Vertices);
+                    piece2.setIndices(piece2Indices);
+                    if (piece2Normals) {
+                        piece2.setVerticesData(BABYLON.VertexBuffer.NormalKind, piece2Normals);
+                    }
+                    piece2.material = originalMaterial;
                 
-                // Position at original location
-                piece2.position = originalPosition.clone();
+                    // Position at original location
+                    piece2.position = originalPosition.clone();
                 
-                // Dispose temporary mesh
-                tempPiece2.dispose();
+                    // Dispose temporary mesh
+                    tempPiece2.dispose();
                 
-                // Force proper bounding calculations and center the mesh properly
-                piece2.refreshBoundingInfo();
-                piece2.computeWorldMatrix(true);
+                    // Force proper bounding calculations and center the mesh properly
+                    piece2.refreshBoundingInfo();
+                    piece2.computeWorldMatrix(true);
                 
-                // Reset any inherited transforms to ensure clean positioning
-                piece2.rotation = BABYLON.Vector3.Zero();
-                piece2.scaling = BABYLON.Vector3.One();
+                    // Reset any inherited transforms to ensure clean positioning
+                    piece2.rotation = BABYLON.Vector3.Zero();
+                    piece2.scaling = BABYLON.Vector3.One();
                 
-                // Force refresh bounding info
-                piece2.refreshBoundingInfo();
-                console.log('ScrollCuttingSystem: ✅ Piece2 positioned at original location');
+                    // Force refresh bounding info
+                    piece2.refreshBoundingInfo();
+                    console.log('ScrollCuttingSystem: ✅ Piece2 positioned at original location');
                 
-                console.log('ScrollCuttingSystem: Created clean piece2 mesh with reset transforms');
+                    console.log('ScrollCuttingSystem: Created clean piece2 mesh with reset transforms');
+                    extraPieces.push(piece2);
+                }
                 
                 // Set up piece 1 (main board piece)
                 // Force refresh bounding info
@@ -2030,69 +1947,6 @@ export class ScrollCuttingSystem {
                 
                 console.log('ScrollCuttingSystem: 🔍 partData assigned to piece1 with dimensions:', piece1.partData.dimensions);
                 
-                // Set up piece 2 (cut-out piece) with unique ID
-                const timestamp = Date.now();
-                const piece2Id = originalId + '_cutout_' + timestamp;
-                piece2.isWorkBenchPart = true;
-                piece2.id = piece2Id; // Unique ID
-                piece2.materialId = originalMaterialId;
-                piece2.materialName = (originalMaterialName || 'Unknown Material') + ' (Cut Piece)';
-                piece2.grade = originalGrade;
-                piece2.pickable = true;
-                piece2.isVisible = true;
-                
-                // Force recalculate bounding box for piece2
-                console.log('ScrollCuttingSystem: Piece2 bounds BEFORE refreshBoundingInfo:', {
-                    min: piece2.getBoundingInfo().minimum,
-                    max: piece2.getBoundingInfo().maximum,
-                    size: piece2.getBoundingInfo().maximum.subtract(piece2.getBoundingInfo().minimum)
-                });
-                
-                // Force clean bounding box calculation for fresh mesh
-                piece2.refreshBoundingInfo();
-                piece2.computeWorldMatrix(true);
-                piece2.refreshBoundingInfo();
-                
-                console.log('ScrollCuttingSystem: ✅ Clean mesh should have correct bounding box automatically');
-                
-                console.log('ScrollCuttingSystem: 🔄 Double-refreshed bounding info for piece2');
-                
-                console.log('ScrollCuttingSystem: Piece2 bounds AFTER refreshBoundingInfo:', {
-                    min: piece2.getBoundingInfo().minimum,
-                    max: piece2.getBoundingInfo().maximum,
-                    size: piece2.getBoundingInfo().maximum.subtract(piece2.getBoundingInfo().minimum)
-                });
-                
-                const piece2BoundingInfo = piece2.getBoundingInfo();
-                const piece2Size = piece2BoundingInfo.maximum.subtract(piece2BoundingInfo.minimum);
-                piece2.dimensions = {
-                    length: Math.abs(piece2Size.z),
-                    width: Math.abs(piece2Size.x),
-                    thickness: Math.abs(piece2Size.y)
-                };
-                
-                console.log('ScrollCuttingSystem: Piece2 recalculated dimensions:', piece2.dimensions);
-                console.log('ScrollCuttingSystem: Piece2 original dimensions were:', originalDimensions);
-                
-                // Create partData for piece2 with matching ID and updated dimensions
-                piece2.partData = {
-                    ...originalPartData,
-                    id: piece2Id,
-                    materialName: (originalMaterialName || 'Unknown Material') + ' (Cut Piece)',
-                    dimensions: piece2.dimensions, // Use the recalculated dimensions
-                    status: 'cut_piece',
-                    modifiedAt: new Date().toISOString()
-                };
-                
-                console.log('ScrollCuttingSystem: Configured piece2 properties:', {
-                    id: piece2.id,
-                    partDataId: piece2.partData?.id,
-                    materialName: piece2.materialName,
-                    isWorkBenchPart: piece2.isWorkBenchPart,
-                    pickable: piece2.pickable,
-                    isVisible: piece2.isVisible
-                });
-                
                 console.log('ScrollCuttingSystem: Configured piece1 properties:', {
                     id: piece1.id,
                     partDataId: piece1.partData?.id,
@@ -2102,22 +1956,87 @@ export class ScrollCuttingSystem {
                     isVisible: piece1.isVisible
                 });
                 
-                // Don't add piece1 to array yet - it will replace the original
-                // Only add piece2 as a new additional piece (add the part data object, not the mesh)
-                console.log('ScrollCuttingSystem: Adding piece2 part data to workBenchParts:', piece2.id);
-                console.log('ScrollCuttingSystem: piece2 isVisible:', piece2.isVisible);
-                console.log('ScrollCuttingSystem: piece2 pickable:', piece2.pickable);
-                console.log('ScrollCuttingSystem: piece2 position:', piece2.position);
-                console.log('ScrollCuttingSystem: workBenchParts length before:', this.drawingWorld.workBenchParts.length);
+                // Set up the cut-out pieces with unique IDs (none when the cut doesn't part the board)
+                const timestamp = Date.now();
+                extraPieces.forEach((piece2, k) => {
+                    const piece2Id = originalId + '_cutout_' + timestamp + (extraPieces.length > 1 ? `_${k + 1}` : '');
+                    piece2.isWorkBenchPart = true;
+                    piece2.id = piece2Id; // Unique ID
+                    piece2.materialId = originalMaterialId;
+                    piece2.materialName = (originalMaterialName || 'Unknown Material') + ' (Cut Piece)';
+                    piece2.grade = originalGrade;
+                    piece2.pickable = true;
+                    piece2.isVisible = true;
+                
+                    // Force recalculate bounding box for piece2
+                    console.log('ScrollCuttingSystem: Piece2 bounds BEFORE refreshBoundingInfo:', {
+                        min: piece2.getBoundingInfo().minimum,
+                        max: piece2.getBoundingInfo().maximum,
+                        size: piece2.getBoundingInfo().maximum.subtract(piece2.getBoundingInfo().minimum)
+                    });
+                
+                    // Force clean bounding box calculation for fresh mesh
+                    piece2.refreshBoundingInfo();
+                    piece2.computeWorldMatrix(true);
+                    piece2.refreshBoundingInfo();
+                
+                    console.log('ScrollCuttingSystem: ✅ Clean mesh should have correct bounding box automatically');
                 
-                // Add the part data object to workBenchParts array (not the mesh)
-                this.drawingWorld.workBenchParts.push(piece2.partData);
+                    console.log('ScrollCuttingSystem: 🔄 Double-refreshed bounding info for piece2');
                 
-                console.log('ScrollCuttingSystem: workBenchParts length after:', this.drawingWorld.workBenchParts.length);
-                console.log('ScrollCuttingSystem: Last added part ID:', this.drawingWorld.workBenchParts[this.drawingWorld.workBenchParts.length - 1]?.id);
-                console.log('ScrollCuttingSystem: Last added part dimensions:', this.drawingWorld.workBenchParts[this.drawingWorld.workBenchParts.length - 1]?.dimensions);
+                    console.log('ScrollCuttingSystem: Piece2 bounds AFTER refreshBoundingInfo:', {
+                        min: piece2.getBoundingInfo().minimum,
+                        max: piece2.getBoundingInfo().maximum,
+                        size: piece2.getBoundingInfo().maximum.subtract(piece2.getBoundingInfo().minimum)
+                    });
+                
+                    const piece2BoundingInfo = piece2.getBoundingInfo();
+                    const piece2Size = piece2BoundingInfo.maximum.subtract(piece2BoundingInfo.minimum);
+                    piece2.dimensions = {
+                        length: Math.abs(piece2Size.z),
+                        width: Math.abs(piece2Size.x),
+                        thickness: Math.abs(piece2Size.y)
+                    };
+                
+                    console.log('ScrollCuttingSystem: Piece2 recalculated dimensions:', piece2.dimensions);
+                    console.log('ScrollCuttingSystem: Piece2 original dimensions were:', originalDimensions);
+                
+                    // Create partData for piece2 with matching ID and updated dimensions
+                    piece2.partData = {
+                        ...originalPartData,
+                        id: piece2Id,
+                        materialName: (originalMaterialName || 'Unknown Material') + ' (Cut Piece)',
+                        dimensions: piece2.dimensions, // Use the recalculated dimensions
+                        status: 'cut_piece',
+                        modifiedAt: new Date().toISOString()
+                    };
+                
+                    console.log('ScrollCuttingSystem: Configured piece2 properties:', {
+                        id: piece2.id,
+                        partDataId: piece2.partData?.id,
+                        materialName: piece2.materialName,
+                        isWorkBenchPart: piece2.isWorkBenchPart,
+                        pickable: piece2.pickable,
+                        isVisible: piece2.isVisible
+                    });
+                
+                    // Don't add piece1 to array yet - it will replace the original
+                    // Only add piece2 as a new additional piece (add the part data object, not the mesh)
+                    console.log('ScrollCuttingSystem: Adding piece2 part data to workBenchParts:', piece2.id);
+                    console.log('ScrollCuttingSystem: piece2 isVisible:', piece2.isVisible);
+                    console.log('ScrollCuttingSystem: piece2 pickable:', piece2.pickable);
+                    console.log('ScrollCuttingSystem: piece2 position:', piece2.position);
+                    console.log('ScrollCuttingSystem: workBenchParts length before:', this.drawingWorld.workBenchParts.length);
                 
-                console.log('ScrollCuttingSystem: Created two pieces using cutting mesh twice');
+                    // Add the part data object to workBenchParts array (not the mesh)
+                    this.drawingWorld.workBenchParts.push(piece2.partData);
+                
+                    console.log('ScrollCuttingSystem: workBenchParts length after:', this.drawingWorld.workBenchParts.length);
+                    console.log('ScrollCuttingSystem: Last added part ID:', this.drawingWorld.workBenchParts[this.drawingWorld.workBenchParts.length - 1]?.id);
+                    console.log('ScrollCuttingSystem: Last added part dimensions:', this.drawingWorld.workBenchParts[this.drawingWorld.workBenchParts.length - 1]?.dimensions);
+                });
+                
+                console.log('ScrollCuttingSystem: Created', extraPieces.length + 1, 'piece(s) from the cut');
                 
                 // Use first piece as primary result
                 cutPart = piece1;
@@ -2146,7 +2065,7 @@ export class ScrollCuttingSystem {
                 });
                 
                 // Clean up
-                cuttingMesh.dispose();
+                if (cuttingMesh) cuttingMesh.dispose();
                 
                 console.log('ScrollCuttingSystem: Created cut piece, disposed original');
                 
@@ -2602,6 +2521,7 @@ export class ScrollCuttingSystem {
                 
                 // Perform CSG boolean subtraction
                 console.log('ScrollCuttingSystem: Performing CSG subtraction...');
+                this.drawingWorld.realizePartFeatures(originalPart);
                 const csgA = BABYLON.CSG.FromMesh(originalPart);
                 const csgB = BABYLON.CSG.FromMesh(cuttingTool);
                 const csgResult = csgA.subtract(csgB);
@@ -3028,6 +2948,158 @@ export class ScrollCuttingSystem {
         console.log('ScrollCuttingSystem: Deactivated scroll cutting mode and restored camera controls');
     }
     
+    /**
+     * Footprint of a prismatic board (flat top and bottom, vertical walls) in
+     * part-local XZ, as its top-face triangles. Null for anything else -
+     * profiled edges, pockets, chamfers - which still needs CSG.
+     */
+    getFlatBoardFootprint(mesh) {
+        const positions = mesh.getVerticesData(BABYLON.VertexBuffer.PositionKind);
+        const indices = mesh.getIndices();
+        if (!positions || !indices || indices.length === 0) return null;
+
+        let bottom = Infinity, top = -Infinity;
+        for (let i = 1; i < positions.length; i += 3) {
+            bottom = Math.min(bottom, positions[i]);
+            top = Math.max(top, positions[i]);
+        }
+        const thickness = top - bottom;
+        const tolerance = Math.max(1e-4, thickness * 1e-4);
+        if (!(thickness > tolerance)) return null;
+
+        const level = i => {
+            const y = positions[i * 3 + 1];
+            if (Math.abs(y - top) <= tolerance) return 1;
+            if (Math.abs(y - bottom) <= tolerance) return -1;
+            return 0;
+        };
+
+        const triangles = [];
+        let minX = Infinity, maxX = -Infinity, minZ = Infinity, maxZ = -Infinity;
+        for (let t = 0; t < indices.length; t += 3) {
+            const corners = [indices[t], indices[t + 1], indices[t + 2]];
+            const levels = corners.map(level);
+            if (levels.includes(0)) return null;
+
+            const loop = corners.map(i => ({ x: positions[i * 3], y: positions[i * 3 + 2] }));
+            const area = polygonArea(loop);
+            if (levels[0] === levels[1] && levels[1] === levels[2]) {
+                if (levels[0] === 1 && area !== 0) {
+                    triangles.push(area > 0 ? loop : loop.reverse());
+                    loop.forEach(p => {
+                        minX = Math.min(minX, p.x);
+                        maxX = Math.max(maxX, p.x);
+                        minZ = Math.min(minZ, p.y);
+                        maxZ = Math.max(maxZ, p.y);
+                    });
+                }
+                continue;
+            }
+
+            // Wall triangles must stand vertically: no footprint when seen from above
+            const span = Math.max(...loop.map(p => Math.abs(p.x - loop[0].x) + Math.abs(p.y - loop[0].y)));
+            if (Math.abs(area) > tolerance * Math.max(span, 1)) return null;
+        }
+        if (triangles.length === 0) return null;
+
+        return { triangles, top, bottom, bounds: { minX, minZ, size: Math.max(maxX - minX, maxZ - minZ) || 1 } };
+    }
+
+    /**
+     * Cut a prismatic board in 2D: the path offset by half the kerf is
+     * subtracted from the footprint
+     * @returns {Object|null} { groups (largest first), top, bottom, bounds }, or null when CSG is needed
+     */
+    computeFlatCutPieces(mesh, kerfWidth) {
+        const footprint = this.getFlatBoardFootprint(mesh);
+        if (!footprint) return null;
+
+        const path = this.smoothedPath.map(point => ({ x: point.x, y: point.z }));
+        const kerf = offsetPolyline(path, kerfWidth / 2);
+        const groups = groupPolygons(booleanPolygons(footprint.triangles, kerf, 'difference'));
+        if (groups.length === 0) return null;
+
+        console.log('ScrollCuttingSystem: Flat cut produced', groups.length, 'piece(s)');
+        return { ...footprint, groups };
+    }
+
+    /**
+     * Extrude one cut outline (with holes) between the board's bottom and top
+     * Walls are smooth-shaded where the outline turns less than WALL_SMOOTH_ANGLE.
+     */
+    extrudeFlatPiece(name, group, flatCut) {
+        const { top, bottom, bounds } = flatCut;
+        const positions = [];
+        const normals = [];
+        const uvs = [];
+        const indices = [];
+        const addVertex = (x, y, z, nx, ny, nz, u, v) => {
+            positions.push(x, y, z);
+            normals.push(nx, ny, nz);
+            uvs.push(u, v);
+            return positions.length / 3 - 1;
+        };
+
+        // Caps (triangles are counter-clockwise in XZ, which faces +Y)
+        const { vertices, indices: capIndices } = triangulatePolygon(group.outer, group.holes);
+        [top, bottom].forEach(y => {
+            const base = positions.length / 3;
+            const ny = y === top ? 1 : -1;
+            vertices.forEach(p => addVertex(
+                p.x, y, p.y, 0, ny, 0,
+                (p.x - bounds.minX) / bounds.size, (p.y - bounds.minZ) / bounds.size
+            ));
+            for (let t = 0; t < capIndices.length; t += 3) {
+                if (ny > 0) indices.push(base + capIndices[t], base + capIndices[t + 1], base + capIndices[t + 2]);
+                else indices.push(base + capIndices[t], base + capIndices[t + 2], base + capIndices[t + 1]);
+            }
+        });
+
+        // Walls: material is on the left of every ring edge, so the outward normal is on the right
+        const smoothCos = Math.cos(WALL_SMOOTH_ANGLE);
+        [group.outer, ...group.holes].forEach(ring => {
+            const count = ring.length;
+            const edgeNormals = ring.map((a, k) => {
+                const b = ring[(k + 1) % count];
+                const length = Math.hypot(b.x - a.x, b.y - a.y) || 1;
+                return { x: (b.y - a.y) / length, z: -(b.x - a.x) / length };
+            });
+            const cornerNormal = (own, other) => {
+                if (own.x * other.x + own.z * other.z < smoothCos) return own;
+                const length = Math.hypot(own.x + other.x, own.z + other.z) || 1;
+                return { x: (own.x + other.x) / length, z: (own.z + other.z) / length };
+            };
+
+            let along = 0;
+            ring.forEach((a, k) => {
+                const b = ring[(k + 1) % count];
+                const length = Math.hypot(b.x - a.x, b.y - a.y);
+                const na = cornerNormal(edgeNormals[k], edgeNormals[(k + count - 1) % count]);
+                const nb = cornerNormal(edgeNormals[k], edgeNormals[(k + 1) % count]);
+                const u0 = along / bounds.size;
+                const u1 = (along + length) / bounds.size;
+                const vTop = (top - bottom) / bounds.size;
+                along += length;
+
+                const aTop = addVertex(a.x, top, a.y, na.x, 0, na.z, u0, vTop);
+                const bTop = addVertex(b.x, top, b.y, nb.x, 0, nb.z, u1, vTop);
+                const bBottom = addVertex(b.x, bottom, b.y, nb.x, 0, nb.z, u1, 0);
+                const aBottom = addVertex(a.x, bottom, a.y, na.x, 0, na.z, u0, 0);
+                indices.push(aBottom, bBottom, bTop, aBottom, bTop, aTop);
+            });
+        });
+
+        const vertexData = new BABYLON.VertexData();
+        vertexData.positions = positions;
+        vertexData.normals = normals;
+        vertexData.uvs = uvs;
+        vertexData.indices = indices;
+
+        const mesh = new BABYLON.Mesh(name, this.scene);
+        vertexData.applyToMesh(mesh);
+        return mesh;
+    }
+
     /**
      * Create a cutting mesh that follows the exact curve path
      */
@@ -3206,10 +3278,25 @@ export class ScrollCuttingSystem {
         this.deactivate();
         
         if (this.pointerObserver) {
-            this.scene.onPointerObservable.remove(this.pointerObserver);
+            this.drawingWorld.pointerDispatcher.unregister(this.pointerObserver);
             this.pointerObserver = null;
         }
         
+        // deactivate() only detaches these while active
+        if (this.keyboardHandler) {
+            document.removeEventListener('keydown', this.keyboardHandler);
+            this.keyboardHandler = null;
+        }
+        if (this.keyboardUpHandler) {
+            document.removeEventListener('keyup', this.keyboardUpHandler);
+            this.keyboardUpHandler = null;
+        }
+        
+        if (this.pathMaterial) {
+            this.pathMaterial.dispose();
+            this.pathMaterial = null;
+        }
+        
         console.log('ScrollCuttingSystem: Disposed');
     }
 }
\ No newline at end of file
@@ -113,8 +113,8 @@ export class SketchMode {
         this.camera.attachControl(this.drawingWorld.canvas, true);
         
         // Show main grid again
-        if (this.drawingWorld.gridSystem && this.drawingWorld.gridSystem.gridGround) {
-            this.drawingWorld.gridSystem.gridGround.setEnabled(true);
+        if (this.drawingWorld.gridSystem) {
+            this.drawingWorld.gridSystem.show();
         }
         
         // Clean up sketch plane grid
@@ -618,8 +618,8 @@ export class SketchMode {
         }
         
         // Hide the main grid when in sketch mode
-        if (this.drawingWorld.gridSystem && this.drawingWorld.gridSystem.gridGround) {
-            this.drawingWorld.gridSystem.gridGround.setEnabled(false);
+        if (this.drawingWorld.gridSystem) {
+            this.drawingWorld.gridSystem.hide();
         }
         
         // DIM NON-SKETCH MESHES BUT KEEP THEM VISIBLE FOR REFERENCE
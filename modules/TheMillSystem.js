@@ -1,5 +1,6 @@
 import { ViewCube } from './ViewCube.js';
 import { Part } from './Part.js';
+import { ShaderGrid } from '../grid/ShaderGrid.js';
 
 // The Mill System - A 2D workspace for cutting operations
 // Simulates real workshop tools in an orthographic view
@@ -21,6 +22,7 @@ class TheMillSystem {
         this.millCanvas = null;
         this.millScene = null;
         this.millCamera = null;
+        this.millGrid = null;
         
         // Turntable and laser elements
         this.turntable = null;
@@ -894,30 +896,19 @@ class TheMillSystem {
     // Execute the cut
     createGrid() {
         const gridSize = 500; // 500cm (5 meter) grid - standard plywood is 244cm
-        const gridStep = 10; // 10cm steps
-        const gridLines = [];
-        
-        for (let i = -gridSize/2; i <= gridSize/2; i += gridStep) {
-            // Vertical lines
-            gridLines.push([
-                new BABYLON.Vector3(i, 0, -gridSize/2),
-                new BABYLON.Vector3(i, 0, gridSize/2)
-            ]);
-            
-            // Horizontal lines
-            gridLines.push([
-                new BABYLON.Vector3(-gridSize/2, 0, i),
-                new BABYLON.Vector3(gridSize/2, 0, i)
-            ]);
-        }
-        
-        // Create grid mesh
-        const gridSystem = BABYLON.MeshBuilder.CreateLineSystem('grid', {
-            lines: gridLines
-        }, this.millScene);
         
-        gridSystem.color = new BABYLON.Color3(0.92, 0.92, 0.92);  // Extremely light grey
-        gridSystem.renderingGroupId = 0; // Render below everything
+        // Shader grid on the table top - one quad instead of a line system
+        this.millGrid = new ShaderGrid(this.millScene, this.millCamera, {
+            name: 'grid',
+            size: gridSize,
+            origin: new BABYLON.Vector3(0, 0.02, 0), // Just above the table to avoid z-fighting
+            minorSpacing: 10, // 10cm steps
+            majorEvery: 10,
+            minorColor: new BABYLON.Color3(0.92, 0.92, 0.92), // Extremely light grey
+            majorColor: new BABYLON.Color3(0.92, 0.92, 0.92),
+            minorOpacity: 1.0
+        });
+        this.millGrid.mesh.renderingGroupId = 0; // Render below everything
         
         // Create table surface below grid for tablesaw bench appearance
         const tableSurface = BABYLON.MeshBuilder.CreateBox("tableSurface", {
@@ -2408,6 +2399,10 @@ class TheMillSystem {
         }
         
         // Clean up mill scene
+        if (this.millGrid) {
+            this.millGrid.dispose();
+            this.millGrid = null;
+        }
         if (this.millScene) {
             this.millScene.dispose();
         }
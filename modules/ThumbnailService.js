@@ -0,0 +1,222 @@
+/**
+ * ThumbnailService Module - Batched Offscreen Part Thumbnails
+ *
+ * Part thumbnails used to be taken with ScreenshotTools on the main engine:
+ * every other mesh was hidden, the canvas was resized to 128px for a frame and
+ * the whole scene re-rendered, once per part. The service renders queued parts
+ * in one batch into a single reusable render target seen through its own camera
+ * and layer mask, so the main view is never touched.
+ *
+ * Thumbnails are keyed by geometry hash and material. The key is stored on the
+ * part next to the image (and saved with the project), so reopening a project
+ * reuses the saved thumbnails and only parts whose geometry changed are drawn.
+ */
+
+import { PartInstancer } from './PartInstancing.js';
+
+// Layer bit only the thumbnail camera sees; main cameras keep the default 0x0FFFFFFF
+const THUMBNAIL_LAYER = 0x10000000;
+const MAX_CACHED_THUMBNAILS = 256;
+
+export class ThumbnailService {
+    /**
+     * @param {BABYLON.Scene} scene
+     * @param {Object} options - { size: thumbnail edge in px, onBatchComplete: (parts) => void }
+     */
+    constructor(scene, options = {}) {
+        this.scene = scene;
+        this.size = options.size ?? 128;
+        this.onBatchComplete = options.onBatchComplete || null;
+
+        this.cache = new Map();  // key -> data URL (insertion order = age)
+        this.queue = new Map();  // key -> { key, mesh, parts: [partData] }
+        this.flushScheduled = false;
+        this.rendering = false;
+
+        this.renderTarget = null;
+        this.camera = null;
+        this.canvas = null;
+    }
+
+    /**
+     * Cache key for a part mesh
+     */
+    static getKey(mesh, materialId) {
+        return `${PartInstancer.computeGeometryHash(mesh)}|${materialId || 'default'}`;
+    }
+
+    /**
+     * Make sure partData.thumbnail shows this mesh
+     *
+     * Returns true when the thumbnail was already current (saved with the part or
+     * cached); otherwise the part is queued and updated by the next batch.
+     */
+    request(mesh, partData) {
+        if (!mesh || !partData || !mesh.geometry) return false;
+
+        const materialId = partData.materialId || (partData.material ? partData.material.id : null);
+        const key = ThumbnailService.getKey(mesh, materialId);
+
+        if (partData.thumbnail && partData.thumbnailKey === key) {
+            this.remember(key, partData.thumbnail);
+            return true;
+        }
+
+        const cached = this.cache.get(key);
+        if (cached) {
+            partData.thumbnail = cached;
+            partData.thumbnailKey = key;
+            return true;
+        }
+
+        // Identical parts in the same batch share one render
+        const entry = this.queue.get(key);
+        if (entry) {
+            if (!entry.parts.includes(partData)) entry.parts.push(partData);
+        } else {
+            this.queue.set(key, { key, mesh, parts: [partData] });
+        }
+        this.scheduleFlush();
+        return false;
+    }
+
+    scheduleFlush() {
+        if (this.flushScheduled) return;
+        this.flushScheduled = true;
+
+        // After the current frame, once textures are loaded
+        this.scene.onAfterRenderObservable.addOnce(() => {
+            this.scene.executeWhenReady(() => this.flush());
+        });
+    }
+
+    /**
+     * Render everything queued so far into the shared render target
+     */
+    async flush() {
+        this.flushScheduled = false;
+        if (this.rendering) {
+            // Parts queued during a batch go into the next one
+            if (this.queue.size > 0) this.scheduleFlush();
+            return;
+        }
+
+        const batch = [...this.queue.values()].filter(entry => !entry.mesh.isDisposed());
+        this.queue.clear();
+        if (batch.length === 0) return;
+
+        this.rendering = true;
+        const updatedParts = [];
+        try {
+            this.ensureTarget();
+            for (const entry of batch) {
+                const data = await this.renderMesh(entry.mesh);
+                if (!data) continue;
+
+                this.remember(entry.key, data);
+                entry.parts.forEach(partData => {
+                    partData.thumbnail = data;
+                    partData.thumbnailKey = entry.key;
+                    updatedParts.push(partData);
+                });
+            }
+        } catch (error) {
+            console.error('ThumbnailService: batch failed', error);
+        } finally {
+            this.rendering = false;
+        }
+
+        if (updatedParts.length > 0 && this.onBatchComplete) {
+            this.onBatchComplete(updatedParts);
+        }
+        if (this.queue.size > 0) this.scheduleFlush();
+    }
+
+    ensureTarget() {
+        if (this.renderTarget) return;
+
+        this.camera = new BABYLON.ArcRotateCamera('thumbnailCamera', Math.PI / 4, Math.PI / 3, 10, BABYLON.Vector3.Zero(), this.scene);
+        this.camera.layerMask = THUMBNAIL_LAYER;
+        this.camera.minZ = 0.01;
+
+        this.renderTarget = new BABYLON.RenderTargetTexture('thumbnailTarget', this.size, this.scene, false);
+        this.renderTarget.activeCamera = this.camera;
+        this.renderTarget.clearColor = new BABYLON.Color4(0, 0, 0, 0);
+        this.renderTarget.renderList = [];
+
+        this.canvas = document.createElement('canvas');
+        this.canvas.width = this.size;
+        this.canvas.height = this.size;
+    }
+
+    /**
+     * Draw one mesh with an isometric framing and read it back as a PNG data URL
+     */
+    async renderMesh(mesh) {
+        const bounds = mesh.getBoundingInfo().boundingSphere;
+        const radius = Math.max(bounds.radiusWorld, 0.01);
+
+        this.camera.setTarget(bounds.centerWorld.clone());
+        this.camera.radius = radius / Math.sin(this.camera.fov / 2) * 1.05;
+        this.camera.maxZ = this.camera.radius + radius * 2;
+        this.camera.getViewMatrix(true);
+
+        // Thin-instanced parts draw at visibility 0 - show this one for its render only
+        const layerMask = mesh.layerMask;
+        const visibility = mesh.visibility;
+        mesh.layerMask = layerMask | THUMBNAIL_LAYER;
+        mesh.visibility = 1;
+        this.renderTarget.renderList[0] = mesh;
+
+        let pixels;
+        try {
+            this.renderTarget.render(false);
+            pixels = await Promise.resolve(this.renderTarget.readPixels());
+        } finally {
+            this.renderTarget.renderList.length = 0;
+            mesh.layerMask = layerMask;
+            mesh.visibility = visibility;
+        }
+        if (!pixels) return null;
+
+        return this.toDataURL(pixels);
+    }
+
+    toDataURL(pixels) {
+        const size = this.size;
+        const ctx = this.canvas.getContext('2d');
+        const image = ctx.createImageData(size, size);
+        const bytes = pixels instanceof Uint8Array ? pixels : new Uint8Array(pixels.buffer);
+
+        // GL rows start at the bottom
+        const rowBytes = size * 4;
+        for (let y = 0; y < size; y++) {
+            const source = (size - 1 - y) * rowBytes;
+            image.data.set(bytes.subarray(source, source + rowBytes), y * rowBytes);
+        }
+        ctx.putImageData(image, 0, 0);
+        return this.canvas.toDataURL('image/png');
+    }
+
+    remember(key, data) {
+        this.cache.delete(key);
+        this.cache.set(key, data);
+        if (this.cache.size > MAX_CACHED_THUMBNAILS) {
+            this.cache.delete(this.cache.keys().next().value);
+        }
+    }
+
+    dispose() {
+        this.queue.clear();
+        this.cache.clear();
+        if (this.renderTarget) {
+            this.renderTarget.dispose();
+            this.renderTarget = null;
+        }
+        if (this.camera) {
+            this.camera.dispose();
+            this.camera = null;
+        }
+        this.canvas = null;
+    }
+}
@@ -0,0 +1,53 @@
+/**
+ * ToolModules - Lazily imported tool systems
+ *
+ * Every workshop tool lives behind a dynamic import so it is only downloaded,
+ * parsed and constructed the first time a user opens it. In the production
+ * build (vite.config.js) each entry becomes its own content-hashed chunk.
+ *
+ * key -> {
+ *   property: DrawingWorld field the instance is stored on,
+ *   tools: DrawingWorld.activeTool values that use this system,
+ *   idleTeardown: false to keep the system once loaded (default true),
+ *   load: () => Promise<Class>
+ * }
+ */
+
+export const TOOL_MODULES = {
+    cut: {
+        property: 'cutToolSystem',
+        tools: ['rip-cut', 'cross-cut', 'cut'],
+        load: () => import('./CutToolSystem.js').then(m => m.CutToolSystem)
+    },
+    mill: {
+        property: 'theMillSystem',
+        tools: [],
+        idleTeardown: false, // Owns its own engine and window listeners
+        load: () => import('./TheMillSystem.js').then(m => m.TheMillSystem)
+    },
+    router: {
+        property: 'routerBitSystem',
+        tools: ['router'],
+        load: () => import('./RouterBitSystem.js').then(m => m.RouterBitSystem)
+    },
+    scroll: {
+        property: 'scrollCuttingSystem',
+        tools: ['scroll-cut'],
+        load: () => import('./ScrollCuttingSystem.js').then(m => m.ScrollCuttingSystem)
+    },
+    plane: {
+        property: 'planeToolSystem',
+        tools: ['plane'],
+        load: () => import('./PlaneToolSystem.js').then(m => m.PlaneToolSystem)
+    },
+    join: {
+        property: 'joinToolSystem',
+        tools: ['join'],
+        load: () => import('./JoinToolSystem.js').then(m => m.JoinToolSystem)
+    },
+    drill: {
+        property: 'drillPressSystem',
+        tools: ['drill'],
+        load: () => import('./DrillPressSystem.js').then(m => m.DrillPressSystem)
+    }
+};
@@ -0,0 +1,164 @@
+/**
+ * ToolRegistry Module - Lazy Creation and Idle Teardown of Tool Systems
+ *
+ * Tool systems build materials, scene pointer observers and DOM when they are
+ * constructed. The registry creates each one on its first activate() call and,
+ * once the user has moved on, tears it down after a period of inactivity so its
+ * observers stop running on every pointer move. The next activation simply
+ * loads it again.
+ *
+ * Systems are stored on the DrawingWorld under their usual property names
+ * (drawingWorld.routerBitSystem, ...), so existing `if (this.routerBitSystem)`
+ * guards keep working: they read null while a tool is unloaded.
+ */
+
+import { TOOL_MODULES } from './ToolModules.js';
+
+export class ToolRegistry {
+    /**
+     * @param {DrawingWorld} drawingWorld
+     * @param {Object} options - { idleTimeout: ms before an unused system is torn down, modules }
+     */
+    constructor(drawingWorld, options = {}) {
+        this.drawingWorld = drawingWorld;
+        this.modules = options.modules || TOOL_MODULES;
+        this.idleTimeout = options.idleTimeout ?? 120000;
+        this.sweepInterval = options.sweepInterval ?? 30000;
+
+        this.loads = new Map();     // key -> Promise<system> while loading
+        this.lastUsed = new Map();  // key -> timestamp of last activation/use
+        this.sweepTimer = null;
+    }
+
+    /**
+     * Loaded system for a key, or null (never triggers a load)
+     */
+    get(key) {
+        const entry = this.modules[key];
+        return entry ? this.drawingWorld[entry.property] || null : null;
+    }
+
+    isLoaded(key) {
+        return !!this.get(key);
+    }
+
+    /**
+     * Load and construct a system (once); resolves to the instance
+     */
+    load(key) {
+        const entry = this.modules[key];
+        if (!entry) {
+            return Promise.reject(new Error(`Unknown tool system: ${key}`));
+        }
+
+        this.touch(key);
+        const existing = this.get(key);
+        if (existing) {
+            return Promise.resolve(existing);
+        }
+
+        let pending = this.loads.get(key);
+        if (!pending) {
+            pending = entry.load()
+                .then(SystemClass => {
+                    if (!this.drawingWorld[entry.property]) {
+                        this.drawingWorld[entry.property] = new SystemClass(this.drawingWorld);
+                    }
+                    this.touch(key);
+                    this.startSweep();
+                    return this.drawingWorld[entry.property];
+                })
+                .finally(() => this.loads.delete(key));
+            this.loads.set(key, pending);
+        }
+        return pending;
+    }
+
+    /**
+     * Load a system if needed and call its activate() with the given arguments
+     * @returns {Promise<*>} Whatever the system's activate() returns
+     */
+    activate(key, ...args) {
+        return this.load(key).then(system => system.activate(...args));
+    }
+
+    /**
+     * Record use so the idle sweep leaves the system alone
+     */
+    touch(key) {
+        this.lastUsed.set(key, performance.now());
+    }
+
+    /**
+     * Whether a loaded system is busy (its tool is selected or it reports itself active)
+     */
+    isInUse(key) {
+        const entry = this.modules[key];
+        const system = this.get(key);
+        if (!entry || !system) return false;
+        if (entry.tools && entry.tools.includes(this.drawingWorld.activeTool)) return true;
+        // Each system names its own active flag
+        return !!(system.isActive || system.cutPreviewActive || system.wasteSelectionActive ||
+            system.planeToolActive || system.joinToolActive);
+    }
+
+    /**
+     * Dispose a loaded system and clear its DrawingWorld property
+     */
+    teardown(key) {
+        const entry = this.modules[key];
+        const system = this.get(key);
+        if (!entry || !system) return false;
+
+        try {
+            if (typeof system.dispose === 'function') {
+                system.dispose();
+            } else if (typeof system.destroy === 'function') {
+                system.destroy();
+            }
+        } catch (error) {
+            console.error(`Failed to tear down ${key} tool:`, error);
+        }
+
+        this.drawingWorld[entry.property] = null;
+        this.lastUsed.delete(key);
+        if (!Object.keys(this.modules).some(k => this.isLoaded(k))) {
+            this.stopSweep();
+        }
+        return true;
+    }
+
+    /**
+     * Tear down every system that is idle for longer than idleTimeout
+     */
+    sweep(now = performance.now()) {
+        Object.entries(this.modules).forEach(([key, entry]) => {
+            if (entry.idleTeardown === false || !this.isLoaded(key)) return;
+            if (this.isInUse(key)) {
+                this.touch(key);
+                return;
+            }
+            const lastUsed = this.lastUsed.get(key) ?? 0;
+            if (now - lastUsed >= this.idleTimeout) {
+                this.teardown(key);
+            }
+        });
+    }
+
+    startSweep() {
+        if (this.sweepTimer || !this.idleTimeout) return;
+        this.sweepTimer = setInterval(() => this.sweep(), this.sweepInterval);
+    }
+
+    stopSweep() {
+        if (this.sweepTimer) {
+            clearInterval(this.sweepTimer);
+            this.sweepTimer = null;
+        }
+    }
+
+    dispose() {
+        this.stopSweep();
+        Object.keys(this.modules).forEach(key => this.teardown(key));
+    }
+}
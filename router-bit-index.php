@@ -0,0 +1,186 @@
+<?php
+/**
+ * Router Bit Index - Paged listing of the router bit library
+ *
+ * router-bit-index.php?q=ogee&category=Custom&page=1&limit=24
+ *     summaries only: name, category, sizes, thumbnail, hash
+ * router-bit-index.php?name=<bit name>
+ *     one bit's full index entry (profile, bounds, blob reference)
+ *
+ * Summaries come from data/router-bits/library.json (written by
+ * scripts/import_router_bit.py, already sorted by name). Meshes are fetched per
+ * bit from load-router-bits.php?blob=<hash>. Bits still in the legacy
+ * data/router-bits.json are listed too; their detail carries the raw meshData.
+ * That file holds every bit's mesh, so it is only decoded after it changes:
+ * summaries and one file per bit are cached under data/router-bits/legacy/.
+ */
+
+header('Content-Type: application/json');
+header('Access-Control-Allow-Origin: *');
+header('Access-Control-Allow-Methods: GET');
+
+if ($_SERVER['REQUEST_METHOD'] !== 'GET') {
+    http_response_code(405);
+    echo json_encode(['error' => 'Method not allowed']);
+    exit;
+}
+
+$libraryFile = __DIR__ . '/data/router-bits/library.json';
+$indexFile = __DIR__ . '/data/router-bits/index.json';
+$legacyFile = __DIR__ . '/data/router-bits.json';
+$legacyCacheDir = __DIR__ . '/data/router-bits/legacy';
+
+const DEFAULT_PAGE_SIZE = 24;
+const MAX_PAGE_SIZE = 100;
+
+function readJsonFile($file, $default) {
+    if (!file_exists($file)) {
+        return $default;
+    }
+    $data = json_decode(file_get_contents($file), true);
+    return is_array($data) ? $data : $default;
+}
+
+// Write then rename so concurrent requests never read a half-written file
+function writeJsonFile($file, $data) {
+    $temp = $file . '.' . getmypid() . '.tmp';
+    if (file_put_contents($temp, json_encode($data)) === false) {
+        return false;
+    }
+    return rename($temp, $file);
+}
+
+function legacyBitFile($cacheDir, $name) {
+    return $cacheDir . '/bits/' . md5($name) . '.json';
+}
+
+/**
+ * Listing summaries for the legacy bits. The legacy file is decoded only when
+ * its stamp differs from the cached one; each bit is then split out so a
+ * ?name= lookup reads just that bit.
+ */
+function legacySummaries($legacyFile, $cacheDir) {
+    if (!file_exists($legacyFile)) {
+        return [];
+    }
+    $stamp = filemtime($legacyFile) . ':' . filesize($legacyFile);
+    $summaryFile = $cacheDir . '/summaries.json';
+    $cached = readJsonFile($summaryFile, null);
+    if ($cached !== null && ($cached['stamp'] ?? null) === $stamp) {
+        return $cached['bits'];
+    }
+
+    $legacy = readJsonFile($legacyFile, []);
+    $summaries = [];
+    $writable = (is_dir($cacheDir . '/bits') || @mkdir($cacheDir . '/bits', 0755, true)) && is_writable($cacheDir . '/bits');
+    foreach ($legacy as $name => $bit) {
+        $summaries[] = [
+            'name' => $name,
+            'category' => $bit['category'] ?? 'Custom',
+            'sizes' => $bit['sizes'] ?? $bit['defaultSizes'] ?? [0.25, 0.5],
+            'thumbnail' => null,
+            'hash' => null,
+            'legacy' => true
+        ];
+        if ($writable) {
+            writeJsonFile(legacyBitFile($cacheDir, $name), $bit);
+        }
+    }
+    // Summaries go last: they mark the per-bit files as current
+    if ($writable) {
+        writeJsonFile($summaryFile, ['stamp' => $stamp, 'bits' => $summaries]);
+    }
+    return $summaries;
+}
+
+// Library version: changes whenever an import or legacy save rewrites a file
+$stamp = '';
+foreach ([$libraryFile, $legacyFile] as $file) {
+    $stamp .= file_exists($file) ? filemtime($file) . ':' . filesize($file) . ';' : '-;';
+}
+$version = substr(md5($stamp), 0, 16);
+
+// Responses depend only on the library version and the query
+$etag = '"' . substr(md5($version . '|' . ($_SERVER['QUERY_STRING'] ?? '')), 0, 16) . '"';
+header('ETag: ' . $etag);
+header('Cache-Control: no-cache');
+if (trim($_SERVER['HTTP_IF_NONE_MATCH'] ?? '') === $etag) {
+    http_response_code(304);
+    exit;
+}
+
+// ==================== SINGLE BIT ====================
+
+if (isset($_GET['name'])) {
+    $name = $_GET['name'];
+    $index = readJsonFile($indexFile, ['bits' => []]);
+    $bit = $index['bits'][$name] ?? null;
+    if ($bit === null) {
+        $listed = array_column(legacySummaries($legacyFile, $legacyCacheDir), 'name');
+        if (in_array($name, $listed, true)) {
+            $bit = readJsonFile(legacyBitFile($legacyCacheDir, $name), null);
+            if ($bit === null) {
+                // Cache directory not writable - fall back to the full file
+                $bit = readJsonFile($legacyFile, [])[$name] ?? null;
+            }
+        }
+    }
+
+    if ($bit === null) {
+        http_response_code(404);
+        echo json_encode(['error' => 'Router bit not found']);
+        exit;
+    }
+    echo json_encode(['success' => true, 'bit' => $bit, 'version' => $version]);
+    exit;
+}
+
+// ==================== LISTING ====================
+
+$library = readJsonFile($libraryFile, ['categories' => [], 'bits' => []]);
+$bits = $library['bits'] ?? [];
+$categories = $library['categories'] ?? [];
+
+// Legacy bits not imported yet (scripts/import_router_bit.py --migrate)
+$legacy = legacySummaries($legacyFile, $legacyCacheDir);
+if (!empty($legacy)) {
+    $listed = array_flip(array_column($bits, 'name'));
+    foreach ($legacy as $summary) {
+        if (!isset($listed[$summary['name']])) {
+            $bits[] = $summary;
+        }
+    }
+    usort($bits, function ($a, $b) {
+        return strcasecmp($a['name'], $b['name']);
+    });
+    $categories = array_values(array_unique(array_merge($categories, array_column($bits, 'category'))));
+    sort($categories);
+}
+
+$query = trim($_GET['q'] ?? '');
+$category = $_GET['category'] ?? '';
+if ($query !== '' || $category !== '') {
+    $bits = array_values(array_filter($bits, function ($bit) use ($query, $category) {
+        if ($category !== '' && ($bit['category'] ?? '') !== $category) {
+            return false;
+        }
+        return $query === '' || stripos($bit['name'], $query) !== false;
+    }));
+}
+
+$limit = max(1, min(MAX_PAGE_SIZE, (int)($_GET['limit'] ?? DEFAULT_PAGE_SIZE)));
+$total = count($bits);
+$pages = max(1, (int)ceil($total / $limit));
+$page = max(1, min($pages, (int)($_GET['page'] ?? 1)));
+
+echo json_encode([
+    'success' => true,
+    'bits' => array_slice($bits, ($page - 1) * $limit, $limit),
+    'categories' => $categories,
+    'total' => $total,
+    'page' => $page,
+    'pages' => $pages,
+    'limit' => $limit,
+    'version' => $version
+]);
+?>
@@ -108,6 +108,25 @@ function createBackup($database_file) {
     return true;
 }
 
+/**
+ * Rebuild the material thumbnail atlas after the database changes
+ * The materials modal renders every card from this one sprite sheet.
+ */
+function buildThumbnailAtlas() {
+    $script = __DIR__ . '/scripts/build_thumbnail_atlas.py';
+    if (!file_exists($script) || !function_exists('exec')) {
+        logError("Thumbnail atlas script unavailable - modal falls back to individual thumbnails");
+        return false;
+    }
+    
+    exec('python3 ' . escapeshellarg($script) . ' 2>&1', $output, $exitCode);
+    if ($exitCode !== 0) {
+        logError("Thumbnail atlas build failed ($exitCode): " . implode(' | ', $output));
+        return false;
+    }
+    return true;
+}
+
 /**
  * Handle GET request - return current materials database
  */
@@ -228,12 +247,15 @@ function handlePostRequest($database_file) {
     $material_count = count($data['materials']);
     logError("Successfully saved $material_count materials to database");
     
+    $atlas_built = buildThumbnailAtlas();
+    
     return [
         'success' => true,
         'message' => 'Materials database saved successfully',
         'material_count' => $material_count,
         'file_size' => filesize($database_file),
-        'last_updated' => $data['last_updated']
+        'last_updated' => $data['last_updated'],
+        'thumbnail_atlas' => $atlas_built
     ];
 }
 
@@ -36,6 +36,28 @@ function writeDatabase($file, $data) {
     return file_put_contents($file, $jsonData) !== false;
 }
 
+// Render part thumbnails and the project preview in the background
+// (scripts/render_project_previews.py); listings pick them up from the manifest
+function renderProjectPreviews($projectID) {
+    $script = __DIR__ . '/scripts/render_project_previews.py';
+    if (!file_exists($script) || !function_exists('exec')) {
+        return false;
+    }
+    
+    exec('python3 ' . escapeshellarg($script) . ' --project ' . escapeshellarg($projectID) . ' > /dev/null 2>&1 &');
+    return true;
+}
+
+// Preview manifest written by render_project_previews.py
+function readPreviewManifest($dataDir) {
+    $file = $dataDir . '/previews/preview-manifest.json';
+    if (!file_exists($file)) {
+        return ['projects' => []];
+    }
+    $manifest = json_decode(file_get_contents($file), true);
+    return is_array($manifest) && isset($manifest['projects']) ? $manifest : ['projects' => []];
+}
+
 // Generate unique project ID
 function generateProjectID() {
     return 'project_' . time() . '_' . mt_rand(1000, 9999);
@@ -117,6 +139,8 @@ if ($method === 'POST') {
     
     $writeResult = writeDatabase($databaseFile, $database);
     if ($writeResult) {
+        renderProjectPreviews($projectID);
+        
         echo json_encode([
             'success' => true,
             'projectID' => $projectID,
@@ -160,6 +184,7 @@ if ($method === 'POST') {
     } else {
         // Load all projects for user
         $userProjects = [];
+        $previews = readPreviewManifest($dataDir);
         foreach ($database['projects'] as $project) {
             if ($project['userID'] === $userID && $project['isActive']) {
                 $userProjects[] = [
@@ -167,7 +192,8 @@ if ($method === 'POST') {
                     'projectName' => $project['projectName'],
                     'description' => $project['description'],
                     'createdAt' => $project['createdAt'],
-                    'modifiedAt' => $project['modifiedAt']
+                    'modifiedAt' => $project['modifiedAt'],
+                    'preview' => $previews['projects'][$project['projectID']]['preview'] ?? null
                 ];
             }
         }
@@ -19,6 +19,40 @@ if (!$data || !isset($data['name']) || !isset($data['meshData'])) {
     exit;
 }
 
+// Weld, decimate and quantize the bit into data/router-bits (scripts/import_router_bit.py)
+// Returns the bit's index entry, or null when the pipeline can't run here
+function importRouterBit($input) {
+    $script = __DIR__ . '/scripts/import_router_bit.py';
+    if (!file_exists($script) || !function_exists('exec')) {
+        return null;
+    }
+    
+    $payload = tempnam(sys_get_temp_dir(), 'router-bit');
+    file_put_contents($payload, $input);
+    $output = [];
+    $status = 1;
+    exec('python3 ' . escapeshellarg($script) . ' --input ' . escapeshellarg($payload) . ' 2>/dev/null', $output, $status);
+    unlink($payload);
+    
+    if ($status !== 0 || empty($output)) {
+        return null;
+    }
+    $entry = json_decode(end($output), true);
+    return is_array($entry) ? $entry : null;
+}
+
+$entry = importRouterBit($input);
+if ($entry !== null) {
+    echo json_encode([
+        'success' => true,
+        'message' => 'Router bit saved successfully',
+        'name' => $data['name'],
+        'routerBit' => $entry
+    ]);
+    exit;
+}
+
+// Fallback: raw mesh arrays in the legacy store (import later with --migrate)
 $routerBitsFile = 'data/router-bits.json';
 $routerBitsDir = dirname($routerBitsFile);
 
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Material texture pipeline
+
+Turns the full-size textures uploaded through upload-material-image.php into
+power-of-two tiers the renderer can upload without resizing:
+
+  data/materials/<id>/tiers/<name>_<size>.jpg / .webp   (2048, 1024, 512, 256)
+  data/materials/<id>/tiers/<name>.ktx2                  (only if basisu/toktx is installed)
+
+KTX2 files carry their full mip chain (Basis UASTC, transcoded on the GPU side);
+the JPEG/WebP tiers are power-of-two so the GPU can build mipmaps directly
+instead of Babylon rescaling NPOT images on the main thread first.
+
+Every run rewrites data/materials/texture-manifest.json, which
+MaterialsLibrary.getTexturePaths uses to pick a tier. Uploads run this script
+per material, possibly at the same time, so the manifest is re-read, merged
+and replaced under an exclusive lock (texture-manifest.json.lock).
+
+Usage:
+    python3 scripts/build_material_textures.py                  # all materials
+    python3 scripts/build_material_textures.py --material oak_red_001
+    python3 scripts/build_material_textures.py --force          # rebuild everything
+"""
+
+import argparse
+import contextlib
+import fcntl
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+try:
+    from PIL import Image
+except ImportError:
+    sys.exit("Pillow is required: pip install Pillow")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MATERIALS_DIR = os.path.join('data', 'materials')
+MANIFEST_PATH = os.path.join(MATERIALS_DIR, 'texture-manifest.json')
+TIER_DIR = 'tiers'
+
+TIER_SIZES = [2048, 1024, 512, 256]
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+
+def web_path(path):
+    """Path relative to the web root with forward slashes (what the browser requests)"""
+    return os.path.relpath(path, ROOT).replace(os.sep, '/')
+
+
+def floor_power_of_two(value):
+    size = 1
+    while size * 2 <= value:
+        size *= 2
+    return size
+
+
+def is_source_texture(filename):
+    """Uploaded diffuse textures and variants - thumbnails are handled separately"""
+    name, ext = os.path.splitext(filename.lower())
+    if ext not in SOURCE_EXTENSIONS:
+        return False
+    return '_texture' in name or '_variant_' in name
+
+
+def find_encoder():
+    """Locate a KTX2 encoder: ('basisu', path), ('toktx', path) or None"""
+    for tool in ('basisu', 'toktx'):
+        path = shutil.which(tool)
+        if path:
+            return tool, path
+    return None
+
+
+def encode_ktx2(encoder, source_png, target):
+    """Encode a power-of-two PNG to KTX2 (UASTC) with a full mip chain"""
+    tool, path = encoder
+    if tool == 'basisu':
+        command = [path, '-ktx2', '-uastc', '-mipmap',
+                   '-file', source_png, '-output_file', target]
+    else:
+        command = [path, '--t2', '--encode', 'uastc', '--genmipmap',
+                   target, source_png]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0 or not os.path.exists(target):
+        print(f"  KTX2 encode failed for {source_png}: {result.stderr.decode(errors='replace').strip()}")
+        return False
+    return True
+
+
+def is_up_to_date(source, outputs):
+    source_time = os.path.getmtime(source)
+    return all(os.path.exists(p) and os.path.getmtime(p) >= source_time for p in outputs)
+
+
+def build_texture(source, encoder, force=False):
+    """Build the tiers for one source image and return its manifest entry"""
+    directory = os.path.dirname(source)
+    name = os.path.splitext(os.path.basename(source))[0]
+    tier_dir = os.path.join(directory, TIER_DIR)
+    os.makedirs(tier_dir, exist_ok=True)
+
+    with Image.open(source) as image:
+        image = image.convert('RGB')
+        width, height = image.size
+        # Square power-of-two tiers: wood textures tile, so stretching to square is harmless
+        top = min(floor_power_of_two(max(width, height)), TIER_SIZES[0])
+        sizes = [s for s in TIER_SIZES if s <= top] or [top]
+
+        tiers = []
+        for size in sizes:
+            jpeg_path = os.path.join(tier_dir, f"{name}_{size}.jpg")
+            webp_path = os.path.join(tier_dir, f"{name}_{size}.webp")
+            if force or not is_up_to_date(source, [jpeg_path, webp_path]):
+                resized = image.resize((size, size), Image.LANCZOS)
+                resized.save(jpeg_path, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+                resized.save(webp_path, 'WEBP', quality=WEBP_QUALITY, method=6)
+            tiers.append({
+                'size': size,
+                'jpeg': web_path(jpeg_path),
+                'webp': web_path(webp_path)
+            })
+
+        ktx2 = None
+        if encoder:
+            ktx2_path = os.path.join(tier_dir, f"{name}.ktx2")
+            if force or not is_up_to_date(source, [ktx2_path]):
+                staging = os.path.join(tier_dir, f"{name}_{sizes[0]}.png")
+                image.resize((sizes[0], sizes[0]), Image.LANCZOS).save(staging, 'PNG')
+                encoded = encode_ktx2(encoder, staging, ktx2_path)
+                os.remove(staging)
+                if encoded:
+                    ktx2 = web_path(ktx2_path)
+            else:
+                ktx2 = web_path(ktx2_path)
+
+    return {
+        'width': width,
+        'height': height,
+        'mtime': int(os.path.getmtime(source)),
+        'ktx2': ktx2,
+        'tiers': tiers
+    }
+
+
+def build_material(material_dir, encoder, force=False):
+    textures = {}
+    for filename in sorted(os.listdir(material_dir)):
+        source = os.path.join(material_dir, filename)
+        if not os.path.isfile(source) or not is_source_texture(filename):
+            continue
+        print(f"  {filename}")
+        try:
+            textures[web_path(source)] = build_texture(source, encoder, force)
+        except (OSError, ValueError) as error:
+            print(f"  Skipping {filename}: {error}")
+    return textures
+
+
+def load_manifest(path):
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {'version': 1, 'materials': {}}
+
+
+@contextlib.contextmanager
+def manifest_lock(path):
+    """Exclusive lock held across read-modify-write of the manifest"""
+    with open(f"{path}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def write_manifest(path, manifest):
+    manifest['generated'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    manifest['tier_sizes'] = TIER_SIZES
+    # Write then rename so the browser never fetches a half-written manifest
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build power-of-two material texture tiers')
+    parser.add_argument('--material', help='Only rebuild this material id')
+    parser.add_argument('--force', action='store_true', help='Rebuild tiers even if up to date')
+    parser.add_argument('--no-ktx2', action='store_true', help='Skip KTX2 even if an encoder is installed')
+    args = parser.parse_args()
+
+    materials_dir = os.path.join(ROOT, MATERIALS_DIR)
+    manifest_path = os.path.join(ROOT, MANIFEST_PATH)
+    if not os.path.isdir(materials_dir):
+        sys.exit(f"No materials directory at {materials_dir}")
+
+    encoder = None if args.no_ktx2 else find_encoder()
+    print(f"KTX2 encoder: {encoder[0] if encoder else 'none (JPEG/WebP tiers only)'}")
+
+    if args.material:
+        material_ids = [args.material]
+    else:
+        material_ids = sorted(d for d in os.listdir(materials_dir)
+                              if os.path.isdir(os.path.join(materials_dir, d)))
+
+    # Tiers are built outside the lock; only the manifest update is serialized
+    results = {}
+    for material_id in material_ids:
+        material_dir = os.path.join(materials_dir, material_id)
+        if not os.path.isdir(material_dir):
+            print(f"Unknown material: {material_id}")
+            results[material_id] = None
+            continue
+        print(f"Processing {material_id}")
+        results[material_id] = build_material(material_dir, encoder, args.force) or None
+
+    with manifest_lock(manifest_path):
+        manifest = load_manifest(manifest_path)
+        if not args.material:
+            # Full rebuild - drop entries for materials that no longer exist
+            manifest['materials'] = {}
+        for material_id, textures in results.items():
+            if textures:
+                manifest['materials'][material_id] = {'textures': textures}
+            else:
+                manifest['materials'].pop(material_id, None)
+        write_manifest(manifest_path, manifest)
+    print(f"Wrote {web_path(manifest_path)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Material thumbnail atlas
+
+Packs every material thumbnail from materials-database.json into one sprite
+sheet so the materials modal costs a single image request instead of one per
+material:
+
+  data/materials/thumbnail-atlas.<hash>.webp   square cells in a grid
+  data/materials/thumbnail-atlas.json          index: material id -> cell
+
+The image name carries a content hash, so it can be cached indefinitely and
+the index never points at a half-written sheet. save-materials.php reruns this
+after every database save; MaterialsLibrary.getThumbnailSprite reads the index.
+
+Usage:
+    python3 scripts/build_thumbnail_atlas.py
+"""
+
+import glob
+import hashlib
+import io
+import json
+import math
+import os
+import sys
+import time
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    sys.exit("Pillow is required: pip install Pillow")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATABASE_PATH = 'materials-database.json'
+ATLAS_DIR = os.path.join('data', 'materials')
+INDEX_PATH = os.path.join(ATLAS_DIR, 'thumbnail-atlas.json')
+
+CELL_SIZE = 256  # Cards are ~130px wide; 2x for HiDPI screens
+WEBP_QUALITY = 80
+BACKGROUND = (248, 249, 250)  # .material-image background
+
+
+def load_thumbnails(database):
+    """(material id, web path) for every material with a thumbnail on disk"""
+    thumbnails = []
+    for material_id, material in sorted(database.get('materials', {}).items()):
+        path = (material.get('visual_assets') or {}).get('thumbnail')
+        if not path or path.startswith('data:'):
+            continue
+        if not os.path.isfile(os.path.join(ROOT, path)):
+            print(f"  Missing thumbnail for {material_id}: {path}")
+            continue
+        thumbnails.append((material_id, path))
+    return thumbnails
+
+
+def build_atlas(thumbnails):
+    columns = max(1, math.ceil(math.sqrt(len(thumbnails))))
+    rows = max(1, math.ceil(len(thumbnails) / columns))
+    atlas = Image.new('RGB', (columns * CELL_SIZE, rows * CELL_SIZE), BACKGROUND)
+
+    entries = {}
+    for i, (material_id, path) in enumerate(thumbnails):
+        column, row = i % columns, i // columns
+        try:
+            with Image.open(os.path.join(ROOT, path)) as image:
+                # Same framing as the old <img object-fit: cover>
+                cell = ImageOps.fit(image.convert('RGB'), (CELL_SIZE, CELL_SIZE), Image.LANCZOS)
+                atlas.paste(cell, (column * CELL_SIZE, row * CELL_SIZE))
+        except (OSError, ValueError) as error:
+            print(f"  Skipping {material_id}: {error}")
+            continue
+        entries[material_id] = {
+            'column': column,
+            'row': row,
+            'source': path
+        }
+
+    return atlas, columns, rows, entries
+
+
+def write_atlas(atlas):
+    """Save the sheet under a content-hashed name"""
+    buffer = io.BytesIO()
+    atlas.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=6)
+    data = buffer.getvalue()
+    digest = hashlib.sha1(data).hexdigest()[:12]
+
+    filename = f"thumbnail-atlas.{digest}.webp"
+    path = os.path.join(ROOT, ATLAS_DIR, filename)
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    return f"{ATLAS_DIR}/{filename}".replace(os.sep, '/'), digest
+
+
+def remove_stale_sheets(current):
+    """Delete sheets the index no longer points at (after the index is swapped)"""
+    for old in glob.glob(os.path.join(ROOT, ATLAS_DIR, 'thumbnail-atlas.*.webp')):
+        if os.path.basename(old) != os.path.basename(current):
+            os.remove(old)
+
+
+def main():
+    with open(os.path.join(ROOT, DATABASE_PATH), 'r') as f:
+        database = json.load(f)
+
+    thumbnails = load_thumbnails(database)
+    print(f"Packing {len(thumbnails)} thumbnails")
+
+    index_path = os.path.join(ROOT, INDEX_PATH)
+    if not thumbnails:
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        print("No thumbnails - atlas index removed")
+        return
+
+    atlas, columns, rows, entries = build_atlas(thumbnails)
+    image_path, digest = write_atlas(atlas)
+
+    index = {
+        'version': digest,
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'image': image_path,
+        'cell_size': CELL_SIZE,
+        'columns': columns,
+        'rows': rows,
+        'materials': entries
+    }
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(temp_path, index_path)
+    remove_stale_sheets(image_path)
+    print(f"Wrote {image_path} ({columns}x{rows}) and {INDEX_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+"""
+Router bit import pipeline
+
+Custom router bits used to be stored as the raw positions/indices/normals
+arrays the browser parsed out of the OBJ, all of them inside
+data/router-bits.json, and served whole on every library load. Imports now go
+through this script, which turns each bit into a compact binary blob plus a
+small index entry:
+
+  data/router-bits/<hash>.bin   welded, decimated, quantized mesh
+  data/router-bits/<hash>.svg   profile thumbnail
+  data/router-bits/index.json   name -> blob, counts, bounds and 2D profile
+  data/router-bits/library.json summaries sorted by name (name, category,
+                                sizes, thumbnail) for router-bit-index.php
+
+Pipeline: weld coincident vertices, decimate with quadric edge collapses until
+the next collapse would move the surface by more than the target error,
+recompute normals (split at creases), quantize positions to 16 bits within the
+bounds and normals to 8-bit octahedral pairs. The 2D profile silhouette (radius
+against height along the bit axis) is extracted from the welded mesh and
+stored in the index, so the bit picker can draw profiles without fetching any
+mesh.
+
+Blob layout (little endian), decoded by modules/RouterBitBlob.js:
+  header   4s magic 'CLRB', u16 format version, u16 index size (2|4),
+           u32 vertex count, u32 index count, 6 x f32 bounds min/max
+  uint16   positions, vertex count x 3 (0..65535 across the bounds)
+  int8     normals, vertex count x 2 (octahedral)
+  u16|u32  indices
+
+save-router-bit.php runs this for each upload; router-bit-index.php pages
+through the library and load-router-bits.php serves the blobs.
+
+Usage:
+    python3 scripts/import_router_bit.py --input upload.json    # save-router-bit.php payload
+    python3 scripts/import_router_bit.py --obj ogee.obj --name "Ogee 1/2"
+    python3 scripts/import_router_bit.py --migrate              # convert data/router-bits.json
+"""
+
+import argparse
+import fcntl
+import hashlib
+import heapq
+import json
+import math
+import os
+import struct
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEGACY_PATH = os.path.join('data', 'router-bits.json')
+BIT_DIR = os.path.join('data', 'router-bits')
+INDEX_PATH = os.path.join(BIT_DIR, 'index.json')
+LIBRARY_PATH = os.path.join(BIT_DIR, 'library.json')
+
+MAGIC = b'CLRB'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHII6f')
+
+WELD_TOLERANCE = 1e-5    # Fraction of the bounds diagonal
+TARGET_ERROR = 1e-3      # Fraction of the bounds diagonal a collapse may move the surface
+CREASE_ANGLE = 40        # Degrees between faces before their shared vertex is split
+PROFILE_SAMPLES = 64     # Heights sampled along the bit axis
+THUMBNAIL_SIZE = 96      # px, profile thumbnails
+DEFAULT_CATEGORY = 'Custom'
+DEFAULT_SIZES = [0.25, 0.5]   # Inches offered when an upload names none
+
+
+# ==================== VECTORS ====================
+
+def sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def normalize(a):
+    length = math.sqrt(dot(a, a))
+    return (a[0] / length, a[1] / length, a[2] / length) if length > 0 else (0.0, 0.0, 0.0)
+
+
+def face_normal(vertices, face):
+    a, b, c = (vertices[i] for i in face)
+    return cross(sub(b, a), sub(c, a))
+
+
+def bounds_of(vertices):
+    low = tuple(min(v[axis] for v in vertices) for axis in range(3))
+    high = tuple(max(v[axis] for v in vertices) for axis in range(3))
+    return low, high
+
+
+def diagonal(bounds):
+    return math.sqrt(sum((bounds[1][axis] - bounds[0][axis]) ** 2 for axis in range(3)))
+
+
+# ==================== INPUT ====================
+
+def load_obj(path):
+    """Vertices and triangles from an OBJ file (polygons fan-triangulated)"""
+    vertices = []
+    faces = []
+    with open(path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == 'v':
+                vertices.append(tuple(float(value) for value in parts[1:4]))
+            elif parts[0] == 'f':
+                polygon = []
+                for token in parts[1:]:
+                    index = int(token.split('/')[0])
+                    polygon.append(index - 1 if index > 0 else len(vertices) + index)
+                for i in range(1, len(polygon) - 1):
+                    faces.append((polygon[0], polygon[i], polygon[i + 1]))
+    return vertices, faces
+
+
+def mesh_from_upload(mesh_data):
+    """Vertices and triangles from the browser's meshData arrays"""
+    positions = mesh_data.get('positions') or []
+    vertices = [tuple(positions[i:i + 3]) for i in range(0, len(positions) - 2, 3)]
+    indices = mesh_data.get('indices') or list(range(len(vertices)))
+    faces = [tuple(indices[i:i + 3]) for i in range(0, len(indices) - 2, 3)]
+    return vertices, faces
+
+
+# ==================== WELD ====================
+
+def weld(vertices, faces, tolerance):
+    """Merge vertices closer than the tolerance; drop degenerate and duplicate triangles"""
+    cells = {}
+    welded = []
+    remap = []
+    for v in vertices:
+        key = tuple(round(c / tolerance) for c in v)
+        if key not in cells:
+            cells[key] = len(welded)
+            welded.append(v)
+        remap.append(cells[key])
+
+    seen = set()
+    kept = []
+    for face in faces:
+        a, b, c = (remap[i] for i in face)
+        if a == b or b == c or a == c:
+            continue
+        key = tuple(sorted((a, b, c)))
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append((a, b, c))
+    return welded, kept
+
+
+# ==================== DECIMATE ====================
+
+def plane_quadric(normal, point, weight=1.0):
+    a, b, c = normal
+    d = -dot(normal, point)
+    return [weight * value for value in (a * a, a * b, a * c, a * d, b * b, b * c, b * d, c * c, c * d, d * d)]
+
+
+def quadric_error(q, p):
+    x, y, z = p
+    return (q[0] * x * x + 2 * q[1] * x * y + 2 * q[2] * x * z + 2 * q[3] * x +
+            q[4] * y * y + 2 * q[5] * y * z + 2 * q[6] * y +
+            q[7] * z * z + 2 * q[8] * z + q[9])
+
+
+def decimate(vertices, faces, max_error):
+    """
+    Quadric edge-collapse decimation
+    Stops once the cheapest collapse would exceed max_error (squared distance to
+    the original planes). Boundary edges carry perpendicular planes so open
+    outlines - flat profile meshes - keep their shape.
+    """
+    vertices = list(vertices)
+    faces = [list(face) for face in faces]
+    alive = [True] * len(faces)
+    vertex_faces = [set() for _ in vertices]
+    quadrics = [[0.0] * 10 for _ in vertices]
+
+    edge_faces = {}
+    for f, face in enumerate(faces):
+        normal = normalize(face_normal(vertices, face))
+        q = plane_quadric(normal, vertices[face[0]])
+        for i in range(3):
+            v = face[i]
+            vertex_faces[v].add(f)
+            quadrics[v] = [x + y for x, y in zip(quadrics[v], q)]
+            edge = tuple(sorted((face[i], face[(i + 1) % 3])))
+            edge_faces.setdefault(edge, []).append(normal)
+
+    for (a, b), normals in edge_faces.items():
+        if len(normals) != 1:
+            continue
+        border = normalize(cross(sub(vertices[b], vertices[a]), normals[0]))
+        q = plane_quadric(border, vertices[a])
+        quadrics[a] = [x + y for x, y in zip(quadrics[a], q)]
+        quadrics[b] = [x + y for x, y in zip(quadrics[b], q)]
+
+    version = [0] * len(vertices)
+    heap = []
+
+    def push(a, b):
+        q = [x + y for x, y in zip(quadrics[a], quadrics[b])]
+        middle = tuple((vertices[a][i] + vertices[b][i]) / 2 for i in range(3))
+        cost, target = min((quadric_error(q, p), p) for p in (vertices[a], vertices[b], middle))
+        heapq.heappush(heap, (max(cost, 0.0), a, b, target, version[a], version[b]))
+
+    for a, b in edge_faces:
+        push(a, b)
+
+    limit = max_error * max_error
+    while heap:
+        cost, a, b, target, version_a, version_b = heapq.heappop(heap)
+        if cost > limit:
+            break
+        if version[a] != version_a or version[b] != version_b:
+            continue
+
+        shared = vertex_faces[a] & vertex_faces[b]
+        changed = (vertex_faces[a] | vertex_faces[b]) - shared
+
+        # Reject collapses that flip or flatten a surviving triangle
+        flipped = False
+        for f in changed:
+            before = face_normal(vertices, faces[f])
+            moved = [target if v in (a, b) else vertices[v] for v in faces[f]]
+            after = cross(sub(moved[1], moved[0]), sub(moved[2], moved[0]))
+            if dot(before, after) <= 0:
+                flipped = True
+                break
+        if flipped:
+            continue
+
+        for f in shared:
+            alive[f] = False
+            for v in faces[f]:
+                vertex_faces[v].discard(f)
+        for f in vertex_faces[b]:
+            faces[f] = [a if v == b else v for v in faces[f]]
+            vertex_faces[a].add(f)
+        vertex_faces[b] = set()
+
+        vertices[a] = target
+        quadrics[a] = [x + y for x, y in zip(quadrics[a], quadrics[b])]
+        version[a] += 1
+        version[b] = -1
+
+        neighbours = {v for f in vertex_faces[a] for v in faces[f] if v != a}
+        for v in neighbours:
+            push(a, v)
+
+    # Compact
+    remap = {}
+    kept_vertices = []
+    kept_faces = []
+    for f, face in enumerate(faces):
+        if not alive[f]:
+            continue
+        for v in face:
+            if v not in remap:
+                remap[v] = len(kept_vertices)
+                kept_vertices.append(vertices[v])
+        kept_faces.append(tuple(remap[v] for v in face))
+    return kept_vertices, kept_faces
+
+
+# ==================== NORMALS ====================
+
+def split_normals(vertices, faces, crease_angle):
+    """Area-weighted vertex normals; vertices are split where faces meet at a crease"""
+    threshold = math.cos(math.radians(crease_angle))
+    weighted = [face_normal(vertices, face) for face in faces]
+    units = [normalize(n) for n in weighted]
+
+    corners = {}
+    for f, face in enumerate(faces):
+        for v in face:
+            corners.setdefault(v, []).append(f)
+
+    positions = []
+    normals = []
+    corner_index = {}
+    for v, incident in corners.items():
+        clusters = []
+        for f in incident:
+            for cluster in clusters:
+                if dot(units[f], units[cluster[0]]) >= threshold:
+                    cluster.append(f)
+                    break
+            else:
+                clusters.append([f])
+        for cluster in clusters:
+            total = (0.0, 0.0, 0.0)
+            for f in cluster:
+                total = (total[0] + weighted[f][0], total[1] + weighted[f][1], total[2] + weighted[f][2])
+            index = len(positions)
+            positions.append(vertices[v])
+            normals.append(normalize(total))
+            for f in cluster:
+                corner_index[(f, v)] = index
+
+    indices = [corner_index[(f, v)] for f, face in enumerate(faces) for v in face]
+    return positions, normals, indices
+
+
+# ==================== PROFILE ====================
+
+def extract_profile(vertices, faces, axis, tolerance):
+    """
+    2D silhouette as [[radius, height]] from the bottom of the bit up
+    Solid bits are measured from their axis through the bounds center; flat
+    profile meshes (no thickness across the axis) from their inner edge.
+    """
+    up = 'xyz'.index(axis)
+    across = [i for i in range(3) if i != up]
+    low, high = bounds_of(vertices)
+    extents = [high[i] - low[i] for i in across]
+
+    if min(extents) <= tolerance:
+        # Flat profile: the in-plane coordinate is the radius
+        inplane = across[0] if extents[0] >= extents[1] else across[1]
+        radius = [v[inplane] - low[inplane] for v in vertices]
+    else:
+        center = [(low[i] + high[i]) / 2 for i in across]
+        radius = [math.hypot(v[across[0]] - center[0], v[across[1]] - center[1]) for v in vertices]
+    height = [v[up] - low[up] for v in vertices]
+    span = high[up] - low[up]
+    if span <= tolerance:
+        return []
+
+    edges = {tuple(sorted((face[i], face[(i + 1) % 3]))) for face in faces for i in range(3)}
+    samples = [span * i / (PROFILE_SAMPLES - 1) for i in range(PROFILE_SAMPLES)]
+    outline = [0.0] * PROFILE_SAMPLES
+    for a, b in edges:
+        ha, hb = height[a], height[b]
+        bottom, top = min(ha, hb), max(ha, hb)
+        first = max(0, math.ceil((bottom - tolerance) / span * (PROFILE_SAMPLES - 1)))
+        last = min(PROFILE_SAMPLES - 1, math.floor((top + tolerance) / span * (PROFILE_SAMPLES - 1)))
+        for i in range(first, last + 1):
+            if top - bottom <= tolerance:
+                r = max(radius[a], radius[b])
+            else:
+                t = min(1.0, max(0.0, (samples[i] - ha) / (hb - ha)))
+                r = radius[a] + (radius[b] - radius[a]) * t
+            outline[i] = max(outline[i], r)
+
+    points = simplify([(outline[i], samples[i]) for i in range(PROFILE_SAMPLES)], tolerance)
+    return [[round(r, 5), round(h, 5)] for r, h in points]
+
+
+def simplify(points, tolerance):
+    """Ramer-Douglas-Peucker: keep the samples the outline can't do without"""
+    if len(points) < 3:
+        return points
+    first, last = points[0], points[-1]
+    dx, dy = last[0] - first[0], last[1] - first[1]
+    length = math.hypot(dx, dy)
+
+    worst, split = 0.0, 0
+    for i in range(1, len(points) - 1):
+        px, py = points[i][0] - first[0], points[i][1] - first[1]
+        deviation = abs(dx * py - dy * px) / length if length else math.hypot(px, py)
+        if deviation > worst:
+            worst, split = deviation, i
+    if worst <= tolerance:
+        return [first, last]
+    return simplify(points[:split + 1], tolerance)[:-1] + simplify(points[split:], tolerance)
+
+
+# ==================== ENCODE ====================
+
+def octahedral(normal):
+    x, y, z = normal
+    total = abs(x) + abs(y) + abs(z) or 1.0
+    x, y = x / total, y / total
+    if z < 0:
+        x, y = (1 - abs(y)) * math.copysign(1, x), (1 - abs(x)) * math.copysign(1, y)
+    return round(x * 127), round(y * 127)
+
+
+def encode_blob(positions, normals, indices, bounds):
+    low, high = bounds
+    scale = [(high[i] - low[i]) or 1.0 for i in range(3)]
+    index_size = 2 if len(positions) <= 0xFFFF else 4
+
+    blob = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, index_size, len(positions), len(indices), *low, *high))
+    quantized = [round((p[i] - low[i]) / scale[i] * 65535) for p in positions for i in range(3)]
+    blob += struct.pack(f'<{len(quantized)}H', *quantized)
+    encoded = [value for n in normals for value in octahedral(n)]
+    blob += struct.pack(f'<{len(encoded)}b', *encoded)
+    blob += struct.pack(f'<{len(indices)}{"H" if index_size == 2 else "I"}', *indices)
+    return bytes(blob)
+
+
+# ==================== IMPORT ====================
+
+def import_bit(name, vertices, faces, error, axis):
+    """Run the pipeline for one bit; returns (index entry, blob bytes)"""
+    if not vertices or not faces:
+        raise ValueError(f"{name}: mesh has no triangles")
+
+    size = diagonal(bounds_of(vertices)) or 1.0
+    welded, welded_faces = weld(vertices, faces, size * WELD_TOLERANCE)
+    profile = extract_profile(welded, welded_faces, axis, size * error)
+    decimated, decimated_faces = decimate(welded, welded_faces, size * error)
+    positions, normals, indices = split_normals(decimated, decimated_faces, CREASE_ANGLE)
+
+    bounds = bounds_of(positions)
+    blob = encode_blob(positions, normals, indices, bounds)
+    entry = {
+        'name': name,
+        'hash': hashlib.sha1(blob).hexdigest()[:16],
+        'bytes': len(blob),
+        'vertexCount': len(positions),
+        'triangleCount': len(indices) // 3,
+        'sourceTriangleCount': len(faces),
+        'bounds': {'min': list(bounds[0]), 'max': list(bounds[1])},
+        'profileAxis': axis,
+        'profile': profile,
+        'formatVersion': FORMAT_VERSION
+    }
+    entry['blob'] = os.path.join(BIT_DIR, entry['hash'] + '.bin').replace(os.sep, '/')
+    return entry, blob
+
+
+def profile_svg(profile):
+    """Profile thumbnail: the silhouette filled against the bit axis"""
+    size = THUMBNAIL_SIZE
+    if not profile:
+        return f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}"/>'
+    width = max(r for r, _ in profile) or 1.0
+    height = max(h for _, h in profile) or 1.0
+    scale = (size - 8) / max(width, height)
+    left = (size - width * scale) / 2
+    bottom = size - (size - height * scale) / 2
+    points = [(left, bottom)] + [(left + r * scale, bottom - h * scale) for r, h in profile] + [(left, bottom - height * scale)]
+    path = ' '.join(f'{x:.1f},{y:.1f}' for x, y in points)
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">'
+            f'<polygon points="{path}" fill="#95a5a6" stroke="#2c3e50" stroke-width="1.5"/></svg>')
+
+
+def summary(entry):
+    """Library listing fields (no profile, bounds or mesh data)"""
+    return {key: entry.get(key) for key in ('name', 'category', 'sizes', 'thumbnail', 'hash', 'triangleCount')}
+
+
+def write_atomic(path, data, mode='wb'):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, mode) as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def update_index(entries):
+    """Merge entries into the index under a lock; remove blobs nothing points at"""
+    index_path = os.path.join(ROOT, INDEX_PATH)
+    with open(index_path + '.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        index = {'bits': {}}
+        if os.path.exists(index_path):
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+
+        for entry in entries:
+            index['bits'][entry['name']] = entry
+        index['generated'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        write_atomic(index_path, json.dumps(index, separators=(',', ':')), 'w')
+
+        bits = sorted(index['bits'].values(), key=lambda entry: entry['name'].lower())
+        library = {
+            'generated': index['generated'],
+            'categories': sorted({entry.get('category') or DEFAULT_CATEGORY for entry in bits}),
+            'bits': [summary(entry) for entry in bits]
+        }
+        write_atomic(os.path.join(ROOT, LIBRARY_PATH), json.dumps(library, separators=(',', ':')), 'w')
+
+        referenced = {entry['hash'] for entry in bits}
+        for filename in os.listdir(os.path.join(ROOT, BIT_DIR)):
+            stem, extension = os.path.splitext(filename)
+            if extension in ('.bin', '.svg') and stem not in referenced:
+                os.remove(os.path.join(ROOT, BIT_DIR, filename))
+
+
+def store(name, vertices, faces, args, extra=None):
+    entry, blob = import_bit(name, vertices, faces, args.error, args.axis)
+    entry.update(extra or {})
+    entry.setdefault('timestamp', time.strftime('%Y-%m-%dT%H:%M:%S'))
+    entry['category'] = entry.get('category') or DEFAULT_CATEGORY
+    entry['sizes'] = entry.get('sizes') or DEFAULT_SIZES
+    entry['thumbnail'] = os.path.join(BIT_DIR, entry['hash'] + '.svg').replace(os.sep, '/')
+
+    path = os.path.join(ROOT, entry['blob'])
+    if not os.path.exists(path):
+        write_atomic(path, blob)
+    write_atomic(os.path.join(ROOT, entry['thumbnail']), profile_svg(entry['profile']), 'w')
+    return entry
+
+
+def upload_extra(data):
+    """Fields of a save-router-bit.php payload kept in the index"""
+    extra = {key: data[key] for key in ('id', 'fileName', 'timestamp', 'category', 'description') if key in data}
+    sizes = data.get('sizes') or data.get('defaultSizes')
+    if isinstance(sizes, list):
+        extra['sizes'] = [float(size) for size in sizes]
+    extra['source'] = 'upload'
+    return extra
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import router bit meshes')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='save-router-bit.php payload (JSON with name and meshData)')
+    source.add_argument('--obj', help='OBJ file to import (requires --name)')
+    source.add_argument('--migrate', action='store_true', help=f'Import every bit in {LEGACY_PATH}')
+    parser.add_argument('--name', help='Bit name for --obj')
+    parser.add_argument('--error', type=float, default=TARGET_ERROR, help='Decimation error as a fraction of the bit size')
+    parser.add_argument('--axis', choices=['x', 'y', 'z'], default='y', help='Bit (spindle) axis for the profile')
+    args = parser.parse_args()
+
+    os.makedirs(os.path.join(ROOT, BIT_DIR), exist_ok=True)
+
+    entries = []
+    if args.input:
+        with open(args.input, 'r') as f:
+            data = json.load(f)
+        vertices, faces = mesh_from_upload(data['meshData'])
+        entries.append(store(data['name'], vertices, faces, args, upload_extra(data)))
+    elif args.obj:
+        if not args.name:
+            parser.error('--obj requires --name')
+        vertices, faces = load_obj(args.obj)
+        entries.append(store(args.name, vertices, faces, args, {'fileName': os.path.basename(args.obj)}))
+    else:
+        legacy_path = os.path.join(ROOT, LEGACY_PATH)
+        legacy = {}
+        if os.path.exists(legacy_path):
+            with open(legacy_path, 'r') as f:
+                legacy = json.load(f) or {}
+        for name, data in legacy.items():
+            vertices, faces = mesh_from_upload(data.get('meshData') or {})
+            if not faces:
+                print(f"  Skipped {name}: no mesh data", file=sys.stderr)
+                continue
+            entries.append(store(name, vertices, faces, args, upload_extra(data)))
+
+    update_index(entries)
+
+    # The last line is the entry save-router-bit.php hands back to the browser
+    for entry in entries:
+        print(f"  {entry['name']}: {entry['sourceTriangleCount']} -> {entry['triangleCount']} triangles, "
+              f"{entry['bytes']} bytes", file=sys.stderr)
+    if args.input or args.obj:
+        print(json.dumps(entries[0]))
+    else:
+        print(f"Imported {len(entries)} bit(s) into {INDEX_PATH}")
+
+
+if __name__ == '__main__':
+    main()
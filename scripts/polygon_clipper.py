@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+2D polygon clipping for scroll cuts
+
+A scroll cut through a flat board is computed in 2D: the kerf is the cut path
+offset by half the blade width, and the cut board is the board outline minus
+the kerf. This is the same engine as modules/PolygonClipper.js, which the
+scroll saw uses in the browser; this copy lets cut outlines be computed and
+checked offline (cut lists, plotter/CNC export, regression checks of the JS).
+
+Clipper-style: coordinates are snapped to an integer grid (SCALE units per path
+unit), every edge is split at every crossing, coincident edges are merged, the
+winding number of both inputs is found on each side of each edge, and the
+edges where the result fill changes are linked into loops. Fill is non-zero.
+Outer loops come out counter-clockwise, holes clockwise.
+
+The offset is built from pieces that share exact grid corners (a rectangle per
+segment, a join piece on the outside of turns that a mitre can't cover within
+tolerance, a half disc at each end) and unioned.
+
+Input JSON:
+  {"outline": [[x, y], ...] | "outlines": [[[x, y], ...], ...],
+   "path": [[x, y], ...], "kerf": 0.3}
+Output JSON:
+  {"pieces": [{"outer": [[x, y], ...], "holes": [...], "area": a}, ...]}
+  largest piece first
+
+Usage:
+    python3 scripts/polygon_clipper.py --input cut.json
+    python3 scripts/polygon_clipper.py < cut.json
+"""
+
+import argparse
+import json
+import math
+import sys
+
+SCALE = 1000                  # Grid units per path unit (10 um for cm)
+MAX_SPLIT_PASSES = 4          # Rounded crossings can create new ones - rarely more than once
+DEFAULT_ARC_TOLERANCE = 0.005  # Max chord error of round joins and caps, path units
+
+
+def js_round(value):
+    """Math.round, so grid points match the browser engine exactly"""
+    return math.floor(value + 0.5)
+
+
+def cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def polygon_area(loop):
+    """Signed area, positive for counter-clockwise loops"""
+    area = 0
+    for i in range(len(loop)):
+        a, b = loop[i - 1], loop[i]
+        area += (a[0] - b[0]) * (a[1] + b[1])
+    return area / 2
+
+
+def perimeter(loop):
+    return sum(math.hypot(loop[i][0] - loop[i - 1][0], loop[i][1] - loop[i - 1][1]) for i in range(len(loop)))
+
+
+def point_in_loop(point, loop):
+    inside = False
+    for i in range(len(loop)):
+        a, b = loop[i], loop[i - 1]
+        if (a[1] > point[1]) != (b[1] > point[1]) and \
+                point[0] < (b[0] - a[0]) * (point[1] - a[1]) / (b[1] - a[1]) + a[0]:
+            inside = not inside
+    return inside
+
+
+def to_grid(loop):
+    points = []
+    for x, y in loop:
+        q = (js_round(x * SCALE), js_round(y * SCALE))
+        if not points or points[-1] != q:
+            points.append(q)
+    while len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    return points if len(points) >= 3 else None
+
+
+def from_grid(loops):
+    return [[(x / SCALE, y / SCALE) for x, y in loop] for loop in loops]
+
+
+# ==================== EDGE ARRANGEMENT ====================
+
+class Segment:
+    """Runs from its lexicographically smaller end; w[set] counts input edges
+    running that way (+1) or the other way (-1)"""
+    __slots__ = ('ax', 'ay', 'bx', 'by', 'w', 'left')
+
+    def __init__(self, ax, ay, bx, by, w0, w1):
+        if ax > bx or (ax == bx and ay > by):
+            ax, ay, bx, by, w0, w1 = bx, by, ax, ay, -w0, -w1
+        self.ax, self.ay, self.bx, self.by = ax, ay, bx, by
+        self.w = [w0, w1]
+        self.left = None
+
+
+def add_loop(segments, loop, group):
+    for i in range(len(loop)):
+        a, b = loop[i], loop[(i + 1) % len(loop)]
+        segments.append(Segment(a[0], a[1], b[0], b[1], 1 if group == 0 else 0, 1 if group == 1 else 0))
+
+
+def strictly_inside(s, x, y):
+    """Strictly between a segment's ends, for a point known to be on its line"""
+    if s.ax != s.bx:
+        return s.ax < x < s.bx
+    return s.ay < y < s.by
+
+
+def intersect(segments, i, j, splits):
+    s, t = segments[i], segments[j]
+    d1x, d1y = s.bx - s.ax, s.by - s.ay
+    d2x, d2y = t.bx - t.ax, t.by - t.ay
+    ex, ey = t.ax - s.ax, t.ay - s.ay
+    denom = d1x * d2y - d1y * d2x
+
+    if denom == 0:
+        # Parallel: only collinear overlaps matter, split each at the other's ends
+        if ex * d1y - ey * d1x != 0:
+            return
+        for x, y in ((t.ax, t.ay), (t.bx, t.by)):
+            if strictly_inside(s, x, y):
+                splits.setdefault(i, []).append((x, y))
+        for x, y in ((s.ax, s.ay), (s.bx, s.by)):
+            if strictly_inside(t, x, y):
+                splits.setdefault(j, []).append((x, y))
+        return
+
+    s_num = ex * d2y - ey * d2x
+    t_num = ex * d1y - ey * d1x
+    if denom < 0:
+        denom, s_num, t_num = -denom, -s_num, -t_num
+    if s_num < 0 or s_num > denom or t_num < 0 or t_num > denom:
+        return
+
+    # Touching ends split the other segment exactly; crossings are rounded to the grid
+    if t_num == 0:
+        x, y = t.ax, t.ay
+    elif t_num == denom:
+        x, y = t.bx, t.by
+    elif s_num == 0:
+        x, y = s.ax, s.ay
+    elif s_num == denom:
+        x, y = s.bx, s.by
+    else:
+        x = js_round(s.ax + d1x * s_num / denom)
+        y = js_round(s.ay + d1y * s_num / denom)
+
+    if 0 < s_num < denom and (x, y) != (s.ax, s.ay) and (x, y) != (s.bx, s.by):
+        splits.setdefault(i, []).append((x, y))
+    if 0 < t_num < denom and (x, y) != (t.ax, t.ay) and (x, y) != (t.bx, t.by):
+        splits.setdefault(j, []).append((x, y))
+
+
+def split_segments(segments):
+    """Split every segment at every crossing, overlap and touching end"""
+    for _ in range(MAX_SPLIT_PASSES):
+        order = sorted(range(len(segments)), key=lambda k: segments[k].ax)
+        splits = {}
+        for m, i in enumerate(order):
+            s = segments[i]
+            s_min_y, s_max_y = min(s.ay, s.by), max(s.ay, s.by)
+            for j in order[m + 1:]:
+                t = segments[j]
+                if t.ax > s.bx:
+                    break
+                if max(t.ay, t.by) < s_min_y or min(t.ay, t.by) > s_max_y:
+                    continue
+                intersect(segments, i, j, splits)
+        if not splits:
+            break
+
+        result = []
+        for i, s in enumerate(segments):
+            points = splits.get(i)
+            if not points:
+                result.append(s)
+                continue
+            ax, ay = s.ax, s.ay
+            for x, y in sorted(points):
+                if (x, y) == (ax, ay):
+                    continue
+                result.append(Segment(ax, ay, x, y, s.w[0], s.w[1]))
+                ax, ay = x, y
+            result.append(Segment(ax, ay, s.bx, s.by, s.w[0], s.w[1]))
+        segments = result
+    return segments
+
+
+def merge_segments(segments):
+    """Coincident segments become one carrying the summed windings"""
+    merged = {}
+    for s in segments:
+        if (s.ax, s.ay) == (s.bx, s.by):
+            continue
+        key = (s.ax, s.ay, s.bx, s.by)
+        existing = merged.get(key)
+        if existing:
+            existing.w[0] += s.w[0]
+            existing.w[1] += s.w[1]
+        else:
+            merged[key] = Segment(s.ax, s.ay, s.bx, s.by, s.w[0], s.w[1])
+    return [s for s in merged.values() if s.w[0] or s.w[1]]
+
+
+class SlabIndex:
+    """Buckets segments into slabs so a ray only visits the segments it can cross
+    axis 'x': vertical rays (non-vertical segments by x range)
+    axis 'y': horizontal rays (non-horizontal segments by y range)"""
+
+    def __init__(self, segments, axis):
+        spans = [(s.ax, s.bx) if axis == 'x' else (min(s.ay, s.by), max(s.ay, s.by)) for s in segments]
+        self.min = min(span[0] for span in spans)
+        top = max(span[1] for span in spans)
+        self.count = max(1, math.ceil(math.sqrt(len(segments))))
+        self.size = max(1, (top - self.min) / self.count)
+        self.slabs = [[] for _ in range(self.count)]
+        for s, (lo, hi) in zip(segments, spans):
+            if lo == hi:
+                continue
+            for k in range(self.slab(lo), self.slab(hi) + 1):
+                self.slabs[k].append(s)
+
+    def slab(self, value):
+        return max(0, min(self.count - 1, math.floor((value - self.min) / self.size)))
+
+    def at(self, value):
+        return self.slabs[self.slab(value)]
+
+
+def compute_windings(segments):
+    """Winding numbers of both inputs just left of each segment (seen from a to b)"""
+    columns = SlabIndex(segments, 'x')
+    rows = SlabIndex(segments, 'y')
+
+    for s in segments:
+        # Doubled midpoint keeps the side tests in integers
+        px, py = s.ax + s.bx, s.ay + s.by
+        left = [0, 0]
+        if s.ax != s.bx:
+            # Left of a +x segment is above it: count segments crossed by an upward ray
+            for t in columns.at(px / 2):
+                if t is s or 2 * t.ax > px or 2 * t.bx <= px:
+                    continue
+                if (t.bx - t.ax) * (py - 2 * t.ay) - (t.by - t.ay) * (px - 2 * t.ax) < 0:
+                    left[0] -= t.w[0]
+                    left[1] -= t.w[1]
+        else:
+            # Left of a +y segment is toward -x: count segments crossed by a leftward ray
+            for t in rows.at(py / 2):
+                if t is s:
+                    continue
+                up = t.by > t.ay
+                lx, ly, hx, hy = (t.ax, t.ay, t.bx, t.by) if up else (t.bx, t.by, t.ax, t.ay)
+                if 2 * ly > py or 2 * hy <= py:
+                    continue
+                if (hx - lx) * (py - 2 * ly) - (hy - ly) * (px - 2 * lx) < 0:
+                    sign = -1 if up else 1
+                    left[0] += sign * t.w[0]
+                    left[1] += sign * t.w[1]
+        s.left = left
+
+
+OPERATIONS = {
+    'union': lambda a, b: a or b,
+    'intersection': lambda a, b: a and b,
+    'difference': lambda a, b: a and not b,
+    'xor': lambda a, b: a != b,
+}
+
+
+def link_loops(edges):
+    """Join boundary edges (filled side on the left) into loops, taking the
+    sharpest left turn at shared vertices so touching loops stay separate"""
+    outgoing = {}
+    for e in edges:
+        outgoing.setdefault(e[0], []).append(e)
+
+    used = set()
+    loops = []
+    for first in edges:
+        if id(first) in used:
+            continue
+        loop = []
+        edge = first
+        while edge:
+            used.add(id(edge))
+            loop.append(edge[0])
+            (ax, ay), (bx, by) = edge
+            back = math.atan2(ay - by, ax - bx)
+            best, following = math.inf, None
+            for candidate in outgoing.get(edge[1], []):
+                if id(candidate) in used and candidate is not first:
+                    continue
+                (cx, cy), (dx, dy) = candidate
+                turn = back - math.atan2(dy - cy, dx - cx)
+                while turn <= 0:
+                    turn += 2 * math.pi
+                while turn > 2 * math.pi:
+                    turn -= 2 * math.pi
+                if turn < best:
+                    best, following = turn, candidate
+            edge = None if following is first else following
+
+        # Drop straight-through and spike vertices
+        while len(loop) >= 3:
+            kept = [p for i, p in enumerate(loop) if cross(loop[i - 1], p, loop[(i + 1) % len(loop)]) != 0]
+            if len(kept) == len(loop):
+                break
+            loop = kept
+        # Rounding can leave loops a grid unit wide; they are not geometry
+        if len(loop) >= 3 and 2 * abs(polygon_area(loop)) > perimeter(loop):
+            loops.append(loop)
+    return loops
+
+
+def boolean_grid(subject, clip, operation):
+    fill = OPERATIONS[operation]
+    segments = []
+    for loop in subject:
+        if loop:
+            add_loop(segments, loop, 0)
+    for loop in clip:
+        if loop:
+            add_loop(segments, loop, 1)
+    if not segments:
+        return []
+
+    segments = merge_segments(split_segments(segments))
+    if not segments:
+        return []
+    compute_windings(segments)
+
+    edges = []
+    for s in segments:
+        left_filled = fill(s.left[0] != 0, s.left[1] != 0)
+        right_filled = fill(s.left[0] - s.w[0] != 0, s.left[1] - s.w[1] != 0)
+        if left_filled == right_filled:
+            continue
+        a, b = (s.ax, s.ay), (s.bx, s.by)
+        edges.append((a, b) if left_filled else (b, a))
+    return link_loops(edges)
+
+
+def boolean_polygons(subject, clip, operation='union'):
+    """Boolean operation on two sets of polygons (non-zero fill within each set)"""
+    if operation not in OPERATIONS:
+        raise ValueError(f"unknown operation '{operation}'")
+    return from_grid(boolean_grid([to_grid(loop) for loop in subject], [to_grid(loop) for loop in clip], operation))
+
+
+def group_polygons(loops):
+    """Outlines with their holes, largest first"""
+    outers = []
+    holes = []
+    for loop in loops:
+        area = polygon_area(loop)
+        if area > 0:
+            outers.append({'outer': loop, 'holes': [], 'area': area, 'net': area})
+        elif area < 0:
+            holes.append((loop, area))
+
+    for loop, area in holes:
+        probe = ((loop[0][0] + loop[1][0]) / 2, (loop[0][1] + loop[1][1]) / 2)
+        owner = None
+        for candidate in outers:
+            if point_in_loop(probe, candidate['outer']) and (owner is None or candidate['area'] < owner['area']):
+                owner = candidate
+        if owner:
+            owner['holes'].append(loop)
+            owner['net'] += area
+
+    groups = [{'outer': g['outer'], 'holes': g['holes'], 'area': g['net']} for g in outers]
+    return sorted(groups, key=lambda g: -g['area'])
+
+
+# ==================== OFFSETTING ====================
+
+def offset_polyline(points, delta, arc_tolerance=DEFAULT_ARC_TOLERANCE):
+    """Region within delta of an open polyline (round joins and round ends)"""
+    step = 2 * math.acos(1 - arc_tolerance / delta) if delta > arc_tolerance else math.pi / 2
+    d = delta * SCALE
+
+    path = []
+    for x, y in points:
+        q = (x * SCALE, y * SCALE)
+        if not path or math.hypot(q[0] - path[-1][0], q[1] - path[-1][1]) >= 1:
+            path.append(q)
+    if not path or d < 1:
+        return []
+
+    def snap(center, angle, radius=d):
+        return (js_round(center[0] + radius * math.cos(angle)), js_round(center[1] + radius * math.sin(angle)))
+
+    def arc(center, start, sweep):
+        """Points strictly between two angles on the arc around center"""
+        count = max(1, math.ceil(abs(sweep) / step))
+        return [snap(center, start + sweep * k / count) for k in range(1, count)]
+
+    if len(path) == 1:
+        return from_grid(boolean_grid([[snap(path[0], 0)] + arc(path[0], 0, 2 * math.pi)], [], 'union'))
+
+    # Left normal angle of each segment, and its four corners (L = left, R = right)
+    segments = []
+    for a, b in zip(path, path[1:]):
+        normal = math.atan2(b[1] - a[1], b[0] - a[0]) + math.pi / 2
+        segments.append({
+            'normal': normal,
+            'length': math.hypot(b[0] - a[0], b[1] - a[1]),
+            'startL': snap(a, normal), 'startR': snap(a, normal + math.pi),
+            'endL': snap(b, normal), 'endR': snap(b, normal + math.pi),
+        })
+
+    pieces = []
+    for i in range(1, len(path) - 1):
+        v = path[i]
+        before, after = segments[i - 1], segments[i]
+        turn = after['normal'] - before['normal']
+        while turn > math.pi:
+            turn -= 2 * math.pi
+        while turn < -math.pi:
+            turn += 2 * math.pi
+
+        # A mitre within tolerance of the round join lets both segments share
+        # its corners - unless moving them would fold a short segment
+        mitre = d / math.cos(turn / 2)
+        shift = d * math.tan(abs(turn) / 2)
+        if mitre - d <= arc_tolerance * SCALE and 2 * shift <= min(before['length'], after['length']):
+            bisector = before['normal'] + turn / 2
+            before['endL'] = after['startL'] = snap(v, bisector, mitre)
+            before['endR'] = after['startR'] = snap(v, bisector + math.pi, mitre)
+        elif turn > 0:
+            # Left turn opens on the right. The piece crosses itself at v; its
+            # inner lobe lies inside both rectangles, so it stays filled
+            pieces.append([before['endR']] + arc(v, before['normal'] + math.pi, turn) +
+                          [after['startR'], after['startL'], before['endL']])
+        else:
+            pieces.append([after['startL']] + arc(v, after['normal'], -turn) +
+                          [before['endL'], before['endR'], after['startR']])
+
+    for s in segments:
+        pieces.append([s['startR'], s['endR'], s['endL'], s['startL']])
+
+    # Round ends
+    first, last = segments[0], segments[-1]
+    pieces.append([first['startL']] + arc(path[0], first['normal'], math.pi) + [first['startR']])
+    pieces.append([last['endR']] + arc(path[-1], last['normal'] + math.pi, math.pi) + [last['endL']])
+
+    return from_grid(boolean_grid(pieces, [], 'union'))
+
+
+def scroll_cut(outlines, path, kerf):
+    """Pieces left when a kerf along path is cut out of the board outlines"""
+    kerf_loops = offset_polyline(path, kerf / 2)
+    return group_polygons(boolean_polygons(outlines, kerf_loops, 'difference'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute scroll cut outlines')
+    parser.add_argument('--input', help='Cut JSON (default: stdin)')
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input) as f:
+            data = json.load(f)
+    else:
+        data = json.load(sys.stdin)
+
+    outlines = data.get('outlines') or [data['outline']]
+    pieces = scroll_cut(outlines, data['path'], float(data.get('kerf', 0.3)))
+    json.dump({'pieces': [
+        {'outer': [list(p) for p in g['outer']], 'holes': [[list(p) for p in h] for h in g['holes']], 'area': round(g['area'], 6)}
+        for g in pieces
+    ]}, sys.stdout, separators=(',', ':'))
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
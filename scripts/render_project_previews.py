@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Headless project previews
+
+Renders isometric part thumbnails and a whole-project preview for saved
+projects without a browser, so project listings can show them without opening
+the 3D workspace. A small NumPy software rasterizer draws each part from the
+geometry stored with the project (meshGeometry) or, for parts saved without
+it, from the Board dimensions:
+
+  data/previews/<hash>.png              one image per render, named by content hash
+  data/previews/preview-manifest.json   index: project id -> preview + part thumbnails
+
+Faces are flat shaded and sample the material's diffuse texture with a box
+projection (saved geometry carries no UVs), falling back to the saved diffuse
+color. A render's hash covers its geometry, transforms, material texture and
+image size, so unchanged parts are never drawn twice - across saves and across
+projects. Renders run in a process pool.
+
+save-project.php runs this for the saved project; listings read the manifest.
+Saves can overlap, so the manifest is re-read, merged and replaced under an
+exclusive lock (preview-manifest.json.lock), and a run only deletes renders
+that the entries it replaced pointed at and nothing references any more.
+
+Usage:
+    python3 scripts/render_project_previews.py                     # all projects
+    python3 scripts/render_project_previews.py --project project_1722_4242
+    python3 scripts/render_project_previews.py --workers 4 --size 256
+"""
+
+import argparse
+import contextlib
+import fcntl
+import hashlib
+import io
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("NumPy is required: pip install numpy")
+
+try:
+    from PIL import Image
+except ImportError:
+    sys.exit("Pillow is required: pip install Pillow")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATABASE_PATH = os.path.join('data', 'users-database.json')
+MATERIALS_PATH = 'materials-database.json'
+TEXTURE_MANIFEST_PATH = os.path.join('data', 'materials', 'texture-manifest.json')
+PREVIEW_DIR = os.path.join('data', 'previews')
+MANIFEST_PATH = os.path.join(PREVIEW_DIR, 'preview-manifest.json')
+
+RENDERER_VERSION = 1        # Bump to invalidate every cached render
+THUMBNAIL_SIZE = 128        # Matches the browser thumbnails (ThumbnailService)
+PREVIEW_SIZE = 256
+SUPERSAMPLE = 2             # Rendered at 2x and downsampled for antialiasing
+TEXTURE_SIZE = 256          # Largest texture tier the rasterizer samples
+TEXTURE_REPEAT_CM = 60.96   # World size of one texture tile (2 ft)
+INCH_TO_CM = 2.54
+
+DEFAULT_COLOR = (0.76, 0.60, 0.42)  # Unfinished wood
+AMBIENT = 0.45
+LIGHT_DIRECTION = np.array([0.35, 0.85, -0.4])
+
+# Isometric view from +X +Y +Z (Babylon is left-handed: right = up x forward)
+VIEW_FORWARD = -np.ones(3) / math.sqrt(3.0)
+VIEW_RIGHT = np.cross([0.0, 1.0, 0.0], VIEW_FORWARD)
+VIEW_RIGHT /= np.linalg.norm(VIEW_RIGHT)
+VIEW_UP = np.cross(VIEW_FORWARD, VIEW_RIGHT)
+
+
+# ==================== GEOMETRY ====================
+
+def vector(value, default):
+    """Saved transforms are either {x, y, z} or [x, y, z]"""
+    if isinstance(value, dict):
+        return [float(value.get(axis, d)) for axis, d in zip('xyz', default)]
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        return [float(v) for v in value]
+    return list(default)
+
+
+def rotation_matrix(rotation):
+    """Babylon Euler rotation (yaw Y, pitch X, roll Z) as a column-vector matrix"""
+    x, y, z = rotation
+    cx, sx = math.cos(x), math.sin(x)
+    cy, sy = math.cos(y), math.sin(y)
+    cz, sz = math.cos(z), math.sin(z)
+    rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return ry @ rx @ rz
+
+
+def box_geometry(dimensions):
+    """Board box: length -> X, thickness -> Y, width -> Z (same as createWorkBenchMaterial)"""
+    hx = float(dimensions.get('length', 0)) * INCH_TO_CM / 2
+    hy = float(dimensions.get('thickness', 0)) * INCH_TO_CM / 2
+    hz = float(dimensions.get('width', 0)) * INCH_TO_CM / 2
+    vertices = [[sx * hx, sy * hy, sz * hz] for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)]
+    indices = [
+        0, 1, 3, 0, 3, 2,  4, 6, 7, 4, 7, 5,  # -X, +X
+        0, 4, 5, 0, 5, 1,  2, 3, 7, 2, 7, 6,  # -Y, +Y
+        0, 2, 6, 0, 6, 4,  1, 5, 7, 1, 7, 3   # -Z, +Z
+    ]
+    return vertices, indices
+
+
+def part_mesh(part):
+    """World-space triangles for a saved part: {'vertices': [[x,y,z]], 'indices': [i]}"""
+    geometry = part.get('meshGeometry') or {}
+    if geometry.get('vertices') and geometry.get('indices'):
+        flat = geometry['vertices']
+        vertices = [flat[i:i + 3] for i in range(0, len(flat) - 2, 3)]
+        indices = geometry['indices']
+        position = vector(geometry.get('position'), (0, 0, 0))
+        rotation = vector(geometry.get('rotation'), (0, 0, 0))
+        scaling = vector(geometry.get('scaling'), (1, 1, 1))
+    elif part.get('dimensions'):
+        vertices, indices = box_geometry(part['dimensions'])
+        position = vector(part.get('position'), (0, 0, 0))
+        rotation = vector(part.get('rotation'), (0, 0, 0))
+        scaling = vector(part.get('scaling'), (1, 1, 1))
+    else:
+        return None
+
+    local = np.asarray(vertices, dtype=np.float64) * np.asarray(scaling)
+    world = local @ rotation_matrix(rotation).T + np.asarray(position)
+    return {'vertices': world.tolist(), 'indices': [int(i) for i in indices]}
+
+
+# ==================== MATERIALS ====================
+
+def load_json(path, default):
+    full_path = os.path.join(ROOT, path)
+    if not os.path.isfile(full_path):
+        return default
+    with open(full_path, 'r') as f:
+        return json.load(f)
+
+
+def texture_path(material_id, materials, texture_manifest):
+    """Smallest pre-built tier at least TEXTURE_SIZE wide, else the original upload"""
+    material = materials.get(material_id) or {}
+    url = (material.get('visual_assets') or {}).get('texture_diffuse')
+    if not url or url.startswith('data:'):
+        return None
+
+    entry = ((texture_manifest.get('materials') or {}).get(material_id) or {}).get('textures', {}).get(url)
+    if entry:
+        tiers = sorted(entry.get('tiers', []), key=lambda tier: tier['size'])
+        fitting = [tier for tier in tiers if tier['size'] >= TEXTURE_SIZE] or tiers[-1:]
+        if fitting and os.path.isfile(os.path.join(ROOT, fitting[0]['jpeg'])):
+            return fitting[0]['jpeg']
+
+    return url if os.path.isfile(os.path.join(ROOT, url)) else None
+
+
+def part_material(part, materials, texture_manifest):
+    material_id = part.get('materialId')
+    if not material_id and isinstance(part.get('material'), dict):
+        material_id = part['material'].get('id')
+    texture = texture_path(material_id, materials, texture_manifest) if material_id else None
+
+    color = DEFAULT_COLOR
+    saved = ((part.get('meshGeometry') or {}).get('material') or {}).get('diffuseColor')
+    if saved:
+        color = (saved.get('r', color[0]), saved.get('g', color[1]), saved.get('b', color[2]))
+
+    stamp = None
+    if texture:
+        stat = os.stat(os.path.join(ROOT, texture))
+        stamp = [int(stat.st_mtime), stat.st_size]
+    return {'texture': texture, 'texture_stamp': stamp, 'color': list(color)}
+
+
+# ==================== RASTERIZER ====================
+
+def load_texture(path, cache):
+    if path not in cache:
+        with Image.open(os.path.join(ROOT, path)) as image:
+            image = image.convert('RGB')
+            image.thumbnail((TEXTURE_SIZE, TEXTURE_SIZE), Image.LANCZOS)
+            cache[path] = np.asarray(image, dtype=np.float32) / 255.0
+    return cache[path]
+
+
+def sample_texture(texture, u, v):
+    """Nearest-texel lookup with wrapping (u, v in tiles)"""
+    height, width = texture.shape[:2]
+    x = np.floor((u % 1.0) * width).astype(np.int64) % width
+    y = np.floor((v % 1.0) * height).astype(np.int64) % height
+    return texture[y, x]
+
+
+def face_uv_axes(normal):
+    """Box projection: grain runs along X on faces and edges, end grain on +-X"""
+    axis = int(np.argmax(np.abs(normal)))
+    if axis == 0:
+        return 2, 1
+    if axis == 1:
+        return 0, 2
+    return 0, 1
+
+
+def rasterize(meshes, size):
+    """Render world-space meshes to an RGBA image framed isometrically"""
+    render_size = size * SUPERSAMPLE
+    color = np.zeros((render_size, render_size, 4), dtype=np.float32)
+    depth = np.full((render_size, render_size), np.inf, dtype=np.float64)
+
+    all_vertices = np.concatenate([np.asarray(mesh['vertices'], dtype=np.float64) for mesh in meshes])
+    screen_u = all_vertices @ VIEW_RIGHT
+    screen_v = all_vertices @ VIEW_UP
+    span = max(screen_u.max() - screen_u.min(), screen_v.max() - screen_v.min(), 1e-6)
+    padding = render_size * 0.06
+    scale = (render_size - 2 * padding) / span
+    center_u = (screen_u.max() + screen_u.min()) / 2
+    center_v = (screen_v.max() + screen_v.min()) / 2
+
+    light = LIGHT_DIRECTION / np.linalg.norm(LIGHT_DIRECTION)
+    textures = {}
+
+    for mesh in meshes:
+        vertices = np.asarray(mesh['vertices'], dtype=np.float64)
+        triangles = np.asarray(mesh['indices'], dtype=np.int64).reshape(-1, 3)
+        px = (vertices @ VIEW_RIGHT - center_u) * scale + render_size / 2
+        py = (center_v - vertices @ VIEW_UP) * scale + render_size / 2
+        pz = vertices @ VIEW_FORWARD
+        material = mesh['material']
+        texture = load_texture(material['texture'], textures) if material.get('texture') else None
+        base = np.asarray(material['color'], dtype=np.float32)
+
+        for a, b, c in triangles:
+            x0, x1, x2 = px[a], px[b], px[c]
+            y0, y1, y2 = py[a], py[b], py[c]
+            area = (x1 - x0) * (y2 - y0) - (x2 - x0) * (y1 - y0)
+            if abs(area) < 1e-12:
+                continue
+
+            left = max(int(math.floor(min(x0, x1, x2))), 0)
+            right = min(int(math.ceil(max(x0, x1, x2))), render_size - 1)
+            top = max(int(math.floor(min(y0, y1, y2))), 0)
+            bottom = min(int(math.ceil(max(y0, y1, y2))), render_size - 1)
+            if left > right or top > bottom:
+                continue
+
+            # Barycentric weights at pixel centers; either winding is drawn
+            gx, gy = np.meshgrid(np.arange(left, right + 1) + 0.5, np.arange(top, bottom + 1) + 0.5)
+            w0 = ((x1 - gx) * (y2 - gy) - (x2 - gx) * (y1 - gy)) / area
+            w1 = ((x2 - gx) * (y0 - gy) - (x0 - gx) * (y2 - gy)) / area
+            w2 = 1.0 - w0 - w1
+            inside = (w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+            if not inside.any():
+                continue
+
+            z = w0 * pz[a] + w1 * pz[b] + w2 * pz[c]
+            region = depth[top:bottom + 1, left:right + 1]
+            visible = inside & (z < region)
+            if not visible.any():
+                continue
+
+            # Flat shading, lit from the side facing the camera
+            normal = np.cross(vertices[b] - vertices[a], vertices[c] - vertices[a])
+            length = np.linalg.norm(normal)
+            if length < 1e-12:
+                continue
+            normal /= length
+            if np.dot(normal, VIEW_FORWARD) > 0:
+                normal = -normal
+            shade = AMBIENT + (1.0 - AMBIENT) * max(0.0, float(np.dot(normal, light)))
+
+            if texture is not None:
+                axis_u, axis_v = face_uv_axes(normal)
+                world_u = w0 * vertices[a][axis_u] + w1 * vertices[b][axis_u] + w2 * vertices[c][axis_u]
+                world_v = w0 * vertices[a][axis_v] + w1 * vertices[b][axis_v] + w2 * vertices[c][axis_v]
+                texel = sample_texture(texture, world_u[visible] / TEXTURE_REPEAT_CM, world_v[visible] / TEXTURE_REPEAT_CM)
+                rgb = texel * shade
+            else:
+                rgb = np.broadcast_to(base * shade, (int(visible.sum()), 3))
+
+            region[visible] = z[visible]
+            target = color[top:bottom + 1, left:right + 1]
+            target[visible, :3] = rgb
+            target[visible, 3] = 1.0
+
+    image = Image.fromarray(np.clip(color * 255.0 + 0.5, 0, 255).astype(np.uint8), 'RGBA')
+    if SUPERSAMPLE > 1:
+        image = image.resize((size, size), Image.LANCZOS)
+    return image
+
+
+# ==================== JOBS ====================
+
+def render_key(meshes, size):
+    """Content hash of everything that affects the image"""
+    digest = hashlib.sha1()
+    digest.update(json.dumps({'version': RENDERER_VERSION, 'size': size}).encode())
+    for mesh in meshes:
+        payload = {
+            'vertices': np.round(np.asarray(mesh['vertices']), 3).tolist(),
+            'indices': mesh['indices'],
+            'material': mesh['material']
+        }
+        digest.update(json.dumps(payload, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+def render_job(job):
+    """Worker: draw one image and write it under its hash (runs in the pool)"""
+    image = rasterize(job['meshes'], job['size'])
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True)
+
+    path = os.path.join(ROOT, job['path'])
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(buffer.getvalue())
+    os.replace(temp_path, path)
+    return job['path']
+
+
+def preview_path(key):
+    return f"{PREVIEW_DIR}/{key}.png".replace(os.sep, '/')
+
+
+def plan_project(project, materials, texture_manifest, thumbnail_size, preview_size, jobs):
+    """Manifest entry for a project; every render it points at is added to jobs"""
+    def request(meshes, size):
+        key = render_key(meshes, size)
+        path = preview_path(key)
+        jobs.setdefault(key, {'meshes': meshes, 'size': size, 'path': path})
+        return path
+
+    entry = {'parts': {}, 'preview': None}
+    bench_meshes = {'work': [], 'assembly': []}
+    for bench, parts in (('work', project.get('workBenchParts') or []),
+                         ('assembly', project.get('assemblyParts') or [])):
+        for part in parts:
+            mesh = part_mesh(part)
+            if not mesh or not mesh['indices']:
+                continue
+            mesh['material'] = part_material(part, materials, texture_manifest)
+            bench_meshes[bench].append(mesh)
+            if part.get('id') is not None:
+                entry['parts'][str(part['id'])] = request([mesh], thumbnail_size)
+
+    # The assembly shows the finished piece; fall back to the work bench
+    meshes = bench_meshes['assembly'] or bench_meshes['work']
+    if meshes:
+        entry['preview'] = request(meshes, preview_size)
+    return entry
+
+
+def entry_paths(entry):
+    """Renders a manifest entry points at"""
+    paths = set(entry.get('parts', {}).values())
+    if entry.get('preview'):
+        paths.add(entry['preview'])
+    return paths
+
+
+def render_missing(jobs, workers):
+    """Render every job whose image is not on disk"""
+    missing = [job for job in jobs.values() if not os.path.isfile(os.path.join(ROOT, job['path']))]
+    if not missing:
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path in pool.map(render_job, missing):
+            print(f"  Rendered {path}")
+
+
+@contextlib.contextmanager
+def manifest_lock(path):
+    """Exclusive lock held across read-modify-write of the manifest"""
+    with open(f"{path}.lock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def write_manifest(path, manifest):
+    manifest['generated'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    # Write then rename so listings never read a half-written manifest
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def remove_stale_previews(stale, manifest):
+    """Delete renders this run dropped from the manifest, unless another entry still uses them"""
+    referenced = set()
+    for entry in manifest['projects'].values():
+        referenced |= entry_paths(entry)
+    for path in stale - referenced:
+        full_path = os.path.join(ROOT, path)
+        if os.path.isfile(full_path):
+            os.remove(full_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render saved project previews')
+    parser.add_argument('--project', help='Only render this project id')
+    parser.add_argument('--workers', type=int, default=None, help='Render processes (default: CPU count)')
+    parser.add_argument('--size', type=int, default=PREVIEW_SIZE, help='Project preview size in px')
+    args = parser.parse_args()
+
+    database = load_json(DATABASE_PATH, {'projects': []})
+    materials = load_json(MATERIALS_PATH, {}).get('materials', {})
+    texture_manifest = load_json(TEXTURE_MANIFEST_PATH, {})
+    os.makedirs(os.path.join(ROOT, PREVIEW_DIR), exist_ok=True)
+
+    projects = [p for p in database.get('projects', []) if p.get('isActive', True)]
+    if args.project:
+        projects = [p for p in projects if p.get('projectID') == args.project]
+
+    jobs = {}
+    entries = {}
+    for project in projects:
+        entry = plan_project(project, materials, texture_manifest, THUMBNAIL_SIZE, args.size, jobs)
+        entry['modifiedAt'] = project.get('modifiedAt')
+        entries[project['projectID']] = entry
+
+    # Renders happen outside the lock; only the manifest update is serialized
+    cached = sum(1 for job in jobs.values() if os.path.isfile(os.path.join(ROOT, job['path'])))
+    print(f"{len(projects)} project(s), {len(jobs) - cached} render(s) not cached")
+    render_missing(jobs, args.workers)
+
+    manifest_path = os.path.join(ROOT, MANIFEST_PATH)
+    with manifest_lock(manifest_path):
+        manifest = load_json(MANIFEST_PATH, {})
+        manifest.setdefault('projects', {})
+
+        # Entries this run replaces or drops; only their renders may go stale
+        replaced = list(manifest['projects']) if not args.project else [args.project]
+        stale = set()
+        for project_id in replaced:
+            stale |= entry_paths(manifest['projects'].pop(project_id, None) or {})
+        manifest['projects'].update(entries)
+
+        # Another run may have removed a render this run found cached
+        render_missing(jobs, args.workers)
+        write_manifest(manifest_path, manifest)
+        remove_stale_previews(stale, manifest)
+    print(f"Wrote {MANIFEST_PATH}")
+
+
+if __name__ == '__main__':
+    main()
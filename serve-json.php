@@ -0,0 +1,64 @@
+<?php
+/**
+ * Serve JSON - Cache-aware delivery of the JSON databases
+ *
+ * serve-json.php?name=materials            revalidates every time (ETag / If-None-Match -> 304)
+ * serve-json.php?name=materials&v=<hash>   immutable when the hash matches the current file
+ *
+ * Only the files listed in assetJsonSources() can be served.
+ */
+
+require_once __DIR__ . '/asset-versions.php';
+
+header('Content-Type: application/json');
+
+if ($_SERVER['REQUEST_METHOD'] !== 'GET' && $_SERVER['REQUEST_METHOD'] !== 'HEAD') {
+    http_response_code(405);
+    echo json_encode(['error' => 'Method not allowed']);
+    exit;
+}
+
+$sources = assetJsonSources();
+$name = $_GET['name'] ?? '';
+
+if (!isset($sources[$name])) {
+    http_response_code(404);
+    echo json_encode(['error' => 'Unknown resource']);
+    exit;
+}
+
+$path = $sources[$name];
+$version = assetVersion($path);
+
+if ($version === null) {
+    http_response_code(404);
+    echo json_encode(['error' => 'Resource not found']);
+    exit;
+}
+
+$etag = '"' . $version . '"';
+header('ETag: ' . $etag);
+header('Last-Modified: ' . gmdate('D, d M Y H:i:s', filemtime(__DIR__ . '/' . $path)) . ' GMT');
+
+// A matching ?v= pins the exact content: safe to cache forever.
+// Anything else (no version, or a stale one) must revalidate.
+if (isset($_GET['v']) && $_GET['v'] === $version) {
+    header('Cache-Control: public, max-age=31536000, immutable');
+} else {
+    header('Cache-Control: no-cache');
+}
+
+$ifNoneMatch = $_SERVER['HTTP_IF_NONE_MATCH'] ?? '';
+if ($ifNoneMatch !== '') {
+    $tags = array_map('trim', explode(',', $ifNoneMatch));
+    if (in_array($etag, $tags, true) || in_array('W/' . $etag, $tags, true) || in_array('*', $tags, true)) {
+        http_response_code(304);
+        exit;
+    }
+}
+
+header('Content-Length: ' . filesize(__DIR__ . '/' . $path));
+if ($_SERVER['REQUEST_METHOD'] === 'GET') {
+    readfile(__DIR__ . '/' . $path);
+}
+?>
@@ -110,6 +110,29 @@ function generateFilename($originalName, $materialId, $imageType) {
     return $safeMaterialId . '_' . $safeImageType . '.' . $extension;
 }
 
+/**
+ * Build power-of-two texture tiers for a material and refresh the texture manifest
+ * Thumbnails are left alone - only diffuse textures and variants get tiers.
+ */
+function buildTextureTiers($materialId) {
+    $script = __DIR__ . '/scripts/build_material_textures.py';
+    if (!file_exists($script) || !function_exists('exec')) {
+        logError("Texture pipeline unavailable - serving original texture");
+        return false;
+    }
+    
+    $safeMaterialId = preg_replace('/[^a-zA-Z0-9_-]/', '', $materialId);
+    $command = 'python3 ' . escapeshellarg($script) . ' --material ' . escapeshellarg($safeMaterialId) . ' 2>&1';
+    exec($command, $output, $exitCode);
+    
+    if ($exitCode !== 0) {
+        logError("Texture pipeline failed ($exitCode): " . implode(' | ', $output));
+        return false;
+    }
+    logError("Texture tiers built for $safeMaterialId");
+    return true;
+}
+
 // Main upload handling
 try {
     logError("Upload script started");
@@ -163,6 +186,12 @@ try {
     // Log success
     logError("Successfully uploaded image: $relativePath");
     
+    // Pre-build mipmap-friendly tiers so project open doesn't decode full-size images
+    $texturesProcessed = false;
+    if ($imageType !== 'thumbnail') {
+        $texturesProcessed = buildTextureTiers($materialId);
+    }
+    
     // Return success response
     echo json_encode([
         'success' => true,
@@ -170,7 +199,8 @@ try {
         'filename' => $filename,
         'materialId' => $materialId,
         'imageType' => $imageType,
-        'fileSize' => filesize($targetPath)
+        'fileSize' => filesize($targetPath),
+        'texturesProcessed' => $texturesProcessed
     ]);
     
 } catch (Exception $e) {
@@ -1,12 +1,29 @@
 import { defineConfig } from 'vite'
 
-export default defineConfig({
+// Production build: `npm run build`
+// drawing-world.js is bundled with every tool system (modules/ToolModules.js) split
+// into its own lazily loaded chunk. File names carry content hashes and
+// dist/.vite/manifest.json lets workspace.php (asset-versions.php) find the entry.
+export default defineConfig(({ mode }) => ({
   root: '.',
+  base: './',
+  esbuild: mode === 'production'
+    ? { drop: ['console', 'debugger'], legalComments: 'none' }
+    : {},
   build: {
     outDir: 'dist',
+    manifest: true,
+    minify: 'esbuild',
+    target: 'es2020',
     rollupOptions: {
       input: {
-        main: './babylon.html'
+        main: './babylon.html',
+        'drawing-world': './drawing-world.js'
+      },
+      output: {
+        entryFileNames: 'assets/[name]-[hash].js',
+        chunkFileNames: 'assets/chunks/[name]-[hash].js',
+        assetFileNames: 'assets/[name]-[hash][extname]'
       }
     }
   },
@@ -14,4 +31,4 @@ export default defineConfig({
     port: 8080,
     host: true
   }
-})
+}))
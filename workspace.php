@@ -1,3 +1,4 @@
+<?php require_once __DIR__ . '/asset-versions.php'; ?>
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -5,16 +6,21 @@
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>CutList - Drawing World</title>
     <link rel="icon" type="image/svg+xml" href="favicon.svg">
-    <link rel="stylesheet" href="workspace.css">
+    <link rel="stylesheet" href="<?php echo assetUrl('workspace.css'); ?>">
     <script src="https://cdn.babylonjs.com/babylon.js"></script>
     <script src="https://cdn.babylonjs.com/loaders/babylonjs.loaders.min.js"></script>
     <script src="https://cdn.babylonjs.com/havok/HavokPhysics_umd.js"></script>
     <script src="https://cdn.babylonjs.com/babylon.physics.js"></script>
     <script src="https://cdn.babylonjs.com/materialsLibrary/babylonjs.materials.min.js"></script>
     <script src="https://cdn.babylonjs.com/gui/babylon.gui.min.js"></script>
-    <script src="MaterialsLibrary.js?v=<?php echo time(); ?>"></script>
-    <script src="Board.js?v=<?php echo time(); ?>"></script>
-    <script src="BoardFactory.js?v=<?php echo time(); ?>"></script>
+    <script>
+        // Content-hash versions of the JSON databases (asset-versions.php)
+        window.CUTLIST_ASSETS = <?php echo json_encode(assetManifest(), JSON_UNESCAPED_SLASHES); ?>;
+    </script>
+    <script src="<?php echo assetUrl('MaterialsLibrary.js'); ?>"></script>
+    <script src="<?php echo assetUrl('Board.js'); ?>"></script>
+    <script src="<?php echo assetUrl('MaterialCache.js'); ?>"></script>
+    <script src="<?php echo assetUrl('BoardFactory.js'); ?>"></script>
     <script>
 
         function showLoadingSpinner(message = 'Please wait while we restore your workspace') {
@@ -452,7 +458,7 @@
         </div>
     </div>
     
-    <script type="module" src="drawing-world.js?v=<?php echo time(); ?>&force=<?php echo rand(1000, 9999); ?>&edge=20250724001"></script>
+    <script type="module" src="<?php echo assetEntry('drawing-world.js'); ?>"></script>
     <script>
 
         function showLoadingSpinner(message = 'Please wait while we restore your workspace') {
@@ -724,6 +730,8 @@
                 
 
                 const preservedWorkBenchParts = (drawingWorld.workBenchParts || []).map(part => {
+                    // Copies of the part's features, realized flags included
+                    const savedFeatures = () => ((drawingWorld.partInstances.get(part.id) || part).features || []).map(feature => ({ ...feature }));
                     // CRITICAL FIX: Properly serialize Part class instances to avoid circular references
                     const partCopy = {
                         id: part.id,
@@ -737,7 +745,12 @@
                         grade: part.grade,
                         grain: part.grain,
                         created: part.created,
-                        modified: part.modified
+                        modified: part.modified,
+                        // Saved thumbnails are reused on open while their geometry key still matches
+                        thumbnail: part.thumbnail || null,
+                        thumbnailKey: part.thumbnailKey || null,
+                        // Flags as the part has them; refreshed once its holes are realized below
+                        features: savedFeatures()
                     };
                     
                     // Find the corresponding mesh in the scene
@@ -750,6 +763,9 @@
                     
                     if (mesh) {
                         console.log('Found mesh for part:', part.id, 'at position:', mesh.position.toString());
+                        // Saved geometry includes holes that were still pending
+                        drawingWorld.realizePartFeatures(mesh);
+                        partCopy.features = savedFeatures();
                         partCopy.meshGeometry = drawingWorld.serializeMeshGeometry(mesh);
                         if (partCopy.meshGeometry && partCopy.meshGeometry.position) {
                             console.log('Saved position:', partCopy.meshGeometry.position);
@@ -773,6 +789,8 @@
                 console.log('Preserved workBench parts:', preservedWorkBenchParts);
                 
                 const preservedAssemblyParts = (drawingWorld.projectParts || []).map(part => {
+                    // Copies of the part's features, realized flags included
+                    const savedFeatures = () => ((drawingWorld.partInstances.get(part.id) || part).features || []).map(feature => ({ ...feature }));
                     // CRITICAL FIX: Properly serialize Part class instances to avoid circular references
                     const partCopy = {
                         id: part.id,
@@ -786,7 +804,12 @@
                         grade: part.grade,
                         grain: part.grain,
                         created: part.created,
-                        modified: part.modified
+                        modified: part.modified,
+                        // Saved thumbnails are reused on open while their geometry key still matches
+                        thumbnail: part.thumbnail || null,
+                        thumbnailKey: part.thumbnailKey || null,
+                        // Flags as the part has them; refreshed once its holes are realized below
+                        features: savedFeatures()
                     };
                     
                     // Find the corresponding mesh in the scene
@@ -798,6 +821,9 @@
                     );
                     
                     if (mesh) {
+                        // Saved geometry includes holes that were still pending
+                        drawingWorld.realizePartFeatures(mesh);
+                        partCopy.features = savedFeatures();
                         partCopy.meshGeometry = drawingWorld.serializeMeshGeometry(mesh);
                     }
                     
@@ -1303,12 +1329,10 @@
                     return;
                 }
                 
-                // Open The Mill with the selected part mesh
-                if (window.drawingWorld.theMillSystem) {
-                    window.drawingWorld.theMillSystem.openMill(partMesh, 'cut');
-                } else {
-                    console.error('The Mill System not initialized');
-                }
+                // Open The Mill with the selected part mesh (its code loads on first use)
+                window.drawingWorld.loadToolSystem('mill')
+                    .then(millSystem => millSystem.openMill(partMesh, 'cut'))
+                    .catch(error => console.error('The Mill System failed to load:', error));
             },
             
             showProperties() {